@@ -0,0 +1,58 @@
+"""
+Card tables with plain emoji strings versus cached, pre-measured symbol Text.
+
+Builds and renders the table of every card of a deck, cycling through the
+deck, the way the game draws panels as cards change hands.
+
+Run with: python benchmarks/bench_alphabet.py
+"""
+import io
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from dobble.game.deck import Deck
+from dobble.ui.components import create_card_table
+from dobble.ui.symbols import SYMBOL_CELLS
+from dobble.utils.alphabet import ALPHABET
+
+SIZES = [8, 18, 32, 60]
+CARDS = 200
+
+
+def plain_table(card) -> Table:
+    """The previous table: wrapped emoji strings, parsed and measured on every render."""
+    emojis = ALPHABET.emojis
+    table = Table(show_header=False, show_edge=False)
+    for _ in range(card.layout.cols):
+        table.add_column("", justify="center")
+    for row in card.layout.grid:
+        table.add_row(*(" " if s is None else emojis[s % len(emojis)] for s in row))
+    return table
+
+
+def timed(console: Console, cards, make) -> float:
+    start = time.perf_counter()
+    for card in cards:
+        console.print(make(card))
+    return (time.perf_counter() - start) / len(cards)
+
+
+def main() -> None:
+    console = Console(file=io.StringIO(), width=200, force_terminal=True, color_system="truecolor")
+    print(f"{'k':>3} {'symbols':>8} {'tiers':>6} {'plain ms':>9} {'cached ms':>10} {'table KiB':>10}")
+    for size in SIZES:
+        deck = Deck.generate(size)
+        cards = [deck[i % len(deck)] for i in range(CARDS)]
+        plain = timed(console, cards, plain_table)
+        SYMBOL_CELLS.prepare(deck.num_symbols)
+        cached = timed(console, cards, lambda card: create_card_table(card, show_coordinates=False))
+        print(
+            f"{size:>3} {deck.num_symbols:>8} {ALPHABET.tiers_for(deck.num_symbols):>6} "
+            f"{plain * 1e3:>9.3f} {cached * 1e3:>10.3f} {SYMBOL_CELLS.nbytes / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
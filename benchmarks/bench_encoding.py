@@ -0,0 +1,76 @@
+"""
+Card encodings: sorted symbol arrays versus integer bitmasks (BitsetDeck).
+
+Times matching two cards, checking a player's top card for a symbol, and
+whole simulated games, in ns per operation (us per game), for each encoding.
+
+Run with: python benchmarks/bench_encoding.py
+"""
+import random
+import timeit
+
+from dobble.game.deck import BitsetDeck, Deck
+from dobble.game.game import DobbleGame
+from dobble.sim.engine import simulate_game
+from dobble.sim.policies import make_policy
+
+SIZES = [4, 8, 18, 30, 60]
+OPS = 20000
+GAMES = 20
+PLAYERS = 4
+
+
+def time_per_op(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=5)) / number
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(
+        f"{'k':>3} {'encoding':>8} {'match ns':>9} {'get_match ns':>12} "
+        f"{'has_symbol ns':>13} {'game us':>9} {'build ms':>9}"
+    )
+    for size in SIZES:
+        array_deck = Deck.generate(size)
+        n = len(array_deck)
+        pairs = [tuple(rng.sample(range(n), 2)) for _ in range(OPS)]
+        probes = [rng.randrange(array_deck.num_symbols) for _ in range(OPS)]
+
+        for encoding in ("array", "bitset"):
+            build = time_per_op(lambda: BitsetDeck(array_deck), 1) * 1e3 if encoding == "bitset" else 0.0
+            game = DobbleGame(size, deck=array_deck, encoding=encoding)
+            deck = game.cards
+            cards = list(deck)
+            game.setup_game([f"P{i}" for i in range(PLAYERS)], rng=random.Random(0))
+            player = game.players[0]
+
+            def match():
+                m = deck.match
+                for a, b in pairs:
+                    m(a, b)
+
+            def get_matching_symbol():
+                for a, b in pairs:
+                    cards[a].get_matching_symbol(cards[b])
+
+            def has_matching_symbol():
+                has = player.has_matching_symbol
+                for symbol in probes:
+                    has(symbol)
+
+            policy = make_policy("random", PLAYERS)
+
+            def games():
+                for seed in range(GAMES):
+                    simulate_game(deck, PLAYERS, policy, seed)
+
+            print(
+                f"{size:>3} {encoding:>8} {time_per_op(match, OPS) * 1e9:>9.0f} "
+                f"{time_per_op(get_matching_symbol, OPS) * 1e9:>12.0f} "
+                f"{time_per_op(has_matching_symbol, OPS) * 1e9:>13.0f} "
+                f"{time_per_op(games, GAMES) * 1e6:>9.0f} {build:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Event log: cost of recording simulated games, and of reading them back.
+
+Reports, per snapshot interval, the slowdown of simulate_game with a log,
+bytes per event, streaming read rate and the time to rebuild a game in the
+middle of the log with Replay.game_at.
+
+Run with: python benchmarks/bench_events.py
+"""
+import os
+import random
+import tempfile
+import time
+
+from dobble.game.deck import Deck
+from dobble.game.events import EventReader, EventWriter, Replay
+from dobble.sim.engine import simulate_game
+from dobble.sim.policies import RandomPolicy
+
+SIZE = 8
+PLAYERS = 4
+GAMES = 2000
+SNAPSHOT_EVERY = [10, 100, 1000]
+
+
+def play(deck: Deck, log=None) -> float:
+    policy = RandomPolicy(PLAYERS)
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        simulate_game(deck, PLAYERS, policy, seed, log=log)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    deck = Deck.generate(SIZE)
+    baseline = play(deck)
+    print(f"{GAMES} games without a log: {baseline:.2f}s")
+    print(f"{'snapshot':>8} {'slowdown':>8} {'B/event':>8} {'read ev/s':>10} {'game_at ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for every in SNAPSHOT_EVERY:
+            path = os.path.join(directory, f"{every}.log")
+            with EventWriter(path, snapshot_every=every) as log:
+                seconds = play(deck, log)
+                events = log.events
+
+            start = time.perf_counter()
+            count = sum(1 for _ in EventReader(path))
+            read = time.perf_counter() - start
+            assert count == events
+
+            replay = Replay(path, deck_for=lambda k: deck)
+            replay.index  # One pass to find the snapshots.
+            rng = random.Random(0)
+            queries = [rng.randrange(GAMES) for _ in range(50)]
+            start = time.perf_counter()
+            for game in queries:
+                replay.game_at(game, replay.index[game].last_seq)
+            game_at = (time.perf_counter() - start) / len(queries)
+
+            print(
+                f"{every:>8} {seconds / baseline:>7.2f}x {os.path.getsize(path) / events:>8.2f} "
+                f"{count / read:>10.0f} {game_at * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Deck export: cards per second and peak memory by worker count.
+
+Exports the largest deck (60 symbols per card, 3541 cards) to PDF with 1, 2,
+... up to all cores, and reports the throughput and the peak resident memory
+of the exporting process and of its workers.
+
+Run with: python benchmarks/bench_export.py [symbols_per_card]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from dobble.export.runner import ExportOptions, export_deck
+from dobble.game.cache import build_cache
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    build_cache([size], verify=False)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, cores} | set(range(4, cores + 1, 4)))
+    print(f"{'workers':>7} {'cards':>6} {'seconds':>8} {'cards/s':>8} {'MiB':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in counts:
+            start = time.perf_counter()
+            cards = export_deck(ExportOptions(size), os.path.join(tmp, "deck.pdf"), "pdf", workers=workers)
+            elapsed = time.perf_counter() - start
+            peak = max(
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+            )
+            print(f"{workers:>7} {cards:>6} {elapsed:>8.2f} {cards / elapsed:>8.0f} {peak / 1024:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Import-time cost of the game modules, measured with `python -X importtime`.
+
+Exits with status 1 if the best of several cold imports of any module is
+slower than its threshold, so it can guard against import-time regressions
+(e.g. work creeping back into module bodies).
+
+Run with: python benchmarks/bench_import.py [--repeat N] [--scale F]
+"""
+import argparse
+import subprocess
+import sys
+
+# Cumulative import time budget per module, in milliseconds, with headroom
+# over the development machine (~72 ms and ~50 ms, most of it typing, re and
+# pathlib). Use --scale on slower or faster machines.
+THRESHOLDS_MS = {
+    "dobble.game.game": 100.0,
+    "dobble.game.card": 70.0,
+}
+
+
+def import_times(module: str) -> dict:
+    """Cumulative import time (ms) of every module loaded by a fresh `import module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7, help="Cold imports per module (best is kept)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every threshold (slow machines)")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<20} {'best ms':>8} {'limit ms':>9} {'emoji ms':>9}")
+    for module, limit in THRESHOLDS_MS.items():
+        runs = [import_times(module) for _ in range(args.repeat)]
+        best = min(runs, key=lambda times: times[module])
+        limit *= args.scale
+        emoji = best.get("dobble.utils.emoji_loader", 0.0)
+        status = "ok" if best[module] <= limit else "SLOW"
+        failed |= status == "SLOW"
+        print(f"{module:<20} {best[module]:>8.1f} {limit:>9.1f} {emoji:>9.1f}  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
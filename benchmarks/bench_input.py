@@ -0,0 +1,75 @@
+"""
+Keyboard latency: time from a key reaching the terminal to read_key returning it.
+
+Keys are written to a pseudo-terminal from another thread while a RawInput
+session waits on it. For comparison, the old approach (switching the
+terminal to raw mode and back around every key) is timed per key too.
+
+Run with: python benchmarks/bench_input.py
+"""
+import os
+import pty
+import statistics
+import termios
+import threading
+import time
+import tty
+
+from dobble.ui.keyboard import RawInput
+
+KEYS = 2000
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def session_latency(master: int, slave: int):
+    sent = []
+    go = threading.Event()
+
+    def typist():
+        for _ in range(KEYS):
+            go.wait()
+            go.clear()
+            sent.append(time.perf_counter())
+            os.write(master, b"x")
+
+    thread = threading.Thread(target=typist)
+    thread.start()
+    latencies = []
+    with RawInput(slave, clock=time.perf_counter) as keyboard:
+        for _ in range(KEYS):
+            go.set()
+            press = keyboard.read_key()
+            latencies.append(press.time - sent[-1])
+    thread.join()
+    return latencies
+
+
+def mode_switch_cost(slave: int) -> float:
+    start = time.perf_counter()
+    for _ in range(KEYS):
+        old = termios.tcgetattr(slave)
+        tty.setraw(slave)
+        termios.tcsetattr(slave, termios.TCSADRAIN, old)
+    return (time.perf_counter() - start) / KEYS
+
+
+def main() -> None:
+    master, slave = pty.openpty()
+    try:
+        latencies = session_latency(master, slave)
+        print(
+            f"session read latency: median {statistics.median(latencies) * 1e6:.0f} us, "
+            f"p99 {percentile(latencies, 0.99) * 1e6:.0f} us"
+        )
+        print(f"per-key raw mode switch (old): {mode_switch_cost(slave) * 1e6:.0f} us")
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+if __name__ == "__main__":
+    main()
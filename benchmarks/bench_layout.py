@@ -0,0 +1,60 @@
+"""
+Coordinate resolution: rebuilding the symbol grid on every lookup versus the
+cached per-card layout.
+
+Run with: python benchmarks/bench_layout.py
+"""
+import math
+import time
+
+from dobble.game.deck import Deck
+from dobble.utils.emoji_loader import EMOJI_MAP
+
+SIZES = [8, 18, 32, 60]
+LOOKUPS = 20000
+
+
+def legacy_symbol_at_coordinate(symbols, coordinate):
+    """The original lookup: sort, build a grid of (symbol, emoji) tuples, index it."""
+    symbols = sorted(symbols)
+    size = math.ceil(math.sqrt(len(symbols)))
+    grid = []
+    idx = 0
+    for i in range(size):
+        row = []
+        for j in range(size):
+            if idx < len(symbols):
+                row.append((symbols[idx], EMOJI_MAP[symbols[idx] % len(EMOJI_MAP)]))
+            else:
+                row.append((None, " "))
+            idx += 1
+        grid.append(row)
+    col = ord(coordinate[0].upper()) - ord("A")
+    row = int(coordinate[1:]) - 1
+    return grid[row][col][0] if 0 <= row < len(grid) and 0 <= col < len(grid[0]) else None
+
+
+def main() -> None:
+    print(f"{'k':>3} {'rebuild ns':>11} {'cached ns':>10} {'speedup':>8}")
+    for size in SIZES:
+        deck = Deck.generate(size)
+        card = deck[len(deck) // 2]
+        symbols = card.symbols
+        coordinates = [card.layout.coordinate_of(s) for s in card.sorted_symbols]
+        n = len(coordinates)
+
+        start = time.perf_counter()
+        for i in range(LOOKUPS):
+            legacy_symbol_at_coordinate(symbols, coordinates[i % n])
+        legacy = (time.perf_counter() - start) / LOOKUPS
+
+        start = time.perf_counter()
+        for i in range(LOOKUPS):
+            card.has_symbol_at_coordinate(coordinates[i % n])
+        cached = (time.perf_counter() - start) / LOOKUPS
+
+        print(f"{size:>3} {legacy * 1e9:>11.0f} {cached * 1e9:>10.0f} {legacy / cached:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
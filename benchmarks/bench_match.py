@@ -0,0 +1,52 @@
+"""
+Matching benchmark: set intersection versus the closed-form plane lookup.
+
+Run with: python benchmarks/bench_match.py
+"""
+import random
+import timeit
+
+from dobble.game.deck import Deck
+
+SIZES = [4, 8, 18, 30, 60]
+PAIRS = 20000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'k':>3} {'sets ns':>9} {'card ns':>9} {'match ns':>9} {'many ns':>9} {'speedup':>8}")
+    for size in SIZES:
+        deck = Deck.generate(size)
+        n = len(deck)
+        pairs = [tuple(rng.sample(range(n), 2)) for _ in range(PAIRS)]
+        sets = [set(deck.row(i).tolist()) for i in range(n)]
+        cards = list(deck)
+
+        def with_sets():
+            for a, b in pairs:
+                next(iter(sets[a] & sets[b]))
+
+        def with_cards():
+            for a, b in pairs:
+                cards[a].get_matching_symbol(cards[b])
+
+        def with_match():
+            match = deck.match
+            for a, b in pairs:
+                match(a, b)
+
+        def with_match_many():
+            deck.match_many(pairs)
+
+        timings = [
+            min(timeit.repeat(fn, number=1, repeat=5)) / PAIRS * 1e9
+            for fn in (with_sets, with_cards, with_match, with_match_many)
+        ]
+        print(
+            f"{size:>3} {timings[0]:>9.0f} {timings[1]:>9.0f} {timings[2]:>9.0f} "
+            f"{timings[3]:>9.0f} {timings[0] / timings[3]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
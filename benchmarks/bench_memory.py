@@ -0,0 +1,67 @@
+"""
+Memory benchmark: per-card Python sets versus the array-backed Deck.
+
+Run with: python benchmarks/bench_memory.py
+"""
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Set, Tuple
+
+from dobble.config import VALID_CARD_SIZES
+from dobble.game.deck import Deck
+from dobble.game.plane import ProjectivePlane
+
+
+@dataclass
+class SetCard:
+    """The original card representation: one dataclass holding a set per card."""
+
+    symbols: Set[int]
+
+
+def build_set_deck(symbols_per_card: int) -> List[SetCard]:
+    rows = ProjectivePlane(symbols_per_card - 1).incidence_rows()
+    k = symbols_per_card
+    # Convert through int lists so symbols are boxed like the original generator produced them.
+    return [SetCard(set(rows[i:i + k].tolist())) for i in range(0, len(rows), k)]
+
+
+def build_array_deck(symbols_per_card: int) -> Deck:
+    return Deck.generate(symbols_per_card)
+
+
+def build_array_deck_with_views(symbols_per_card: int) -> Tuple[Deck, list]:
+    deck = Deck.generate(symbols_per_card)
+    return deck, list(deck)
+
+
+def measure(builder: Callable, symbols_per_card: int) -> Tuple[int, float]:
+    """Return (bytes retained, seconds) for building one deck."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = builder(symbols_per_card)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+
+def main() -> None:
+    print(f"{'k':>3} {'cards':>6} {'sets KiB':>10} {'array KiB':>10} {'+views KiB':>11} {'ratio':>7}")
+    for size in VALID_CARD_SIZES:
+        sets, _ = measure(build_set_deck, size)
+        arrays, _ = measure(build_array_deck, size)
+        views, _ = measure(build_array_deck_with_views, size)
+        cards = size * size - size + 1
+        print(
+            f"{size:>3} {cards:>6} {sets / 1024:>10.1f} {arrays / 1024:>10.1f} "
+            f"{views / 1024:>11.1f} {sets / arrays:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Deck registry: a private deck per game versus one shared deck per order.
+
+Creates many tables at a handful of difficulties, as a server does, and
+reports the time per game and the memory retained by the games, with and
+without the registry.
+
+Run with: python benchmarks/bench_registry.py
+"""
+import gc
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from dobble.game.game import DobbleGame
+from dobble.game.registry import DeckRegistry, build_deck
+
+SIZES = [6, 8, 12, 18]
+GAMES = 1000
+
+
+def private_game(size: int) -> DobbleGame:
+    return DobbleGame(size, deck=build_deck(size))
+
+
+def measure(make: Callable[[int], DobbleGame]) -> Tuple[float, int]:
+    """Return (seconds per game, bytes retained) for GAMES games spread over SIZES."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    games: List[DobbleGame] = []
+    for i in range(GAMES):
+        game = make(SIZES[i % len(SIZES)])
+        game.setup_game(["A", "B", "C", "D"])
+        games.append(game)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del games
+    return elapsed / GAMES, retained
+
+
+def main() -> None:
+    registry = DeckRegistry()
+    print(f"{'decks':>10} {'us/game':>9} {'MiB':>8}")
+    for name, make in (
+        ("private", private_game),
+        ("registry", lambda size: DobbleGame(size, registry=registry)),
+    ):
+        per_game, retained = measure(make)
+        print(f"{name:>10} {per_game * 1e6:>9.1f} {retained / 2 ** 20:>8.2f}")
+    print(registry.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Game screen redraw cost per turn: clearing and re-rendering everything (the
+original display_game_state) versus cached panels and a diffed redraw.
+
+Reports frames per second and bytes written to the terminal per turn.
+
+Run with: python benchmarks/bench_render.py
+"""
+import io
+import random
+import time
+
+from rich.columns import Columns
+from rich.console import Console
+from rich.panel import Panel
+
+from dobble.game.game import DobbleGame
+from dobble.ui.components import create_card_table
+from dobble.ui.screen import GameScreen
+
+PLAYER_COUNTS = [2, 8, 32]
+SYMBOLS_PER_CARD = 18
+TURNS = 40
+
+
+def terminal() -> Console:
+    return Console(file=io.StringIO(), width=160, height=120, force_terminal=True, color_system="truecolor")
+
+
+def legacy_display(console: Console, game: DobbleGame) -> None:
+    """The original redraw: clear the screen and rebuild every table and panel."""
+    console.clear()
+    if game.live_card:
+        console.print(
+            Panel(
+                create_card_table(game.live_card, show_coordinates=True),
+                title="[cyan]Live Card[/cyan]",
+                border_style="cyan",
+                expand=False,
+            )
+        )
+    panels = [
+        Panel(
+            create_card_table(player.get_card(), show_coordinates=False),
+            title=f"[bold]{player.name}[/bold] ({len(player.cards)} cards)",
+            border_style="green",
+        )
+        for player in game.players
+        if player.get_card()
+    ]
+    console.print(Columns(panels, equal=True, expand=True))
+
+
+def run(num_players: int, draw) -> tuple:
+    """Play TURNS turns, drawing after each; return (frames per second, bytes per turn)."""
+    game = DobbleGame(SYMBOLS_PER_CARD)
+    game.setup_game([f"Player {i}" for i in range(num_players)], rng=random.Random(0))
+    rng = random.Random(1)
+    console = terminal()
+    draw(console, game)  # First frame: both approaches draw everything.
+    console.file.seek(0)
+    console.file.truncate()
+
+    elapsed = 0.0
+    for _ in range(TURNS):
+        game.play_winning_card(rng.randrange(num_players))
+        start = time.perf_counter()
+        draw(console, game)
+        elapsed += time.perf_counter() - start
+        console.print("Enter coordinate of the matching symbol: B2")
+    written = len(console.file.getvalue().encode())
+    return TURNS / elapsed, written / TURNS
+
+
+def main() -> None:
+    print(f"{'players':>7} {'legacy fps':>11} {'live fps':>9} {'legacy B/turn':>14} {'live B/turn':>12}")
+    for num_players in PLAYER_COUNTS:
+        legacy_fps, legacy_bytes = run(num_players, legacy_display)
+        screens = {}
+
+        def live_display(console: Console, game: DobbleGame) -> None:
+            screen = screens.get(id(console))
+            if screen is None:
+                screen = screens[id(console)] = GameScreen(console)
+            screen.show(game)
+
+        live_fps, live_bytes = run(num_players, live_display)
+        print(f"{num_players:>7} {legacy_fps:>11.0f} {live_fps:>9.0f} {legacy_bytes:>14.0f} {live_bytes:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Sharded hosting throughput: turns per second against worker count.
+
+Starts `dobble serve --workers N` for N = 1..cores and drives it with one
+`dobble loadgen --connect` process per core (so the load generator is not
+the bottleneck), then reports aggregate turns/s and the speedup over one
+worker. Scaling is only near-linear while the machine has a free core for
+each worker, the front process and the load generators.
+
+Run with: python benchmarks/bench_shards.py
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+TABLES = 200
+CLIENTS = os.cpu_count() or 1
+GAMES = 3
+
+
+def run(workers: int) -> float:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "dobble.main", "serve", "--port", "0", "--workers", str(workers)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        address = server.stdout.readline().split()[-1]
+        time.sleep(0.5)  # let the workers map their decks
+        loads = [
+            subprocess.Popen(
+                [
+                    sys.executable, "-m", "dobble.main", "loadgen", "--connect", address,
+                    "--tables", str(TABLES // CLIENTS), "--games", str(GAMES),
+                    "--think-ms", "0", "--seed", str(seed), "--json",
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            for seed in range(CLIENTS)
+        ]
+        reports = [json.loads(load.communicate()[0]) for load in loads]
+    finally:
+        server.terminate()
+        server.wait()
+    return sum(report["turns"] for report in reports) / max(report["seconds"] for report in reports)
+
+
+def main() -> None:
+    print(f"{'workers':>7} {'turns/s':>9} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        rate = run(workers)
+        baseline = baseline or rate
+        print(f"{workers:>7} {rate:>9.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Simulation throughput: one game at a time through DobbleGame versus NumPy batches.
+
+Run with: python benchmarks/bench_sim.py
+"""
+import time
+
+from dobble.game.deck import Deck
+from dobble.sim.batched import simulate_batch
+from dobble.sim.engine import simulate_game
+from dobble.sim.policies import make_policy
+
+CASES = [(8, 2), (8, 4), (12, 4), (18, 8)]
+OBJECT_GAMES = 300
+BATCH_GAMES = 8192
+
+
+def main() -> None:
+    print(f"{'k':>3} {'players':>7} {'policy':>9} {'object g/s':>11} {'batched g/s':>12} {'speedup':>8}")
+    for size, players in CASES:
+        deck = Deck.generate(size)
+        for policy_name in ("random", "reaction"):
+            policy = make_policy(policy_name, players)
+            start = time.perf_counter()
+            for seed in range(OBJECT_GAMES):
+                simulate_game(deck, players, policy, seed)
+            object_rate = OBJECT_GAMES / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            simulate_batch(deck, players, BATCH_GAMES, policy_name, seed=0)
+            batch_rate = BATCH_GAMES / (time.perf_counter() - start)
+
+            print(
+                f"{size:>3} {players:>7} {policy_name:>9} {object_rate:>11.0f} "
+                f"{batch_rate:>12.0f} {batch_rate / object_rate:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
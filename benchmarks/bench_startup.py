@@ -0,0 +1,51 @@
+"""
+Cold-start time of the command-line entry point, in fresh interpreters.
+
+Reports the best of several runs for a bare interpreter, `dobble --help`, a
+tiny headless simulation, and the interactive launch (everything up to the
+first prompt), plus whether the terminal UI stack was loaded.
+
+Run with: python benchmarks/bench_startup.py
+"""
+import subprocess
+import sys
+import time
+
+REPEAT = 7
+
+CASES = {
+    "python (baseline)": "pass",
+    "dobble --help": "from dobble.main import main\ntry:\n    main(['--help'])\nexcept SystemExit:\n    pass",
+    "dobble simulate": (
+        "from dobble.main import main\n"
+        "main(['simulate', '--games', '1', '--workers', '1', '--symbols', '3'])"
+    ),
+    "interactive launch": "import dobble.main\ndobble.main.GameController()",
+}
+
+# Appended to each case to report whether the UI stack was imported.
+PROBE = "\nimport sys\nprint('UI', 'rich' in sys.modules or 'termios' in sys.modules, file=sys.stderr)"
+
+
+def run(code: str) -> tuple:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code + PROBE],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, "UI True" in result.stderr
+
+
+def main() -> None:
+    print(f"{'case':<20} {'best ms':>8} {'UI loaded':>10}")
+    for name, code in CASES.items():
+        runs = [run(code) for _ in range(REPEAT)]
+        best = min(elapsed for elapsed, _ in runs)
+        print(f"{name:<20} {best * 1e3:>8.1f} {str(runs[0][1]):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Symbol queries: scanning every card versus the symbol index.
+
+Times "which cards carry symbol s" by a scan of the deck and by the CSR
+symbol index, the index build, and in-play frequency queries during a game.
+
+Run with: python benchmarks/bench_symbols.py
+"""
+import random
+import time
+import timeit
+
+from dobble.game.deck import Deck
+from dobble.game.game import DobbleGame
+
+SIZES = [4, 8, 18, 30, 60]
+QUERIES = 200
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'k':>3} {'build ms':>9} {'scan us':>9} {'index us':>9} {'speedup':>8} {'in play us':>10}")
+    for size in SIZES:
+        deck = Deck.generate(size)
+        symbols = [rng.randrange(deck.num_symbols) for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        deck.symbol_index()
+        build = time.perf_counter() - start
+
+        def scan():
+            contains = deck.contains
+            for symbol in symbols:
+                [i for i in range(len(deck)) if contains(i, symbol)]
+
+        def index():
+            cards_with = deck.cards_with
+            for symbol in symbols:
+                list(cards_with(symbol))
+
+        game = DobbleGame(size, deck=deck)
+        game.setup_game(["A", "B", "C", "D"], rng=rng)
+        for _ in range(len(deck) // 8):
+            game.play_winning_card(rng.randrange(4))
+
+        def in_play():
+            for symbol in symbols:
+                game.cards_in_play_with(symbol)
+                game.symbol_frequency(symbol)
+
+        scan_us = min(timeit.repeat(scan, number=1, repeat=3)) / QUERIES * 1e6
+        index_us = min(timeit.repeat(index, number=1, repeat=5)) / QUERIES * 1e6
+        in_play_us = min(timeit.repeat(in_play, number=1, repeat=5)) / QUERIES * 1e6
+        print(
+            f"{size:>3} {build * 1e3:>9.2f} {scan_us:>9.1f} {index_us:>9.2f} "
+            f"{scan_us / index_us:>7.0f}x {in_play_us:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
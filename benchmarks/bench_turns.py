@@ -0,0 +1,52 @@
+"""
+Per-turn cost as the deck grows: list.pop(0) piles and a full is_over scan
+versus CardStack windows and incremental game-over tracking.
+
+Run with: python benchmarks/bench_turns.py
+"""
+import random
+import time
+
+from dobble.game.game import DobbleGame
+
+SIZES = [60, 128, 258, 513, 1025]
+PLAYERS = 8
+TURNS = 2000
+
+
+def time_turns(game: DobbleGame, legacy: bool) -> float:
+    """Average seconds per turn (play a card, then check for game over)."""
+    if legacy:
+        # The original design: list piles popped from the front, and a scan of every player.
+        for player in game.players:
+            player.cards = list(player.cards)
+    players = game.players
+    start = time.perf_counter()
+    for turn in range(TURNS):
+        game.play_winning_card(turn % PLAYERS)
+        if legacy:
+            any(player.is_out_of_cards for player in players)
+        else:
+            game.is_over
+    return (time.perf_counter() - start) / TURNS
+
+
+def dealt_game(size: int) -> DobbleGame:
+    game = DobbleGame(size, lazy=True)
+    game.setup_game([f"P{i}" for i in range(PLAYERS)], rng=random.Random(0))
+    return game
+
+
+def main() -> None:
+    print(f"{'k':>5} {'cards':>8} {'list ns/turn':>13} {'stack ns/turn':>14}")
+    for size in SIZES:
+        game = dealt_game(size)
+        if len(game.players[0].cards) <= TURNS // PLAYERS:
+            continue
+        legacy = time_turns(game, legacy=True)
+        stack = time_turns(dealt_game(size), legacy=False)
+        print(f"{size:>5} {len(game.cards):>8} {legacy * 1e9:>13.0f} {stack * 1e9:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Cold render time of the game screen as the table grows: every player in one
+Columns versus a terminal-sized Viewport page.
+
+Run with: python benchmarks/bench_viewport.py
+"""
+import io
+import random
+import time
+
+from rich.console import Console
+
+from dobble.game.game import DobbleGame
+from dobble.ui.components import RenderCache
+from dobble.ui.display import game_screen
+from dobble.ui.viewport import Viewport
+
+SYMBOLS_PER_CARD = 32
+PLAYER_COUNTS = [8, 32, 128, 512]
+FRAMES = 3
+
+
+def frame_time(game: DobbleGame, viewport) -> tuple:
+    """Best time to render one frame from an empty cache; also the number of lines drawn."""
+    best = float("inf")
+    for _ in range(FRAMES):
+        console = Console(file=io.StringIO(), width=160, height=50, force_terminal=True, color_system="truecolor")
+        start = time.perf_counter()
+        console.print(game_screen(game, RenderCache(), viewport=viewport))
+        best = min(best, time.perf_counter() - start)
+    return best, console.file.getvalue().count("\n")
+
+
+def main() -> None:
+    print(f"{'players':>7} {'columns ms':>11} {'lines':>6} {'viewport ms':>12} {'lines':>6}")
+    for num_players in PLAYER_COUNTS:
+        game = DobbleGame(SYMBOLS_PER_CARD, lazy=True)
+        game.setup_game([f"Guest {i}" for i in range(num_players)], rng=random.Random(0))
+        full, full_lines = frame_time(game, None)
+        paged, paged_lines = frame_time(game, Viewport())
+        print(f"{num_players:>7} {full * 1e3:>11.1f} {full_lines:>6} {paged * 1e3:>12.1f} {paged_lines:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+The dobble.bench cases under pytest-benchmark.
+
+Run with: pytest benchmarks/test_benchmarks.py --benchmark-json=results.json
+(needs pytest-benchmark; the same cases run without it through `dobble bench run`).
+Either JSON file can be passed to `dobble bench compare`.
+"""
+import pytest
+
+from dobble.bench import CASES
+from dobble.config import VALID_CARD_SIZES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("size", VALID_CARD_SIZES)
+@pytest.mark.parametrize("case", list(CASES))
+def test_bench(benchmark, case, size):
+    benchmark.group = case
+    benchmark(CASES[case](size))
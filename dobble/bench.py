@@ -0,0 +1,349 @@
+"""
+Performance benchmarks for the game engine, behind `dobble bench`.
+
+Each case times one operation (generating a deck, matching two cards,
+dealing a game, ...) at one deck size. Results are written as JSON and can
+be compared against a stored baseline to flag regressions. The same cases
+run under pytest-benchmark via benchmarks/test_benchmarks.py, and
+`dobble bench run --format pytest-benchmark` writes JSON that
+pytest-benchmark's own tools can read.
+"""
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .config import VALID_CARD_SIZES
+from .game.deck import Deck
+from .game.game import DobbleGame
+
+FORMAT_VERSION = 1
+NUM_PLAYERS = 4
+
+Operation = Callable[[], Any]
+
+
+def _sample_pairs(num_cards: int, rng: random.Random, count: int = 256) -> List[tuple]:
+    return [(rng.randrange(num_cards), rng.randrange(num_cards)) for _ in range(count)]
+
+
+def bench_generate_cards(size: int) -> Operation:
+    """Build a full deck from scratch (what _generate_cards does without a cache file)."""
+    return lambda: Deck.generate(size)
+
+
+def bench_get_matching_symbol(size: int) -> Operation:
+    """Find the shared symbol of two cards of one deck."""
+    deck = Deck.generate(size)
+    pairs = itertools.cycle([(deck[a], deck[b]) for a, b in _sample_pairs(len(deck), random.Random(0))])
+
+    def run():
+        a, b = next(pairs)
+        return a.get_matching_symbol(b)
+
+    return run
+
+
+def bench_has_symbol_at_coordinate(size: int) -> Operation:
+    """Resolve a coordinate on a card to its symbol."""
+    deck = Deck.generate(size)
+    rng = random.Random(0)
+    lookups = []
+    for index, _ in _sample_pairs(len(deck), rng):
+        card = deck[index]
+        lookups.append((card, card.layout.coordinate_of(rng.choice(card.sorted_symbols))))
+    lookups = itertools.cycle(lookups)
+
+    def run():
+        card, coordinate = next(lookups)
+        return card.has_symbol_at_coordinate(coordinate)
+
+    return run
+
+
+def bench_setup_game(size: int) -> Operation:
+    """Shuffle and deal a deck to NUM_PLAYERS players."""
+    game = DobbleGame(size, deck=Deck.generate(size))
+    names = [f"Player {i + 1}" for i in range(NUM_PLAYERS)]
+    rng = random.Random(0)
+    return lambda: game.setup_game(names, rng=rng)
+
+
+def bench_find_matching_players(size: int) -> Operation:
+    """Find the players whose top card carries the symbol at a coordinate of the live card."""
+    game = DobbleGame(size, deck=Deck.generate(size))
+    game.setup_game([f"Player {i + 1}" for i in range(NUM_PLAYERS)], rng=random.Random(0))
+    layout = game.live_card.layout
+    coordinates = itertools.cycle([layout.coordinate_of(s) for s in game.live_card.sorted_symbols])
+    return lambda: game.find_matching_players(next(coordinates))
+
+
+def bench_create_card_table(size: int) -> Operation:
+    """Build the rich Table for a card (uncached)."""
+    from .ui.components import create_card_table
+
+    deck = Deck.generate(size)
+    cards = itertools.cycle([deck[i] for i, _ in _sample_pairs(len(deck), random.Random(0), 32)])
+    return lambda: create_card_table(next(cards))
+
+
+def bench_simulate_game(size: int) -> Operation:
+    """Play a whole headless game between NUM_PLAYERS random bots."""
+    from .sim.engine import simulate_game
+    from .sim.policies import make_policy
+
+    deck = Deck.generate(size)
+    policy = make_policy("random", NUM_PLAYERS)
+    seeds = itertools.count()
+    return lambda: simulate_game(deck, NUM_PLAYERS, policy, next(seeds))
+
+
+CASES: Dict[str, Callable[[int], Operation]] = {
+    "generate_cards": bench_generate_cards,
+    "get_matching_symbol": bench_get_matching_symbol,
+    "has_symbol_at_coordinate": bench_has_symbol_at_coordinate,
+    "setup_game": bench_setup_game,
+    "find_matching_players": bench_find_matching_players,
+    "create_card_table": bench_create_card_table,
+    "simulate_game": bench_simulate_game,
+}
+
+
+class BenchResult(NamedTuple):
+    """
+    Timing of one case at one deck size. Times are seconds per operation.
+
+    Attributes:
+        case (str): Case name (see CASES).
+        size (int): Symbols per card.
+        min (float): Fastest round.
+        max (float): Slowest round.
+        median (float): Median round.
+        mean (float): Mean round.
+        stddev (float): Standard deviation across rounds.
+        rounds (int): Number of timed rounds.
+        iterations (int): Operations per round.
+    """
+
+    case: str
+    size: int
+    min: float
+    max: float
+    median: float
+    mean: float
+    stddev: float
+    rounds: int
+    iterations: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}[{self.size}]"
+
+
+def measure(case: str, size: int, operation: Operation, min_time: float = 0.02, rounds: int = 5) -> BenchResult:
+    """
+    Time an operation: calibrate how many calls make a round last min_time, then time rounds.
+
+    Args:
+        case (str): Case name, for the result.
+        size (int): Deck size, for the result.
+        operation (Operation): Zero-argument callable performing one operation.
+        min_time (float): Target duration of one round, in seconds.
+        rounds (int): Number of timed rounds.
+    """
+    timer = time.perf_counter
+    iterations = 1
+    while True:
+        start = timer()
+        for _ in range(iterations):
+            operation()
+        elapsed = timer() - start
+        if elapsed >= min_time or iterations >= 1 << 20:
+            break
+        iterations *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    times = []
+    for _ in range(rounds):
+        start = timer()
+        for _ in range(iterations):
+            operation()
+        times.append((timer() - start) / iterations)
+
+    return BenchResult(
+        case,
+        size,
+        min(times),
+        max(times),
+        statistics.median(times),
+        statistics.fmean(times),
+        statistics.stdev(times) if len(times) > 1 else 0.0,
+        rounds,
+        iterations,
+    )
+
+
+def run_suite(
+    cases: Optional[Iterable[str]] = None,
+    sizes: Optional[Iterable[int]] = None,
+    min_time: float = 0.02,
+    rounds: int = 5,
+    progress: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """
+    Run the benchmark cases over deck sizes.
+
+    Args:
+        cases (Optional[Iterable[str]]): Case names (default: all of CASES).
+        sizes (Optional[Iterable[int]]): Symbols per card (default: every valid size).
+        min_time (float): Target duration of one round, in seconds.
+        rounds (int): Timed rounds per case and size.
+        progress (Optional[Callable[[BenchResult], None]]): Called with each result as it completes.
+    """
+    cases = list(CASES) if cases is None else list(cases)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s) {', '.join(unknown)}; choose from {', '.join(CASES)}")
+
+    results = []
+    for case in cases:
+        for size in VALID_CARD_SIZES if sizes is None else sizes:
+            result = measure(case, size, CASES[case](size), min_time, rounds)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def to_json(results: List[BenchResult]) -> Dict[str, Any]:
+    """The suite's own JSON document for a run."""
+    return {
+        "format": "dobble-bench",
+        "version": FORMAT_VERSION,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "machine_info": machine_info(),
+        "results": [result._asdict() for result in results],
+    }
+
+
+def to_pytest_benchmark_json(results: List[BenchResult]) -> Dict[str, Any]:
+    """
+    A pytest-benchmark style JSON document for a run.
+
+    Entries are named like those of benchmarks/test_benchmarks.py. Each
+    operation is one pytest-benchmark "call", so stats are per operation, as
+    they are in the native format.
+    """
+    benchmarks = []
+    for result in results:
+        benchmarks.append(
+            {
+                "group": result.case,
+                "name": f"test_bench[{result.case}-{result.size}]",
+                "fullname": f"benchmarks/test_benchmarks.py::test_bench[{result.case}-{result.size}]",
+                "params": {"case": result.case, "size": result.size},
+                "param": f"{result.case}-{result.size}",
+                "extra_info": {},
+                "stats": {
+                    "min": result.min,
+                    "max": result.max,
+                    "mean": result.mean,
+                    "stddev": result.stddev,
+                    "median": result.median,
+                    "rounds": result.rounds,
+                    "iterations": result.iterations,
+                    "ops": 1 / result.mean if result.mean else 0.0,
+                    "total": result.mean * result.rounds * result.iterations,
+                },
+            }
+        )
+    return {
+        "machine_info": machine_info(),
+        "commit_info": {},
+        "benchmarks": benchmarks,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "version": "dobble-bench",
+    }
+
+
+def load_results(path: str) -> Dict[str, float]:
+    """
+    Read median seconds per operation, keyed by "case[size]", from either JSON format.
+
+    Raises:
+        ValueError: If the file is not a benchmark result document.
+    """
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("format") == "dobble-bench":
+        return {f"{r['case']}[{r['size']}]": r["median"] for r in document["results"]}
+    if "benchmarks" in document:
+        return {
+            f"{b['params']['case']}[{b['params']['size']}]": b["stats"]["median"]
+            for b in document["benchmarks"]
+        }
+    raise ValueError(f"{path} is not a benchmark result file")
+
+
+class Comparison(NamedTuple):
+    """
+    One benchmark in both runs.
+
+    Attributes:
+        key (str): "case[size]".
+        baseline (float): Baseline median, seconds per operation.
+        current (float): Current median, seconds per operation.
+        ratio (float): current / baseline.
+        regressed (bool): Slower than the baseline by more than the threshold.
+    """
+
+    key: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float], threshold: float = 0.1) -> List[Comparison]:
+    """
+    Compare two runs benchmark by benchmark (those present in both).
+
+    Args:
+        baseline (Dict[str, float]): Baseline medians (see load_results).
+        current (Dict[str, float]): Current medians.
+        threshold (float): Allowed slowdown before a benchmark counts as
+            regressed (0.1 = 10% slower).
+    """
+    comparisons = []
+    for key, base in baseline.items():
+        if key not in current:
+            continue
+        ratio = current[key] / base if base else float("inf")
+        comparisons.append(Comparison(key, base, current[key], ratio, ratio > 1 + threshold))
+    return comparisons
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def print_result(result: BenchResult, file=sys.stdout) -> None:
+    print(f"{result.key:<32} {format_time(result.median):>10}  (min {format_time(result.min)})", file=file)
@@ -1,6 +1,7 @@
 from typing import Dict
 
-VALID_CARD_SIZES = [2, 3, 4, 6, 8, 12, 14, 18, 20, 24, 30, 32, 38, 42, 44, 48, 54, 60]
+# Symbols per card minus one must be a prime power (the order of a finite projective plane).
+VALID_CARD_SIZES = [2, 3, 4, 5, 6, 8, 9, 10, 12, 14, 17, 18, 20, 24, 26, 28, 30, 32, 33, 38, 42, 44, 48, 50, 54, 60]
 DIFFICULTY_LEVELS: Dict[str, int] = {
     "Trivial": 3,
     "Easy": 4,
@@ -0,0 +1,103 @@
+"""
+Vector marks for printing symbols without an emoji font.
+
+Each symbol is drawn as a shape in a colour. There are len(SHAPES) *
+len(COLOURS) such marks; beyond that, marks repeat with a number written in
+them, so every symbol of even the largest deck prints distinctly.
+"""
+import math
+from typing import List, NamedTuple, Sequence, Tuple
+
+from .placement import Placement
+
+Point = Tuple[float, float]
+
+
+def _regular(sides: int, start: float = -90.0) -> Tuple[Point, ...]:
+    """A regular polygon with unit circumradius, first corner at start degrees."""
+    return tuple(
+        (math.cos(math.radians(start + 360 * i / sides)), math.sin(math.radians(start + 360 * i / sides)))
+        for i in range(sides)
+    )
+
+
+def _star(points: int, inner: float) -> Tuple[Point, ...]:
+    outer = _regular(points)
+    inside = _regular(points, -90 + 180 / points)
+    return tuple(
+        corner for pair in zip(outer, inside) for corner in (pair[0], (pair[1][0] * inner, pair[1][1] * inner))
+    )
+
+
+_ARM = 0.35
+# Unit-radius outlines, each closed polygon listed corner by corner.
+SHAPES: Tuple[Tuple[str, Tuple[Point, ...]], ...] = (
+    ("circle", _regular(24)),
+    ("triangle", _regular(3)),
+    ("square", _regular(4, 45)),
+    ("diamond", _regular(4)),
+    ("pentagon", _regular(5)),
+    ("hexagon", _regular(6)),
+    ("star", _star(5, 0.45)),
+    (
+        "cross",
+        (
+            (-_ARM, -0.9), (_ARM, -0.9), (_ARM, -_ARM), (0.9, -_ARM), (0.9, _ARM), (_ARM, _ARM),
+            (_ARM, 0.9), (-_ARM, 0.9), (-_ARM, _ARM), (-0.9, _ARM), (-0.9, -_ARM), (-_ARM, -_ARM),
+        ),
+    ),
+)
+
+# Twelve colours that stay apart in print and for most colour-blind readers.
+COLOURS: Tuple[Tuple[int, int, int], ...] = (
+    (0, 114, 178),
+    (213, 94, 0),
+    (0, 158, 115),
+    (204, 121, 167),
+    (230, 159, 0),
+    (86, 180, 233),
+    (0, 0, 0),
+    (153, 51, 51),
+    (51, 102, 51),
+    (102, 51, 153),
+    (128, 128, 128),
+    (170, 136, 0),
+)
+
+NUM_MARKS = len(SHAPES) * len(COLOURS)
+
+
+class Mark(NamedTuple):
+    """
+    How one symbol is printed.
+
+    Attributes:
+        shape (str): Name of the shape.
+        outline (Tuple[Point, ...]): The shape's corners at unit radius.
+        colour (Tuple[int, int, int]): Fill colour as 0-255 RGB.
+        label (str): Number written in the shape ("" for the first NUM_MARKS symbols).
+    """
+
+    shape: str
+    outline: Tuple[Point, ...]
+    colour: Tuple[int, int, int]
+    label: str
+
+
+def mark_for(symbol: int) -> Mark:
+    """The mark of a symbol: shape varies fastest, then colour, then the label."""
+    band, rest = divmod(symbol, NUM_MARKS)
+    colour, shape = divmod(rest, len(SHAPES))
+    name, outline = SHAPES[shape]
+    return Mark(name, outline, COLOURS[colour], str(band) if band else "")
+
+
+def hex_colour(colour: Sequence[int]) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*colour)
+
+
+def corners(outline: Sequence[Point], placement: Placement) -> List[Point]:
+    """An outline scaled, turned and moved onto a placement, in card units."""
+    turn = math.radians(placement.rotation)
+    cos, sin = math.cos(turn) * placement.radius, math.sin(turn) * placement.radius
+    return [(placement.x + x * cos - y * sin, placement.y + x * sin + y * cos) for x, y in outline]
@@ -0,0 +1,169 @@
+"""
+A minimal streaming PDF writer, and cards as PDF drawing operators.
+
+Pages are compressed and written as soon as they are added; the writer keeps
+only the byte offset of each object written so far, for the cross-reference
+table at the end. Symbols are drawn as vector marks (see glyphs): the PDF's
+standard fonts have no emoji, and embedding a colour emoji font is out of
+reach without a font library.
+"""
+import math
+import zlib
+from array import array
+from typing import BinaryIO, List, Sequence, Tuple
+
+from .glyphs import corners, mark_for
+from .placement import Placement
+
+MM = 72 / 25.4  # Points per millimetre.
+A4 = (210 * MM, 297 * MM)
+# Helvetica's digits are all 556/1000 of the font size wide.
+DIGIT_WIDTH = 0.556
+# Control-point distance for drawing a quarter circle as a cubic Bezier curve.
+_KAPPA = 4 * (math.sqrt(2) - 1) / 3
+
+_CATALOG, _PAGES, _FONT = 1, 2, 3
+
+
+def _num(value: float) -> str:
+    return f"{value:.4f}".rstrip("0").rstrip(".") or "0"
+
+
+def _circle(r: float) -> str:
+    k = r * _KAPPA
+    n = _num
+    return (
+        f"{n(r)} 0 m {n(r)} {n(k)} {n(k)} {n(r)} 0 {n(r)} c "
+        f"{n(-k)} {n(r)} {n(-r)} {n(k)} {n(-r)} 0 c "
+        f"{n(-r)} {n(-k)} {n(-k)} {n(-r)} 0 {n(-r)} c "
+        f"{n(k)} {n(-r)} {n(r)} {n(-k)} {n(r)} 0 c"
+    )
+
+
+def card_content(placements: Sequence[Placement]) -> bytes:
+    """
+    Drawing operators for one card, in card units (the unit circle, y down).
+
+    Callers place the card with a transformation that maps card units onto
+    the page and flips y (see card_transform).
+    """
+    ops: List[str] = ["0 0 0 RG 0.01 w", _circle(0.995), "S"]
+    for placement in placements:
+        mark = mark_for(placement.symbol)
+        path = corners(mark.outline, placement)
+        ops.append("%.3f %.3f %.3f rg" % tuple(c / 255 for c in mark.colour))
+        ops.append("%.4f %.4f m " % path[0] + " ".join(["%.4f %.4f l" % point for point in path[1:]]) + " h f")
+        if mark.label:
+            # Text space is y up: map it onto the turned symbol, undoing the flip.
+            size = placement.radius * 0.7
+            turn = math.radians(placement.rotation)
+            a, b_ = size * math.cos(turn), size * math.sin(turn)
+            u, v = -DIGIT_WIDTH * len(mark.label) / 2, -0.35
+            x = placement.x + a * u + b_ * v
+            y = placement.y + b_ * u - a * v
+            ops.append(
+                "1 1 1 rg BT /F1 1 Tf %.4f %.4f %.4f %.4f %.4f %.4f Tm (%s) Tj ET" % (a, b_, b_, -a, x, y, mark.label)
+            )
+    return "\n".join(ops).encode("ascii")
+
+
+def card_transform(x: float, y: float, diameter: float) -> bytes:
+    """The cm operator placing a card centred at page point (x, y)."""
+    half = diameter / 2
+    return f"{_num(half)} 0 0 {_num(-half)} {_num(x)} {_num(y)} cm".encode("ascii")
+
+
+def card_grid(page_size: Tuple[float, float], diameter: float, margin: float = 10 * MM) -> List[Tuple[float, float]]:
+    """
+    Centres of the cards that fit on a page, top row first.
+
+    Raises:
+        ValueError: If not even one card fits.
+    """
+    width, height = page_size
+    cols = int((width - 2 * margin) // diameter)
+    rows = int((height - 2 * margin) // diameter)
+    if cols < 1 or rows < 1:
+        raise ValueError("Cards are too large for the page")
+    left = (width - cols * diameter) / 2
+    top = height - (height - rows * diameter) / 2
+    return [
+        (left + (c + 0.5) * diameter, top - (r + 0.5) * diameter) for r in range(rows) for c in range(cols)
+    ]
+
+
+class PdfWriter:
+    """
+    Writes a PDF page by page.
+
+    Use as a context manager, or call close() to write the page tree and
+    cross-reference table that finish the file.
+
+    Attributes:
+        file (BinaryIO): Where the PDF is written.
+        page_size (Tuple[float, float]): Width and height of every page, in points.
+    """
+
+    def __init__(self, file: BinaryIO, page_size: Tuple[float, float] = A4):
+        self.file = file
+        self.page_size = page_size
+        self._offsets = array("Q", [0, 0, 0])  # Objects 1-3 are written by close().
+        self._pages = array("I")
+        self._position = 0
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self) -> "PdfWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def num_pages(self) -> int:
+        return len(self._pages)
+
+    def _write(self, data: bytes) -> None:
+        self.file.write(data)
+        self._position += len(data)
+
+    def _object(self, number: int, body: bytes) -> None:
+        self._offsets[number - 1] = self._position
+        self._write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    def _new_object(self, body: bytes) -> int:
+        self._offsets.append(0)
+        number = len(self._offsets)
+        self._object(number, body)
+        return number
+
+    def add_page(self, content: bytes) -> None:
+        """Write one page from its drawing operators."""
+        data = zlib.compress(content)
+        stream = self._new_object(
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(data) + data + b"\nendstream"
+        )
+        self._pages.append(
+            self._new_object(b"<< /Type /Page /Parent %d 0 R /Contents %d 0 R >>" % (_PAGES, stream))
+        )
+
+    def close(self) -> None:
+        """Finish the file (the file itself is left open)."""
+        if self._offsets[_CATALOG - 1]:
+            return
+        width, height = self.page_size
+        self._object(_FONT, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>")
+        kids = b" ".join(b"%d 0 R" % page for page in self._pages)
+        self._object(
+            _PAGES,
+            b"<< /Type /Pages /Count %d /Kids [%s] /MediaBox [0 0 %s %s] /Resources << /Font << /F1 %d 0 R >> >> >>"
+            % (len(self._pages), kids, _num(width).encode(), _num(height).encode(), _FONT),
+        )
+        self._object(_CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % _PAGES)
+        xref = self._position
+        lines = [b"xref", b"0 %d" % (len(self._offsets) + 1), b"0000000000 65535 f "]
+        lines.extend(b"%010d 00000 n " % offset for offset in self._offsets)
+        self._write(b"\n".join(lines) + b"\n")
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(self._offsets) + 1, _CATALOG, xref)
+        )
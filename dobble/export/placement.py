@@ -0,0 +1,105 @@
+"""
+Where each symbol goes on a printed card.
+
+Printed cards are round, with symbols of different sizes turned every which
+way. Placement starts from the card's symbol layout: each grid cell becomes a
+point in the card, scaled so that discs of half the smallest spacing between
+points fit inside the card without touching. Each symbol then gets a random
+size, offset and rotation within its own disc, so no two symbols can overlap
+however the dice fall.
+
+Coordinates are in card units: the card is the unit circle centred on the
+origin, with y pointing down (as in SVG).
+"""
+import math
+import random
+from functools import lru_cache
+from typing import List, NamedTuple, Sequence, Tuple
+
+from ..game.layout import CardLayout
+
+# Band inside the card's edge kept clear of symbols.
+MARGIN = 0.06
+# Each symbol's radius, as a fraction of the disc it may move in.
+SIZE_RANGE = (0.6, 0.95)
+
+
+class Placement(NamedTuple):
+    """
+    One symbol on a printed card.
+
+    Attributes:
+        symbol (int): The symbol.
+        x (float): Centre, in card units.
+        y (float): Centre, in card units (down is positive).
+        radius (float): Radius of the circle the symbol is drawn in.
+        rotation (float): Clockwise turn in degrees.
+    """
+
+    symbol: int
+    x: float
+    y: float
+    radius: float
+    rotation: float
+
+
+@lru_cache(maxsize=64)
+def _lattice(rows: int, cols: int, cells: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[Tuple[float, float], ...], float]:
+    """
+    Card positions of the occupied cells of a grid, and the radius each may use.
+
+    Every card of a deck usually shares its grid shape, so this is worked out
+    once per shape.
+    """
+    points = [((c + 0.5) / cols - 0.5, (r + 0.5) / rows - 0.5) for r, c in cells]
+    spacing = 1.0
+    for i, (x1, y1) in enumerate(points):
+        for x2, y2 in points[i + 1:]:
+            spacing = min(spacing, math.hypot(x2 - x1, y2 - y1))
+    farthest = max(math.hypot(x, y) for x, y in points)
+    # Scale so the farthest point's disc just touches the margin.
+    scale = (1 - MARGIN) / (farthest + spacing / 2)
+    return tuple((x * scale, y * scale) for x, y in points), spacing * scale / 2
+
+
+def place_symbols(layout: CardLayout, index: int, seed: int = 0) -> List[Placement]:
+    """
+    Place one card's symbols at random without overlaps.
+
+    The placement depends only on (seed, index) and the layout, so a deck
+    exports identically however it is split between processes.
+
+    Args:
+        layout (CardLayout): The card's symbol layout.
+        index (int): The card's row in its deck.
+        seed (int): Seed mixed with the index.
+
+    Returns:
+        List[Placement]: One placement per symbol, in layout order.
+    """
+    cells = [(r, c, symbol) for r, row in enumerate(layout.grid) for c, symbol in enumerate(row) if symbol is not None]
+    if not cells:
+        return []
+    points, free = _lattice(layout.rows, layout.cols, tuple((r, c) for r, c, _ in cells))
+    rng = random.Random(hash((seed, index)))
+    low, high = SIZE_RANGE
+    placements = []
+    for (_, _, symbol), (x, y) in zip(cells, points):
+        radius = free * rng.uniform(low, high)
+        angle = rng.uniform(0, 2 * math.pi)
+        offset = (free - radius) * math.sqrt(rng.random())
+        placements.append(
+            Placement(symbol, x + offset * math.cos(angle), y + offset * math.sin(angle), radius, rng.uniform(0, 360))
+        )
+    return placements
+
+
+def overlaps(placements: Sequence[Placement]) -> bool:
+    """Whether any two symbols' circles intersect, or any leaves the card."""
+    for i, a in enumerate(placements):
+        if math.hypot(a.x, a.y) + a.radius > 1:
+            return True
+        for b in placements[i + 1:]:
+            if math.hypot(a.x - b.x, a.y - b.y) < a.radius + b.radius:
+                return True
+    return False
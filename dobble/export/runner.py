@@ -0,0 +1,197 @@
+"""
+Exporting whole decks: cards are drawn in a process pool and written in order.
+
+Chunks of cards are scheduled with a bounded number in flight and collected
+in deck order, so output is written as it is drawn and memory stays flat
+however large the deck. Every card's drawing depends only on the options and
+its index, so the files are identical for any worker count or chunk size.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Deque, Iterator, List, NamedTuple, Optional, Union
+
+from ..game.deck import Deck
+from ..game.layout import make_layout
+from ..game.plane import is_valid_card_size
+from ..game.registry import get_deck
+from .pdf import A4, MM, PdfWriter, card_content, card_grid, card_transform
+from .placement import place_symbols
+from .svg import card_svg
+
+FORMATS = ("svg", "pdf")
+GLYPHS = ("emoji", "shapes")
+
+
+class ExportOptions(NamedTuple):
+    """
+    What to export.
+
+    Attributes:
+        symbols_per_card (int): Deck order.
+        glyphs (str): "emoji" or "shapes" (see dobble.export.glyphs); PDF
+            export draws shapes only.
+        layout (str): Symbol layout the placement starts from (see LAYOUTS).
+        seed (int): Seed of the placement, rotations and emoji order.
+        card_mm (float): Printed card diameter.
+    """
+
+    symbols_per_card: int
+    glyphs: str = "shapes"
+    layout: str = "square"
+    seed: int = 0
+    card_mm: float = 80.0
+
+
+@lru_cache(maxsize=8)
+def _deck(symbols_per_card: int, layout: str, seed: int) -> Deck:
+    options = {"seed": seed} if layout == "rotated" else {}
+    return get_deck(symbols_per_card).with_layout(make_layout(layout, **options))
+
+
+@lru_cache(maxsize=8)
+def _emojis(seed: int):
+    from ..utils.emoji_loader import EmojiMap
+
+    return EmojiMap(seed)
+
+
+def check_options(options: ExportOptions, fmt: str) -> None:
+    """Raise ValueError if options cannot be exported in a format."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; choose from {', '.join(FORMATS)}")
+    if options.glyphs not in GLYPHS:
+        raise ValueError(f"Unknown glyphs {options.glyphs!r}; choose from {', '.join(GLYPHS)}")
+    if not is_valid_card_size(options.symbols_per_card):
+        raise ValueError(
+            f"Invalid card size {options.symbols_per_card}: symbols per card minus one must be a prime power"
+        )
+    if options.card_mm <= 0:
+        raise ValueError("Cards need a positive size")
+    make_layout(options.layout)
+    if options.glyphs == "emoji":
+        if fmt == "pdf":
+            raise ValueError("PDF export draws symbols as shapes; use SVG for emoji")
+        num_symbols = options.symbols_per_card ** 2 - options.symbols_per_card + 1
+        if num_symbols > len(_emojis(options.seed)):
+            raise ValueError(
+                f"A {options.symbols_per_card}-symbol deck has {num_symbols} symbols but there are only "
+                f"{len(_emojis(options.seed))} emojis; use shapes"
+            )
+
+
+def render_cards(options: ExportOptions, fmt: str, start: int, count: int) -> List[bytes]:
+    """
+    Draw cards start..start+count-1: SVG documents, or PDF drawing operators.
+
+    Runs in the worker processes; the deck comes from each process's registry.
+    """
+    deck = _deck(options.symbols_per_card, options.layout, options.seed)
+    emojis = _emojis(options.seed) if options.glyphs == "emoji" else None
+    rendered = []
+    for index in range(start, start + count):
+        placements = place_symbols(deck.card_layout(index), index, options.seed)
+        if fmt == "svg":
+            rendered.append(card_svg(placements, options.card_mm, emojis).encode("utf-8"))
+        else:
+            rendered.append(card_content(placements))
+    return rendered
+
+
+def iter_cards(
+    options: ExportOptions, fmt: str, workers: Optional[int] = None, chunk_size: int = 64
+) -> Iterator[bytes]:
+    """
+    Draw every card of the deck, yielding them in deck order as they are ready.
+
+    Args:
+        options (ExportOptions): What to draw.
+        fmt (str): "svg" or "pdf" (see render_cards).
+        workers (Optional[int]): Worker processes (default: all cores). With 1,
+            cards are drawn in this process.
+        chunk_size (int): Cards per scheduled task.
+    """
+    check_options(options, fmt)
+    k = options.symbols_per_card
+    num_cards = k * k - k + 1
+    chunks = ((start, min(chunk_size, num_cards - start)) for start in range(0, num_cards, chunk_size))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start, count in chunks:
+            yield from render_cards(options, fmt, start, count)
+        return
+
+    from ..game.cache import build_cache
+
+    # Workers map the deck from the cache rather than each generating it.
+    build_cache([k], verify=False)
+    max_in_flight = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for start, count in chunks:
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(render_cards, options, fmt, start, count))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def export_deck(
+    options: ExportOptions,
+    path: Union[str, os.PathLike],
+    fmt: str = "pdf",
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Export every card of a deck.
+
+    SVG export writes one file per card (card-01.svg, ..., numbered to the
+    width of the deck size) into the directory path; PDF export writes one
+    file with as many cards to a page as fit on A4.
+
+    Args:
+        options (ExportOptions): What to export.
+        path: Output directory (SVG) or file (PDF).
+        fmt (str): "svg" or "pdf".
+        workers (Optional[int]): Worker processes (default: all cores).
+        chunk_size (int): Cards per scheduled task.
+        progress (Optional[Callable[[int], None]]): Called with the number of
+            cards written so far, after each one.
+
+    Returns:
+        int: Number of cards written.
+    """
+    check_options(options, fmt)
+    path = Path(path)
+    cards = iter_cards(options, fmt, workers, chunk_size)
+    written = 0
+    if fmt == "svg":
+        path.mkdir(parents=True, exist_ok=True)
+        k = options.symbols_per_card
+        digits = len(str(k * k - k + 1))
+        for written, svg in enumerate(cards, 1):
+            (path / f"card-{written:0{digits}d}.svg").write_bytes(svg)
+            if progress is not None:
+                progress(written)
+        return written
+
+    diameter = options.card_mm * MM
+    slots = card_grid(A4, diameter)
+    with open(path, "wb") as f, PdfWriter(f, A4) as pdf:
+        page: List[bytes] = []
+        for written, content in enumerate(cards, 1):
+            x, y = slots[len(page)]
+            page.append(b"q " + card_transform(x, y, diameter) + b"\n" + content + b"\nQ")
+            if len(page) == len(slots):
+                pdf.add_page(b"\n".join(page))
+                page = []
+            if progress is not None:
+                progress(written)
+        if page:
+            pdf.add_page(b"\n".join(page))
+    return written
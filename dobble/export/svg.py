@@ -0,0 +1,65 @@
+"""
+Cards as standalone SVG documents.
+
+A card's viewBox is its unit circle, so the drawing scales to any printed size.
+"""
+from typing import Mapping, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from .glyphs import corners, hex_colour, mark_for
+from .placement import Placement
+
+FONT_FAMILY = "Helvetica, Arial, sans-serif"
+# Emoji glyphs fill about a font-size square; this fits one inside a placement's circle.
+EMOJI_SCALE = 1.4
+
+
+def _text(x: float, y: float, size: float, rotation: float, text: str, extra: str = "") -> str:
+    return (
+        f'<text x="{x:.4f}" y="{y:.4f}" font-size="{size:.4f}" text-anchor="middle" '
+        f'dominant-baseline="central" transform="rotate({rotation:.1f} {x:.4f} {y:.4f})"{extra}>'
+        f"{escape(text)}</text>"
+    )
+
+
+def card_svg(
+    placements: Sequence[Placement], size_mm: float = 80.0, emojis: Optional[Mapping[int, str]] = None
+) -> str:
+    """
+    Draw one card.
+
+    Args:
+        placements (Sequence[Placement]): The card's symbols (see place_symbols).
+        size_mm (float): Printed diameter of the card.
+        emojis (Optional[Mapping[int, str]]): Draw symbols as these emojis;
+            if None, as shapes (see glyphs.mark_for).
+
+    Returns:
+        str: The SVG document.
+    """
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size_mm:g}mm" height="{size_mm:g}mm" '
+        f'viewBox="-1 -1 2 2" font-family="{FONT_FAMILY}">',
+        '<circle r="0.995" fill="white" stroke="black" stroke-width="0.01"/>',
+    ]
+    for placement in placements:
+        if emojis is not None:
+            parts.append(
+                _text(
+                    placement.x, placement.y, placement.radius * EMOJI_SCALE, placement.rotation,
+                    emojis[placement.symbol],
+                )
+            )
+            continue
+        mark = mark_for(placement.symbol)
+        points = " ".join(f"{x:.4f},{y:.4f}" for x, y in corners(mark.outline, placement))
+        parts.append(f'<polygon points="{points}" fill="{hex_colour(mark.colour)}"/>')
+        if mark.label:
+            parts.append(
+                _text(
+                    placement.x, placement.y, placement.radius * 0.7, placement.rotation, mark.label,
+                    ' fill="white" font-weight="bold"',
+                )
+            )
+    parts.append("</svg>\n")
+    return "\n".join(parts)
@@ -0,0 +1,232 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from .deck import Deck
+from .plane import ProjectivePlane
+
+# Bump GENERATOR_VERSION whenever the card/symbol numbering of ProjectivePlane changes,
+# and FORMAT_VERSION whenever the file layout below changes.
+GENERATOR_VERSION = 1
+FORMAT_VERSION = 1
+
+MAGIC = b"DOBLDECK"
+# magic, format version, generator version, byte order, typecode,
+# symbols_per_card, num_cards, payload crc32, payload length
+_HEADER = struct.Struct("<8sHHcc2xIIIQ")
+# Payload starts on a 64-byte boundary so the mapped array is aligned.
+HEADER_SIZE = 64
+# Array typecodes decks are stored in (see deck._typecode_for).
+_TYPECODES = (b"H", b"I", b"Q")
+
+PathLike = Union[str, os.PathLike]
+
+
+class DeckCacheError(ValueError):
+    """Raised when a cached deck file is unreadable, stale or corrupt."""
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory holding cached decks.
+
+    Uses $DOBBLE_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/pydobble or
+    ~/.cache/pydobble.
+    """
+    if os.environ.get("DOBBLE_CACHE_DIR"):
+        return Path(os.environ["DOBBLE_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pydobble"
+
+
+def deck_path(symbols_per_card: int, cache_dir: Optional[PathLike] = None) -> Path:
+    """Path of the cache file for a deck order (and the current generator version)."""
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return directory / f"deck-{symbols_per_card}-g{GENERATOR_VERSION}.bin"
+
+
+def save_deck(deck: Deck, cache_dir: Optional[PathLike] = None) -> Path:
+    """
+    Write a deck to the cache atomically.
+
+    The file is written to a temporary name in the cache directory, fsynced
+    and then renamed over the final path, so readers only ever see complete
+    files.
+
+    Returns:
+        Path: The path written.
+    """
+    if deck.data is None or deck.plane is None:
+        raise ValueError("Only fully generated projective-plane decks can be cached")
+
+    path = deck_path(deck.symbols_per_card, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = deck.data.cast("B")
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        GENERATOR_VERSION,
+        b"<" if sys.byteorder == "little" else b">",
+        deck.data.format.encode(),
+        deck.symbols_per_card,
+        deck.num_cards,
+        zlib.crc32(payload),
+        payload.nbytes,
+    ).ljust(HEADER_SIZE, b"\0")
+
+    import tempfile  # Only needed when writing; keeps `import dobble.game` light.
+
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def load_deck(
+    symbols_per_card: int, cache_dir: Optional[PathLike] = None, verify: bool = True
+) -> Optional[Deck]:
+    """
+    Load a cached deck by memory-mapping its file.
+
+    The deck's array is a read-only view straight onto the mapped pages, so
+    loading copies nothing and every process mapping the same file shares its
+    memory.
+
+    Args:
+        symbols_per_card (int): Order of the deck to load.
+        cache_dir: Cache directory (defaults to default_cache_dir()).
+        verify (bool): Check the payload checksum before returning.
+
+    Returns:
+        Optional[Deck]: The deck, or None if it is not cached.
+
+    Raises:
+        DeckCacheError: If the file exists but is corrupt or was written by
+            an incompatible version.
+    """
+    path = deck_path(symbols_per_card, cache_dir)
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+
+    with f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # Empty file
+            raise DeckCacheError(f"{path}: {e}") from None
+
+    view = memoryview(mapped)
+
+    def fail(problem: str) -> DeckCacheError:
+        # Unmap the file before reporting it; nothing else holds the mapping yet.
+        view.release()
+        mapped.close()
+        return DeckCacheError(f"{path}: {problem}")
+
+    if len(view) < HEADER_SIZE:
+        raise fail("truncated header")
+
+    magic, fmt, gen, order, typecode, k, num_cards, crc, length = _HEADER.unpack_from(view)
+    expected_order = b"<" if sys.byteorder == "little" else b">"
+    if magic != MAGIC:
+        raise fail("not a deck cache file")
+    if fmt != FORMAT_VERSION or gen != GENERATOR_VERSION:
+        raise fail("written by an incompatible version")
+    if order != expected_order:
+        raise fail("written on a machine with a different byte order")
+    if k != symbols_per_card:
+        raise fail(f"holds a {k}-symbol deck, expected {symbols_per_card}")
+    if typecode not in _TYPECODES:
+        raise fail(f"unknown array typecode {typecode!r}")
+
+    plane = ProjectivePlane(symbols_per_card - 1)
+    if num_cards != plane.num_lines or length != num_cards * k * struct.calcsize(typecode.decode()):
+        raise fail("unexpected deck dimensions")
+    if len(view) != HEADER_SIZE + length:
+        raise fail("truncated payload")
+    if verify:
+        with view[HEADER_SIZE:] as payload:
+            intact = zlib.crc32(payload) == crc
+        if not intact:
+            raise fail("checksum mismatch")
+    return Deck(view[HEADER_SIZE:].cast(typecode.decode()), k, num_cards=num_cards, plane=plane)
+
+
+def load_or_build(
+    symbols_per_card: int, cache_dir: Optional[PathLike] = None, write: bool = True
+) -> Deck:
+    """
+    Load a deck from the cache, generating (and, if write is set, caching) it on a miss.
+
+    Corrupt or stale cache files are treated as misses and overwritten.
+    """
+    try:
+        deck = load_deck(symbols_per_card, cache_dir)
+    except DeckCacheError:
+        deck = None
+    if deck is not None:
+        return deck
+
+    deck = Deck.generate(symbols_per_card)
+    if write:
+        save_deck(deck, cache_dir)
+    return deck
+
+
+def build_cache(
+    sizes: Iterable[int], cache_dir: Optional[PathLike] = None, force: bool = False, verify: bool = True
+) -> List[Path]:
+    """
+    Prebuild cache files for every given deck order.
+
+    Existing valid files are kept unless force is set. With verify set, every
+    deck (kept or newly built) is checked with verify_deck first, so a bad
+    generator never leaves a deck in the cache.
+
+    Returns:
+        List[Path]: The cache file for each size.
+
+    Raises:
+        ValueError: If a deck has cards that do not share exactly one symbol.
+    """
+    paths = []
+    for size in sizes:
+        deck = None
+        if not force:
+            try:
+                deck = load_deck(size, cache_dir)
+            except DeckCacheError:
+                pass
+        built = deck is None
+        if built:
+            deck = Deck.generate(size)
+        if verify:
+            _check_deck(deck)
+        paths.append(save_deck(deck, cache_dir) if built else deck_path(size, cache_dir))
+    return paths
+
+
+def _check_deck(deck: Deck) -> None:
+    from .verify import verify_deck
+
+    result = verify_deck(deck, max_violations=3)
+    if not result.ok:
+        pairs = ", ".join(f"cards {v.card1} and {v.card2} share {v.overlap}" for v in result.violations)
+        raise ValueError(f"Invalid {deck.symbols_per_card}-symbol deck: {pairs}")
@@ -1,10 +1,10 @@
-from dataclasses import dataclass
-from typing import List, Set, Tuple, Optional
-import math
-from ..utils.emoji_loader import EMOJI_MAP
+from typing import Iterable, List, Sequence, Set, Tuple, Optional
+
+from . import deck as _deck
+from .layout import CardLayout
+from ..utils.alphabet import ALPHABET
 
 
-@dataclass
 class DobbleCard:
     """
     Represents a game card.
@@ -12,42 +12,91 @@ class DobbleCard:
     Each card contains a set of symbols with exactly one symbol that matches
     any other given card. Symbols are represented by integers.
 
+    A card is a lightweight view onto one row of a Deck. Cards built directly
+    from a set of symbols get a private single-card deck.
+
     Attributes:
         symbols (Set[int]): Set of integer symbols on the card.
     """
 
-    symbols: Set[int]
+    __slots__ = ("_deck", "_index")
+
+    def __init__(self, symbols: Iterable[int]):
+        self._deck = _deck.Deck.from_rows([symbols])
+        self._index = 0
+
+    @classmethod
+    def _view(cls, deck: "_deck.Deck", index: int) -> "DobbleCard":
+        """Create a card viewing row index of deck, without copying."""
+        card = cls.__new__(cls)
+        card._deck = deck
+        card._index = index
+        return card
+
+    @property
+    def deck(self) -> "_deck.Deck":
+        """The deck this card is a view onto."""
+        return self._deck
+
+    @property
+    def index(self) -> int:
+        """The card's row in its deck."""
+        return self._index
+
+    @property
+    def symbols(self) -> Set[int]:
+        """The card's symbols, as a new set."""
+        return set(self._deck.row(self._index))
+
+    @property
+    def sorted_symbols(self) -> Sequence[int]:
+        """The card's symbols in ascending order, as a zero-copy view."""
+        return self._deck.row(self._index)
+
+    @property
+    def layout(self) -> CardLayout:
+        """Where the card's symbols sit on screen (computed once per card by its deck)."""
+        return self._deck.card_layout(self._index)
+
+    @property
+    def mask(self) -> int:
+        """The card's symbols as a bitmask (bit s set when the card carries symbol s)."""
+        return self._deck.mask(self._index)
+
+    def has_symbol(self, symbol: int) -> bool:
+        """Check whether the card carries the given symbol."""
+        return self._deck.contains(self._index, symbol)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DobbleCard):
+            return NotImplemented
+        if self._deck is other._deck and self._index == other._index:
+            return True
+        return self.sorted_symbols == other.sorted_symbols
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.sorted_symbols))
+
+    def __repr__(self) -> str:
+        return f"DobbleCard(symbols={self.symbols!r})"
 
     def __str__(self) -> str:
-        emoji_symbols = [EMOJI_MAP[s % len(EMOJI_MAP)] for s in sorted(self.symbols)]
-        return f"Card({', '.join(emoji_symbols)})"
+        text = ALPHABET.text
+        return f"Card({', '.join(text(s) for s in self.sorted_symbols)})"
 
     def get_symbol_grid(self) -> List[List[Tuple[Optional[int], str]]]:
         """
         Convert the card's symbols into a grid layout for display.
 
+        The grid follows the card's cached layout (see the layout property).
+
         Returns:
             List[List[Tuple[int, str]]]: A 2D grid where each cell contains
-            a tuple of (symbol_number, emoji_character). Empty cells contain (None, " ").
+            a tuple of (symbol_number, symbol_text) (see dobble.utils.alphabet).
+            Empty cells contain (None, " ").
         """
-        symbols = sorted(self.symbols)
-        size = math.ceil(math.sqrt(len(symbols)))
-        grid = []
-        idx = 0
-
-        for i in range(size):
-            row = []
-            for j in range(size):
-                if idx < len(symbols):
-                    symbol = symbols[idx]
-                    emoji = EMOJI_MAP[symbol % len(EMOJI_MAP)]
-                    row.append((symbol, emoji))
-                else:
-                    row.append((None, " "))
-                idx += 1
-            grid.append(row)
-
-        return grid
+        text = ALPHABET.text
+        return [[(None, " ") if s is None else (s, text(s)) for s in row] for row in self.layout.grid]
 
     def get_matching_symbol(self, other: "DobbleCard") -> Optional[Tuple[int, str]]:
         """
@@ -57,14 +106,17 @@ class DobbleCard:
             other (DobbleCard): The other card to compare with.
 
         Returns:
-            Tuple[int, str]: A tuple of (symbol_number, emoji_character) if a match is found,
+            Tuple[int, str]: A tuple of (symbol_number, symbol_text) if a match is found,
             None otherwise.
         """
-        matching_symbols = self.symbols & other.symbols
-        if not matching_symbols:
+        if self._deck is other._deck:
+            matching_num = self._deck.match(self._index, other._index)
+        else:
+            common = self.mask & other.mask
+            matching_num = (common & -common).bit_length() - 1 if common else None
+        if matching_num is None:
             return None
-        matching_num = next(iter(matching_symbols))
-        return matching_num, EMOJI_MAP[matching_num % len(EMOJI_MAP)]
+        return matching_num, ALPHABET.text(matching_num)
 
     def has_symbol_at_coordinate(self, coordinate: str) -> Optional[int]:
         """
@@ -76,10 +128,4 @@ class DobbleCard:
         Returns:
             Optional[int]: The symbol at that coordinate, if any.
         """
-        try:
-            col = ord(coordinate[0].upper()) - ord("A")
-            row = int(coordinate[1:]) - 1
-            grid = self.get_symbol_grid()
-            return grid[row][col][0] if 0 <= row < len(grid) and 0 <= col < len(grid[0]) else None
-        except (IndexError, ValueError):
-            return None
+        return self.layout.symbol_at_coordinate(coordinate)
@@ -0,0 +1,418 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+import copy
+from itertools import accumulate
+import sys
+import threading
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from . import card as _card
+from .layout import CardLayout, Layout, SquareLayout
+from .plane import ProjectivePlane
+
+# Card layouts kept per deck; a game only ever looks at a few cards at a time.
+LAYOUT_CACHE_SIZE = 1024
+
+
+def _typecode_for(max_value: int) -> str:
+    """Smallest unsigned array typecode that can hold values up to max_value."""
+    if max_value <= 0xFFFF:
+        return "H"
+    if max_value <= 0xFFFFFFFF:
+        return "I"
+    return "Q"
+
+
+class SymbolIndex(NamedTuple):
+    """
+    Which cards carry each symbol, in compressed sparse row (CSR) form.
+
+    This is the transpose of the deck's own layout (cards to symbols): the
+    cards carrying symbol s are cards[offsets[s]:offsets[s + 1]], in
+    ascending order. It takes one integer per symbol on every card, plus
+    one per symbol.
+
+    Attributes:
+        offsets (array): num_symbols + 1 running totals of symbol frequencies.
+        cards (array): Card indices grouped by symbol.
+    """
+
+    offsets: array
+    cards: array
+
+    @classmethod
+    def build(cls, deck: "Deck") -> "SymbolIndex":
+        """
+        Build the index of a deck with a counting sort over its rows.
+
+        With NumPy, a stable argsort of the symbol array does the same in C.
+        """
+        num_symbols = deck.num_symbols
+        total = deck.num_cards * deck.symbols_per_card
+        offsets = array(_typecode_for(total))
+        cards = array(_typecode_for(max(deck.num_cards - 1, 0)))
+
+        try:
+            import numpy as np  # Not at module level: importing the game must not load NumPy.
+        except ImportError:  # pragma: no cover
+            np = None
+        if np is not None and deck.data is not None and total:
+            values = np.frombuffer(deck.data, dtype=deck.data.format)
+            counts = np.bincount(values, minlength=num_symbols)
+            offsets.frombytes(np.concatenate(([0], np.cumsum(counts))).astype(offsets.typecode).tobytes())
+            order = np.argsort(values, kind="stable") // deck.symbols_per_card
+            cards.frombytes(order.astype(cards.typecode).tobytes())
+            return cls(offsets, cards)
+
+        counts = [0] * (num_symbols + 1)
+        for i in range(deck.num_cards):
+            for symbol in deck.row(i):
+                counts[symbol + 1] += 1
+        offsets.extend(accumulate(counts))
+        cards.extend([0] * total)
+        cursor = list(offsets)
+        for i in range(deck.num_cards):
+            for symbol in deck.row(i):
+                cards[cursor[symbol]] = i
+                cursor[symbol] += 1
+        return cls(offsets, cards)
+
+    def cards_with(self, symbol: int) -> Sequence[int]:
+        """The cards carrying symbol, in ascending order, as a zero-copy view."""
+        if not 0 <= symbol < len(self.offsets) - 1:
+            return ()
+        return memoryview(self.cards)[self.offsets[symbol]:self.offsets[symbol + 1]]
+
+    def frequency(self, symbol: int) -> int:
+        """Number of cards carrying symbol."""
+        if not 0 <= symbol < len(self.offsets) - 1:
+            return 0
+        return self.offsets[symbol + 1] - self.offsets[symbol]
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.itemsize * len(self.offsets) + self.cards.itemsize * len(self.cards)
+
+
+class Deck:
+    """
+    A read-only deck of cards stored as one contiguous integer array.
+
+    Row i of the (num_cards, symbols_per_card) array holds the sorted symbols
+    of card i. Cards handed out by the deck are lightweight views onto a row,
+    so a deck costs a few bytes per symbol instead of one Python set per card.
+
+    Attributes:
+        symbols_per_card (int): Number of symbols on each card.
+        num_cards (int): Number of cards in the deck.
+        num_symbols (int): Size of the symbol universe (largest symbol + 1).
+        plane (Optional[ProjectivePlane]): The plane the deck was built from, if any.
+        layout (Layout): How cards are arranged on screen (see card_layout).
+    """
+
+    def __init__(
+        self,
+        data: Union[array, memoryview],
+        symbols_per_card: int,
+        num_cards: Optional[int] = None,
+        plane: Optional[ProjectivePlane] = None,
+    ):
+        self._data = memoryview(data).toreadonly()
+        self.symbols_per_card = symbols_per_card
+        if num_cards is None:
+            num_cards = len(self._data) // symbols_per_card
+        if len(self._data) != num_cards * symbols_per_card:
+            raise ValueError("Deck data does not match num_cards * symbols_per_card")
+        self.num_cards = num_cards
+        self.plane = plane
+        if plane is not None:
+            self.num_symbols = plane.num_points
+        else:
+            self.num_symbols = max(self._data, default=-1) + 1
+        self._incidence: Optional[bytes] = None
+        self._symbol_index: Optional[SymbolIndex] = None
+        self._reset_layouts(SquareLayout())
+
+    def _reset_layouts(self, layout: Layout) -> None:
+        self.layout = layout
+        self._layouts: "OrderedDict[int, CardLayout]" = OrderedDict()
+        # Decks are shared between games (see DeckRegistry), possibly in several threads.
+        self._layouts_lock = threading.Lock()
+
+    @classmethod
+    def generate(cls, symbols_per_card: int) -> "Deck":
+        """Build the full projective-plane deck with the given number of symbols per card."""
+        plane = ProjectivePlane(symbols_per_card - 1)
+        return cls(plane.incidence_rows(), symbols_per_card, plane=plane)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[int]]) -> "Deck":
+        """Build a deck from arbitrary rows of symbols (each row is sorted and de-duplicated)."""
+        rows = [sorted(set(row)) for row in rows]
+        widths = {len(row) for row in rows}
+        if len(widths) > 1:
+            raise ValueError("All cards in a deck must have the same number of symbols")
+
+        flat = [symbol for row in rows for symbol in row]
+        if flat and min(flat) < 0:
+            raise ValueError("Symbols must be non-negative integers")
+        data = array(_typecode_for(max(flat, default=0)), flat)
+        return cls(data, widths.pop() if widths else 0, num_cards=len(rows))
+
+    def __len__(self) -> int:
+        return self.num_cards
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["_card.DobbleCard", List["_card.DobbleCard"]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.num_cards))]
+        if index < 0:
+            index += self.num_cards
+        if not 0 <= index < self.num_cards:
+            raise IndexError("Deck index out of range")
+        return _card.DobbleCard._view(self, index)
+
+    def __iter__(self) -> Iterator["_card.DobbleCard"]:
+        view = _card.DobbleCard._view
+        return (view(self, i) for i in range(self.num_cards))
+
+    def __repr__(self) -> str:
+        return f"Deck(num_cards={self.num_cards}, symbols_per_card={self.symbols_per_card})"
+
+    @property
+    def data(self) -> Optional[memoryview]:
+        """The flat, read-only symbol array (None for decks that compute rows on demand)."""
+        return self._data
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the symbol array (and the incidence bitmap and symbol index, if built)."""
+        return self._data.nbytes + self._derived_nbytes()
+
+    def _derived_nbytes(self) -> int:
+        incidence = len(self._incidence) if self._incidence is not None else 0
+        return incidence + (self._symbol_index.nbytes if self._symbol_index is not None else 0)
+
+    def row(self, index: int) -> Sequence[int]:
+        """Return the sorted symbols of a card as a zero-copy view."""
+        k = self.symbols_per_card
+        return self._data[index * k:(index + 1) * k]
+
+    def card_layout(self, index: int) -> CardLayout:
+        """Return the on-screen layout of card index, computing it on first use."""
+        layouts = self._layouts
+        with self._layouts_lock:
+            layout = layouts.get(index)
+            if layout is not None:
+                layouts.move_to_end(index)
+                return layout
+
+        layout = self.layout.arrange(self.row(index), index)
+        with self._layouts_lock:
+            layouts[index] = layout
+            if len(layouts) > LAYOUT_CACHE_SIZE:
+                layouts.popitem(last=False)
+        return layout
+
+    def with_layout(self, layout: Layout) -> "Deck":
+        """
+        Return a deck sharing this deck's cards but arranging them with another layout.
+
+        The symbol data is shared, not copied, so this is cheap for any deck size.
+        """
+        deck = copy.copy(self)
+        deck._reset_layouts(layout)
+        return deck
+
+    def contains(self, index: int, symbol: int) -> bool:
+        """Check whether card index carries the given symbol."""
+        row = self.row(index)
+        pos = bisect_left(row, symbol)
+        return pos < len(row) and row[pos] == symbol
+
+    def match(self, card1: int, card2: int) -> Optional[int]:
+        """
+        Return the symbol shared by two cards, given their indices.
+
+        For decks built from a projective plane this is computed in O(1) from the
+        cards' line equations, without touching their symbols. A card matches
+        itself on every symbol; its smallest symbol is returned in that case.
+
+        Returns:
+            Optional[int]: The shared symbol, or None if the cards share none.
+        """
+        if card1 == card2:
+            row = self.row(card1)
+            return row[0] if len(row) else None
+        if self.plane is not None:
+            return self.plane.intersection(card1, card2)
+        common = set(self.row(card1)).intersection(self.row(card2))
+        return min(common) if common else None
+
+    def mask(self, index: int) -> int:
+        """Return card index as a bitmask over the symbol universe (bit s set when it carries s)."""
+        mask = 0
+        for symbol in self.row(index):
+            mask |= 1 << symbol
+        return mask
+
+    def match_many(self, pairs: Iterable[Tuple[int, int]]) -> List[Optional[int]]:
+        """Return the shared symbol for every (card1, card2) pair of indices."""
+        match = self.match
+        if self.plane is not None:
+            intersection = self.plane.intersection
+            return [intersection(a, b) if a != b else match(a, b) for a, b in pairs]
+        return [match(a, b) for a, b in pairs]
+
+    def incidence(self) -> bytes:
+        """
+        Return the packed card-by-symbol incidence bitmap, building it on first use.
+
+        Card i occupies bytes [i * stride, (i + 1) * stride) where
+        stride = ceil(num_symbols / 8); bit s of that range is set when card i
+        carries symbol s.
+        """
+        if self._incidence is None:
+            stride = self.incidence_stride
+            bitmap = bytearray(self.num_cards * stride)
+            row = self.row
+            for i in range(self.num_cards):
+                offset = i * stride
+                for symbol in row(i):
+                    bitmap[offset + (symbol >> 3)] |= 1 << (symbol & 7)
+            self._incidence = bytes(bitmap)
+        return self._incidence
+
+    @property
+    def incidence_stride(self) -> int:
+        """Bytes per card in the incidence bitmap."""
+        return (self.num_symbols + 7) // 8
+
+    def symbol_index(self) -> SymbolIndex:
+        """Return the index from symbols to the cards carrying them, building it on first use."""
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex.build(self)
+        return self._symbol_index
+
+    def cards_with(self, symbol: int) -> Sequence[int]:
+        """The indices of the cards carrying symbol, in ascending order."""
+        return self.symbol_index().cards_with(symbol)
+
+    def symbol_frequency(self, symbol: int) -> int:
+        """Number of cards in the deck carrying symbol."""
+        if self.plane is not None:
+            # Every point of a plane lies on order + 1 lines.
+            return self.symbols_per_card if 0 <= symbol < self.num_symbols else 0
+        return self.symbol_index().frequency(symbol)
+
+
+class BitsetDeck(Deck):
+    """
+    A deck that also keeps every card as a Python integer bitmask over the symbols.
+
+    The symbol array is shared with the deck it was built from; the masks add
+    about num_symbols / 8 bytes per card. Matching two cards is then one AND
+    and a lowest-set-bit extraction, and checking for a symbol is one bit
+    test, for any deck (not only those with a plane). Cards are the same
+    DobbleCard views as for any other deck.
+    """
+
+    def __init__(self, deck: Deck):
+        if deck.data is None:
+            raise ValueError("The bitset encoding needs a fully generated deck")
+        super().__init__(deck.data, deck.symbols_per_card, num_cards=deck.num_cards, plane=deck.plane)
+        self._reset_layouts(deck.layout)
+        stride = self.incidence_stride
+        bitmap = self.incidence()
+        self._masks = [
+            int.from_bytes(bitmap[i * stride:(i + 1) * stride], "little") for i in range(self.num_cards)
+        ]
+
+    def __repr__(self) -> str:
+        return f"BitsetDeck(num_cards={self.num_cards}, symbols_per_card={self.symbols_per_card})"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the symbol array, the incidence bitmap and the masks."""
+        return super().nbytes + sum(sys.getsizeof(mask) for mask in self._masks)
+
+    def mask(self, index: int) -> int:
+        return self._masks[index]
+
+    def contains(self, index: int, symbol: int) -> bool:
+        return symbol >= 0 and (self._masks[index] >> symbol) & 1 == 1
+
+    def match(self, card1: int, card2: int) -> Optional[int]:
+        # A card matched with itself keeps all its bits; the lowest is its smallest symbol.
+        common = self._masks[card1] & self._masks[card2]
+        return (common & -common).bit_length() - 1 if common else None
+
+    def match_many(self, pairs: Iterable[Tuple[int, int]]) -> List[Optional[int]]:
+        masks = self._masks
+        result: List[Optional[int]] = []
+        for a, b in pairs:
+            common = masks[a] & masks[b]
+            result.append((common & -common).bit_length() - 1 if common else None)
+        return result
+
+
+class LazyDeck(Deck):
+    """
+    A projective-plane deck whose cards are computed from their index on demand.
+
+    Nothing proportional to the deck size is built up front: card i is derived
+    from its line equation on first access and kept in a bounded LRU cache.
+    This makes decks of very large orders practical, since a game only ever
+    looks at a handful of cards at a time.
+
+    Attributes:
+        cache_size (int): Maximum number of materialised rows kept (0 disables caching).
+    """
+
+    def __init__(self, symbols_per_card: int, cache_size: int = 256):
+        self.symbols_per_card = symbols_per_card
+        self.plane = ProjectivePlane(symbols_per_card - 1)
+        self.num_cards = self.plane.num_lines
+        self.num_symbols = self.plane.num_points
+        self.cache_size = cache_size
+        self._data = None
+        self._incidence = None
+        self._symbol_index = None
+        self._rows: "OrderedDict[int, memoryview]" = OrderedDict()
+        self._rows_lock = threading.Lock()
+        self._reset_layouts(SquareLayout())
+
+    def __repr__(self) -> str:
+        return f"LazyDeck(num_cards={self.num_cards}, symbols_per_card={self.symbols_per_card})"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the cached rows (and the incidence bitmap and symbol index, if built)."""
+        with self._rows_lock:
+            rows = list(self._rows.values())
+        return sum(row.nbytes for row in rows) + self._derived_nbytes()
+
+    def cards_with(self, symbol: int) -> Sequence[int]:
+        """The cards carrying symbol, computed from the plane in O(order) (no index is built)."""
+        if self._symbol_index is not None:
+            return self._symbol_index.cards_with(symbol)
+        if not 0 <= symbol < self.num_symbols:
+            return ()
+        return self.plane.point_lines(symbol)
+
+    def row(self, index: int) -> Sequence[int]:
+        """Return the sorted symbols of a card, computing them if not cached."""
+        rows = self._rows
+        with self._rows_lock:
+            row = rows.get(index)
+            if row is not None:
+                rows.move_to_end(index)
+                return row
+
+        row = memoryview(self.plane.line_points(index))
+        if self.cache_size > 0:
+            with self._rows_lock:
+                rows[index] = row
+                if len(rows) > self.cache_size:
+                    rows.popitem(last=False)
+        return row
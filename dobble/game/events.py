@@ -0,0 +1,598 @@
+"""
+An append-only binary log of game events, and replay from it.
+
+A log starts with a header (MAGIC, then the wall-clock start time in
+microseconds) followed by records:
+
+    varint length | kind byte | varint game | varint time delta | payload
+
+All integers are unsigned LEB128 varints, so card and symbol indices of
+small decks take one byte. The time delta is in microseconds of the
+monotonic clock since the previous record. Payloads by kind:
+
+    deal      symbols_per_card, players, (name length, UTF-8 name) per
+              player, cards, the dealt order (live card last, as in
+              DobbleGame.setup_game)
+    guess     symbol, player + 1 (0 when nobody in particular called it)
+    match     symbol, count, matching players
+    win       player, card played to the centre
+    snapshot  seq, absolute time, symbols_per_card, players, names as for
+              deal, live card, then per player: count, cards top first
+
+One log can hold any number of games, interleaved (e.g. every table of a
+server); each record carries the number of the game it belongs to. Every
+snapshot_every events of a game a snapshot of its whole state is written,
+so replay can start from the nearest snapshot instead of the deal.
+"""
+import os
+import time
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from weakref import WeakValueDictionary
+
+from .deck import Deck
+from .game import DobbleGame
+from .player import Player
+from .registry import get_deck
+from .stack import CardStack
+
+MAGIC = b"DOBBLOG\x01"
+
+DEAL, GUESS, MATCH, WIN, SNAPSHOT = range(5)
+KINDS = ("deal", "guess", "match", "win", "snapshot")
+
+DEFAULT_SNAPSHOT_EVERY = 1000
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def _put_varint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append(value & 0x7F | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _varints(values: Sequence[int]) -> bytearray:
+    """Encode values as consecutive varints."""
+    buf = bytearray()
+    for value in values:
+        if value < 0x80:
+            buf.append(value)
+        else:
+            _put_varint(buf, value)
+    return buf
+
+
+def _get_varint(data, pos: int) -> Tuple[int, int]:
+    """Decode the varint at data[pos:]; returns (value, next pos). IndexError if incomplete."""
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+class Deal(NamedTuple):
+    """Cards dealt for a new game (cards is the dealt order, live card last)."""
+
+    symbols_per_card: int
+    names: Tuple[str, ...]
+    cards: Tuple[int, ...]
+
+
+class Guess(NamedTuple):
+    """A symbol was called, by player (None when not attributed to anyone)."""
+
+    symbol: int
+    player: Optional[int]
+
+
+class Match(NamedTuple):
+    """Players whose top cards carry a called symbol."""
+
+    symbol: int
+    players: Tuple[int, ...]
+
+
+class Win(NamedTuple):
+    """Player played card, their top card, to the centre."""
+
+    player: int
+    card: int
+
+
+class Snapshot(NamedTuple):
+    """A game's whole state, after every event before seq."""
+
+    symbols_per_card: int
+    names: Tuple[str, ...]
+    live: int
+    stacks: Tuple[Tuple[int, ...], ...]
+
+
+class Event(NamedTuple):
+    """
+    One record of a log.
+
+    Attributes:
+        seq (int): Position among the log's events (snapshots are not
+            counted: a snapshot's seq is that of the next event).
+        game (int): Number of the game the event belongs to, from 0.
+        time (float): Seconds since the log was started.
+        kind (str): One of KINDS.
+        data: A Deal, Guess, Match, Win or Snapshot.
+    """
+
+    seq: int
+    game: int
+    time: float
+    kind: str
+    data: Union[Deal, Guess, Match, Win, Snapshot]
+
+
+class EventWriter:
+    """
+    Writes an event log.
+
+    Records are encoded into a buffer that is written out in bulk once it
+    holds buffer_size bytes (and on flush and close), so logging a turn
+    costs a few list appends rather than a system call.
+
+    A game is logged by passing it to deal, which returns the game's number
+    in the log; DobbleGame does this itself when it has a log (see its log
+    argument). The writer keeps a weak reference to each game it logs, to
+    snapshot it every snapshot_every events.
+
+    Attributes:
+        events (int): Events written so far.
+        games (int): Games started so far.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, BinaryIO],
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """
+        Start a log.
+
+        Args:
+            file: A path (created or truncated) or a binary file open for writing.
+            snapshot_every (int): Events of a game between snapshots of it.
+            buffer_size (int): Bytes buffered before writing to the file.
+        """
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be positive")
+        self._owns_file = not hasattr(file, "write")
+        self._file: BinaryIO = open(file, "wb") if self._owns_file else file
+        self.snapshot_every = snapshot_every
+        self.buffer_size = buffer_size
+        self.events = 0
+        self.games = 0
+        self._buffer = bytearray(MAGIC)
+        _put_varint(self._buffer, time.time_ns() // 1000)
+        self._start = time.monotonic_ns()
+        self._last = 0
+        self._live: "WeakValueDictionary[int, DobbleGame]" = WeakValueDictionary()
+        self._since_snapshot: Dict[int, int] = {}
+
+    def __enter__(self) -> "EventWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _record(self, kind: int, game: int, values: Sequence[int] = (), payload: bytes = b"") -> None:
+        """Append a record whose payload is values (as varints) followed by payload."""
+        now = (time.monotonic_ns() - self._start) // 1000
+        record = _varints((kind, game, now - self._last, *values)) + payload
+        self._last = now
+        buf = self._buffer
+        if len(record) < 0x80:
+            buf.append(len(record))
+        else:
+            _put_varint(buf, len(record))
+        buf += record
+        if len(buf) >= self.buffer_size:
+            self.flush()
+
+    def _event(self, kind: int, game: int, values: Sequence[int] = (), payload: bytes = b"") -> None:
+        self._record(kind, game, values, payload)
+        self.events += 1
+        since = self._since_snapshot.get(game)
+        if since is None:
+            return
+        if since + 1 >= self.snapshot_every:
+            self.snapshot(game)
+        else:
+            self._since_snapshot[game] = since + 1
+
+    @staticmethod
+    def _put_names(payload: bytearray, names: Sequence[str]) -> None:
+        _put_varint(payload, len(names))
+        for name in names:
+            encoded = name.encode()
+            _put_varint(payload, len(encoded))
+            payload += encoded
+
+    def deal(self, game: DobbleGame, order: Sequence[int]) -> int:
+        """
+        Log the deal of a new game and return its number.
+
+        Args:
+            game (DobbleGame): The game, just dealt.
+            order (Sequence[int]): The card indices dealt to the players (the
+                live card, game.live_card, is logged after them).
+        """
+        number = self.games
+        self.games += 1
+        payload = bytearray()
+        _put_varint(payload, game.symbols_per_card)
+        self._put_names(payload, [player.name for player in game.players])
+        _put_varint(payload, len(order) + 1)
+        for card in order:
+            _put_varint(payload, card)
+        _put_varint(payload, game.live_card.index)
+        self._live[number] = game
+        self._since_snapshot[number] = 0
+        self._event(DEAL, number, payload=payload)
+        return number
+
+    def guess(self, game: int, symbol: int, player: Optional[int] = None) -> None:
+        """Log a call of symbol in game, by player if known."""
+        self._event(GUESS, game, (symbol, 0 if player is None else player + 1))
+
+    def match(self, game: int, symbol: int, players: Sequence[int]) -> None:
+        """Log which players' top cards carry a called symbol."""
+        self._event(MATCH, game, (symbol, len(players), *players))
+
+    def win(self, game: int, player: int, card: int) -> None:
+        """Log that player played card (their top card) to the centre."""
+        self._event(WIN, game, (player, card))
+        live = self._live.get(game)
+        if live is not None and live.is_over:
+            self.forget(game)
+
+    def snapshot(self, game: int) -> None:
+        """Write a snapshot of a game's current state (a no-op for games no longer tracked)."""
+        live = self._live.get(game)
+        if live is None:
+            return
+        payload = bytearray()
+        _put_varint(payload, self.events)
+        _put_varint(payload, (time.monotonic_ns() - self._start) // 1000)
+        _put_varint(payload, live.symbols_per_card)
+        self._put_names(payload, [player.name for player in live.players])
+        _put_varint(payload, live.live_card.index)
+        for player in live.players:
+            indices = player.cards.indices
+            _put_varint(payload, len(indices))
+            for card in indices:
+                _put_varint(payload, card)
+        self._record(SNAPSHOT, game, payload=payload)
+        self._since_snapshot[game] = 0
+
+    def forget(self, game: int) -> None:
+        """Stop snapshotting a game (done automatically when it is won)."""
+        self._live.pop(game, None)
+        self._since_snapshot.pop(game, None)
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush, and close the file if the writer opened it."""
+        if self._file.closed:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def _decode(kind: int, data: bytes, pos: int):
+    """Decode a payload; returns (payload tuple, snapshot seq and time or None)."""
+    get = _get_varint
+    if kind == GUESS:
+        symbol, pos = get(data, pos)
+        player, pos = get(data, pos)
+        return Guess(symbol, player - 1 if player else None), None
+    if kind == WIN:
+        player, pos = get(data, pos)
+        card, pos = get(data, pos)
+        return Win(player, card), None
+    if kind == MATCH:
+        symbol, pos = get(data, pos)
+        count, pos = get(data, pos)
+        players = []
+        for _ in range(count):
+            player, pos = get(data, pos)
+            players.append(player)
+        return Match(symbol, tuple(players)), None
+
+    header = None
+    if kind == SNAPSHOT:
+        seq, pos = get(data, pos)
+        micros, pos = get(data, pos)
+        header = (seq, micros)
+    symbols_per_card, pos = get(data, pos)
+    num_players, pos = get(data, pos)
+    names = []
+    for _ in range(num_players):
+        length, pos = get(data, pos)
+        names.append(data[pos:pos + length].decode())
+        pos += length
+
+    def cards(count: int) -> Tuple[int, ...]:
+        nonlocal pos
+        values = []
+        for _ in range(count):
+            value, pos = get(data, pos)
+            values.append(value)
+        return tuple(values)
+
+    if kind == DEAL:
+        count, pos = get(data, pos)
+        return Deal(symbols_per_card, tuple(names), cards(count)), None
+    if kind == SNAPSHOT:
+        live, pos = get(data, pos)
+        stacks = []
+        for _ in range(num_players):
+            count, pos = get(data, pos)
+            stacks.append(cards(count))
+        return Snapshot(symbols_per_card, tuple(names), live, tuple(stacks)), header
+    raise ValueError(f"Unknown event kind {kind}")
+
+
+class EventReader:
+    """
+    Reads an event log as a stream.
+
+    The file is read in chunks of chunk_size bytes and decoded one record
+    at a time, so memory use does not depend on the length of the log. A
+    record cut short at the end of the file (e.g. by a crash while
+    writing) ends the stream.
+
+    Attributes:
+        started_at (float): Wall-clock time the log was started (seconds
+            since the epoch).
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], chunk_size: int = DEFAULT_BUFFER_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        with open(path, "rb") as f:
+            head = f.read(len(MAGIC) + 10)
+        if not head.startswith(MAGIC):
+            raise ValueError(f"{path} is not a dobble event log")
+        try:
+            micros, self._data_offset = _get_varint(head, len(MAGIC))
+        except IndexError:
+            raise ValueError(f"{path} is not a dobble event log") from None
+        self.started_at = micros / 1e6
+
+    def records(self, offset: Optional[int] = None) -> Iterator[Tuple[int, int, int, int, bytes, int]]:
+        """
+        Iterate raw records from a file offset (default: the first record).
+
+        Yields:
+            (offset, kind, game, time delta in microseconds, record, payload
+            start) for each record.
+        """
+        get = _get_varint
+        with open(self.path, "rb") as f:
+            base = self._data_offset if offset is None else offset
+            f.seek(base)
+            buf = b""
+            pos = 0
+            while True:
+                try:
+                    length, start = get(buf, pos)
+                    end = start + length
+                    if end > len(buf):
+                        raise IndexError
+                except IndexError:
+                    more = f.read(max(self.chunk_size, 2 * (len(buf) - pos)))
+                    if not more:
+                        return
+                    base += pos
+                    buf = buf[pos:] + more
+                    pos = 0
+                    continue
+                kind = buf[start]
+                game, p = get(buf, start + 1)
+                delta, p = get(buf, p)
+                yield base + pos, kind, game, delta, buf, p
+                pos = end
+
+    def __iter__(self) -> Iterator[Event]:
+        return self.events()
+
+    def events(self, snapshots: bool = False) -> Iterator[Event]:
+        """Iterate decoded events in order; with snapshots, snapshot records too."""
+        return self._events(None, 0, 0, snapshots)
+
+    def _events(self, offset: Optional[int], seq: int, micros: int, snapshots: bool) -> Iterator[Event]:
+        kinds = KINDS
+        for _, kind, game, delta, buf, pos in self.records(offset):
+            micros += delta
+            if kind == SNAPSHOT and not snapshots:
+                continue
+            data, header = _decode(kind, buf, pos)
+            if header is not None:
+                yield Event(header[0], game, header[1] / 1e6, kinds[kind], data)
+                continue
+            yield Event(seq, game, micros / 1e6, kinds[kind], data)
+            seq += 1
+
+
+def read_events(path: Union[str, os.PathLike], snapshots: bool = False) -> Iterator[Event]:
+    """Stream the events of a log (see EventReader)."""
+    return EventReader(path).events(snapshots)
+
+
+class _GameIndex:
+    """
+    Where a game's records are, and its last event.
+
+    starts holds (seq, offset, micros, record seq) for the deal and each
+    snapshot: the state they hold is that before event seq, and reading
+    resumes at offset with the clock at micros and the event counter at
+    record seq.
+    """
+
+    __slots__ = ("starts", "last_seq")
+
+    def __init__(self):
+        self.starts: List[Tuple[int, int, int, int]] = []
+        self.last_seq = -1
+
+
+class Replay:
+    """
+    Rebuilds the state of any game in a log at any point.
+
+    One pass over the log (on first use) records where each game was dealt
+    and snapshotted: a few integers per snapshot, not per event. A game is
+    then rebuilt by seeking to its last snapshot before the requested
+    point and applying the events after it, so the work per query is
+    bounded by snapshot_every events of that game (plus the interleaved
+    events of other games).
+
+    Attributes:
+        reader (EventReader): The log.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], deck_for: Optional[Callable[[int], Deck]] = None):
+        """
+        Args:
+            path: The log.
+            deck_for (Optional[Callable[[int], Deck]]): Returns the deck for a
+                number of symbols per card (default: the shared registry's).
+        """
+        self.reader = EventReader(path)
+        self._deck_for = deck_for
+        self._decks: Dict[int, Deck] = {}
+        self._index: Optional[Dict[int, _GameIndex]] = None
+
+    def _deck(self, symbols_per_card: int) -> Deck:
+        deck = self._decks.get(symbols_per_card)
+        if deck is None:
+            if self._deck_for is not None:
+                deck = self._deck_for(symbols_per_card)
+            else:
+                deck = get_deck(symbols_per_card)
+            self._decks[symbols_per_card] = deck
+        return deck
+
+    @property
+    def index(self) -> Dict[int, _GameIndex]:
+        if self._index is None:
+            index: Dict[int, _GameIndex] = {}
+            seq = micros = 0
+            for offset, kind, game, delta, buf, pos in self.reader.records():
+                before = micros
+                micros += delta
+                if kind == DEAL:
+                    index[game] = _GameIndex()
+                entry = index.get(game)
+                if entry is None:
+                    raise ValueError(f"Record at offset {offset} belongs to game {game}, which was never dealt")
+                if kind == SNAPSHOT:
+                    snap_seq, _ = _get_varint(buf, pos)
+                    entry.starts.append((snap_seq, offset, before, snap_seq))
+                    continue
+                if kind == DEAL:
+                    entry.starts.append((seq + 1, offset, before, seq))
+                entry.last_seq = seq
+                seq += 1
+            self._index = index
+        return self._index
+
+    @property
+    def games(self) -> int:
+        """Number of games in the log."""
+        return len(self.index)
+
+    def _restore(self, data: Union[Deal, Snapshot]) -> DobbleGame:
+        game = DobbleGame(data.symbols_per_card, deck=self._deck(data.symbols_per_card))
+        if isinstance(data, Deal):
+            game.deal(list(data.names), data.cards)
+        else:
+            game.restore(
+                [Player(name, CardStack(game.cards, stack)) for name, stack in zip(data.names, data.stacks)],
+                data.live,
+            )
+        return game
+
+    def game_at(self, game: int, seq: Optional[int] = None) -> DobbleGame:
+        """
+        Rebuild a game as it was before event seq (default: after all its events).
+
+        Args:
+            game (int): Game number.
+            seq (Optional[int]): Log position; events of the game from seq
+                on are not applied.
+
+        Returns:
+            DobbleGame: The rebuilt game.
+        """
+        entry = self.index.get(game)
+        if entry is None:
+            raise ValueError(f"No game {game} in the log")
+        if seq is None:
+            seq = entry.last_seq + 1
+        candidates = [start for start in entry.starts if start[0] <= seq]
+        if not candidates:
+            raise ValueError(f"Game {game} had not been dealt before event {seq}")
+        _, offset, micros, record_seq = candidates[-1]
+
+        state = None
+        for event in self.reader._events(offset, record_seq, micros, snapshots=True):
+            if state is None:
+                state = self._restore(event.data)
+                continue
+            if event.seq >= seq or event.seq > entry.last_seq:
+                break
+            if event.game == game and event.kind == "win":
+                self._apply_win(state, event)
+        return state
+
+    @staticmethod
+    def _apply_win(state: DobbleGame, event: Event) -> None:
+        player, card = event.data
+        if state.players[player].cards.top_index != card:
+            raise ValueError(f"Event {event.seq} does not match the replayed game")
+        state.play_winning_card(player)
+
+    def states(self) -> Iterator[Tuple[Event, DobbleGame]]:
+        """
+        Replay the whole log in one streaming pass.
+
+        Yields:
+            (event, game): Each event with the state of its game after it.
+            Games are kept only while they are being played.
+        """
+        live: Dict[int, DobbleGame] = {}
+        for event in self.reader.events():
+            if event.kind == "deal":
+                state = live[event.game] = self._restore(event.data)
+            else:
+                state = live.get(event.game)
+                if state is None:
+                    raise ValueError(f"Event {event.seq} belongs to game {event.game}, which is not in play")
+                if event.kind == "win":
+                    self._apply_win(state, event)
+            yield event, state
+            if state.is_over:
+                del live[event.game]
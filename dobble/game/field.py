@@ -0,0 +1,156 @@
+from typing import List, Optional, Tuple
+
+
+def prime_power(n: int) -> Optional[Tuple[int, int]]:
+    """
+    Decompose n as p**k for a prime p.
+
+    Args:
+        n (int): The number to decompose.
+
+    Returns:
+        Optional[Tuple[int, int]]: (p, k) if n is a prime power, None otherwise.
+    """
+    if n < 2:
+        return None
+
+    p = 2
+    while p * p <= n and n % p:
+        p += 1
+    if n % p:
+        p = n
+
+    k = 0
+    while n % p == 0:
+        n //= p
+        k += 1
+    return (p, k) if n == 1 else None
+
+
+class GaloisField:
+    """
+    Arithmetic in the finite field GF(p^k).
+
+    Elements are the integers 0..order-1; the base-p digits of an element are
+    the coefficients of its polynomial representation. All operations are
+    precomputed into lookup tables so that callers can do batched table
+    lookups (e.g. with operator.itemgetter) instead of arithmetic.
+
+    Attributes:
+        order (int): Number of elements in the field.
+        characteristic (int): The prime p.
+        degree (int): The exponent k.
+        add (List[Tuple[int, ...]]): add[a][b] == a + b.
+        mul (List[Tuple[int, ...]]): mul[a][b] == a * b.
+        neg (Tuple[int, ...]): neg[a] == -a.
+        inv (Tuple[int, ...]): inv[a] == 1 / a (inv[0] is 0 by convention).
+    """
+
+    def __init__(self, order: int):
+        decomposition = prime_power(order)
+        if decomposition is None:
+            raise ValueError(f"Field order must be a prime power, got {order}")
+
+        self.order = order
+        self.characteristic, self.degree = decomposition
+
+        if self.degree == 1:
+            self._build_prime_tables()
+        else:
+            self._build_extension_tables()
+
+    def __repr__(self) -> str:
+        return f"GaloisField({self.order})"
+
+    def sub(self, a: int, b: int) -> int:
+        """Return a - b."""
+        return self.add[a][self.neg[b]]
+
+    def div(self, a: int, b: int) -> int:
+        """Return a / b."""
+        if b == 0:
+            raise ZeroDivisionError(f"division by zero in GF({self.order})")
+        return self.mul[a][self.inv[b]]
+
+    def _build_prime_tables(self) -> None:
+        q = self.order
+        self.add = [tuple((a + b) % q for b in range(q)) for a in range(q)]
+        self.mul = [tuple((a * b) % q for b in range(q)) for a in range(q)]
+        self.neg = tuple((-a) % q for a in range(q))
+        self.inv = (0,) + tuple(pow(a, q - 2, q) for a in range(1, q))
+
+    def _build_extension_tables(self) -> None:
+        p, k, q = self.characteristic, self.degree, self.order
+        digits = [self._to_digits(a) for a in range(q)]
+
+        if p == 2:
+            self.add = [tuple(a ^ b for b in range(q)) for a in range(q)]
+            self.neg = tuple(range(q))
+        else:
+            self.add = [
+                tuple(self._from_digits([(x + y) % p for x, y in zip(digits[a], digits[b])]) for b in range(q))
+                for a in range(q)
+            ]
+            self.neg = tuple(self._from_digits([(-x) % p for x in digits[a]]) for a in range(q))
+
+        exp = self._primitive_powers()
+        log = [0] * q
+        for i, element in enumerate(exp):
+            log[element] = i
+
+        n = q - 1
+        zero_row = (0,) * q
+        self.mul = [zero_row] + [
+            (0,) + tuple(exp[(log[a] + log[b]) % n] for b in range(1, q)) for a in range(1, q)
+        ]
+        self.inv = (0,) + tuple(exp[(n - log[a]) % n] for a in range(1, q))
+
+    def _primitive_powers(self) -> List[int]:
+        """
+        Find a primitive polynomial f of degree k and return the successive
+        powers x^0, x^1, ..., x^(q-2) of its root x, reduced modulo f.
+
+        If x has multiplicative order q - 1 modulo f, then f is primitive (and
+        therefore irreducible), so the search needs no separate factorisation.
+        """
+        p, k, q = self.characteristic, self.degree, self.order
+
+        for tail in range(1, q):
+            # f(x) = x^k + tail(x); tail must have a non-zero constant term.
+            f = self._to_digits(tail)
+            if f[0] == 0:
+                continue
+
+            powers = []
+            current = [1] + [0] * (k - 1)
+            seen_one = False
+            for _ in range(q - 1):
+                value = self._from_digits(current)
+                if value == 1 and powers:
+                    seen_one = True
+                    break
+                powers.append(value)
+                # Multiply by x, then reduce x^k = -tail(x).
+                lead = current[-1]
+                current = [0] + current[:-1]
+                if lead:
+                    current = [(c - lead * t) % p for c, t in zip(current, f)]
+
+            if not seen_one and self._from_digits(current) == 1:
+                return powers
+
+        raise ValueError(f"No primitive polynomial found for GF({q})")  # pragma: no cover
+
+    def _to_digits(self, a: int) -> List[int]:
+        p = self.characteristic
+        out = []
+        for _ in range(self.degree):
+            a, r = divmod(a, p)
+            out.append(r)
+        return out
+
+    def _from_digits(self, digits: List[int]) -> int:
+        value = 0
+        for d in reversed(digits):
+            value = value * self.characteristic + d
+        return value
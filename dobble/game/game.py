@@ -1,9 +1,21 @@
-from typing import List, Tuple, Optional
+from array import array
+from collections import defaultdict
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import random
 
 from .card import DobbleCard
+from .deck import BitsetDeck, Deck
+from .layout import Layout
+from .plane import is_valid_card_size
 from .player import Player
-from ..config import VALID_CARD_SIZES
+from .registry import DeckRegistry, default_registry
+from .stack import CardStack, LazyPermutation
+
+if TYPE_CHECKING:
+    from .events import EventWriter
+
+ENCODINGS = ("array", "bitset")
 
 
 class DobbleGame:
@@ -14,59 +26,269 @@ class DobbleGame:
 
     Attributes:
         symbols_per_card (int): Number of symbols on each card.
-        cards (List[DobbleCard]): All cards in the game.
+        lazy (bool): Whether cards are computed on demand rather than generated up front.
+        encoding (str): How cards are stored ("array" or "bitset").
+        cards (Deck): All cards in the game.
         live_card (DobbleCard): The current central card.
         players (List[Player]): List of players in the game.
+        log (Optional[EventWriter]): Where the game's events are recorded, if anywhere.
+        log_game (Optional[int]): The current game's number in the log.
     """
 
-    def __init__(self, symbols_per_card: int):
-        """Initialise a new Dobble game."""
+    def __init__(
+        self,
+        symbols_per_card: int,
+        lazy: bool = False,
+        deck: Optional[Deck] = None,
+        layout: Optional[Layout] = None,
+        encoding: str = "array",
+        log: Optional["EventWriter"] = None,
+        registry: Optional[DeckRegistry] = None,
+    ):
+        """
+        Initialise a new Dobble game.
+
+        Args:
+            symbols_per_card (int): Number of symbols on each card.
+            lazy (bool): Compute each card from its index on first access instead
+                of generating the whole deck, and deal from a permutation
+                computed as cards are drawn. Use this for very large orders.
+            deck (Optional[Deck]): An existing deck of the right order to play with.
+                Decks are read-only, so many games can share one.
+            layout (Optional[Layout]): How to arrange symbols on screen. Defaults
+                to the deck's own layout (a square grid).
+            encoding (str): How cards are stored: "array" (sorted symbol rows)
+                or "bitset" (rows plus an integer bitmask per card, for
+                popcount-style matching; not available with lazy).
+            log (Optional[EventWriter]): Record deals, calls, matches and cards
+                played to this event log (see dobble.game.events).
+            registry (Optional[DeckRegistry]): Where to get the shared deck when
+                none is given (default: the process-wide registry).
+        """
+
+        if not is_valid_card_size(symbols_per_card):
+            raise ValueError(
+                f"Invalid number of symbols per card: {symbols_per_card} "
+                "(symbols per card minus one must be a prime power)"
+            )
+
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding {encoding!r}; choose from {', '.join(ENCODINGS)}")
+        if encoding == "bitset" and lazy:
+            raise ValueError("Lazy decks only support the array encoding")
 
         self.symbols_per_card = symbols_per_card
-        self.cards = self._generate_cards()
+        self.lazy = lazy
+        self.encoding = encoding
+        if deck is not None and deck.symbols_per_card != symbols_per_card:
+            raise ValueError("Deck does not have the requested number of symbols per card")
+        self.cards = deck if deck is not None else self._generate_cards(registry)
+        if encoding == "bitset" and not isinstance(self.cards, BitsetDeck):
+            self.cards = BitsetDeck(self.cards)
+        if layout is not None:
+            self.cards = self.cards.with_layout(layout)
+        self.log = log
+        self.log_game: Optional[int] = None
         self.live_card: Optional[DobbleCard] = None
-        self.players: List[Player] = []
+        self._players: List[Player] = []
+        self._players_out: Set[int] = set()
+        # Inverted index: symbol -> players whose top card carries it.
+        self._symbol_players: Dict[int, Set[int]] = {}
+        self._top_symbols: List[Sequence[int]] = []
+        # Cards no longer in play (undealt, or played over in the centre), and
+        # how many of them carry each symbol.
+        self._out_of_play: Set[int] = set()
+        self._symbols_out_of_play: Dict[int, int] = defaultdict(int)
 
-    def _generate_cards(self) -> List[DobbleCard]:
+    def _generate_cards(self, registry: Optional[DeckRegistry] = None) -> Deck:
         """
         Generate a complete set of Dobble cards ensuring each pair of cards shares exactly one symbol.
 
+        Cards are the lines of the projective plane over GF(symbols_per_card - 1),
+        so any order that is a prime power is supported. A deck prebuilt with
+        `dobble cache build` is memory-mapped instead of being regenerated, and
+        games of the same order share one deck through the registry.
+
         Returns:
-            List[DobbleCard]: The generated set of cards.
-        """
-        n = self.symbols_per_card - 1
-        cards = (
-            [[i + n**2 for i in range(n + 1)]]
-            + [[(o + i * n) for i in range(n)] + [n + n**2] for o in range(n)]
-            + [
-                [(o * n + i * (p * n + 1)) % (n**2) for i in range(n)] + [p + n**2]
-                for p in range(n)
-                for o in range(n)
-            ]
-        )
-        return [DobbleCard(set(card)) for card in cards]
+            Deck: The generated set of cards.
+        """
+        if registry is None:
+            registry = default_registry()
+        if self.lazy:
+            return registry.get(self.symbols_per_card, "lazy")
+        return registry.get(self.symbols_per_card, "bitset" if self.encoding == "bitset" else "plane")
+
+    def setup_game(self, player_names: List[str], rng: Optional[random.Random] = None) -> None:
+        """
+        Set up the game by creating players and dealing cards to them.
 
-    def setup_game(self, player_names: List[str]) -> None:
-        """Set up the game by creating players and dealing cards to them."""
+        Dealing shuffles one permutation of card indices (see deal). A lazy
+        game deals from a LazyPermutation instead, so setting up costs the
+        same whatever the size of the deck.
+
+        Args:
+            player_names (List[str]): Names of the players, in seating order.
+            rng (Optional[random.Random]): Source of randomness for the shuffle,
+                for reproducible deals. Defaults to the random module.
+        """
 
         if not player_names:
             raise ValueError("Must provide at least one player name")
 
-        shuffled = self.cards.copy()
-        random.shuffle(shuffled)
+        if self.lazy:
+            self._deal(player_names, LazyPermutation(len(self.cards), rng))
+            return
+        shuffled = array("I", range(len(self.cards)))
+        (rng or random).shuffle(shuffled)
+        self._deal(player_names, shuffled)
 
-        self.live_card = shuffled.pop()
-        cards_per_player = len(shuffled) // len(player_names)
+    def deal(self, player_names: List[str], order: Sequence[int]) -> None:
+        """
+        Deal the cards in a given order.
 
-        self.players = [
-            Player(name=name, cards=shuffled[i * cards_per_player:(i + 1) * cards_per_player])
-            for i, name in enumerate(player_names)
-        ]
+        The last card of order goes to the centre and the rest are split
+        evenly between the players, in seating order; each player's pile is
+        a CardStack window onto one shared copy of order.
+
+        Args:
+            player_names (List[str]): Names of the players, in seating order.
+            order (Sequence[int]): Card indices (a permutation of the deck, or part of one).
+        """
+        if not player_names:
+            raise ValueError("Must provide at least one player name")
+        self._deal(player_names, array("I", order))
+
+    def _deal(self, player_names: List[str], dealt: Sequence[int]) -> None:
+        """As deal, taking ownership of dealt (an array or a LazyPermutation)."""
+        num_dealt = len(dealt) - 1
+        live = dealt[num_dealt]
+        cards_per_player = num_dealt // len(player_names)
+        in_hands = cards_per_player * len(player_names)
+        full_deck = len(dealt) == len(self.cards)
+        self.restore(
+            [
+                Player(
+                    name=name,
+                    cards=CardStack(self.cards, dealt, i * cards_per_player, (i + 1) * cards_per_player),
+                )
+                for i, name in enumerate(player_names)
+            ],
+            live,
+            # A full permutation leaves only its tail undealt; otherwise restore works it out.
+            out_of_play=dealt[in_hands:num_dealt] if full_deck else None,
+        )
+        if self.log is not None:
+            self.log_game = self.log.deal(self, dealt[:in_hands])
+
+    def restore(self, players: List[Player], live: int, out_of_play: Optional[Iterable[int]] = None) -> None:
+        """
+        Put the game in a given state (e.g. one saved in an event log).
+
+        Assigning players does the same, keeping the live card.
+
+        Args:
+            players (List[Player]): The players, holding their current piles.
+            live (int): Deck index of the live card.
+            out_of_play (Optional[Iterable[int]]): The cards in neither a pile
+                nor the centre, if known (otherwise they are worked out).
+
+        Raises:
+            ValueError: If a pile holds cards of another deck.
+        """
+        for player in players:
+            self._check_pile(player)
+        self.live_card = self.cards[live]
+        self._players = players
+        if out_of_play is None:
+            in_play = bytearray(len(self.cards))
+            in_play[live] = 1
+            for player in players:
+                for card in player.cards:
+                    in_play[card.index] = 1
+            out_of_play = [i for i, flag in enumerate(in_play) if not flag]
+        self._out_of_play = set()
+        self._symbols_out_of_play = defaultdict(int)
+        for card in out_of_play:
+            self._take_out_of_play(card)
+        self._watch_players()
+
+    @property
+    def players(self) -> List[Player]:
+        """
+        The players, in seating order.
+
+        The game watches each player's pile, so piles must change by
+        assigning Player.cards or through Player.take_top_card; changing a
+        pile in place (player.cards.pop(), .append()) goes unnoticed.
+        """
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]) -> None:
+        if self.live_card is None:
+            self._players = players
+            self._watch_players()
+        else:
+            self.restore(players, self.live_card.index)
+
+    def _check_pile(self, player: Player) -> None:
+        """Raise ValueError unless every card of the player's pile is one of this game's."""
+        cards = player.cards
+        if isinstance(cards, CardStack):
+            foreign = cards.deck is not self.cards
+        else:
+            foreign = any(card.deck is not self.cards for card in cards)
+        if foreign:
+            raise ValueError(f"{player.name} holds cards that are not from this game's deck")
+
+    def _watch_players(self) -> None:
+        self._players_out = set()
+        self._symbol_players = {}
+        self._top_symbols = [() for _ in self._players]
+        for i, player in enumerate(self._players):
+            player.watch(partial(self._on_top_card_changed, i))
+            self._on_top_card_changed(i, player)
+
+    def _take_out_of_play(self, card: int) -> None:
+        self._out_of_play.add(card)
+        counts = self._symbols_out_of_play
+        for symbol in self.cards.row(card):
+            counts[symbol] += 1
+
+    def _on_top_card_changed(self, player_idx: int, player: Player) -> None:
+        """Keep incremental game state in step with a player's pile."""
+        top_card = player.get_card()
+        if top_card is not None and top_card.deck is not self.cards:
+            # Every card reaches the centre from the top of a pile, so this also
+            # keeps foreign cards out of the in-play counts and the event log.
+            raise ValueError(f"{player.name} holds cards that are not from this game's deck")
+
+        index = self._symbol_players
+        for symbol in self._top_symbols[player_idx]:
+            holders = index[symbol]
+            holders.discard(player_idx)
+            if not holders:
+                del index[symbol]
+
+        if top_card is None:
+            self._players_out.add(player_idx)
+            self._top_symbols[player_idx] = ()
+            return
+
+        self._players_out.discard(player_idx)
+        symbols = top_card.sorted_symbols
+        self._top_symbols[player_idx] = symbols
+        for symbol in symbols:
+            holders = index.get(symbol)
+            if holders is None:
+                index[symbol] = {player_idx}
+            else:
+                holders.add(player_idx)
 
     @property
     def is_over(self) -> bool:
         """Check if any player has run out of cards."""
-        return any(player.is_out_of_cards for player in self.players)
+        return bool(self._players_out)
 
     def get_symbol_at_coordinate(self, coordinate: str) -> Optional[int]:
         """Get the symbol at the given coordinate on the live card."""
@@ -88,12 +310,74 @@ class DobbleGame:
         if symbol is None:
             return []
 
-        return [i for i, player in enumerate(self.players) if player.has_matching_symbol(symbol)]
+        return self.find_players_with_symbol(symbol)
+
+    def find_players_with_symbol(self, symbol: int) -> List[int]:
+        """
+        Find all players whose top cards carry the given symbol.
+
+        Answered from an index of top-card symbols that is updated as cards are
+        played, so the cost depends on the number of matches, not of players.
+
+        Returns:
+            List[int]: Indices of the matching players, in seating order.
+        """
+        matching = sorted(self._symbol_players.get(symbol, ()))
+        if self.log is not None:
+            self.log.guess(self.log_game, symbol)
+            if matching:
+                self.log.match(self.log_game, symbol, matching)
+        return matching
+
+    def record_guess(self, symbol: int, player: Optional[int] = None) -> None:
+        """Log a call of symbol by player, for callers that check claims themselves."""
+        if self.log is not None:
+            self.log.guess(self.log_game, symbol, player)
 
     def play_winning_card(self, winner_idx: int) -> None:
-        """Move winning card to the centre."""
+        """
+        Move winning card to the centre.
+
+        Raises:
+            ValueError: If the winner's pile was changed in place since the
+                game last saw it (see players).
+        """
         player = self.players[winner_idx]
+        top_card = player.get_card()
+        if (top_card.sorted_symbols if top_card is not None else ()) != self._top_symbols[winner_idx]:
+            raise ValueError(f"{player.name}'s pile was changed in place; assign Player.cards instead")
+        previous = self.live_card
         self.live_card = player.take_top_card()
+        if previous is not None:
+            # The card it covers leaves play; the winner's card only changes place.
+            self._take_out_of_play(previous.index)
+        if self.log is not None and self.live_card is not None:
+            self.log.win(self.log_game, winner_idx, self.live_card.index)
+
+    def symbol_frequency(self, symbol: int) -> int:
+        """
+        Number of cards still in play (in a pile or in the centre) that carry symbol.
+
+        Kept up to date as cards are dealt and played: the deck's own count
+        (see Deck.symbol_frequency) minus the cards out of play carrying the
+        symbol, so each turn costs symbols_per_card updates.
+        """
+        return self.cards.symbol_frequency(symbol) - self._symbols_out_of_play.get(symbol, 0)
+
+    def cards_in_play_with(self, symbol: int) -> List[int]:
+        """
+        Deck indices of the cards still in play that carry symbol, in ascending order.
+
+        Looked up in the deck's symbol index (see Deck.cards_with), so the
+        cost is the symbol's frequency in the deck, not the deck size.
+        """
+        out_of_play = self._out_of_play
+        return [card for card in self.cards.cards_with(symbol) if card not in out_of_play]
+
+    @property
+    def num_cards_in_play(self) -> int:
+        """Cards in the players' piles and the centre."""
+        return len(self.cards) - len(self._out_of_play) if self.live_card is not None else 0
 
     def get_game_results(self) -> List[Tuple[str, int]]:
         """Get the final game results for all players."""
@@ -101,7 +385,6 @@ class DobbleGame:
 
     def get_winner(self) -> Optional[str]:
         """Get the name of the winning player, if any."""
-        for player in self.players:
-            if player.is_out_of_cards:
-                return player.name
-        return None
+        if not self._players_out:
+            return None
+        return self.players[min(self._players_out)].name
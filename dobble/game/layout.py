@@ -0,0 +1,209 @@
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+
+def column_label(col: int) -> str:
+    """Spreadsheet-style column label: A..Z, then AA, AB, ..."""
+    label = ""
+    col += 1
+    while col:
+        col, rem = divmod(col - 1, 26)
+        label = chr(65 + rem) + label
+    return label
+
+
+def parse_coordinate(coordinate: str) -> Optional[Tuple[int, int]]:
+    """
+    Split a coordinate such as 'B3' or 'aa12' into zero-based (row, col).
+
+    Returns:
+        Optional[Tuple[int, int]]: The cell, or None if the coordinate is malformed.
+    """
+    letters = 0
+    while letters < len(coordinate) and coordinate[letters].isalpha():
+        letters += 1
+    if not letters:
+        return None
+    try:
+        row = int(coordinate[letters:]) - 1
+    except ValueError:
+        return None
+    col = 0
+    for ch in coordinate[:letters].upper():
+        if not "A" <= ch <= "Z":
+            return None
+        col = col * 26 + ord(ch) - 64
+    return row, col - 1
+
+
+class CardLayout:
+    """
+    Where each symbol of one card sits on screen, computed once and cached.
+
+    Cells are addressed by (row, col) and by coordinate strings ('A1' is the
+    top-left cell). Both directions - coordinate to symbol and symbol to
+    coordinate - are dictionary lookups.
+
+    Attributes:
+        rows (int): Number of grid rows.
+        cols (int): Number of grid columns.
+        grid (Tuple[Tuple[Optional[int], ...], ...]): Symbol in each cell, None where empty.
+    """
+
+    __slots__ = ("rows", "cols", "grid", "_by_coordinate", "_positions")
+
+    def __init__(self, grid: Sequence[Sequence[Optional[int]]]):
+        self.grid = tuple(tuple(row) for row in grid)
+        self.rows = len(self.grid)
+        self.cols = len(self.grid[0]) if self.grid else 0
+        self._by_coordinate: Dict[str, int] = {}
+        self._positions: Dict[int, Tuple[int, int]] = {}
+        for r, row in enumerate(self.grid):
+            for c, symbol in enumerate(row):
+                if symbol is not None:
+                    self._by_coordinate[f"{column_label(c)}{r + 1}"] = symbol
+                    self._positions[symbol] = (r, c)
+
+    def __repr__(self) -> str:
+        return f"CardLayout(rows={self.rows}, cols={self.cols})"
+
+    def symbol_at(self, row: int, col: int) -> Optional[int]:
+        """Symbol in cell (row, col), or None if the cell is empty or off the grid."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.grid[row][col]
+        return None
+
+    def symbol_at_coordinate(self, coordinate: str) -> Optional[int]:
+        """Symbol at a coordinate such as 'A1', or None if there is none."""
+        symbol = self._by_coordinate.get(coordinate)
+        if symbol is not None:
+            return symbol
+        cell = parse_coordinate(coordinate)
+        return self.symbol_at(*cell) if cell is not None else None
+
+    def position_of(self, symbol: int) -> Optional[Tuple[int, int]]:
+        """Zero-based (row, col) of a symbol, or None if the card does not carry it."""
+        return self._positions.get(symbol)
+
+    def coordinate_of(self, symbol: int) -> Optional[str]:
+        """Coordinate string of a symbol, or None if the card does not carry it."""
+        position = self._positions.get(symbol)
+        if position is None:
+            return None
+        return f"{column_label(position[1])}{position[0] + 1}"
+
+
+class Layout:
+    """
+    A strategy for placing a card's symbols on a grid.
+
+    Subclasses implement arrange(); decks call it once per card and cache the result.
+    """
+
+    name = ""
+
+    def arrange(self, symbols: Sequence[int], index: int) -> CardLayout:
+        """
+        Lay out one card.
+
+        Args:
+            symbols (Sequence[int]): The card's symbols in ascending order.
+            index (int): The card's row in its deck, for layouts that vary per card.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class SquareLayout(Layout):
+    """Symbols in ascending order, row by row, on the smallest square grid that fits."""
+
+    name = "square"
+
+    def arrange(self, symbols: Sequence[int], index: int) -> CardLayout:
+        size = math.ceil(math.sqrt(len(symbols)))
+        cells: List[Optional[int]] = list(symbols)
+        cells.extend([None] * (size * size - len(cells)))
+        return CardLayout([cells[r * size:(r + 1) * size] for r in range(size)])
+
+
+class HexLayout(Layout):
+    """
+    A honeycomb: rows alternate between w and w - 1 symbols, odd rows offset by half a cell.
+
+    Uses doubled column coordinates, so even rows occupy even columns and odd
+    rows odd columns; rendered as a table this gives the staggered look.
+    """
+
+    name = "hex"
+
+    def arrange(self, symbols: Sequence[int], index: int) -> CardLayout:
+        n = len(symbols)
+        if not n:
+            return CardLayout([])
+        width = max(1, math.ceil(math.sqrt(n)))
+        cols = 2 * width - 1
+        grid: List[List[Optional[int]]] = []
+        pos = 0
+        while pos < n:
+            odd = len(grid) % 2
+            row: List[Optional[int]] = [None] * cols
+            for c in range(odd, cols, 2):
+                if pos == n:
+                    break
+                row[c] = symbols[pos]
+                pos += 1
+            grid.append(row)
+        return CardLayout(grid)
+
+
+class RandomRotationLayout(Layout):
+    """
+    Another layout with each card turned as if dealt at random.
+
+    The card's symbols are spun round (cyclically shifted) and the grid is given
+    a random quarter turn. The rotation depends only on (seed, card index), so a
+    card always looks the same within a game and across runs.
+
+    Attributes:
+        base (Layout): The layout being rotated.
+        seed (int): Seed mixed with each card index.
+    """
+
+    name = "rotated"
+
+    def __init__(self, base: Optional[Layout] = None, seed: int = 0):
+        self.base = base if base is not None else SquareLayout()
+        self.seed = seed
+
+    def __repr__(self) -> str:
+        return f"RandomRotationLayout(base={self.base!r}, seed={self.seed})"
+
+    def arrange(self, symbols: Sequence[int], index: int) -> CardLayout:
+        if not len(symbols):
+            return self.base.arrange(symbols, index)
+        rng = random.Random(hash((self.seed, index)))
+        shift = rng.randrange(len(symbols))
+        spun = list(symbols[shift:]) + list(symbols[:shift])
+        grid = [list(row) for row in self.base.arrange(spun, index).grid]
+        for _ in range(rng.randrange(4)):
+            grid = [list(row) for row in zip(*grid[::-1])]
+        return CardLayout(grid)
+
+
+LAYOUTS: Dict[str, Type[Layout]] = {
+    SquareLayout.name: SquareLayout,
+    HexLayout.name: HexLayout,
+    RandomRotationLayout.name: RandomRotationLayout,
+}
+
+
+def make_layout(name: str, **options) -> Layout:
+    """Construct a layout by name (see LAYOUTS)."""
+    try:
+        layout_cls = LAYOUTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown layout {name!r}; choose from {', '.join(LAYOUTS)}") from None
+    return layout_cls(**options)
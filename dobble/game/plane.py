@@ -0,0 +1,212 @@
+from array import array
+from operator import add, itemgetter
+from typing import Optional, Tuple
+
+from .field import GaloisField, prime_power
+
+
+def is_valid_card_size(symbols_per_card: int) -> bool:
+    """Check whether a deck with the given number of symbols per card can be built."""
+    order = symbols_per_card - 1
+    return order == 1 or prime_power(order) is not None
+
+
+class ProjectivePlane:
+    """
+    The finite projective plane of order q, built over GF(q).
+
+    Points (symbols) are numbered as follows:
+
+    - affine point (x, y) is x * q + y, for x, y in GF(q);
+    - the point at infinity of slope m is q^2 + m;
+    - the vertical point at infinity is q^2 + q.
+
+    Lines (cards) are numbered as follows:
+
+    - line 0 is the line at infinity;
+    - line 1 + c is the vertical line x = c;
+    - line 1 + q + m * q + b is the line y = m * x + b.
+
+    Every line holds q + 1 points, every point lies on q + 1 lines and any
+    two lines meet in exactly one point.
+
+    Attributes:
+        order (int): The order q of the plane.
+        field (Optional[GaloisField]): The coordinate field (None for order 1).
+        num_points (int): q^2 + q + 1.
+        num_lines (int): q^2 + q + 1.
+    """
+
+    def __init__(self, order: int):
+        if order < 1 or (order > 1 and prime_power(order) is None):
+            raise ValueError(f"Projective plane order must be a prime power, got {order}")
+
+        self.order = order
+        # Order 1 is the degenerate plane (a triangle); its only field element is 0.
+        self.field: Optional[GaloisField] = GaloisField(order) if order > 1 else None
+        self.num_points = order * order + order + 1
+        self.num_lines = self.num_points
+
+        # Order 1 only ever needs 0 + 0 and 0 * 0, so a one-element table suffices.
+        trivial = [(0,)]
+        self._add = self.field.add if self.field else trivial
+        self._mul = self.field.mul if self.field else trivial
+        self._neg = self.field.neg if self.field else (0,)
+        self._inv = self.field.inv if self.field else (0,)
+
+    @property
+    def typecode(self) -> str:
+        """Smallest unsigned array typecode that can hold every point number."""
+        return "H" if self.num_points <= 0xFFFF else "I"
+
+    def incidence_rows(self) -> array:
+        """
+        Build every line of the plane in one flat array.
+
+        The result holds num_lines rows of order + 1 points each, row-major,
+        with each row sorted in ascending order. Rows are built one slope at a
+        time using the field tables and C-level gathers, so construction cost is
+        a handful of builtin calls per line rather than per point.
+
+        Returns:
+            array: Flat array of length num_lines * (order + 1).
+        """
+        q = self.order
+        qq = q * q
+        rows = array(self.typecode)
+
+        rows.extend(range(qq, qq + q + 1))
+        for c in range(q):
+            rows.extend(range(c * q, c * q + q))
+            rows.append(qq + q)
+
+        add_table = self._add
+        mul_table = self._mul
+        column_base = [x * q for x in range(q)]
+
+        for m in range(q):
+            gather = _gather(mul_table[m])
+            for b in range(q):
+                # Affine points (x, m * x + b) are already sorted by x.
+                rows.extend(map(add, column_base, gather(add_table[b])))
+                rows.append(qq + m)
+
+        return rows
+
+    def line_points(self, line: int) -> array:
+        """
+        Build a single line, in O(order), without building the rest of the plane.
+
+        Returns:
+            array: The line's points in ascending order, identical to the
+            corresponding row of incidence_rows().
+        """
+        if not 0 <= line < self.num_lines:
+            raise IndexError("Line number out of range")
+        q = self.order
+        qq = q * q
+        points = array(self.typecode)
+        if line == 0:
+            points.extend(range(qq, qq + q + 1))
+        elif line <= q:
+            c = line - 1
+            points.extend(range(c * q, c * q + q))
+            points.append(qq + q)
+        else:
+            m, b = divmod(line - 1 - q, q)
+            plus_b = self._add[b]
+            points.extend([x * q + plus_b[v] for x, v in enumerate(self._mul[m])])
+            points.append(qq + m)
+        return points
+
+    def point_lines(self, point: int) -> array:
+        """
+        Build the lines through a point, in O(order).
+
+        This is the dual of line_points: the point's row of the transposed
+        incidence matrix.
+
+        Returns:
+            array: The numbers of the order + 1 lines through the point, in
+            ascending order.
+        """
+        if not 0 <= point < self.num_points:
+            raise IndexError("Point number out of range")
+        q = self.order
+        qq = q * q
+        lines = array(self.typecode)
+        if point == qq + q:
+            # The vertical point at infinity: the line at infinity and every x = c.
+            lines.extend(range(q + 1))
+        elif point >= qq:
+            # The point at infinity of slope m: the line at infinity and every y = mx + b.
+            lines.append(0)
+            lines.extend(range(1 + q + (point - qq) * q, 1 + q + (point - qq + 1) * q))
+        else:
+            # The affine point (x, y): x = c for c = x, and y = mx + b for b = y - mx.
+            x, y = divmod(point, q)
+            lines.append(1 + x)
+            minus_y = [self._add[y][self._neg[v]] for v in range(q)]  # b for each m*x
+            lines.extend([1 + q + m * q + minus_y[self._mul[m][x]] for m in range(q)])
+        return lines
+
+    def line_coordinates(self, line: int) -> Tuple[str, int, int]:
+        """
+        Decode a line number into its equation.
+
+        Returns:
+            Tuple[str, int, int]: ("infinity", 0, 0), ("vertical", c, 0) for x = c,
+            or ("affine", m, b) for y = m * x + b.
+        """
+        if not 0 <= line < self.num_lines:
+            raise IndexError("Line number out of range")
+        q = self.order
+        if line == 0:
+            return "infinity", 0, 0
+        if line <= q:
+            return "vertical", line - 1, 0
+        m, b = divmod(line - 1 - q, q)
+        return "affine", m, b
+
+    def intersection(self, line1: int, line2: int) -> int:
+        """
+        Return the point shared by two distinct lines, computed from their equations.
+
+        This is O(1): a few table lookups, with no per-symbol work.
+        """
+        q = self.order
+        a1 = line1 - 1 - q
+        a2 = line2 - 1 - q
+        if a1 >= 0 and a2 >= 0 and a1 != a2:
+            # Two affine lines, by far the most common case.
+            m1, b1 = divmod(a1, q)
+            m2, b2 = divmod(a2, q)
+            if m1 == m2:
+                return q * q + m1
+            # m1 x + b1 = m2 x + b2  =>  x = (b2 - b1) / (m1 - m2)
+            plus, times, neg = self._add, self._mul, self._neg
+            x = times[plus[b2][neg[b1]]][self._inv[plus[m1][neg[m2]]]]
+            return x * q + plus[times[m1][x]][b1]
+
+        if line1 == line2:
+            raise ValueError("A line meets itself in every one of its points")
+        if line1 > line2:
+            line1, line2 = line2, line1
+
+        qq = q * q
+        if line1 == 0:
+            # The line at infinity meets x = c at the vertical point, y = mx + b at slope m.
+            return qq + q if line2 <= q else qq + (line2 - 1 - q) // q
+        if line2 <= q:
+            return qq + q
+        # x = c meets y = mx + b at (c, mc + b).
+        m2, b2 = divmod(line2 - 1 - q, q)
+        return (line1 - 1) * q + self._add[self._mul[m2][line1 - 1]][b2]
+
+
+def _gather(indices):
+    """Return a callable picking the given indices out of a sequence, always as a tuple."""
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda seq: (seq[index],)
+    return itemgetter(*indices)
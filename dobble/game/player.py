@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Union
 
 from .card import DobbleCard
+from .stack import CardStack
 
 
 @dataclass
@@ -11,11 +12,36 @@ class Player:
 
     Attributes:
         name (str): The player's name.
-        cards (List[DobbleCard]): The player's deck of cards.
+        cards (Union[CardStack, List[DobbleCard]]): The player's deck of cards,
+            top card first. Assign a new pile rather than changing it in place,
+            so a watching game sees the change.
     """
 
     name: str
-    cards: List[DobbleCard]
+    cards: Union[CardStack, List[DobbleCard]]
+    _watcher: Optional[Callable[["Player"], None]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name != "cards" or self._watcher is None:
+            object.__setattr__(self, name, value)
+            return
+        previous = self.cards
+        object.__setattr__(self, name, value)
+        try:
+            self._watcher(self)
+        except Exception:
+            # The watcher refused the pile: keep the one it last accepted.
+            object.__setattr__(self, name, previous)
+            raise
+
+    def watch(self, callback: Optional[Callable[["Player"], None]]) -> None:
+        """
+        Register a callback to run whenever the player's top card changes.
+
+        The game uses this to keep its own bookkeeping (such as who has run out
+        of cards) up to date without rescanning every player each turn.
+        """
+        self._watcher = callback
 
     def __str__(self) -> str:
         return f"{self.name} ({len(self.cards)} cards)"
@@ -26,12 +52,17 @@ class Player:
 
     def take_top_card(self) -> Optional[DobbleCard]:
         """Remove and return the top card."""
-        return self.cards.pop(0) if self.cards else None
+        if not self.cards:
+            return None
+        card = self.cards.pop(0)
+        if self._watcher is not None:
+            self._watcher(self)
+        return card
 
     def has_matching_symbol(self, symbol: int) -> bool:
         """Check if the player's top card has the given symbol."""
         top_card = self.get_card()
-        return symbol in top_card.symbols
+        return top_card.has_symbol(symbol)
 
     @property
     def is_out_of_cards(self) -> bool:
@@ -0,0 +1,170 @@
+"""
+An in-process registry of shared, read-only decks.
+
+Decks of one order are identical and never modified by play (games deal a
+permutation of card indices), so every game in a process can share one. The
+registry hands out that one deck per (order, generator), building or mapping
+it on the first request, and evicts the least recently used decks once it
+holds more than max_decks of them or more than max_bytes.
+
+Evicting a deck only drops the registry's reference: games still playing with
+it keep it alive, and the next request builds (or maps) it afresh.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .cache import load_or_build
+from .deck import BitsetDeck, Deck, LazyDeck
+
+GENERATORS = ("plane", "lazy", "bitset")
+
+DEFAULT_MAX_DECKS = 16
+
+
+class RegistryStats(NamedTuple):
+    """
+    Counters of a DeckRegistry.
+
+    Attributes:
+        hits (int): Requests served by a deck already held.
+        misses (int): Requests that built (or mapped) a deck.
+        evictions (int): Decks dropped to stay within the bounds.
+        decks (int): Decks held now.
+        nbytes (int): Bytes held by those decks, as of when each was added.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    decks: int
+    nbytes: int
+
+
+def build_deck(symbols_per_card: int, generator: str = "plane") -> Deck:
+    """
+    Build (or map from the deck cache) a deck without going through a registry.
+
+    Args:
+        symbols_per_card (int): Order of the deck.
+        generator (str): "plane" (the full deck, mapped from the cache when
+            prebuilt), "lazy" (cards computed on first access) or "bitset"
+            (the full deck plus a bitmask per card).
+
+    Returns:
+        Deck: The new deck.
+    """
+    if generator == "plane":
+        return load_or_build(symbols_per_card, write=False)
+    if generator == "lazy":
+        return LazyDeck(symbols_per_card)
+    if generator == "bitset":
+        return BitsetDeck(load_or_build(symbols_per_card, write=False))
+    raise ValueError(f"Unknown deck generator {generator!r}; choose from {', '.join(GENERATORS)}")
+
+
+class DeckRegistry:
+    """
+    Shared decks keyed by order and generator, with LRU eviction.
+
+    All methods are safe to call from several threads. A deck is built
+    outside the lock, so a slow build of one order does not hold up requests
+    for others; if two threads miss on the same key at once, both build, the
+    first to finish is kept and both get that one. The decks themselves can
+    be used from several threads at once: their card data is read-only and
+    their row and layout caches are locked.
+
+    Attributes:
+        max_decks (int): Most decks held at once.
+        max_bytes (Optional[int]): Most bytes held at once (None: unbounded).
+            The most recently requested deck is kept even if it alone exceeds it.
+    """
+
+    def __init__(self, max_decks: int = DEFAULT_MAX_DECKS, max_bytes: Optional[int] = None):
+        if max_decks < 1:
+            raise ValueError("A deck registry must hold at least one deck")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_decks = max_decks
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._decks: "OrderedDict[Tuple[int, str], Deck]" = OrderedDict()
+        self._sizes: Dict[Tuple[int, str], int] = {}
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, symbols_per_card: int, generator: str = "plane") -> Deck:
+        """
+        The shared deck of an order, building it on the first request.
+
+        Args:
+            symbols_per_card (int): Order of the deck.
+            generator (str): How the deck is made (see build_deck).
+
+        Returns:
+            Deck: The deck. It is read-only; do not change its caches' settings.
+        """
+        key = (symbols_per_card, generator)
+        with self._lock:
+            deck = self._decks.get(key)
+            if deck is not None:
+                self._decks.move_to_end(key)
+                self._hits += 1
+                return deck
+            self._misses += 1
+
+        built = build_deck(symbols_per_card, generator)
+        with self._lock:
+            deck = self._decks.get(key)
+            if deck is not None:  # Another thread got there first.
+                self._decks.move_to_end(key)
+                return deck
+            self._decks[key] = built
+            self._sizes[key] = built.nbytes
+            self._nbytes += self._sizes[key]
+            self._evict()
+        return built
+
+    def _evict(self) -> None:
+        """Drop least recently used decks until within bounds (lock held)."""
+        while len(self._decks) > 1 and (
+            len(self._decks) > self.max_decks
+            or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+        ):
+            key, _ = self._decks.popitem(last=False)
+            self._nbytes -= self._sizes.pop(key)
+            self._evictions += 1
+
+    def __contains__(self, key: Tuple[int, str]) -> bool:
+        with self._lock:
+            return key in self._decks
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._decks)
+
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            return RegistryStats(self._hits, self._misses, self._evictions, len(self._decks), self._nbytes)
+
+    def clear(self) -> None:
+        """Drop every deck (counters are kept)."""
+        with self._lock:
+            self._decks.clear()
+            self._sizes.clear()
+            self._nbytes = 0
+
+
+_default = DeckRegistry()
+
+
+def default_registry() -> DeckRegistry:
+    """The process-wide registry games use unless given a deck."""
+    return _default
+
+
+def get_deck(symbols_per_card: int, generator: str = "plane") -> Deck:
+    """The shared deck of an order from the process-wide registry."""
+    return _default.get(symbols_per_card, generator)
@@ -0,0 +1,163 @@
+import random
+from array import array
+from typing import Iterator, List, Optional, Sequence, Union
+
+from .card import DobbleCard
+from .deck import Deck
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+class LazyPermutation:
+    """
+    A random permutation of range(n), computed one position at a time.
+
+    Position i is sent through a keyed four-round Feistel network over the
+    smallest even number of bits that covers n, and sent through again until
+    the result is below n (cycle walking; under four passes on average).
+    Only the round keys are stored, so shuffling a lazy deck of a million
+    cards costs no more than shuffling a small one.
+
+    Slicing returns the positions as an array.
+    """
+
+    __slots__ = ("_n", "_half", "_mask", "_shift", "_keys")
+
+    ROUNDS = 4
+
+    def __init__(self, n: int, rng: Optional[random.Random] = None):
+        if n < 0:
+            raise ValueError("A permutation needs a non-negative length")
+        half = max(1, ((n - 1).bit_length() + 1) // 2)
+        self._n = n
+        self._half = half
+        self._mask = (1 << half) - 1
+        self._shift = 64 - half
+        self._keys = tuple((rng or random).getrandbits(64) for _ in range(self.ROUNDS))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _permute(self, position: int) -> int:
+        half, mask, shift = self._half, self._mask, self._shift
+        x = position
+        while True:
+            left, right = x >> half, x & mask
+            for key in self._keys:
+                # The top bits of a 64-bit multiply depend on every bit of right.
+                left, right = right, left ^ (((right + key) * _GOLDEN & _MASK64) >> shift)
+            x = left << half | right
+            if x < self._n:
+                return x
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, array]:
+        if isinstance(index, slice):
+            return array("I", map(self._permute, range(*index.indices(self._n))))
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("LazyPermutation index out of range")
+        return self._permute(index)
+
+    def __iter__(self) -> Iterator[int]:
+        return map(self._permute, range(self._n))
+
+    def __repr__(self) -> str:
+        return f"LazyPermutation({self._n})"
+
+
+class CardStack:
+    """
+    A pile of cards held as indices into a shared deck.
+
+    Dealing a stack copies integers rather than card objects; cards are only
+    materialised (as views onto the deck) when they are looked at.
+
+    A stack is a window [start, stop) onto an index array (or a
+    LazyPermutation), which may be shared with other stacks (e.g. one dealt
+    permutation for the whole table). Taking the top or bottom card just moves one end of the window,
+    so it is O(1) however large the pile is.
+
+    Attributes:
+        deck (Deck): The deck the indices refer to.
+    """
+
+    __slots__ = ("deck", "_indices", "_start", "_stop")
+
+    def __init__(
+        self,
+        deck: Deck,
+        indices: Sequence[int],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ):
+        self.deck = deck
+        self._indices = indices if isinstance(indices, (array, LazyPermutation)) else array("I", indices)
+        self._start = start
+        self._stop = len(self._indices) if stop is None else stop
+
+    @property
+    def indices(self) -> Sequence[int]:
+        """The deck indices of the cards in the stack, top card first (a copy)."""
+        return self._indices[self._start:self._stop]
+
+    @property
+    def top_index(self) -> Optional[int]:
+        """Deck index of the top card, or None if the stack is empty."""
+        return self._indices[self._start] if self._start < self._stop else None
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[DobbleCard, List[DobbleCard]]:
+        if isinstance(index, slice):
+            return [self.deck[i] for i in self.indices[index]]
+        size = self._stop - self._start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("CardStack index out of range")
+        return self.deck[self._indices[self._start + index]]
+
+    def __iter__(self) -> Iterator[DobbleCard]:
+        deck = self.deck
+        indices = self._indices
+        return (deck[indices[i]] for i in range(self._start, self._stop))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CardStack):
+            return self.deck is other.deck and self.indices == other.indices
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"CardStack({len(self)} cards)"
+
+    def pop(self, index: int = -1) -> DobbleCard:
+        """
+        Remove and return the card at the given position.
+
+        Popping the top (0) or bottom (-1) card is O(1). Popping from the middle
+        first gives the stack a private copy of its indices.
+        """
+        size = self._stop - self._start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("pop from empty CardStack" if not size else "pop index out of range")
+
+        if index == 0:
+            card = self._indices[self._start]
+            self._start += 1
+        elif index == size - 1:
+            self._stop -= 1
+            card = self._indices[self._stop]
+        else:
+            self._indices = self.indices
+            self._start, self._stop = 0, size - 1
+            card = self._indices.pop(index)
+        return self.deck[card]
@@ -0,0 +1,189 @@
+"""
+Check that every pair of cards in a deck shares exactly one symbol.
+
+The overlap counts of all pairs are the entries of M @ M.T, where M is the
+card-by-symbol incidence matrix. verify_deck computes that product a block
+of rows at a time, so memory stays bounded by the block size rather than
+the square of the deck size, and blocks run in parallel. With NumPy the
+blocks are float32 matrix products; without it, cards are Python integer
+bitsets and overlaps are popcounts of their ANDs.
+"""
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, List, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .deck import Deck
+
+BACKENDS = ("numpy", "python")
+
+
+class DeckViolation(NamedTuple):
+    """
+    A pair of cards that does not share exactly one symbol.
+
+    Attributes:
+        card1 (int): Index of the first card.
+        card2 (int): Index of the second card (card1 itself when a card
+            does not carry symbols_per_card distinct symbols).
+        overlap (int): Number of symbols the two cards share.
+    """
+
+    card1: int
+    card2: int
+    overlap: int
+
+
+class VerifyResult(NamedTuple):
+    """
+    Outcome of verify_deck.
+
+    Attributes:
+        num_cards (int): Cards in the deck.
+        pairs_checked (int): Pairs whose overlap was computed, counting each
+            card with itself (every pair, unless checking stopped early at
+            max_violations).
+        violations (List[DeckViolation]): The first violations found, in
+            (card1, card2) order.
+    """
+
+    num_cards: int
+    pairs_checked: int
+    violations: List[DeckViolation]
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+
+def _dense(bitmap: "np.ndarray", start: int, stop: int, num_symbols: int) -> "np.ndarray":
+    """Rows start..stop-1 of the incidence matrix as float32, unpacked from the bitmap."""
+    bits = np.unpackbits(bitmap[start:stop], axis=1, count=num_symbols, bitorder="little")
+    return bits.astype(np.float32)
+
+
+def _numpy_block(deck: Deck, bitmap: "np.ndarray", start: int, stop: int, chunk_size: int, limit: int):
+    """Violations among pairs (i, j), start <= i < stop, j >= i; returns (violations, pairs)."""
+    k = deck.symbols_per_card
+    rows = _dense(bitmap, start, stop, deck.num_symbols)
+    i = np.arange(start, stop)[:, None]
+    found: List[DeckViolation] = []
+    for col_start in range(start, deck.num_cards, chunk_size):
+        col_stop = min(col_start + chunk_size, deck.num_cards)
+        overlaps = rows @ _dense(bitmap, col_start, col_stop, deck.num_symbols).T
+        j = np.arange(col_start, col_stop)[None, :]
+        bad = (j >= i) & (overlaps != np.where(j == i, k, 1))
+        # nonzero is in row-major order, so the first `limit` of each block
+        # include the block's share of the first `limit` overall.
+        for a, b in zip(*(axis[:limit] for axis in np.nonzero(bad))):
+            found.append(DeckViolation(start + int(a), col_start + int(b), int(overlaps[a, b])))
+    pairs = sum(deck.num_cards - i for i in range(start, stop))
+    return sorted(found)[:limit], pairs
+
+
+def _count_ones(bits: int) -> int:
+    """Population count for Pythons without int.bit_count (before 3.10)."""
+    return bin(bits).count("1")
+
+
+_popcount = getattr(int, "bit_count", _count_ones)
+
+
+def _python_block(deck: Deck, bits: List[int], start: int, stop: int, limit: int):
+    """As _numpy_block, with integer bitsets."""
+    k = deck.symbols_per_card
+    found: List[DeckViolation] = []
+    pairs = 0
+    for i in range(start, stop):
+        card = bits[i]
+        if _popcount(card) != k:
+            found.append(DeckViolation(i, i, _popcount(card)))
+        for j in range(i + 1, len(bits)):
+            overlap = _popcount(card & bits[j])
+            if overlap != 1:
+                found.append(DeckViolation(i, j, overlap))
+                if len(found) >= limit:
+                    return found, pairs + j - i + 1
+        pairs += len(bits) - i
+    return found, pairs
+
+
+def verify_deck(
+    deck: Deck,
+    chunk_size: int = 512,
+    workers: Optional[int] = None,
+    max_violations: int = 10,
+    backend: Optional[str] = None,
+) -> VerifyResult:
+    """
+    Check that every pair of cards shares exactly one symbol, and every card has
+    symbols_per_card distinct symbols.
+
+    Cards are checked in blocks of chunk_size rows against every later card.
+    Blocks are scheduled over a thread pool with a bounded number in flight
+    and collected in order, so the violations reported are always the first
+    ones in (card1, card2) order, and checking stops once max_violations
+    have been found.
+
+    Args:
+        deck (Deck): The deck to check.
+        chunk_size (int): Cards per block. Memory use is
+            O(chunk_size * num_symbols) per worker.
+        workers (Optional[int]): Threads (default: all cores). NumPy releases
+            the GIL during the products, so blocks overlap; the Python
+            backend gains little from more than one.
+        max_violations (int): Stop after this many violations.
+        backend (Optional[str]): "numpy" or "python" (default: numpy if installed).
+
+    Returns:
+        VerifyResult: Whether the deck is valid, and the first violating pairs.
+    """
+    if backend is None:
+        backend = "numpy" if np is not None else "python"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {', '.join(BACKENDS)}")
+    if backend == "numpy" and np is None:
+        raise ValueError("The numpy backend requires NumPy: pip install 'pydobble[fast]'")
+    if chunk_size < 1 or max_violations < 1:
+        raise ValueError("chunk_size and max_violations must be positive")
+
+    num_cards = deck.num_cards
+    stride = deck.incidence_stride
+    bitmap = deck.incidence()
+    if backend == "numpy":
+        matrix = np.frombuffer(bitmap, dtype=np.uint8).reshape(num_cards, stride)
+
+        def run(start: int):
+            stop = min(start + chunk_size, num_cards)
+            return _numpy_block(deck, matrix, start, stop, chunk_size, max_violations)
+
+    else:
+        bits = [int.from_bytes(bitmap[i * stride:(i + 1) * stride], "little") for i in range(num_cards)]
+
+        def run(start: int):
+            return _python_block(deck, bits, start, min(start + chunk_size, num_cards), max_violations)
+
+    violations: List[DeckViolation] = []
+    pairs_checked = 0
+    starts = iter(range(0, num_cards, chunk_size))
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: Deque = deque(pool.submit(run, start) for _, start in zip(range(workers * 2), starts))
+        while pending:
+            found, pairs = pending.popleft().result()
+            violations.extend(found)
+            pairs_checked += pairs
+            if len(violations) >= max_violations:
+                for future in pending:
+                    future.cancel()
+                break
+            start = next(starts, None)
+            if start is not None:
+                pending.append(pool.submit(run, start))
+
+    return VerifyResult(num_cards, pairs_checked, violations[:max_violations])
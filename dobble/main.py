@@ -1,12 +1,24 @@
+"""
+Command-line entry point.
+
+Only argparse and dobble.config are imported up front. Each subcommand
+imports what it needs when it runs, and the terminal UI (rich, termios) is
+loaded only for the interactive game, so `dobble --help` and the headless
+subcommands start quickly.
+"""
+import argparse
+import math
 import sys
-from typing import Optional, List
+import time
+from typing import TYPE_CHECKING, Callable, Optional, List, TypeVar
+
+from .config import DIFFICULTY_LEVELS, VALID_CARD_SIZES
 
-from rich.prompt import Prompt
+if TYPE_CHECKING:
+    from .game.game import DobbleGame
+    from .ui.keyboard import KeyBindings
 
-from .game.game import DobbleGame
-from .ui.game_ui import GameUI
-from .ui.display import display_title, display_game_state
-from .ui.components import console
+Number = TypeVar("Number", int, float)
 
 
 class GameController:
@@ -14,23 +26,72 @@ class GameController:
     Controls the game flow and coordinates between the game logic and UI.
     """
 
-    def __init__(self):
+    def __init__(self, race_keys: Optional[str] = None):
+        from .ui.game_ui import GameUI
+        from .ui.keyboard import RawInput
+        from .ui.screen import GameScreen
+
         self.ui = GameUI()
-        self.game: Optional[DobbleGame] = None
+        self.screen = GameScreen()
+        self.keyboard = RawInput()
+        self.race_keys = race_keys
+        self.bindings: Optional["KeyBindings"] = None
+        self.game: Optional["DobbleGame"] = None
 
     def setup_new_game(self) -> None:
         """Initialise a new game with user-selected options."""
+        from .game.game import DobbleGame
+
         symbols_per_card = self.ui.select_difficulty()
         self.game = DobbleGame(symbols_per_card=symbols_per_card)
 
         player_names = self.ui.get_player_names()
+        self.bindings = self._race_bindings(len(player_names))
         self.game.setup_game(player_names)
 
+    def _race_bindings(self, num_players: int) -> Optional["KeyBindings"]:
+        """
+        Each player's race key, from --race-keys or the defaults.
+
+        None when there are more players than default keys: ties are then
+        settled by picking the winner from a numbered list.
+        """
+        from .ui.keyboard import DEFAULT_RACE_KEYS, KeyBindings
+
+        if self.race_keys is None:
+            if num_players > len(DEFAULT_RACE_KEYS):
+                return None
+            return KeyBindings.default(num_players)
+        if len(self.race_keys) < num_players:
+            raise SystemExit(f"--race-keys needs a key for each of the {num_players} players")
+        try:
+            return KeyBindings(list(self.race_keys[:num_players]))
+        except ValueError as e:
+            raise SystemExit(str(e))
+
+    def _echo(self, text: str) -> None:
+        from .ui.components import console
+
+        console.file.write(text)
+        console.file.flush()
+
     def run_game_turn(self) -> None:
-        """Handle a single game turn."""
-        display_game_state(self.game)
+        """Handle a single game turn (with the keyboard session open)."""
+        from .ui.components import console
+
+        viewport = self.screen.viewport
+        while True:
+            self.screen.show(self.game)
+            paging = ", '<' or '>' to see other players" if viewport.num_pages > 1 else ""
+            console.print(
+                f"\nEnter coordinate of the matching symbol (e.g. B2){paging}, or 'q' to quit: ", end=""
+            )
+            coordinate = self.keyboard.read_line(echo=self._echo).strip()
+            if coordinate in ("<", ">") and viewport.num_pages > 1:
+                viewport.scroll(1 if coordinate == ">" else -1)
+                continue
+            break
 
-        coordinate = Prompt.ask("\nEnter coordinate of the matching symbol (e.g. B2), or 'q' to quit")
         if coordinate.lower() == "q":
             sys.exit(0)
 
@@ -39,7 +100,13 @@ class GameController:
             console.print("[red]Nobody has that symbol.[/red]")
             return
 
-        winner_idx = self.ui.select_winner(matching_players, self.game.players)
+        if self.bindings is None:
+            winner_idx = self.ui.select_winner(matching_players, self.game.players, self.keyboard, self._echo)
+        else:
+            winner_idx = self.ui.race_winner(matching_players, self.game.players, self.keyboard, self.bindings)
+        if len(matching_players) > 1:
+            # The race prompt may have scrolled the screen; redraw it in full.
+            self.screen.invalidate()
         self.game.play_winning_card(winner_idx)
 
         player_name = self.game.players[winner_idx].name
@@ -47,23 +114,534 @@ class GameController:
 
     def run_game(self) -> None:
         """Run the main game loop."""
+        from .ui.components import console
+        from .ui.display import display_title
+
         console.clear()
         display_title()
 
         self.setup_new_game()
 
-        while not self.game.is_over:
-            self.run_game_turn()
+        # One keyboard session for the whole game: keys are read (and
+        # timestamped) the moment they are typed.
+        with self.keyboard:
+            while not self.game.is_over:
+                self.run_game_turn()
 
-            if not self.game.is_over:
-                console.input("\nPress Enter to continue...")
+                if not self.game.is_over:
+                    console.print("\nPress Enter to continue...")
+                    self.keyboard.wait_for(("enter",))
 
         self.ui.display_game_results(self.game)
 
 
-def main():
+def _number(text: str, convert: Callable[[str], Number], what: str, valid: Callable[[Number], bool]) -> Number:
+    try:
+        value = convert(text)
+    except ValueError:
+        value = None
+    if value is None or not valid(value):
+        raise argparse.ArgumentTypeError(f"{text!r} is not {what}")
+    return value
+
+
+def positive_int(text: str) -> int:
+    """argparse type: an integer of at least 1."""
+    return _number(text, int, "a positive integer", lambda value: value > 0)
+
+
+def non_negative_int(text: str) -> int:
+    """argparse type: an integer of at least 0."""
+    return _number(text, int, "a non-negative integer", lambda value: value >= 0)
+
+
+def port_number(text: str) -> int:
+    """argparse type: a TCP port (0 picks a free one)."""
+    return _number(text, int, "a port number (0-65535)", lambda value: 0 <= value <= 65535)
+
+
+def positive_float(text: str) -> float:
+    """argparse type: a finite number above 0."""
+    return _number(text, float, "a positive number", lambda value: math.isfinite(value) and value > 0)
+
+
+def non_negative_float(text: str) -> float:
+    """argparse type: a finite number of at least 0."""
+    return _number(text, float, "a non-negative number", lambda value: math.isfinite(value) and value >= 0)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser. With no subcommand, an interactive game is started."""
+    parser = argparse.ArgumentParser(prog="dobble", description="Play Dobble in the terminal.")
+    parser.add_argument(
+        "--race-keys",
+        metavar="KEYS",
+        help="Keys players 1, 2, ... press to win a tie, one character each (default: `/[];',.-=)",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    cache_parser = subparsers.add_parser("cache", help="Manage the on-disk deck cache")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", required=True)
+    build = cache_subparsers.add_parser("build", help="Prebuild cached decks and the emoji table")
+    build.add_argument(
+        "--dir",
+        default=None,
+        help="Cache directory (default: $DOBBLE_CACHE_DIR, $XDG_CACHE_HOME/pydobble or ~/.cache/pydobble)",
+    )
+    build.add_argument(
+        "--sizes",
+        type=positive_int,
+        nargs="+",
+        default=VALID_CARD_SIZES,
+        help="Symbols per card to build (default: every valid size)",
+    )
+    build.add_argument("--force", action="store_true", help="Rebuild files that are already valid")
+    build.add_argument(
+        "--no-verify",
+        dest="verify",
+        action="store_false",
+        help="Skip checking that every pair of cards shares exactly one symbol",
+    )
+
+    simulate = subparsers.add_parser("simulate", help="Run headless simulated games")
+    simulate.add_argument("--games", type=positive_int, default=10000, help="Number of games (default: 10000)")
+    simulate.add_argument("--players", type=positive_int, default=2, help="Players per game (default: 2)")
+    size = simulate.add_mutually_exclusive_group()
+    size.add_argument("--symbols", type=positive_int, help="Symbols per card")
+    size.add_argument(
+        "--difficulty",
+        choices=list(DIFFICULTY_LEVELS),
+        default="Normal",
+        help="Difficulty level (default: Normal)",
+    )
+    simulate.add_argument(
+        "--policy",
+        choices=["random", "fastest", "reaction"],
+        default="random",
+        help="Bot policy (default: random)",
+    )
+    simulate.add_argument(
+        "--engine",
+        choices=["object", "batched"],
+        default="object",
+        help="Play games one at a time, or in NumPy batches of --chunk-size (default: object)",
+    )
+    simulate.add_argument("--workers", type=positive_int, default=None, help="Worker processes (default: all cores)")
+    simulate.add_argument("--chunk-size", type=positive_int, default=1000, help="Games per scheduled task (default: 1000)")
+    simulate.add_argument("--seed", type=non_negative_int, default=0, help="Base seed (default: 0)")
+    simulate.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    simulate.add_argument(
+        "--log", metavar="PATH", help="Record every game to a binary event log (plays games in this process)"
+    )
+
+    serve_parser = subparsers.add_parser("serve", help="Host games over TCP (line-delimited JSON)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=port_number, default=7854, help="Port to listen on; 0 picks one (default: 7854)")
+    serve_parser.add_argument(
+        "--max-pending",
+        type=positive_int,
+        default=256,
+        help="Outgoing messages buffered per client before it is dropped as too slow (default: 256)",
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=non_negative_int,
+        default=0,
+        help="Route tables to this many worker processes (default: 0, host every table in one process)",
+    )
+    serve_parser.add_argument(
+        "--log", metavar="PATH", help="Record every table's games to a binary event log (not with --workers)"
+    )
+
+    replay = subparsers.add_parser("replay", help="Summarise an event log, or rebuild a game from it")
+    replay.add_argument("log", help="Event log written by simulate or serve --log")
+    replay.add_argument("--game", type=non_negative_int, default=None, help="Show this game's state (numbered from 0)")
+    replay.add_argument("--at", type=non_negative_int, default=None, help="Show the state before this event (default: the end)")
+
+    loadgen = subparsers.add_parser("loadgen", help="Measure a game server with bot clients")
+    loadgen.add_argument(
+        "--connect", metavar="HOST:PORT", default=None, help="Server to load (default: start a local one)"
+    )
+    loadgen.add_argument("--tables", type=positive_int, default=100, help="Tables played at once (default: 100)")
+    loadgen.add_argument("--players", type=positive_int, default=2, help="Bots per table (default: 2)")
+    loadgen.add_argument("--symbols", type=positive_int, default=8, help="Symbols per card (default: 8)")
+    loadgen.add_argument("--games", type=positive_int, default=1, help="Games in a row per table (default: 1)")
+    loadgen.add_argument(
+        "--think-ms", type=non_negative_float, default=5.0, help="Longest random delay before a bot claims (default: 5)"
+    )
+    loadgen.add_argument("--seed", type=non_negative_int, default=0, help="Seed for think times (default: 0)")
+    loadgen.add_argument(
+        "--workers", type=non_negative_int, default=0, help="Worker processes of the local server (default: 0, none)"
+    )
+    loadgen.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    export = subparsers.add_parser("export", help="Write every card of a deck to SVG files or a printable PDF")
+    size = export.add_mutually_exclusive_group()
+    size.add_argument("--symbols", type=positive_int, help="Symbols per card")
+    size.add_argument(
+        "--difficulty",
+        choices=list(DIFFICULTY_LEVELS),
+        default="Normal",
+        help="Difficulty level (default: Normal)",
+    )
+    export.add_argument(
+        "--output", "-o", required=True, help="PDF file, or directory for one SVG file per card"
+    )
+    export.add_argument(
+        "--format",
+        choices=["svg", "pdf"],
+        default=None,
+        help="Output format (default: pdf if the output ends in .pdf, otherwise svg)",
+    )
+    export.add_argument(
+        "--glyphs",
+        choices=["emoji", "shapes"],
+        default=None,
+        help="Draw symbols as emoji (SVG only) or numbered coloured shapes "
+        "(default: emoji when the deck has few enough symbols for SVG, otherwise shapes)",
+    )
+    export.add_argument(
+        "--layout", choices=["square", "hex", "rotated"], default="square", help="Symbol layout (default: square)"
+    )
+    export.add_argument("--card-mm", type=positive_float, default=80.0, help="Card diameter in millimetres (default: 80)")
+    export.add_argument("--seed", type=non_negative_int, default=0, help="Seed of placements and emoji order (default: 0)")
+    export.add_argument("--workers", type=positive_int, default=None, help="Worker processes (default: all cores)")
+    export.add_argument("--chunk-size", type=positive_int, default=64, help="Cards per scheduled task (default: 64)")
+
+    bench_parser = subparsers.add_parser("bench", help="Run performance benchmarks")
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command", required=True)
+    bench_run = bench_subparsers.add_parser("run", help="Time the benchmark cases and write JSON results")
+    bench_run.add_argument(
+        "--cases", nargs="+", default=None, help="Cases to run (default: all; see dobble.bench.CASES)"
+    )
+    bench_run.add_argument(
+        "--sizes",
+        type=positive_int,
+        nargs="+",
+        default=VALID_CARD_SIZES,
+        help="Symbols per card to benchmark (default: every valid size)",
+    )
+    bench_run.add_argument(
+        "--min-time", type=positive_float, default=0.02, help="Target seconds per timed round (default: 0.02)"
+    )
+    bench_run.add_argument("--rounds", type=positive_int, default=5, help="Timed rounds per benchmark (default: 5)")
+    bench_run.add_argument("--output", "-o", default=None, help="Write JSON results to this file")
+    bench_run.add_argument(
+        "--format",
+        choices=["dobble", "pytest-benchmark"],
+        default="dobble",
+        help="JSON layout of the results (default: dobble)",
+    )
+    bench_compare = bench_subparsers.add_parser(
+        "compare", help="Compare results against a baseline; exit 1 on regressions"
+    )
+    bench_compare.add_argument("baseline", help="Baseline JSON results")
+    bench_compare.add_argument("current", help="Current JSON results")
+    bench_compare.add_argument(
+        "--threshold",
+        type=non_negative_float,
+        default=0.1,
+        help="Allowed slowdown of a median before it counts as a regression (default: 0.1 = 10%%)",
+    )
+
+    return parser
+
+
+def run_cache_command(args: argparse.Namespace) -> None:
+    """Handle `dobble cache ...`."""
+    from .game.cache import build_cache
+    from .game.plane import is_valid_card_size
+    from .utils.emoji_loader import save_emoji_table
+
+    for size in args.sizes:
+        if not is_valid_card_size(size):
+            raise SystemExit(f"Invalid card size {size}: symbols per card minus one must be a prime power")
+    try:
+        paths = build_cache(args.sizes, cache_dir=args.dir, force=args.force, verify=args.verify)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    for path in paths:
+        print(f"✓ {path}")
+    print(f"✓ {save_emoji_table(args.dir)}")
+
+
+def run_simulate_command(args: argparse.Namespace) -> None:
+    """Handle `dobble simulate`."""
+    from .game.plane import is_valid_card_size
+    from .sim.runner import SimulationConfig, run_simulations
+
+    symbols_per_card = args.symbols if args.symbols is not None else DIFFICULTY_LEVELS[args.difficulty]
+    if not is_valid_card_size(symbols_per_card):
+        raise SystemExit(
+            f"Invalid card size {symbols_per_card}: symbols per card minus one must be a prime power"
+        )
+    if args.log and args.engine != "object":
+        raise SystemExit("--log needs the object engine")
+
+    config = SimulationConfig(symbols_per_card, args.players, args.policy, engine=args.engine)
+    start = time.perf_counter()
+    if args.log:
+        from .game.events import EventWriter
+
+        with EventWriter(args.log) as log:
+            stats = run_simulations(config, args.games, seed=args.seed, log=log)
+    else:
+        stats = run_simulations(
+            config, args.games, seed=args.seed, workers=args.workers, chunk_size=args.chunk_size
+        )
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    summary.update(
+        symbols_per_card=symbols_per_card,
+        players=args.players,
+        policy=args.policy,
+        engine=args.engine,
+        seconds=elapsed,
+        games_per_second=stats.games / elapsed,
+    )
+    if args.json:
+        import json
+
+        print(json.dumps(summary))
+        return
+
+    print(
+        f"{stats.games} games of {args.players} players, {symbols_per_card} symbols per card, "
+        f"{args.policy} policy in {elapsed:.2f}s ({summary['games_per_second']:.0f} games/s)"
+    )
+    print(
+        f"Turns: mean {summary['mean_turns']:.1f}, stdev {summary['stdev_turns']:.1f}, "
+        f"p50 {summary['p50_turns']}, p90 {summary['p90_turns']}, p99 {summary['p99_turns']}"
+    )
+    print(f"Guesses per game: {summary['mean_guesses']:.1f}")
+    for seat, rate in enumerate(summary["win_rates"], 1):
+        print(f"Player {seat} win rate: {rate:.3f}")
+    if stats.unfinished:
+        print(f"{stats.unfinished} games hit the guess limit")
+
+
+def run_serve_command(args: argparse.Namespace) -> None:
+    """Handle `dobble serve`."""
+    import asyncio
+
+    from .net.server import serve
+
+    if args.log and args.workers:
+        raise SystemExit("--log is not supported with --workers")
+
+    def ready(server):
+        # Printed once listening; `dobble loadgen` reads the port from this line.
+        print(f"Listening on {server.host}:{server.bound_port}", flush=True)
+
+    log = None
+    if args.log:
+        from .game.events import EventWriter
+
+        log = EventWriter(args.log)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_pending, ready=ready, workers=args.workers, log=log))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log is not None:
+            log.close()
+
+
+def run_replay_command(args: argparse.Namespace) -> None:
+    """Handle `dobble replay`."""
+    from collections import Counter
+
+    from .game.events import EventReader, Replay
+
+    try:
+        if args.game is None:
+            reader = EventReader(args.log)
+            kinds: Counter = Counter()
+            last = None
+            for last in reader:
+                kinds[last.kind] += 1
+            seconds = last.time if last is not None else 0.0
+            print(f"{sum(kinds.values())} events over {seconds:.2f}s, {kinds['deal']} games")
+            for kind in ("deal", "guess", "match", "win"):
+                print(f"  {kind}: {kinds[kind]}")
+            return
+
+        game = Replay(args.log).game_at(args.game, args.at)
+    except (OSError, ValueError) as e:
+        raise SystemExit(str(e))
+    print(f"Live card: {game.live_card}")
+    for player in game.players:
+        print(f"{player}: top card {player.get_card() or '-'}")
+    if game.is_over:
+        print(f"Winner: {game.get_winner()}")
+
+
+def run_loadgen_command(args: argparse.Namespace) -> None:
+    """Handle `dobble loadgen`."""
+    import asyncio
+    import subprocess
+
+    from .game.plane import is_valid_card_size
+    from .net.loadgen import run_load
+
+    if not is_valid_card_size(args.symbols):
+        raise SystemExit(f"Invalid card size {args.symbols}: symbols per card minus one must be a prime power")
+
+    server = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        host = host or "127.0.0.1"
+    else:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "dobble.main", "serve", "--port", "0", "--workers", str(args.workers)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        line = server.stdout.readline()
+        if not line.startswith("Listening on "):
+            server.kill()
+            raise SystemExit("The local server did not start")
+        host, _, port = line.split()[-1].rpartition(":")
+
+    try:
+        report = asyncio.run(
+            run_load(
+                host,
+                int(port),
+                tables=args.tables,
+                players=args.players,
+                symbols=args.symbols,
+                games=args.games,
+                think=args.think_ms / 1000,
+                seed=args.seed,
+            )
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        import json
+
+        print(json.dumps({**report._asdict(), "turns_per_second": report.turns_per_second}))
+        return
+    print(
+        f"{report.games} games at {report.tables} tables of {report.players} players "
+        f"in {report.seconds:.2f}s ({report.turns_per_second:.0f} turns/s)"
+    )
+    print(f"Turn latency: p50 {report.p50_ms:.2f} ms, p99 {report.p99_ms:.2f} ms")
+    print(
+        f"Server CPU: {report.server_cpu_seconds:.2f}s, "
+        f"{report.tables_per_core:.0f} tables per core at this pace"
+    )
+
+
+def run_export_command(args: argparse.Namespace) -> None:
+    """Handle `dobble export`."""
+    from .export.runner import ExportOptions, check_options, export_deck
+    from .game.plane import is_valid_card_size
+
+    symbols_per_card = args.symbols if args.symbols is not None else DIFFICULTY_LEVELS[args.difficulty]
+    if not is_valid_card_size(symbols_per_card):
+        raise SystemExit(
+            f"Invalid card size {symbols_per_card}: symbols per card minus one must be a prime power"
+        )
+    fmt = args.format or ("pdf" if args.output.lower().endswith(".pdf") else "svg")
+    glyphs = args.glyphs
+    if glyphs is None:
+        glyphs = "shapes"
+        if fmt == "svg":
+            try:
+                check_options(ExportOptions(symbols_per_card, "emoji", seed=args.seed), fmt)
+                glyphs = "emoji"
+            except ValueError:
+                pass
+    options = ExportOptions(symbols_per_card, glyphs, args.layout, args.seed, args.card_mm)
+
+    start = time.perf_counter()
+    try:
+        cards = export_deck(options, args.output, fmt, workers=args.workers, chunk_size=args.chunk_size)
+    except (OSError, ValueError) as e:
+        raise SystemExit(str(e))
+    elapsed = time.perf_counter() - start
+    print(f"✓ {cards} cards to {args.output} in {elapsed:.2f}s")
+
+
+def run_bench_command(args: argparse.Namespace) -> None:
+    """Handle `dobble bench ...`."""
+    import json
+
+    from . import bench
+
+    if args.bench_command == "compare":
+        try:
+            comparisons = bench.compare(
+                bench.load_results(args.baseline), bench.load_results(args.current), args.threshold
+            )
+        except (OSError, ValueError, KeyError) as e:
+            raise SystemExit(f"Cannot compare results: {e}")
+        for c in comparisons:
+            flag = "REGRESSED" if c.regressed else ""
+            print(
+                f"{c.key:<32} {bench.format_time(c.baseline):>10} -> {bench.format_time(c.current):>10}"
+                f"  {c.ratio:6.2f}x  {flag}".rstrip()
+            )
+        regressions = [c for c in comparisons if c.regressed]
+        print(f"{len(regressions)} of {len(comparisons)} benchmarks regressed by more than {args.threshold:.0%}")
+        if regressions:
+            raise SystemExit(1)
+        return
+
+    # Progress goes to stderr when the JSON goes to stdout.
+    progress_file = sys.stdout if args.output else sys.stderr
+    try:
+        results = bench.run_suite(
+            args.cases,
+            args.sizes,
+            min_time=args.min_time,
+            rounds=args.rounds,
+            progress=lambda result: bench.print_result(result, file=progress_file),
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+    document = bench.to_json(results) if args.format == "dobble" else bench.to_pytest_benchmark_json(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"✓ {args.output}")
+    else:
+        print(json.dumps(document, indent=2))
+
+
+def main(argv: Optional[List[str]] = None):
     """Entry point for the game."""
-    controller = GameController()
+    args = build_parser().parse_args(argv)
+
+    if args.command == "cache":
+        run_cache_command(args)
+        return
+    if args.command == "simulate":
+        run_simulate_command(args)
+        return
+    if args.command == "serve":
+        run_serve_command(args)
+        return
+    if args.command == "replay":
+        run_replay_command(args)
+        return
+    if args.command == "loadgen":
+        run_loadgen_command(args)
+        return
+    if args.command == "export":
+        run_export_command(args)
+        return
+    if args.command == "bench":
+        run_bench_command(args)
+        return
+
+    controller = GameController(race_keys=args.race_keys)
     controller.run_game()
 
 
@@ -0,0 +1,190 @@
+"""
+Load generator for `dobble serve` (`dobble loadgen`).
+
+Opens one connection per bot, seats the bots at their own tables and plays
+games as fast as the server allows: on every turn each bot waits a random
+"think" time, then claims the symbol its card shares with the live card.
+Turn latency is measured per claim, from sending it to receiving the
+server's verdict (the turn's result or a rejection).
+"""
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, NamedTuple
+
+from .protocol import DEFAULT_HOST, MAX_LINE, encode
+
+
+class LoadReport(NamedTuple):
+    """
+    Outcome of a load run.
+
+    Attributes:
+        tables (int): Tables played concurrently.
+        players (int): Bots per table.
+        games (int): Games completed.
+        turns (int): Turns completed.
+        seconds (float): Wall-clock duration of the run.
+        p50_ms (float): Median turn latency.
+        p99_ms (float): 99th percentile turn latency.
+        server_cpu_seconds (float): CPU time the server used during the run.
+        tables_per_core (float): Tables one fully busy server core could host
+            at this pace (tables * seconds / server_cpu_seconds).
+    """
+
+    tables: int
+    players: int
+    games: int
+    turns: int
+    seconds: float
+    p50_ms: float
+    p99_ms: float
+    server_cpu_seconds: float
+    tables_per_core: float
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.seconds if self.seconds else 0.0
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of values (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(fraction * len(ordered) + 0.5) - 1))]
+
+
+async def _request_stats(host: str, port: int) -> Dict:
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+    writer.write(encode({"type": "stats"}))
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+
+class _Bot:
+    def __init__(self, table: str, name: str, players: int, symbols: int, think: float, rng: random.Random):
+        self.table = table
+        self.name = name
+        self.players = players
+        self.symbols = symbols
+        self.think = think
+        self.rng = rng
+        self.latencies: List[float] = []
+        self.turns = 0
+        self._sent: Dict[int, float] = {}
+        self._turn = -1
+
+    async def _claim(self, writer: asyncio.StreamWriter, turn: int, symbol: int) -> None:
+        if self.think:
+            await asyncio.sleep(self.rng.uniform(0, self.think))
+        if turn != self._turn or writer.is_closing():
+            return
+        self._sent[turn] = time.perf_counter()
+        writer.write(encode({"type": "claim", "turn": turn, "symbol": symbol}))
+
+    def _verdict(self, turn: int) -> None:
+        sent = self._sent.pop(turn, None)
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent)
+
+    async def play(self, host: str, port: int, games: int) -> int:
+        """Play games at this bot's table; return the number finished."""
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        claims = set()
+        finished = 0
+        try:
+            for game in range(games):
+                writer.write(
+                    encode(
+                        {
+                            "type": "join",
+                            "table": f"{self.table}-{game}",
+                            "name": self.name,
+                            "players": self.players,
+                            "symbols": self.symbols,
+                        }
+                    )
+                )
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        return finished
+                    message = json.loads(line)
+                    kind = message["type"]
+                    if kind == "turn":
+                        self._turn = message["turn"]
+                        common = set(message["card"]).intersection(message["live"])
+                        if common:
+                            task = asyncio.create_task(self._claim(writer, self._turn, min(common)))
+                            claims.add(task)
+                            task.add_done_callback(claims.discard)
+                    elif kind == "result":
+                        self.turns += 1
+                        self._verdict(message["turn"])
+                    elif kind == "rejected":
+                        self._verdict(message["turn"])
+                    elif kind == "over":
+                        self._turn = -1
+                        finished += message["seat"] is not None
+                        break
+                    elif kind == "error":
+                        raise RuntimeError(message["message"])
+        finally:
+            for task in claims:
+                task.cancel()
+            writer.close()
+        return finished
+
+
+async def run_load(
+    host: str = DEFAULT_HOST,
+    port: int = 0,
+    tables: int = 100,
+    players: int = 2,
+    symbols: int = 8,
+    games: int = 1,
+    think: float = 0.005,
+    seed: int = 0,
+) -> LoadReport:
+    """
+    Play games on a running server and measure it.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+        tables (int): Tables played at the same time.
+        players (int): Bots per table.
+        symbols (int): Symbols per card.
+        games (int): Games played in a row at each table.
+        think (float): Longest random delay, in seconds, before a bot claims.
+        seed (int): Seed for the bots' think times.
+    """
+    rng = random.Random(seed)
+    bots = [
+        _Bot(f"load-{seed}-{t}", f"Bot {p + 1}", players, symbols, think, random.Random(rng.getrandbits(64)))
+        for t in range(tables)
+        for p in range(players)
+    ]
+    before = await _request_stats(host, port)
+    start = time.perf_counter()
+    finished = await asyncio.gather(*(bot.play(host, port, games) for bot in bots))
+    seconds = time.perf_counter() - start
+    after = await _request_stats(host, port)
+
+    latencies = [latency for bot in bots for latency in bot.latencies]
+    cpu = after["cpu_seconds"] - before["cpu_seconds"]
+    return LoadReport(
+        tables=tables,
+        players=players,
+        # Every bot at a table sees the same games finish.
+        games=sum(finished) // players,
+        turns=sum(bot.turns for bot in bots) // players,
+        seconds=seconds,
+        p50_ms=percentile(latencies, 0.5) * 1e3,
+        p99_ms=percentile(latencies, 0.99) * 1e3,
+        server_cpu_seconds=cpu,
+        tables_per_core=tables * seconds / cpu if cpu > 0 else float("inf"),
+    )
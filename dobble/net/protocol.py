@@ -0,0 +1,73 @@
+"""
+The line-delimited JSON protocol spoken by `dobble serve`.
+
+Every message is one JSON object on its own line with a "type" field.
+
+Client to server:
+    {"type": "join", "table": "t1", "name": "Ada", "players": 2, "symbols": 8}
+        Take a seat. "table" is optional: without it the client is seated at
+        any waiting table of that size. The table's first player sets its
+        number of players and symbols per card; the game starts once every
+        seat is taken.
+    {"type": "claim", "turn": 3, "symbol": 17}
+        Claim that the top card shares a symbol with the live card.
+        "coordinate" (e.g. "B2", on the live card) may be sent instead of
+        "symbol".
+    {"type": "leave"}
+    {"type": "stats"}
+
+Server to client:
+    {"type": "joined", "table": "t1", "seat": 0, "players": 2, "symbols": 8}
+    {"type": "turn", "table": "t1", "turn": 3, "live": [...], "card": [...],
+     "cards": 12, "ts": 1234.5}
+        The live card, the client's own top card and how many cards it holds.
+    {"type": "result", "table": "t1", "turn": 3, "seat": 1, "name": "Bob",
+     "symbol": 17, "ts": 1234.6}
+        The earliest valid claim (by server receive time) won the turn.
+    {"type": "rejected", "turn": 3, "reason": "late" | "wrong" | "stale" | "over",
+     "behind": 0.004}
+        A claim that did not win; "behind" (seconds after the winning claim)
+        is sent with "late", and "over" answers claims that crossed the end
+        of the game.
+    {"type": "over", "table": "t1", "seat": 1, "name": "Bob", "turns": 40}
+        The game ended; seat and name are null if a player left.
+    {"type": "stats", ...}
+    {"type": "error", "message": "..."}
+
+Timestamps are the server's monotonic clock, in seconds.
+"""
+import json
+from typing import Any, Dict
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7854
+
+# Longest line accepted from a client, in bytes.
+MAX_LINE = 64 * 1024
+
+Message = Dict[str, Any]
+
+
+class ProtocolError(ValueError):
+    """Raised for lines that are not valid protocol messages."""
+
+
+def encode(message: Message) -> bytes:
+    """Serialise a message as one line."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> Message:
+    """
+    Parse one line into a message.
+
+    Raises:
+        ProtocolError: If the line is not a JSON object with a string "type".
+    """
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ProtocolError(f"Invalid JSON: {e}") from None
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ProtocolError('Messages must be JSON objects with a string "type"')
+    return message
@@ -0,0 +1,66 @@
+from bisect import bisect, insort
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Tuple
+
+# Points per node on the ring; more points spread keys more evenly.
+DEFAULT_REPLICAS = 64
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    A consistent-hash ring mapping keys (table ids) to nodes (workers).
+
+    Each node owns the arcs of the ring ending at its points. Adding or
+    removing a node only moves the keys on its own arcs, so when a worker
+    dies only its tables are reassigned, and the survivors keep theirs.
+
+    Attributes:
+        replicas (int): Points per node.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = DEFAULT_REPLICAS):
+        self.replicas = replicas
+        self._points: List[Tuple[int, str]] = []
+        self._nodes: Dict[str, List[int]] = {}
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
+
+    def add(self, node: str) -> None:
+        """Add a node (no-op if present)."""
+        if node in self._nodes:
+            return
+        hashes = [_hash(f"{node}#{i}") for i in range(self.replicas)]
+        self._nodes[node] = hashes
+        for h in hashes:
+            insort(self._points, (h, node))
+
+    def remove(self, node: str) -> None:
+        """Remove a node (no-op if absent)."""
+        if self._nodes.pop(node, None) is not None:
+            self._points = [point for point in self._points if point[1] != node]
+
+    def node_for(self, key: str) -> str:
+        """
+        The node owning a key.
+
+        Raises:
+            ValueError: If the ring is empty.
+        """
+        if not self._points:
+            raise ValueError("No nodes on the ring")
+        i = bisect(self._points, (_hash(key), "")) % len(self._points)
+        return self._points[i][1]
@@ -0,0 +1,526 @@
+"""
+Host many Dobble tables in one asyncio event loop (`dobble serve`).
+
+Each client connection has a reader coroutine that handles one line at a
+time without ever blocking the loop, and a writer coroutine that drains a
+bounded outgoing queue. Claims are stamped with the server's clock as they
+are read, and the earliest valid claim for the current turn wins it; later
+claims for the same turn are told how far behind they were. This replaces
+the interactive "who spotted it first?" prompt.
+
+Tables share one read-only deck per order, so a table costs a DobbleGame,
+a permutation of card indices and its seats. Only the server's deck sizes
+can be asked for, and their decks are built (off the event loop) before
+clients are served.
+"""
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from ..config import VALID_CARD_SIZES
+from ..game.deck import Deck
+from ..game.events import EventWriter
+from ..game.game import DobbleGame
+from ..game.registry import DeckRegistry, default_registry
+from .protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, Message, ProtocolError, decode, encode
+
+MAX_PLAYERS = 64
+MAX_NAME = 32
+# Outgoing messages buffered per client before it is dropped as too slow.
+DEFAULT_MAX_PENDING = 256
+
+
+class Connection:
+    """
+    One client connection and its bounded outgoing queue.
+
+    send() never blocks: messages are queued for the writer task, which
+    writes them in batches and waits for the socket to drain. A client that
+    stops reading lets its queue fill up, and is disconnected once
+    max_pending messages are waiting, so one slow client cannot hold up a
+    table or grow the server's memory.
+
+    Attributes:
+        name (str): The player's name.
+        table (Optional[Table]): The table the client sits at.
+        seat (int): The client's seat at that table.
+        closed (bool): Whether the connection is closing.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, max_pending: int = DEFAULT_MAX_PENDING):
+        self.writer = writer
+        self.max_pending = max_pending
+        self.name = "Player"
+        self.table: Optional["Table"] = None
+        # The table whose game just ended, to answer claims that crossed its end.
+        self.last_table: Optional["Table"] = None
+        self.seat = -1
+        self.closed = False
+        self.dropped = False
+        self._queue: Deque[bytes] = deque()
+        self._ready = asyncio.Event()
+
+    def send(self, data: bytes) -> None:
+        """Queue an encoded message for the client."""
+        if self.closed:
+            return
+        if len(self._queue) >= self.max_pending:
+            self.dropped = True
+            self.abort()
+            return
+        self._queue.append(data)
+        self._ready.set()
+
+    async def pump(self) -> None:
+        """Write queued messages until the connection is closed and the queue is empty."""
+        queue = self._queue
+        writer = self.writer
+        try:
+            while queue or not self.closed:
+                if not queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                data = b"".join(queue)
+                queue.clear()
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.closed = True
+            writer.close()
+
+    def close(self) -> None:
+        """Close once the queued messages have been written."""
+        self.closed = True
+        self._ready.set()
+
+    def abort(self) -> None:
+        """Close immediately, discarding queued messages."""
+        self.closed = True
+        self._queue.clear()
+        self.writer.transport.abort()
+        self._ready.set()
+
+
+class Table:
+    """
+    A game being played (or waiting for players) on the server.
+
+    Attributes:
+        id (str): Table id.
+        num_players (int): Seats at the table.
+        game (DobbleGame): The game.
+        seats (List[Optional[Connection]]): Who sits where.
+        turn (int): Current turn number, starting at 0.
+        started (bool): Whether every seat was filled and cards were dealt.
+        won_at (float): Server time of the claim that won the previous turn.
+    """
+
+    def __init__(
+        self, table_id: str, num_players: int, deck: Deck, rng: random.Random, log: Optional[EventWriter] = None
+    ):
+        self.id = table_id
+        self.num_players = num_players
+        self.game = DobbleGame(deck.symbols_per_card, deck=deck, log=log)
+        self.seats: List[Optional[Connection]] = [None] * num_players
+        self.turn = 0
+        self.started = False
+        self.won_at = 0.0
+        self._rng = rng
+
+    @property
+    def symbols_per_card(self) -> int:
+        return self.game.symbols_per_card
+
+    @property
+    def is_full(self) -> bool:
+        return None not in self.seats
+
+    @property
+    def is_empty(self) -> bool:
+        return all(conn is None for conn in self.seats)
+
+    def sit(self, conn: Connection) -> int:
+        """Seat a client in the first free seat and return it."""
+        seat = self.seats.index(None)
+        self.seats[seat] = conn
+        conn.table = self
+        conn.seat = seat
+        return seat
+
+    def start(self, now: float) -> None:
+        """Deal the cards and send the first turn."""
+        self.game.setup_game([conn.name for conn in self.seats], rng=self._rng)
+        self.started = True
+        self.send_turn(now)
+
+    def send_turn(self, now: float) -> None:
+        """Send every player the live card and their own top card."""
+        live = list(self.game.live_card.sorted_symbols)
+        for seat, conn in enumerate(self.seats):
+            player = self.game.players[seat]
+            top_card = player.get_card()
+            conn.send(
+                encode(
+                    {
+                        "type": "turn",
+                        "table": self.id,
+                        "turn": self.turn,
+                        "live": live,
+                        "card": list(top_card.sorted_symbols) if top_card is not None else [],
+                        "cards": len(player.cards),
+                        "ts": now,
+                    }
+                )
+            )
+
+    def broadcast(self, message: Message) -> None:
+        data = encode(message)
+        for conn in self.seats:
+            if conn is not None:
+                conn.send(data)
+
+
+class DobbleServer:
+    """
+    Hosts tables for any number of clients in one event loop.
+
+    Attributes:
+        host (str): Interface to listen on.
+        port (int): Port to listen on (0 picks a free one; see bound_port).
+        max_pending (int): Outgoing messages buffered per client before it is dropped.
+        tables (Dict[str, Table]): Tables waiting for players or being played.
+        stats (Dict[str, int]): Counters reported by the "stats" message.
+        log (Optional[EventWriter]): Event log every table's games are recorded to.
+        registry (DeckRegistry): Where tables get their shared, read-only decks.
+        sizes (List[int]): Symbols per card that tables may be played with.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        seed: Optional[int] = None,
+        log: Optional[EventWriter] = None,
+        registry: Optional[DeckRegistry] = None,
+        sizes: Optional[List[int]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.tables: Dict[str, Table] = {}
+        self.stats: Dict[str, int] = {
+            "connections_total": 0,
+            "games_started": 0,
+            "games_finished": 0,
+            "turns": 0,
+            "claims": 0,
+            "slow_clients_dropped": 0,
+        }
+        self.log = log
+        self.registry = registry if registry is not None else default_registry()
+        self.sizes = list(VALID_CARD_SIZES if sizes is None else sizes)
+        # Decks of every size, held here so registry evictions never rebuild one on the loop.
+        self._decks: Dict[int, Deck] = {}
+        self._rng = random.Random(seed)
+        self._waiting: Dict[Tuple[int, int], Table] = {}
+        self._auto_ids = itertools.count(1)
+        self._connections: Set[Connection] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._started_at = time.monotonic()
+        self._cpu_at_start = time.process_time()
+
+    async def prepare_decks(self) -> None:
+        """Build (or map from the cache) the deck of every size, in a thread so the loop keeps running."""
+        loop = asyncio.get_running_loop()
+        for size in self.sizes:
+            if size not in self._decks:
+                self._decks[size] = await loop.run_in_executor(None, self.registry.get, size)
+
+    async def start(self) -> None:
+        """Prepare the decks and start listening."""
+        await self.prepare_decks()
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE, backlog=4096
+        )
+
+    @property
+    def bound_port(self) -> int:
+        """The port actually listened on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and drop every client."""
+        if self._server is not None:
+            self._server.close()
+        for conn in list(self._connections):
+            conn.abort()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _deck(self, symbols_per_card: int) -> Deck:
+        deck = self._decks.get(symbols_per_card)
+        if deck is None:  # Only when dispatching without start() or prepare_decks().
+            deck = self._decks[symbols_per_card] = self.registry.get(symbols_per_card)
+        return deck
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = Connection(writer, self.max_pending)
+        self._connections.add(conn)
+        self.stats["connections_total"] += 1
+        pump = asyncio.create_task(conn.pump())
+        self._tasks.add(pump)
+        pump.add_done_callback(self._tasks.discard)
+        loop = asyncio.get_running_loop()
+        try:
+            while not conn.closed:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    conn.send(encode({"type": "error", "message": f"Lines are limited to {MAX_LINE} bytes"}))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                self.dispatch(conn, line, loop.time())
+        finally:
+            if conn.dropped:
+                self.stats["slow_clients_dropped"] += 1
+            self._leave(conn)
+            self._connections.discard(conn)
+            conn.close()
+
+    def dispatch(self, conn: Connection, line: bytes, received: float) -> None:
+        """Handle one line from a client, read at server time received."""
+        try:
+            message = decode(line)
+        except ProtocolError as e:
+            conn.send(encode({"type": "error", "message": str(e)}))
+            return
+        kind = message["type"]
+        if kind == "claim":
+            self._claim(conn, message, received)
+        elif kind == "join":
+            self._join(conn, message, received)
+        elif kind == "leave":
+            self._leave(conn)
+        elif kind == "stats":
+            conn.send(encode(self.snapshot()))
+        else:
+            conn.send(encode({"type": "error", "message": f"Unknown message type {kind!r}"}))
+
+    def snapshot(self) -> Message:
+        """The "stats" message: counters, live tables, shared decks and the server's CPU time."""
+        playing = sum(1 for table in self.tables.values() if table.started)
+        decks = self.registry.stats()
+        return {
+            "type": "stats",
+            **self.stats,
+            "connections": len(self._connections),
+            "tables_playing": playing,
+            "tables_waiting": len(self.tables) - playing,
+            "decks": decks.decks,
+            "deck_hits": decks.hits,
+            "deck_misses": decks.misses,
+            "cpu_seconds": time.process_time() - self._cpu_at_start,
+            "uptime": time.monotonic() - self._started_at,
+        }
+
+    def _join(self, conn: Connection, message: Message, now: float) -> None:
+        def error(text: str) -> None:
+            conn.send(encode({"type": "error", "message": text}))
+
+        if conn.table is not None:
+            return error(f"Already at table {conn.table.id}")
+        players = message.get("players")
+        symbols = message.get("symbols")
+        if players is not None and (not isinstance(players, int) or not 1 <= players <= MAX_PLAYERS):
+            return error(f"players must be between 1 and {MAX_PLAYERS}")
+        if symbols is not None and (not isinstance(symbols, int) or symbols not in self.sizes):
+            return error(f"symbols must be one of {', '.join(map(str, self.sizes))}")
+
+        table_id = message.get("table")
+        if table_id is not None and not isinstance(table_id, str):
+            return error("table must be a string")
+        table = self.tables.get(table_id) if table_id is not None else None
+        if table is not None:
+            if table.started or table.is_full:
+                return error(f"Table {table_id} is full")
+            if (players or table.num_players) != table.num_players or (
+                symbols or table.symbols_per_card
+            ) != table.symbols_per_card:
+                return error(
+                    f"Table {table_id} is for {table.num_players} players "
+                    f"with {table.symbols_per_card} symbols per card"
+                )
+        else:
+            players = players or 2
+            symbols = symbols or 8
+            deck = self._deck(symbols)
+            if len(deck) <= players:
+                return error(f"A {symbols}-symbol deck has too few cards for {players} players")
+            if table_id is None:
+                table = self._waiting.get((players, symbols))
+            if table is None:
+                table = Table(
+                    table_id if table_id is not None else f"auto-{next(self._auto_ids)}",
+                    players,
+                    deck,
+                    random.Random(self._rng.getrandbits(64)),
+                    self.log,
+                )
+                self._add_table(table, waiting=table_id is None)
+
+        conn.name = str(message.get("name") or f"Player {table.seats.index(None) + 1}")[:MAX_NAME]
+        seat = table.sit(conn)
+        conn.last_table = None
+        conn.send(
+            encode(
+                {
+                    "type": "joined",
+                    "table": table.id,
+                    "seat": seat,
+                    "players": table.num_players,
+                    "symbols": table.symbols_per_card,
+                }
+            )
+        )
+        if table.is_full:
+            self._waiting.pop((table.num_players, table.symbols_per_card), None)
+            self.stats["games_started"] += 1
+            table.start(now)
+
+    def _claim(self, conn: Connection, message: Message, received: float) -> None:
+        table = conn.table
+        if table is None and conn.last_table is not None:
+            conn.send(encode({"type": "rejected", "turn": message.get("turn"), "reason": "over"}))
+            return
+        if table is None or not table.started:
+            conn.send(encode({"type": "error", "message": "Not in a game"}))
+            return
+        self.stats["claims"] += 1
+        turn = message.get("turn", table.turn)
+        if turn != table.turn:
+            rejection: Message = {"type": "rejected", "turn": turn, "reason": "stale"}
+            if turn == table.turn - 1:
+                rejection.update(reason="late", behind=received - table.won_at)
+            conn.send(encode(rejection))
+            return
+
+        game = table.game
+        symbol = message.get("symbol")
+        if symbol is None and isinstance(message.get("coordinate"), str):
+            symbol = game.get_symbol_at_coordinate(message["coordinate"])
+        if isinstance(symbol, int):
+            game.record_guess(symbol, conn.seat)
+        top_card = game.players[conn.seat].get_card()
+        if (
+            not isinstance(symbol, int)
+            or top_card is None
+            or not game.live_card.has_symbol(symbol)
+            or not top_card.has_symbol(symbol)
+        ):
+            conn.send(encode({"type": "rejected", "turn": turn, "reason": "wrong"}))
+            return
+
+        game.play_winning_card(conn.seat)
+        table.won_at = received
+        table.turn += 1
+        self.stats["turns"] += 1
+        table.broadcast(
+            {
+                "type": "result",
+                "table": table.id,
+                "turn": turn,
+                "seat": conn.seat,
+                "name": conn.name,
+                "symbol": symbol,
+                "ts": received,
+            }
+        )
+        if game.is_over:
+            self.stats["games_finished"] += 1
+            self._end(table, conn.seat, conn.name)
+        else:
+            table.send_turn(received)
+
+    def _leave(self, conn: Connection) -> None:
+        table = conn.table
+        if table is None:
+            return
+        if table.started:
+            self._end(table, None, None, reason=f"{conn.name} left")
+            return
+        table.seats[conn.seat] = None
+        conn.table = None
+        if table.is_empty:
+            self._remove_table(table)
+
+    def _end(self, table: Table, seat: Optional[int], name: Optional[str], reason: Optional[str] = None) -> None:
+        message: Message = {"type": "over", "table": table.id, "seat": seat, "name": name, "turns": table.turn}
+        if reason is not None:
+            message["reason"] = reason
+        table.broadcast(message)
+        for conn in table.seats:
+            if conn is not None:
+                conn.table = None
+                conn.last_table = table
+        self._remove_table(table)
+
+    def _add_table(self, table: Table, waiting: bool = False) -> None:
+        """Register a new table; waiting tables are offered to joins without a table id."""
+        self.tables[table.id] = table
+        if waiting:
+            self._waiting[(table.num_players, table.symbols_per_card)] = table
+
+    def _remove_table(self, table: Table) -> None:
+        """Forget a table that ended or emptied (subclasses hook in here)."""
+        del self.tables[table.id]
+        if self._waiting.get((table.num_players, table.symbols_per_card)) is table:
+            del self._waiting[(table.num_players, table.symbols_per_card)]
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    ready=None,
+    workers: int = 0,
+    log: Optional[EventWriter] = None,
+) -> None:
+    """
+    Run a server until cancelled.
+
+    Args:
+        ready: Called with the started server once it is listening.
+        workers (int): With 0, host every table in this process; otherwise
+            route tables to this many worker processes (see dobble.net.shards).
+        log (Optional[EventWriter]): Record every table's games to this log
+            (single-process hosting only).
+    """
+    if workers:
+        from .shards import ShardedServer
+
+        server = ShardedServer(host, port, max_pending, workers=workers)
+    else:
+        server = DobbleServer(host, port, max_pending, log=log)
+    await server.start()
+    if ready is not None:
+        ready(server)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,426 @@
+"""
+Host tables across worker processes (`dobble serve --workers N`).
+
+A front process accepts every client connection and routes each table to
+one of N worker processes, chosen by consistent hashing on the table id
+(see HashRing). A table stays pinned to its worker until it ends. Workers
+run the same game logic as the single-process server (DobbleServer), fed
+over a socket pair per worker with frames of the form
+
+    <client id> <op> <timestamp> <JSON line>
+
+where op is "m" (a client message, or a message for a client), "c" (the
+client disconnected), "s" (a stats request or reply), "n" (a table was
+created), "e" (a table ended) or "j" (the client sat down at a table).
+Claims are stamped by the front as it reads them, so every worker settles
+turns on the same clock.
+
+Joins without a table id are all sent, per number of players and symbols,
+to one worker, which seats them at its waiting tables just as the
+single-process server does; the front does not count seats itself.
+
+Decks are prebuilt into the on-disk cache before the workers start; each
+worker memory-maps the cache files, so all processes share one copy of the
+deck data through the page cache instead of generating their own.
+
+When a worker dies, clients at its tables are told their game is over, its
+arcs of the ring pass to the surviving workers, and a replacement is
+started and put back on the ring. Tables in play on other workers are not
+moved.
+"""
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..config import VALID_CARD_SIZES
+from ..game.cache import build_cache
+from .protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, Message, ProtocolError, decode, encode
+from .ring import HashRing
+from .server import DEFAULT_MAX_PENDING, Connection, DobbleServer, Table
+
+# Buffered bytes on a worker pipe before the writer waits for it to drain.
+PIPE_HIGH_WATER = 1 << 20
+# A worker that dies sooner than this after starting is replaced only after
+# the same delay, so a worker that cannot start does not respawn in a loop.
+RESPAWN_DELAY = 1.0
+
+
+def _frame(client_id: int, op: str, payload: bytes = b"\n", ts: float = 0.0) -> bytes:
+    return f"{client_id} {op} {ts!r} ".encode() + payload
+
+
+def _parse_frame(line: bytes) -> Tuple[int, str, float, bytes]:
+    client_id, op, ts, payload = line.split(b" ", 3)
+    return int(client_id), op.decode(), float(ts), payload
+
+
+class _PipeConnection:
+    """A client as seen by a worker: messages for it are framed onto the worker's pipe."""
+
+    def __init__(self, client_id: int, pipe: asyncio.StreamWriter):
+        self.client_id = client_id
+        self.pipe = pipe
+        self.name = "Player"
+        self.table: Optional[Table] = None
+        self.last_table: Optional[Table] = None
+        self.seat = -1
+        self.closed = False
+        self.dropped = False
+
+    def send(self, data: bytes) -> None:
+        self.pipe.write(_frame(self.client_id, "m", data))
+
+
+class WorkerServer(DobbleServer):
+    """The game logic of one worker: a DobbleServer whose clients live in the front process."""
+
+    def __init__(
+        self,
+        pipe: asyncio.StreamWriter,
+        name: str = "worker",
+        seed: Optional[int] = None,
+        sizes: Optional[List[int]] = None,
+    ):
+        super().__init__(seed=seed, sizes=sizes)
+        self.pipe = pipe
+        # Waiting tables get ids unique across workers: auto-<worker>-<n>.
+        self._auto_ids = (f"{name}-{i}" for i in itertools.count(1))
+
+    def _add_table(self, table: Table, waiting: bool = False) -> None:
+        super()._add_table(table, waiting)
+        self.pipe.write(_frame(0, "n", encode({"table": table.id})))
+
+    def _remove_table(self, table: Table) -> None:
+        super()._remove_table(table)
+        self.pipe.write(_frame(0, "e", encode({"table": table.id})))
+
+
+async def _run_worker(sock: socket.socket, name: str, sizes: Optional[List[int]] = None) -> None:
+    reader, writer = await asyncio.open_connection(sock=sock, limit=2 * MAX_LINE)
+    server = WorkerServer(writer, name, sizes=sizes)
+    await server.prepare_decks()
+    clients: Dict[int, _PipeConnection] = {}
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        client_id, op, ts, payload = _parse_frame(line)
+        if op == "m":
+            conn = clients.get(client_id)
+            if conn is None:
+                conn = clients[client_id] = _PipeConnection(client_id, writer)
+            table = conn.table
+            server.dispatch(conn, payload, ts)
+            if conn.table is not None and conn.table is not table:
+                writer.write(_frame(client_id, "j", encode({"table": conn.table.id})))
+        elif op == "c":
+            conn = clients.pop(client_id, None)
+            if conn is not None:
+                server._leave(conn)
+        elif op == "s":
+            writer.write(_frame(0, "s", encode(server.snapshot())))
+        if writer.transport.get_write_buffer_size() > PIPE_HIGH_WATER:
+            await writer.drain()
+
+
+def worker_main(sock: socket.socket, name: str = "worker", sizes: Optional[List[int]] = None) -> None:
+    """Entry point of a worker process."""
+    try:
+        asyncio.run(_run_worker(sock, name, sizes))
+    except KeyboardInterrupt:
+        pass
+
+
+class _Worker:
+    """The front's handle on one worker process."""
+
+    def __init__(self, name: str, process, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.name = name
+        self.process = process
+        self.reader = reader
+        self.writer = writer
+        self.alive = True
+        self.started_at = time.monotonic()
+        self.stats_waiters: List[asyncio.Future] = []
+
+
+class _FrontClient:
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self.worker: Optional[_Worker] = None
+        self.table: Optional[str] = None
+
+
+class ShardedServer:
+    """
+    The front process: accepts clients and routes their tables to workers.
+
+    Has the same start/bound_port/serve_forever/close interface as DobbleServer.
+
+    Attributes:
+        host (str): Interface to listen on.
+        port (int): Port to listen on (0 picks a free one; see bound_port).
+        max_pending (int): Outgoing messages buffered per client before it is dropped.
+        num_workers (int): Worker processes kept running.
+        respawn (bool): Replace workers that die.
+        sizes (List[int]): Symbols per card tables may use; their decks are
+            prebuilt into the cache for the workers.
+        ring (HashRing): Live workers, by name.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        workers: Optional[int] = None,
+        respawn: bool = True,
+        sizes: Optional[List[int]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.num_workers = workers or os.cpu_count() or 1
+        self.respawn = respawn
+        self.sizes = list(VALID_CARD_SIZES if sizes is None else sizes)
+        self.ring = HashRing()
+        self.workers: Dict[str, _Worker] = {}
+        self.worker_failures = 0
+        self.connections_total = 0
+        self.slow_clients_dropped = 0
+        self._routes: Dict[str, _Worker] = {}
+        self._clients: Dict[int, _FrontClient] = {}
+        self._client_ids = itertools.count(1)
+        self._auto: Dict[str, _Worker] = {}
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._closing = False
+        self._cpu_at_start = time.process_time()
+
+    async def start(self) -> None:
+        """Prebuild the decks, start the workers and listen."""
+        build_cache(self.sizes, verify=False)
+        for i in range(self.num_workers):
+            await self._start_worker(f"worker-{i}")
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE, backlog=4096
+        )
+
+    @property
+    def bound_port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, drop every client and stop the workers."""
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._clients.values()):
+            client.conn.abort()
+        for worker in self.workers.values():
+            worker.writer.close()
+            worker.process.terminate()
+        for worker in self.workers.values():
+            await asyncio.get_running_loop().run_in_executor(None, worker.process.join)
+        for task in list(self._tasks):
+            task.cancel()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _start_worker(self, name: str) -> None:
+        ours, theirs = socket.socketpair()
+        process = self._context.Process(
+            target=worker_main, args=(theirs, name, self.sizes), name=f"dobble-{name}", daemon=True
+        )
+        process.start()
+        theirs.close()
+        reader, writer = await asyncio.open_connection(sock=ours, limit=2 * MAX_LINE)
+        worker = self.workers[name] = _Worker(name, process, reader, writer)
+        self.ring.add(name)
+        self._spawn(self._read_worker(worker))
+
+    async def _read_worker(self, worker: _Worker) -> None:
+        reader = worker.reader
+        while True:
+            try:
+                line = await reader.readline()
+            except ConnectionError:
+                line = b""
+            if not line:
+                break
+            client_id, op, _, payload = _parse_frame(line)
+            if op == "m":
+                client = self._clients.get(client_id)
+                if client is not None:
+                    client.conn.send(payload)
+            elif op == "j":
+                client = self._clients.get(client_id)
+                if client is not None and client.worker is worker:
+                    client.table = json.loads(payload)["table"]
+            elif op == "n":
+                # Pin the table, so it stays put if the ring changes while it is played.
+                self._routes[json.loads(payload)["table"]] = worker
+            elif op == "e":
+                table_id = json.loads(payload)["table"]
+                if self._routes.get(table_id) is worker:
+                    del self._routes[table_id]
+            elif op == "s" and worker.stats_waiters:
+                worker.stats_waiters.pop(0).set_result(json.loads(payload))
+        await self._worker_died(worker)
+
+    async def _worker_died(self, worker: _Worker) -> None:
+        worker.alive = False
+        self.ring.remove(worker.name)
+        for waiter in worker.stats_waiters:
+            waiter.cancel()
+        if self._closing:
+            return
+        self.worker_failures += 1
+        lost = {table_id for table_id, owner in self._routes.items() if owner is worker}
+        for table_id in lost:
+            del self._routes[table_id]
+        for client in self._clients.values():
+            if client.worker is worker:
+                if client.table in lost:
+                    client.conn.send(
+                        encode(
+                            {
+                                "type": "over",
+                                "table": client.table,
+                                "seat": None,
+                                "name": None,
+                                "turns": None,
+                                "reason": "worker failed",
+                            }
+                        )
+                    )
+                client.worker = None
+                client.table = None
+        worker.writer.close()
+        worker.process.join(0)
+        del self.workers[worker.name]
+        if self.respawn:
+            if time.monotonic() - worker.started_at < RESPAWN_DELAY:
+                await asyncio.sleep(RESPAWN_DELAY)
+            if not self._closing:
+                await self._start_worker(worker.name)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client_id = next(self._client_ids)
+        conn = Connection(writer, self.max_pending)
+        client = self._clients[client_id] = _FrontClient(conn)
+        self.connections_total += 1
+        self._spawn(conn.pump())
+        loop = asyncio.get_running_loop()
+        try:
+            while not conn.closed:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    conn.send(encode({"type": "error", "message": f"Lines are limited to {MAX_LINE} bytes"}))
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                await self._route(client_id, client, line, loop.time())
+        finally:
+            if conn.dropped:
+                self.slow_clients_dropped += 1
+            del self._clients[client_id]
+            if client.worker is not None and client.worker.alive:
+                client.worker.writer.write(_frame(client_id, "c"))
+            conn.close()
+
+    async def _route(self, client_id: int, client: _FrontClient, line: bytes, received: float) -> None:
+        try:
+            message = decode(line)
+        except ProtocolError as e:
+            client.conn.send(encode({"type": "error", "message": str(e)}))
+            return
+
+        kind = message["type"]
+        if kind == "stats":
+            client.conn.send(encode(await self.snapshot()))
+            return
+        if kind == "join":
+            table_id = message.get("table")
+            if table_id is not None and not isinstance(table_id, str):
+                client.conn.send(encode({"type": "error", "message": "table must be a string"}))
+                return
+            worker = self._routes.get(table_id) if table_id is not None else self._auto_worker(message)
+            if worker is None:
+                if not len(self.ring):
+                    client.conn.send(encode({"type": "error", "message": "No workers available"}))
+                    return
+                worker = self.workers[self.ring.node_for(table_id)]
+            if client.worker is not None and client.worker is not worker and client.worker.alive:
+                # Leaving a finished game's worker for another: let the old one forget the client.
+                client.worker.writer.write(_frame(client_id, "c"))
+            client.worker = worker
+            client.table = table_id  # For an auto join, set when the worker seats the client.
+
+        worker = client.worker
+        if worker is None or not worker.alive:
+            client.conn.send(encode({"type": "error", "message": "Not in a game"}))
+            return
+        worker.writer.write(_frame(client_id, "m", line, received))
+        if worker.writer.transport.get_write_buffer_size() > PIPE_HIGH_WATER:
+            await worker.writer.drain()
+
+    def _auto_worker(self, message: Message) -> Optional[_Worker]:
+        """
+        The worker seating joins without a table id for this number of players and symbols.
+
+        The choice is kept while the worker lives, so a waiting table is not
+        left behind when the ring changes.
+        """
+        key = f"{message.get('players') or 2}:{message.get('symbols') or 8}"
+        worker = self._auto.get(key)
+        if worker is None or not worker.alive:
+            if not len(self.ring):
+                return None
+            worker = self._auto[key] = self.workers[self.ring.node_for(f"auto:{key}")]
+        return worker
+
+    async def snapshot(self) -> Message:
+        """The "stats" message, summed over the workers, plus the front's own counters."""
+        loop = asyncio.get_running_loop()
+        waiters = []
+        for worker in list(self.workers.values()):
+            if worker.alive:
+                waiter = loop.create_future()
+                worker.stats_waiters.append(waiter)
+                worker.writer.write(_frame(0, "s"))
+                waiters.append(waiter)
+        replies = await asyncio.gather(*waiters, return_exceptions=True)
+        totals: Message = {"type": "stats"}
+        for reply in replies:
+            if isinstance(reply, BaseException):
+                continue
+            for key, value in reply.items():
+                if isinstance(value, (int, float)) and key not in ("connections", "uptime"):
+                    totals[key] = totals.get(key, 0) + value
+        totals["cpu_seconds"] = totals.get("cpu_seconds", 0.0) + time.process_time() - self._cpu_at_start
+        totals.update(
+            connections=len(self._clients),
+            connections_total=self.connections_total,
+            slow_clients_dropped=self.slow_clients_dropped,
+            workers=len(self.ring),
+            worker_failures=self.worker_failures,
+        )
+        return totals
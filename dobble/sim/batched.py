@@ -0,0 +1,182 @@
+"""
+Simulate a whole batch of games in lockstep with NumPy.
+
+Each game's state is a row of a few arrays: the dealt piles are a
+(games, players, cards) index array, each player's top card is a pointer
+into their pile, and the live card is one entry of an index vector. Every
+step advances all unfinished games at once, using a card-by-symbol
+incidence matrix to find matching players instead of asking each Player.
+
+The rules are those of DobbleGame.find_matching_players and
+play_winning_card; dobble.sim.engine.simulate_game is the reference
+implementation and the two are checked against each other statistically.
+"""
+from typing import NamedTuple, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError("Batched simulation requires NumPy: pip install 'pydobble[fast]'") from None
+
+from ..game.deck import Deck
+from .engine import DEFAULT_MAX_GUESSES, GameResult, SimulationStats
+
+BATCH_POLICIES = ("random", "fastest", "reaction")
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of a batch of games, one entry per game.
+
+    Attributes:
+        turns (np.ndarray): Cards played to the centre.
+        guesses (np.ndarray): Calls made, including ones nobody matched.
+        winners (np.ndarray): Seat that ran out of cards first, or -1 if unfinished.
+    """
+
+    turns: "np.ndarray"
+    guesses: "np.ndarray"
+    winners: "np.ndarray"
+
+    def to_stats(self, num_players: int) -> SimulationStats:
+        """Aggregate the batch into a SimulationStats."""
+        stats = SimulationStats(num_players)
+        values, counts = np.unique(self.turns, return_counts=True)
+        stats.turn_counts.update(dict(zip(values.tolist(), counts.tolist())))
+        finished = self.winners[self.winners >= 0]
+        stats.wins = np.bincount(finished, minlength=num_players).tolist()
+        stats.games = int(self.turns.size)
+        stats.unfinished = stats.games - int(finished.size)
+        stats.total_guesses = int(self.guesses.sum())
+        return stats
+
+
+def deck_arrays(deck: Deck):
+    """
+    Return the deck as a (num_cards, k) symbol array and a (num_cards, num_symbols)
+    boolean incidence matrix.
+    """
+    if deck.data is not None:
+        rows = np.frombuffer(deck.data, dtype=np.dtype(deck.data.format))
+        rows = rows.reshape(len(deck), deck.symbols_per_card)
+    else:
+        rows = np.array([list(deck.row(i)) for i in range(len(deck))], dtype=np.int64)
+    incidence = np.zeros((len(deck), deck.num_symbols), dtype=bool)
+    incidence[np.arange(len(deck))[:, None], rows] = True
+    return rows, incidence
+
+
+def simulate_batch(
+    deck: Deck,
+    num_players: int,
+    num_games: int,
+    policy: str = "random",
+    seed: Union[int, Sequence[int]] = 0,
+    max_guesses: int = DEFAULT_MAX_GUESSES,
+    speeds: Optional[Sequence[float]] = None,
+    skills: Optional[Sequence[float]] = None,
+    base_ms: float = 150.0,
+    sigma: float = 0.4,
+) -> BatchResult:
+    """
+    Play num_games games in lockstep.
+
+    Args:
+        deck (Deck): Deck to play with.
+        num_players (int): Players per game.
+        num_games (int): Games in the batch.
+        policy (str): "random", "fastest" or "reaction", with the same meaning
+            (and options) as the policies in dobble.sim.policies.
+        seed (Union[int, Sequence[int]]): Seed (or seed sequence) for the batch's generator.
+        max_guesses (int): Per-game guess limit.
+
+    Returns:
+        BatchResult: Per-game outcomes.
+    """
+    if policy not in BATCH_POLICIES:
+        raise ValueError(f"Unknown policy {policy!r}; choose from {', '.join(BATCH_POLICIES)}")
+    for values in (speeds, skills):
+        if values is not None and len(values) != num_players:
+            raise ValueError("Need one value per player")
+
+    rng = np.random.default_rng(seed)
+    rows, incidence = deck_arrays(deck)
+    num_cards, k = rows.shape
+    per_player = (num_cards - 1) // num_players
+
+    # Deal: the last card of each shuffled permutation goes to the centre, as in setup_game.
+    order = np.broadcast_to(np.arange(num_cards, dtype=np.int32), (num_games, num_cards))
+    order = rng.permuted(order, axis=1)
+    live = order[:, -1].copy()
+    piles = order[:, : num_players * per_player].reshape(num_games, num_players, per_player)
+
+    turns = np.zeros(num_games, dtype=np.int64)
+    guesses = np.zeros(num_games, dtype=np.int64)
+    winners = np.full(num_games, -1, dtype=np.int64)
+    if per_player == 0:
+        winners[:] = 0  # Everyone starts out of cards; the first seat is reported, as in get_winner.
+        return BatchResult(turns, guesses, winners)
+
+    pointers = np.zeros((num_games, num_players), dtype=np.int64)
+    active = np.arange(num_games)
+    seats = np.arange(num_players)
+
+    if policy == "fastest":
+        speeds = np.asarray(speeds if speeds is not None else [1.0] * num_players, dtype=float)
+        fastest = np.flatnonzero(speeds == speeds.max())
+    elif policy == "reaction":
+        skills = np.asarray(skills if skills is not None else [1.0] * num_players, dtype=float)
+        log_medians = np.log(base_ms * k / skills)
+
+    while active.size:
+        tops = piles[active[:, None], seats, pointers[active]]
+        guesses[active] += 1
+
+        if policy == "random":
+            called = rows[live[active], rng.integers(k, size=active.size)]
+            matching = incidence[tops, called[:, None]]
+            keys = rng.random(matching.shape)
+            keys[~matching] = 2.0
+            winner = keys.argmin(axis=1)
+            scored = matching.any(axis=1)
+        else:
+            if policy == "fastest":
+                winner = fastest[rng.integers(fastest.size, size=active.size)]
+            else:
+                times = rng.lognormal(log_medians, sigma, size=(active.size, num_players))
+                winner = times.argmin(axis=1)
+            # Every top card matches the live card, so the first spotter always scores.
+            scored = np.ones(active.size, dtype=bool)
+
+        games = active[scored]
+        seat = winner[scored]
+        live[games] = tops[scored, seat]
+        pointers[games, seat] += 1
+        turns[games] += 1
+
+        finished = pointers[games, seat] == per_player
+        winners[games[finished]] = seat[finished]
+
+        still_playing = winners[active] < 0
+        still_playing &= guesses[active] < max_guesses
+        active = active[still_playing]
+
+    return BatchResult(turns, guesses, winners)
+
+
+def simulate_batched_stats(
+    deck: Deck,
+    num_players: int,
+    num_games: int,
+    policy: str = "random",
+    seed: int = 0,
+    batch_size: int = 4096,
+    **options,
+) -> SimulationStats:
+    """Simulate num_games games in batches of batch_size and return their aggregate."""
+    stats = SimulationStats(num_players)
+    for batch, start in enumerate(range(0, num_games, batch_size)):
+        count = min(batch_size, num_games - start)
+        result = simulate_batch(deck, num_players, count, policy, seed=[seed, batch], **options)
+        stats.merge(result.to_stats(num_players))
+    return stats
@@ -0,0 +1,165 @@
+import math
+import random
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+from ..game.deck import Deck
+from ..game.game import DobbleGame
+from .policies import Policy
+
+if TYPE_CHECKING:
+    from ..game.events import EventWriter
+
+DEFAULT_MAX_GUESSES = 1_000_000
+
+
+class GameResult(NamedTuple):
+    """
+    Outcome of one simulated game.
+
+    Attributes:
+        seed (int): The seed the game was played with.
+        turns (int): Number of cards played to the centre.
+        guesses (int): Number of calls, including ones nobody matched.
+        winner (Optional[int]): Seat of the player who ran out of cards first.
+    """
+
+    seed: int
+    turns: int
+    guesses: int
+    winner: Optional[int]
+
+
+def game_seed(base_seed: int, game_index: int) -> int:
+    """Seed for game number game_index of a run, independent of how games are scheduled."""
+    return (base_seed << 40) + game_index
+
+
+def simulate_game(
+    deck: Deck,
+    num_players: int,
+    policy: Policy,
+    seed: int,
+    max_guesses: int = DEFAULT_MAX_GUESSES,
+    log: Optional["EventWriter"] = None,
+) -> GameResult:
+    """
+    Play one game to completion without any user interface.
+
+    Args:
+        deck (Deck): Deck to play with (shared, read-only).
+        num_players (int): Number of players.
+        policy (Policy): Decides the winner of each turn.
+        seed (int): Seed for the deal and for the policy's randomness.
+        max_guesses (int): Give up (with no winner) after this many calls.
+        log (Optional[EventWriter]): Record the game's events to this log.
+
+    Returns:
+        GameResult: The outcome.
+    """
+    rng = random.Random(seed)
+    game = DobbleGame(deck.symbols_per_card, deck=deck, log=log)
+    game.setup_game([f"Player {i + 1}" for i in range(num_players)], rng=rng)
+
+    choose_winner = policy.choose_winner
+    play_winning_card = game.play_winning_card
+    turns = guesses = 0
+    while not game.is_over and guesses < max_guesses:
+        guesses += 1
+        winner = choose_winner(game, rng)
+        if winner is not None:
+            play_winning_card(winner)
+            turns += 1
+
+    winner = next((i for i, player in enumerate(game.players) if player.is_out_of_cards), None)
+    return GameResult(seed, turns, guesses, winner)
+
+
+class SimulationStats:
+    """
+    Streaming aggregate of many game results.
+
+    Results can be added one at a time or merged from other aggregates (e.g.
+    one per worker chunk), so no per-game data has to be kept.
+
+    Attributes:
+        num_players (int): Players per game.
+        games (int): Number of games aggregated.
+        unfinished (int): Games that hit the guess limit.
+        turn_counts (Counter): Histogram of game length in turns.
+        wins (List[int]): Games won per seat.
+        total_guesses (int): Calls made across all games.
+    """
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.games = 0
+        self.unfinished = 0
+        self.turn_counts: Counter = Counter()
+        self.wins = [0] * num_players
+        self.total_guesses = 0
+
+    def add(self, result: GameResult) -> None:
+        """Add one game result."""
+        self.games += 1
+        self.turn_counts[result.turns] += 1
+        self.total_guesses += result.guesses
+        if result.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[result.winner] += 1
+
+    def merge(self, other: "SimulationStats") -> None:
+        """Fold another aggregate into this one."""
+        if other.num_players != self.num_players:
+            raise ValueError("Cannot merge statistics for different player counts")
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.turn_counts.update(other.turn_counts)
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.total_guesses += other.total_guesses
+
+    @property
+    def mean_turns(self) -> float:
+        if not self.games:
+            return math.nan
+        return sum(turns * count for turns, count in self.turn_counts.items()) / self.games
+
+    @property
+    def stdev_turns(self) -> float:
+        if self.games < 2:
+            return math.nan
+        mean = self.mean_turns
+        squares = sum((turns - mean) ** 2 * count for turns, count in self.turn_counts.items())
+        return math.sqrt(squares / (self.games - 1))
+
+    def turn_quantile(self, q: float) -> Optional[int]:
+        """Smallest game length such that at least a fraction q of games were no longer."""
+        if not self.games:
+            return None
+        target = q * self.games
+        seen = 0
+        for turns in sorted(self.turn_counts):
+            seen += self.turn_counts[turns]
+            if seen >= target:
+                return turns
+        return max(self.turn_counts)  # pragma: no cover
+
+    def win_rates(self) -> List[float]:
+        """Fraction of finished games won by each seat."""
+        finished = self.games - self.unfinished
+        return [wins / finished if finished else math.nan for wins in self.wins]
+
+    def summary(self) -> Dict[str, Any]:
+        """Plain-data summary, suitable for JSON."""
+        return {
+            "games": self.games,
+            "unfinished": self.unfinished,
+            "mean_turns": self.mean_turns,
+            "stdev_turns": self.stdev_turns,
+            "p50_turns": self.turn_quantile(0.5),
+            "p90_turns": self.turn_quantile(0.9),
+            "p99_turns": self.turn_quantile(0.99),
+            "mean_guesses": self.total_guesses / self.games if self.games else math.nan,
+            "win_rates": self.win_rates(),
+        }
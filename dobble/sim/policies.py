@@ -0,0 +1,128 @@
+import math
+import random
+from typing import Dict, Optional, Sequence, Type
+
+from ..game.game import DobbleGame
+
+
+class Policy:
+    """
+    Decides who wins each turn of a simulated game.
+
+    A policy stands in for the people at the table: given the game state it
+    returns the index of the player who claims the live card, or None if the
+    turn produced no winner (e.g. a symbol nobody holds was called).
+    """
+
+    name = ""
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+
+    def choose_winner(self, game: DobbleGame, rng: random.Random) -> Optional[int]:
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """
+    Random guessing, as in the interactive game.
+
+    A random symbol on the live card is called; one of the players whose top
+    card carries it (if any) wins, chosen uniformly.
+    """
+
+    name = "random"
+
+    def choose_winner(self, game: DobbleGame, rng: random.Random) -> Optional[int]:
+        symbols = game.live_card.sorted_symbols
+        symbol = symbols[rng.randrange(len(symbols))]
+        matching = game.find_players_with_symbol(symbol)
+        if not matching:
+            return None
+        return matching[rng.randrange(len(matching))] if len(matching) > 1 else matching[0]
+
+
+class FastestSpotterPolicy(Policy):
+    """
+    The fastest player at the table always spots their match first.
+
+    Players are ranked by a fixed speed (higher is faster); ties between
+    equally fast players are broken uniformly at random.
+    """
+
+    name = "fastest"
+
+    def __init__(self, num_players: int, speeds: Optional[Sequence[float]] = None):
+        super().__init__(num_players)
+        self.speeds = list(speeds) if speeds is not None else [1.0] * num_players
+        if len(self.speeds) != num_players:
+            raise ValueError("Need one speed per player")
+        top = max(self.speeds)
+        self._fastest = [i for i, speed in enumerate(self.speeds) if speed == top]
+
+    def choose_winner(self, game: DobbleGame, rng: random.Random) -> Optional[int]:
+        fastest = self._fastest
+        return fastest[rng.randrange(len(fastest))] if len(fastest) > 1 else fastest[0]
+
+
+class ReactionTimePolicy(Policy):
+    """
+    Each player spots their match after a random, log-normally distributed delay.
+
+    The median delay grows with the number of symbols to scan and shrinks
+    with the player's skill; the player with the shortest delay wins.
+
+    Attributes:
+        base_ms (float): Median time to scan one symbol, for a player of skill 1.
+        sigma (float): Log-normal shape parameter (spread of reaction times).
+        skills (Sequence[float]): Per-player skill multipliers.
+    """
+
+    name = "reaction"
+
+    def __init__(
+        self,
+        num_players: int,
+        base_ms: float = 150.0,
+        sigma: float = 0.4,
+        skills: Optional[Sequence[float]] = None,
+    ):
+        super().__init__(num_players)
+        self.base_ms = base_ms
+        self.sigma = sigma
+        self.skills = list(skills) if skills is not None else [1.0] * num_players
+        if len(self.skills) != num_players:
+            raise ValueError("Need one skill per player")
+        self._mu: Dict[int, Sequence[float]] = {}
+
+    def _log_medians(self, symbols_per_card: int) -> Sequence[float]:
+        mu = self._mu.get(symbols_per_card)
+        if mu is None:
+            mu = self._mu[symbols_per_card] = [
+                math.log(self.base_ms * symbols_per_card / skill) for skill in self.skills
+            ]
+        return mu
+
+    def reaction_times(self, game: DobbleGame, rng: random.Random) -> Sequence[float]:
+        """Draw one spotting delay (in milliseconds) per player."""
+        sigma = self.sigma
+        lognormvariate = rng.lognormvariate
+        return [lognormvariate(mu, sigma) for mu in self._log_medians(game.symbols_per_card)]
+
+    def choose_winner(self, game: DobbleGame, rng: random.Random) -> Optional[int]:
+        times = self.reaction_times(game, rng)
+        return min(range(len(times)), key=times.__getitem__)
+
+
+POLICIES: Dict[str, Type[Policy]] = {
+    policy.name: policy for policy in (RandomPolicy, FastestSpotterPolicy, ReactionTimePolicy)
+}
+
+
+def make_policy(name: str, num_players: int, **options) -> Policy:
+    """Create a policy by name."""
+    try:
+        policy = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown policy {name!r}; choose from {', '.join(POLICIES)}") from None
+    return policy(num_players, **options)
@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterator, NamedTuple, Optional, Set
+
+from ..game.registry import get_deck
+from .engine import DEFAULT_MAX_GUESSES, SimulationStats, game_seed, simulate_game
+from .policies import make_policy
+
+if TYPE_CHECKING:
+    from ..game.events import EventWriter
+
+
+class SimulationConfig(NamedTuple):
+    """
+    What to simulate. Sent to worker processes, so it must stay picklable.
+
+    Attributes:
+        symbols_per_card (int): Deck order.
+        num_players (int): Players per game.
+        policy (str): Policy name (see dobble.sim.policies.POLICIES).
+        policy_options (Dict[str, Any]): Keyword arguments for the policy.
+        max_guesses (int): Per-game guess limit.
+        engine (str): "object" plays each game through DobbleGame; "batched"
+            plays each chunk as one NumPy batch (see dobble.sim.batched).
+    """
+
+    symbols_per_card: int
+    num_players: int
+    policy: str = "random"
+    policy_options: Dict[str, Any] = {}
+    max_guesses: int = DEFAULT_MAX_GUESSES
+    engine: str = "object"
+
+
+def run_chunk(
+    config: SimulationConfig, base_seed: int, start: int, count: int, log: Optional["EventWriter"] = None
+) -> SimulationStats:
+    """Simulate games start..start+count-1 of a run and return their aggregate (optionally logging them)."""
+    # One deck per order per process, from the registry: built (or mapped) on first use.
+    deck = get_deck(config.symbols_per_card)
+    if config.engine == "batched":
+        from .batched import simulate_batch
+
+        result = simulate_batch(
+            deck,
+            config.num_players,
+            count,
+            config.policy,
+            seed=[base_seed, start],
+            max_guesses=config.max_guesses,
+            **config.policy_options,
+        )
+        return result.to_stats(config.num_players)
+
+    policy = make_policy(config.policy, config.num_players, **config.policy_options)
+    stats = SimulationStats(config.num_players)
+    for index in range(start, start + count):
+        seed = game_seed(base_seed, index)
+        stats.add(simulate_game(deck, config.num_players, policy, seed, config.max_guesses, log=log))
+    return stats
+
+
+def iter_chunks(
+    config: SimulationConfig,
+    num_games: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[SimulationStats]:
+    """
+    Simulate num_games games, yielding one aggregate per chunk as chunks finish.
+
+    Chunks are scheduled over a process pool with a bounded number in flight,
+    so memory stays flat however many games are requested. Every game's seed
+    depends only on (seed, game index), so merged results are identical for
+    any worker count or chunk size. (The batched engine draws one random
+    stream per chunk, so its results depend on the chunk size.)
+
+    Args:
+        config (SimulationConfig): What to simulate.
+        num_games (int): Total number of games.
+        seed (int): Base seed for the run.
+        workers (Optional[int]): Worker processes (default: all cores). With 1,
+            chunks run in this process.
+        chunk_size (int): Games per scheduled task.
+    """
+    if config.engine not in ("object", "batched"):
+        raise ValueError(f"Unknown engine {config.engine!r}")
+    make_policy(config.policy, config.num_players, **config.policy_options)  # Fail fast on bad options.
+    chunks = ((start, min(chunk_size, num_games - start)) for start in range(0, num_games, chunk_size))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start, count in chunks:
+            yield run_chunk(config, seed, start, count)
+        return
+
+    max_in_flight = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Set[Future] = set()
+        for start, count in chunks:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(run_chunk, config, seed, start, count))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run_simulations(
+    config: SimulationConfig,
+    num_games: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    log: Optional["EventWriter"] = None,
+) -> SimulationStats:
+    """
+    Simulate num_games games and return the merged aggregate (see iter_chunks).
+
+    With a log, every game's events are recorded to it, and games are played
+    one at a time in this process (the object engine only).
+    """
+    if log is not None:
+        if config.engine != "object":
+            raise ValueError("Only the object engine can log games")
+        return run_chunk(config, seed, 0, num_games, log=log)
+    total = SimulationStats(config.num_players)
+    for stats in iter_chunks(config, num_games, seed, workers, chunk_size):
+        total.merge(stats)
+    return total
@@ -1,20 +1,63 @@
-from rich.console import Console
+from collections import OrderedDict
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from rich.box import Box
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.panel import Panel
+from rich.segment import Segment
 from rich.table import Table
 from rich import box
 
 from ..game.card import DobbleCard
+from ..game.layout import column_label
+from .symbols import SYMBOL_CELLS
+
+
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """The shared Console, created on first use rather than at import time."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    # `console` is kept as a module attribute for `from .components import console`.
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class Theme(NamedTuple):
+    """
+    Colours and box style of the card panels.
+
+    Attributes:
+        live_border (str): Border (and title) style of the live card panel.
+        player_border (str): Border style of the players' panels.
+        box (Box): Box style of the card tables.
+    """
 
+    live_border: str = "cyan"
+    player_border: str = "green"
+    box: Box = box.ROUNDED
 
-console = Console()
 
+DEFAULT_THEME = Theme()
 
-def create_card_table(card: DobbleCard, show_coordinates: bool = True) -> Table:
+
+def create_card_table(card: DobbleCard, show_coordinates: bool = True, theme: Theme = DEFAULT_THEME) -> Table:
     """
     Create a rich Table representation of a card.
 
     Args:
         card (DobbleCard): The card to create a table for.
         show_coordinates (bool): Whether to show coordinate labels (A1, B2, etc.).
+        theme (Theme): Styling to use.
 
     Returns:
         Table: A rich Table object representing the card.
@@ -22,26 +65,127 @@ def create_card_table(card: DobbleCard, show_coordinates: bool = True) -> Table:
     if not card:
         return Table()
 
-    grid = card.get_symbol_grid()
-    size = len(grid)
+    layout = card.layout
+    size = layout.cols
+    symbol_text = SYMBOL_CELLS.text
 
-    table = Table(box=box.ROUNDED, show_header=show_coordinates, show_edge=False)
+    table = Table(box=theme.box, show_header=show_coordinates, show_edge=False)
 
     if show_coordinates:
         table.add_column("")
         for i in range(size):
-            table.add_column(chr(65 + i), justify="center")
+            table.add_column(column_label(i), justify="center")
     else:
         for i in range(size):
             table.add_column("", justify="center")
 
-    for i, row in enumerate(grid):
+    for i, row in enumerate(layout.grid):
         if show_coordinates:
             table_row = [str(i + 1)]
         else:
             table_row = []
 
-        table_row.extend(emoji for _, emoji in row)
+        table_row.extend(" " if s is None else symbol_text(s) for s in row)
         table.add_row(*table_row)
 
     return table
+
+
+class CachedRenderable:
+    """
+    A renderable that remembers how it measured and rendered at each width.
+
+    Rich lays out and renders every renderable on every print; wrapping an
+    unchanging panel in this makes repeat prints of it nearly free.
+    """
+
+    __slots__ = ("renderable", "_measurements", "_lines")
+
+    def __init__(self, renderable: RenderableType):
+        self.renderable = renderable
+        self._measurements: Dict[int, Measurement] = {}
+        self._lines: Dict[Tuple[int, Optional[int]], List[List[Segment]]] = {}
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        measurement = self._measurements.get(options.max_width)
+        if measurement is None:
+            measurement = Measurement.get(console, options, self.renderable)
+            self._measurements[options.max_width] = measurement
+        return measurement
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        key = (options.max_width, options.height)
+        lines = self._lines.get(key)
+        if lines is None:
+            lines = self._lines[key] = console.render_lines(self.renderable, options, pad=False)
+        new_line = Segment.line()
+        for line in lines:
+            yield from line
+            yield new_line
+
+
+class RenderCache:
+    """
+    LRU cache of rendered card tables and panels.
+
+    Tables are keyed by (card, show_coordinates, theme) and panels additionally
+    by their title and border, so a frame only re-renders the panels whose
+    card (or card count) changed since they were last drawn.
+
+    Attributes:
+        maxsize (int): Maximum number of cached renderables.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that built a new renderable.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedRenderable]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable) -> Optional[CachedRenderable]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key: Hashable, entry: CachedRenderable) -> CachedRenderable:
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def card_table(
+        self, card: DobbleCard, show_coordinates: bool = True, theme: Theme = DEFAULT_THEME
+    ) -> CachedRenderable:
+        """The (cached) table for a card; see create_card_table."""
+        key = (card.deck, card.index, show_coordinates, theme)
+        entry = self._get(key)
+        if entry is None:
+            entry = self._put(key, CachedRenderable(create_card_table(card, show_coordinates, theme)))
+        return entry
+
+    def card_panel(
+        self,
+        card: DobbleCard,
+        title: str,
+        border_style: str,
+        show_coordinates: bool = True,
+        theme: Theme = DEFAULT_THEME,
+        expand: bool = True,
+    ) -> CachedRenderable:
+        """The (cached) panel showing a card's table under a title."""
+        key = (card.deck, card.index, show_coordinates, theme, title, border_style, expand)
+        entry = self._get(key)
+        if entry is None:
+            table = self.card_table(card, show_coordinates, theme)
+            panel = Panel(table, title=title, border_style=border_style, expand=expand)
+            entry = self._put(key, CachedRenderable(panel))
+        return entry
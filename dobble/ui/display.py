@@ -1,8 +1,14 @@
+from typing import List, Optional
+
 from rich.columns import Columns
-from rich.panel import Panel
+from rich.console import Group, RenderableType
 
 from ..game.game import DobbleGame
-from .components import create_card_table, console
+from .components import DEFAULT_THEME, RenderCache, Theme, console
+from .viewport import Viewport
+
+# Shared by every screen that doesn't bring its own cache.
+_render_cache = RenderCache()
 
 
 def display_title():
@@ -14,16 +20,32 @@ def display_title():
     console.print(title, justify="center")
 
 
-def display_game_state(game: DobbleGame) -> None:
-    """Display the current game state, including the live card and all players' top cards."""
-    console.clear()
+def game_screen(
+    game: DobbleGame,
+    cache: Optional[RenderCache] = None,
+    theme: Theme = DEFAULT_THEME,
+    viewport: Optional[Viewport] = None,
+) -> RenderableType:
+    """
+    The game screen: the live card above every player's top card.
+
+    Panels come from a RenderCache, so only cards that changed since the last
+    frame are laid out and rendered again. With a viewport, only the players
+    on its current page that fit the terminal are drawn (see Viewport).
+    """
+    cache = cache if cache is not None else _render_cache
+    if viewport is not None:
+        return viewport.view(game, cache, theme)
+    parts: List[RenderableType] = []
 
     if game.live_card:
-        console.print(
-            Panel(
-                create_card_table(game.live_card, show_coordinates=True),
-                title="[cyan]Live Card[/cyan]",
-                border_style="cyan",
+        parts.append(
+            cache.card_panel(
+                game.live_card,
+                title=f"[{theme.live_border}]Live Card[/]",
+                border_style=theme.live_border,
+                show_coordinates=True,
+                theme=theme,
                 expand=False,
             )
         )
@@ -32,13 +54,21 @@ def display_game_state(game: DobbleGame) -> None:
     for player in game.players:
         top_card = player.get_card()
         if top_card:
-            card_table = create_card_table(top_card, show_coordinates=False)
             player_panels.append(
-                Panel(
-                    card_table,
+                cache.card_panel(
+                    top_card,
                     title=f"[bold]{player.name}[/bold] ({len(player.cards)} cards)",
-                    border_style="green",
+                    border_style=theme.player_border,
+                    show_coordinates=False,
+                    theme=theme,
                 )
             )
 
-    console.print(Columns(player_panels, equal=True, expand=True))
+    parts.append(Columns(player_panels, equal=True, expand=True))
+    return Group(*parts)
+
+
+def display_game_state(game: DobbleGame) -> None:
+    """Display the current game state, including the live card and all players' top cards."""
+    console.clear()
+    console.print(game_screen(game))
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 from rich.prompt import Prompt, IntPrompt
 
 from ..config import VALID_CARD_SIZES, DIFFICULTY_LEVELS
@@ -7,6 +7,7 @@ from ..game.player import Player
 from .display import display_title, display_game_state
 from .input import get_arrow_key_selection, display_difficulty_options
 from .components import console
+from .keyboard import KeyBindings, RawInput
 
 
 class GameUI:
@@ -44,8 +45,19 @@ class GameUI:
         return [name.strip() for name in names if name.strip()]
 
     @staticmethod
-    def select_winner(matching_players: List[int], players: List[Player]) -> int:
-        """Handle winner selection when multiple players have matching symbols."""
+    def select_winner(
+        matching_players: List[int],
+        players: List[Player],
+        keyboard: Optional[RawInput] = None,
+        echo: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """
+        Handle winner selection when multiple players have matching symbols.
+
+        Used instead of a race when there are more players than race keys.
+        With an open keyboard session the number is read through it (the
+        terminal is not in line mode then), echoing with echo.
+        """
         if len(matching_players) == 1:
             return matching_players[0]
 
@@ -56,13 +68,38 @@ class GameUI:
             console.print(f"{i}. {players[player_idx].name}")
 
         while True:
-            choice = IntPrompt.ask(
-                "Enter player number",
-                choices=[str(i) for i in range(1, len(matching_players) + 1)],
-            )
+            if keyboard is None:
+                choice = IntPrompt.ask(
+                    "Enter player number",
+                    choices=[str(i) for i in range(1, len(matching_players) + 1)],
+                )
+            else:
+                console.print(f"Enter player number [1-{len(matching_players)}]: ", end="")
+                line = keyboard.read_line(echo=echo).strip()
+                choice = int(line) if line.isdigit() else 0
             if 1 <= choice <= len(matching_players):
                 return matching_players[choice - 1]
 
+    @staticmethod
+    def race_winner(
+        matching_players: List[int], players: List[Player], keyboard: RawInput, bindings: KeyBindings
+    ) -> int:
+        """
+        Settle a tie by a race: the first matching player to press their key wins.
+
+        Keys pressed before the race starts are discarded, and other keys are
+        ignored, so the winner is the earliest race key read after the prompt.
+        """
+        if len(matching_players) == 1:
+            return matching_players[0]
+
+        console.print("\n[yellow]More than one player has that symbol![/yellow]")
+        racers = ", ".join(f"{players[i].name} [bold]{bindings.key_for(i)}[/bold]" for i in matching_players)
+        console.print(f"First to press their key wins: {racers}")
+        keyboard.flush()
+        winner, _ = keyboard.first_press(bindings, matching_players)
+        return winner
+
     @staticmethod
     def display_turn_result(player_name: Optional[str]):
         """Display the result of a player's turn."""
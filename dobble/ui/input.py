@@ -1,7 +1,4 @@
-import sys
-import tty
-import termios
-from typing import List, Callable
+from typing import Callable, List, Optional
 
 from rich.table import Table
 from rich.style import Style
@@ -11,10 +8,11 @@ from rich import box
 from ..config import DIFFICULTY_LEVELS
 from .components import console
 from .display import display_title
+from .keyboard import RawInput
 
 
 def get_arrow_key_selection(
-    options: List[str], display_func: Callable[[int], None]
+    options: List[str], display_func: Callable[[int], None], keyboard: Optional[RawInput] = None
 ) -> int:
     """
     Handle arrow key selection from a list of options.
@@ -22,23 +20,15 @@ def get_arrow_key_selection(
     Args:
         options: List of options to choose from
         display_func: Function to display the current state
+        keyboard: Keyboard session to read from. Defaults to one opened on
+            stdin for the whole selection.
 
     Returns:
         Selected index
     """
-
-    def get_key():
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-            if ch == "\x1b":
-                ch = sys.stdin.read(2)
-                return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
+    if keyboard is None:
+        with RawInput() as keyboard:
+            return get_arrow_key_selection(options, display_func, keyboard)
 
     current_selection = 0
 
@@ -46,13 +36,13 @@ def get_arrow_key_selection(
         console.clear()
         display_func(current_selection)
 
-        key = get_key()
+        key = keyboard.wait_for(("up", "down", "enter")).key
 
-        if key == "[A":  # Up arrow
+        if key == "up":
             current_selection = (current_selection - 1) % len(options)
-        elif key == "[B":  # Down arrow
+        elif key == "down":
             current_selection = (current_selection + 1) % len(options)
-        elif key == "\r":  # Enter key
+        elif key == "enter":
             return current_selection
 
 
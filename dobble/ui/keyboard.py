@@ -0,0 +1,277 @@
+"""
+Keyboard input without line buffering, for racing players at one keyboard.
+
+A RawInput session switches the terminal out of canonical mode once, for as
+long as it is open, instead of around every keypress. Keys are read with a
+selector as soon as the terminal has them, decoded (arrow keys and other
+escape sequences become names such as "up") and stamped with the monotonic
+clock at the moment they were read. Keys that arrive in one read were
+pressed within one poll of each other; they keep their order.
+
+Output processing and signals are left on, so rich renders as usual and
+Ctrl-C still interrupts.
+"""
+import codecs
+import os
+import selectors
+import sys
+import termios
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Race keys for players 1, 2, ... by default: far apart on the keyboard, and
+# none of them letters or digits, which are used to type coordinates.
+DEFAULT_RACE_KEYS = ("`", "/", "[", "]", ";", "'", ",", ".", "-", "=")
+
+# How long to wait for the rest of an escape sequence before taking ESC as a key.
+ESCAPE_TIMEOUT = 0.05
+
+_NAMED = {"\r": "enter", "\n": "enter", "\x7f": "backspace", "\x08": "backspace", "\t": "tab"}
+_CSI = {"A": "up", "B": "down", "C": "right", "D": "left", "H": "home", "F": "end"}
+
+
+class KeyPress(NamedTuple):
+    """
+    A key and when it was read.
+
+    Attributes:
+        key (str): The character typed, or a name ("up", "enter", ...).
+        time (float): Monotonic clock reading when the key was read.
+    """
+
+    key: str
+    time: float
+
+
+def parse_keys(text: str) -> Tuple[List[str], str]:
+    """
+    Split decoded terminal input into keys.
+
+    Returns:
+        Tuple[List[str], str]: The keys, and a trailing incomplete escape
+        sequence to prepend to the next input ("" if there is none).
+    """
+    keys: List[str] = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch != "\x1b":
+            keys.append(_NAMED.get(ch, ch))
+            i += 1
+            continue
+        if i + 1 == len(text):
+            return keys, text[i:]
+        intro = text[i + 1]
+        if intro == "O":  # SS3: ESC O <final>
+            if i + 2 == len(text):
+                return keys, text[i:]
+            final = text[i + 2]
+            keys.append(_CSI.get(final, text[i:i + 3]))
+            i += 3
+        elif intro == "[":  # CSI: ESC [ <parameters> <final in @..~>
+            j = i + 2
+            while j < len(text) and not "@" <= text[j] <= "~":
+                j += 1
+            if j == len(text):
+                return keys, text[i:]
+            final = text[j]
+            keys.append(_CSI.get(final, text[i:j + 1]) if j == i + 2 else text[i:j + 1])
+            i = j + 1
+        else:
+            keys.append("escape")
+            i += 1
+    return keys, ""
+
+
+class KeyBindings:
+    """
+    Which key each local player races with.
+
+    Attributes:
+        keys (List[str]): Key of player 0, 1, ...
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        if len(set(keys)) != len(keys):
+            raise ValueError("Every player needs a different key")
+        for key in keys:
+            if len(key) != 1 or key.isalnum() or key.isspace():
+                raise ValueError(f"Race keys must be single symbols (not letters, digits or spaces): {key!r}")
+        self.keys = list(keys)
+        self._players: Dict[str, int] = {key: i for i, key in enumerate(keys)}
+
+    @classmethod
+    def default(cls, num_players: int) -> "KeyBindings":
+        """Bindings from DEFAULT_RACE_KEYS for num_players players."""
+        if num_players > len(DEFAULT_RACE_KEYS):
+            raise ValueError(f"Default race keys cover at most {len(DEFAULT_RACE_KEYS)} players")
+        return cls(DEFAULT_RACE_KEYS[:num_players])
+
+    def player_for(self, key: str) -> Optional[int]:
+        """The player bound to key, if any."""
+        return self._players.get(key)
+
+    def key_for(self, player: int) -> str:
+        return self.keys[player]
+
+
+class RawInput:
+    """
+    A persistent unbuffered keyboard session.
+
+    Use as a context manager (or call open and close). Reading works on any
+    readable file descriptor; when it is a terminal, canonical mode and echo
+    are switched off while the session is open, and restored afterwards.
+
+    Attributes:
+        fd (int): File descriptor read from.
+        clock (Callable[[], float]): Timestamps keys (default: time.monotonic).
+    """
+
+    def __init__(self, fd: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self.clock = clock
+        self._saved: Optional[list] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._queue: Deque[KeyPress] = deque()
+
+    def __enter__(self) -> "RawInput":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._selector is not None
+
+    def open(self) -> None:
+        """Switch the terminal to unbuffered input (once; opening twice is a no-op)."""
+        if self._selector is not None:
+            return
+        if os.isatty(self.fd):
+            self._saved = termios.tcgetattr(self.fd)
+            mode = termios.tcgetattr(self.fd)
+            mode[0] &= ~(termios.IXON | termios.ICRNL)  # iflag: no flow control, keep \r distinct
+            mode[3] &= ~(termios.ICANON | termios.ECHO | termios.IEXTEN)  # lflag
+            mode[6][termios.VMIN] = 1
+            mode[6][termios.VTIME] = 0
+            termios.tcsetattr(self.fd, termios.TCSANOW, mode)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.fd, selectors.EVENT_READ)
+
+    def close(self) -> None:
+        """Restore the terminal."""
+        if self._selector is None:
+            return
+        self._selector.close()
+        self._selector = None
+        if self._saved is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def _fill(self, timeout: Optional[float]) -> bool:
+        """Read whatever input is available (waiting up to timeout); return whether any was."""
+        if self._selector is None:
+            raise ValueError("The input session is not open")
+        if not self._selector.select(timeout):
+            return False
+        data = os.read(self.fd, 1024)
+        now = self.clock()
+        if not data:
+            raise EOFError("Input closed")
+        keys, self._pending = parse_keys(self._pending + self._decoder.decode(data))
+        while self._pending and self._selector.select(ESCAPE_TIMEOUT):
+            more = os.read(self.fd, 1024)
+            if not more:
+                break
+            extra, self._pending = parse_keys(self._pending + self._decoder.decode(more))
+            keys += extra
+        if self._pending:
+            # A lone ESC, or a sequence cut short: deliver it key by key.
+            keys += ["escape", *self._pending[1:]]
+            self._pending = ""
+        self._queue.extend(KeyPress(key, now) for key in keys)
+        return True
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[KeyPress]:
+        """The next key, waiting up to timeout seconds (None: forever); None if there was none."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._queue:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._fill(remaining) and deadline is not None and time.monotonic() >= deadline:
+                return None
+        return self._queue.popleft()
+
+    def read_keys(self, timeout: float = 0.0) -> List[KeyPress]:
+        """Every key read so far or arriving within timeout, without blocking longer."""
+        if not self._queue:
+            self._fill(timeout)
+        while self._fill(0):
+            pass
+        keys = list(self._queue)
+        self._queue.clear()
+        return keys
+
+    def flush(self) -> None:
+        """Discard keys pressed so far (e.g. before starting a race)."""
+        self.read_keys()
+
+    def wait_for(self, keys: Iterable[str], timeout: Optional[float] = None) -> Optional[KeyPress]:
+        """Wait for one of keys, ignoring others; None on timeout."""
+        wanted = set(keys)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            press = self.read_key(remaining)
+            if press is None or press.key in wanted:
+                return press
+
+    def read_line(self, echo: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Read a line, handling backspace.
+
+        Args:
+            echo: Called with text to show as the line is edited (e.g. a
+                console's write); the terminal itself no longer echoes.
+        """
+        chars: List[str] = []
+        while True:
+            key = self.read_key().key
+            if key == "enter":
+                if echo is not None:
+                    echo("\n")
+                return "".join(chars)
+            if key == "backspace":
+                if chars:
+                    chars.pop()
+                    if echo is not None:
+                        echo("\b \b")
+            elif len(key) == 1 and key.isprintable():
+                chars.append(key)
+                if echo is not None:
+                    echo(key)
+
+    def first_press(
+        self, bindings: KeyBindings, players: Iterable[int], timeout: Optional[float] = None
+    ) -> Optional[Tuple[int, KeyPress]]:
+        """
+        Wait for the first of players to press their key.
+
+        Keys are taken in the order they were read, so when two players' keys
+        arrive together the one typed first wins.
+
+        Returns:
+            Optional[Tuple[int, KeyPress]]: The winning player and their
+            keypress, or None on timeout.
+        """
+        racing = set(players)
+        keys = [bindings.key_for(player) for player in racing]
+        press = self.wait_for(keys, timeout)
+        if press is None:
+            return None
+        return bindings.player_for(press.key), press
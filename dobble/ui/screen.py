@@ -0,0 +1,112 @@
+from typing import List, Optional
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.control import Control
+from rich.segment import ControlType, Segment
+
+from ..game.game import DobbleGame
+from .components import DEFAULT_THEME, RenderCache, Theme, get_console
+from .display import game_screen
+from .viewport import Viewport
+
+_ERASE_LINE = Control((ControlType.ERASE_IN_LINE, 2))
+
+
+class DiffRender:
+    """
+    A frame anchored at the top of the screen that rewrites only changed lines.
+
+    The first frame (or one following a resize, or one too tall to fit with
+    room for prompts underneath) clears the screen and is drawn in full. After
+    that each frame is compared line by line with the previous one, and only
+    lines that differ are rewritten; the lines below the frame, where prompts
+    and messages were printed, are erased.
+
+    Attributes:
+        renderable (RenderableType): The frame to draw next.
+        reserve (int): Lines kept free below the frame for prompts.
+    """
+
+    def __init__(self, renderable: RenderableType = "", reserve: int = 8):
+        self.renderable = renderable
+        self.reserve = reserve
+        self._previous: Optional[List[List[Segment]]] = None
+        self._previous_width = 0
+
+    def invalidate(self) -> None:
+        """Forget the previous frame, so the next one is drawn in full."""
+        self._previous = None
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        lines = console.render_lines(self.renderable, options, pad=False)
+        new_line = Segment.line()
+
+        previous = self._previous
+        fits = len(lines) + self.reserve <= options.size.height
+        resized = options.max_width != self._previous_width
+        if not console.is_terminal or not fits or previous is None or resized:
+            self._previous = lines if fits else None
+            self._previous_width = options.max_width
+            if console.is_terminal:
+                yield Control.clear()
+                yield Control.home()
+            for line in lines:
+                yield from line
+                yield new_line
+            return
+
+        for y, line in enumerate(lines):
+            if y < len(previous) and previous[y] == line:
+                continue
+            yield Control.move_to(0, y)
+            yield from line
+            yield Control((ControlType.ERASE_IN_LINE, 0))
+            # Console.print crops each output line to the console width, so end every rewritten line.
+            yield new_line
+        # Prompts are printed into the reserved lines under the frame; a
+        # shorter frame also leaves the end of the previous one to erase.
+        yield Control.move_to(0, len(lines))
+        for i in range(max(len(lines), len(previous)) + self.reserve - len(lines)):
+            if i:
+                yield new_line  # Not after the last line, which may be the bottom of the screen.
+            yield _ERASE_LINE
+        yield Control.move_to(0, len(lines))
+        self._previous = lines
+
+
+class GameScreen:
+    """
+    The in-game screen, redrawn in place each turn.
+
+    Panels come from a RenderCache, so a turn only renders the cards that
+    changed, and the terminal only receives the lines that changed. Players
+    are shown a page at a time through a Viewport sized to the terminal.
+
+    Attributes:
+        console (Console): Where the screen is drawn.
+        cache (RenderCache): Cache of rendered card panels.
+        theme (Theme): Styling of the card panels.
+        viewport (Viewport): Which players are on screen.
+    """
+
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        cache: Optional[RenderCache] = None,
+        theme: Theme = DEFAULT_THEME,
+        reserve: int = 8,
+    ):
+        self.console = console if console is not None else get_console()
+        self.cache = cache if cache is not None else RenderCache()
+        self.theme = theme
+        self.viewport = Viewport(reserve=reserve)
+        self._render = DiffRender(reserve=reserve)
+
+    def invalidate(self) -> None:
+        """Draw the next frame in full (e.g. after something else wrote over the screen)."""
+        self._render.invalidate()
+
+    def show(self, game: DobbleGame) -> None:
+        """Draw the current state of a game."""
+        self._render.renderable = game_screen(game, self.cache, self.theme, self.viewport)
+        self.console.print(self._render)
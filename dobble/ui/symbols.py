@@ -0,0 +1,130 @@
+"""
+Symbols as rich Text, built once and measured once.
+
+A SymbolCells table keeps, per symbol number, its terminal cell width in a
+byte array and its Text (built on first use). The Text reports the stored
+width when rich measures it and replays its first rendering, so drawing a
+card table does no width calculations or text layout for its symbols after
+the first time each is drawn.
+"""
+from array import array
+from typing import List, Optional
+
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.text import Text
+
+from ..utils.alphabet import ALPHABET, SymbolAlphabet
+
+
+class SymbolText(Text):
+    """
+    Text of one symbol, measured ahead of time and rendered once.
+
+    The segments are worked out on the first render and then only padded to
+    the cell's width and justification.
+    """
+
+    __slots__ = ("cell_width", "_segments")
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement(self.cell_width, self.cell_width)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        excess = options.max_width - self.cell_width
+        if excess < 0:
+            yield from super().__rich_console__(console, options)
+            return
+        if self._segments is None:
+            self._segments = list(self.render(console))
+        justify = options.justify or self.justify
+        if justify == "center":
+            left = excess // 2
+        elif justify == "right":
+            left = excess
+        else:
+            left = 0
+        if left:
+            yield Segment(" " * left)
+        yield from self._segments
+        if justify in ("left", "center", "full") and excess > left:
+            yield Segment(" " * (excess - left))
+
+
+class SymbolCells:
+    """
+    Rendered symbols and their cell widths, filled in as symbols are drawn.
+
+    Attributes:
+        alphabet (SymbolAlphabet): How symbols look.
+        builds (int): Symbols whose Text and width have been worked out.
+    """
+
+    def __init__(self, alphabet: Optional[SymbolAlphabet] = None):
+        self.alphabet = alphabet if alphabet is not None else ALPHABET
+        self.builds = 0
+        self._widths = array("B")  # 0: not built yet.
+        self._texts: List[Optional[SymbolText]] = []
+        self._emojis = self.alphabet.emojis
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def _build(self, symbol: int) -> SymbolText:
+        if symbol >= len(self._texts):
+            grow = symbol + 1 - len(self._texts)
+            self._widths.extend(bytes(grow))
+            self._texts.extend([None] * grow)
+        look = self.alphabet[symbol]
+        text = SymbolText(end="", no_wrap=True)
+        text.append(look.glyph, style=look.style or None)
+        if look.tier:
+            text.append(look.text[len(look.glyph):], style="dim")
+        text.cell_width = cell_len(look.text)
+        text._segments = None
+        self._widths[symbol] = min(text.cell_width, 255)
+        self._texts[symbol] = text
+        self.builds += 1
+        return text
+
+    def text(self, symbol: int) -> SymbolText:
+        """The symbol's Text (shared: do not modify it)."""
+        if self.alphabet.emojis is not self._emojis:
+            self.clear()
+        try:
+            text = self._texts[symbol]
+        except IndexError:
+            text = None
+        return text if text is not None else self._build(symbol)
+
+    def width(self, symbol: int) -> int:
+        """Terminal cells the symbol takes."""
+        if self.alphabet.emojis is self._emojis and symbol < len(self._widths) and self._widths[symbol]:
+            return self._widths[symbol]
+        return self.text(symbol).cell_width
+
+    def prepare(self, num_symbols: int) -> None:
+        """Build every symbol of a deck up front (e.g. before the first frame)."""
+        for symbol in range(num_symbols):
+            self.text(symbol)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the width table (the Texts are extra)."""
+        return self._widths.itemsize * len(self._widths)
+
+    def clear(self) -> None:
+        """
+        Forget every symbol.
+
+        Happens by itself when the alphabet is given other emojis; call it
+        after reseeding the alphabet's EmojiMap in place.
+        """
+        self._widths = array("B")
+        self._texts = []
+        self._emojis = self.alphabet.emojis
+
+
+SYMBOL_CELLS = SymbolCells()
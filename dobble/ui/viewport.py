@@ -0,0 +1,157 @@
+import math
+from itertools import chain
+from typing import List, Optional
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.table import Table
+from rich.text import Text
+
+from ..game.game import DobbleGame
+from ..game.player import Player
+from .components import DEFAULT_THEME, RenderCache, Theme
+
+
+class Viewport:
+    """
+    Pages through the players' panels so only those that fit on screen are built.
+
+    The page size is worked out at render time from the terminal size and the
+    size of one card panel. Players on other pages are listed in a compact
+    summary (name and card count) under the panels, cut off once it fills its
+    lines, so the cost of a frame depends on the visible area rather than on
+    the number of players.
+
+    Attributes:
+        page (int): Current page, starting at 0.
+        page_size (int): Players per page at the last render.
+        num_pages (int): Number of pages at the last render.
+        reserve (int): Lines left free below the screen for prompts.
+        summary_lines (int): Lines given to the off-screen summary.
+    """
+
+    def __init__(self, reserve: int = 8, summary_lines: int = 2):
+        self.page = 0
+        self.page_size = 0
+        self.num_pages = 1
+        self.reserve = reserve
+        self.summary_lines = summary_lines
+
+    def scroll(self, pages: int) -> None:
+        """Move forward (or back, if negative) by a number of pages."""
+        self.page = max(0, min(self.page + pages, self.num_pages - 1))
+
+    def view(
+        self, game: DobbleGame, cache: RenderCache, theme: Theme = DEFAULT_THEME
+    ) -> "ViewportView":
+        """A renderable of the game screen showing the current page of players."""
+        return ViewportView(self, game, cache, theme)
+
+
+class ViewportView:
+    """The game screen as seen through a Viewport; see Viewport."""
+
+    def __init__(self, viewport: Viewport, game: DobbleGame, cache: RenderCache, theme: Theme):
+        self.viewport = viewport
+        self.game = game
+        self.cache = cache
+        self.theme = theme
+
+    def _player_panel(self, player: Player):
+        return self.cache.card_panel(
+            player.get_card(),
+            title=f"[bold]{player.name}[/bold] ({len(player.cards)} cards)",
+            border_style=self.theme.player_border,
+            show_coordinates=False,
+            theme=self.theme,
+        )
+
+    def _summary(self, start: int, stop: int, width: int) -> Text:
+        """Name and card count of players outside [start, stop), up to the summary's space."""
+        viewport = self.viewport
+        players = self.game.players
+        budget = width * (viewport.summary_lines - 1)
+        parts: List[str] = []
+        used = 0
+        shown = 0
+        others = len(players) - (stop - start)
+        for i in chain(range(stop, len(players)), range(start)):
+            part = f"{players[i].name} ({len(players[i].cards)})"
+            if used + len(part) + 2 > budget - 12:
+                break
+            parts.append(part)
+            used += len(part) + 2
+            shown += 1
+        if shown < others:
+            parts.append(f"+{others - shown} more")
+        header = f"Page {viewport.page + 1}/{viewport.num_pages} ('<' and '>' to turn)"
+        return Text(header + "\n" + ", ".join(parts), style="dim", no_wrap=True, overflow="ellipsis")
+
+    def _paginate(self, panel_width: int, panel_height: int, width: int, available: int):
+        """Fix the page size for panels of the given size; return (start, stop, per_row) of the page."""
+        viewport = self.viewport
+        num_players = len(self.game.players)
+        per_row = max(1, (width + 1) // (panel_width + 1))
+        page_size = per_row * max(1, available // panel_height)
+        if page_size < num_players:
+            # Make room for the summary under the panels.
+            page_size = per_row * max(1, (available - viewport.summary_lines) // panel_height)
+        viewport.page_size = page_size
+        viewport.num_pages = max(1, math.ceil(num_players / page_size))
+        viewport.page = min(viewport.page, viewport.num_pages - 1)
+        start = viewport.page * page_size
+        return start, min(start + page_size, num_players), per_row
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        viewport = self.viewport
+        game = self.game
+        theme = self.theme
+        width = options.max_width
+        height = options.height or options.size.height
+        new_line = Segment.line()
+
+        used = 0
+        if game.live_card:
+            live_panel = self.cache.card_panel(
+                game.live_card,
+                title=f"[{theme.live_border}]Live Card[/]",
+                border_style=theme.live_border,
+                show_coordinates=True,
+                theme=theme,
+                expand=False,
+            )
+            lines = console.render_lines(live_panel, options, pad=False)
+            for line in lines:
+                yield from line
+                yield new_line
+            used = len(lines)
+
+        players = game.players
+        sample: Optional[Player] = next((p for p in players if p.get_card() is not None), None)
+        if sample is None:
+            return
+
+        # One card's panel: its table's natural size plus border and padding.
+        table = self.cache.card_table(sample.get_card(), False, theme)
+        table_width = Measurement.get(console, options, table).maximum
+        panel_height = len(console.render_lines(table, options.update_width(table_width), pad=False)) + 2
+
+        available = height - used - viewport.reserve
+        start, stop, per_row = self._paginate(table_width + 4, panel_height, width, available)
+        # Widen the panels if a visible title would not fit, then page again.
+        title_width = max(len(f"{p.name} ({len(p.cards)} cards)") + 6 for p in players[start:stop])
+        if title_width > table_width + 4:
+            start, stop, per_row = self._paginate(title_width, panel_height, width, available)
+
+        grid = Table.grid(expand=True, padding=(0, 1))
+        for _ in range(per_row):
+            grid.add_column(ratio=1)
+        panels = [self._player_panel(p) for p in players[start:stop] if p.get_card() is not None]
+        for row_start in range(0, len(panels), per_row):
+            row = panels[row_start:row_start + per_row]
+            grid.add_row(*row, *[""] * (per_row - len(row)))
+        yield grid
+
+        if viewport.num_pages > 1:
+            yield self._summary(start, stop, width)
@@ -0,0 +1,91 @@
+"""
+How symbols look: a unique visual symbol for every symbol number.
+
+The emoji table has about a thousand emojis, fewer than the largest decks
+have symbols. Rather than wrapping round (which draws two different symbols
+identically), the alphabet grows in tiers as decks need them: tier 0 is the
+plain emojis, and each further tier repeats them on a background colour, with
+a superscript tier number in plain text. Decks small enough for the emoji
+table look exactly as before.
+
+This module does not import rich; dobble.ui.symbols turns symbols into
+styled, pre-measured rich Text.
+"""
+from typing import NamedTuple, Optional
+
+from .emoji_loader import EMOJI_MAP, EmojiMap
+
+# Background colours of tiers 1, 2, ... (repeating, though tiers beyond this
+# still differ by their tier number).
+TINTS = (
+    "on dark_red",
+    "on dark_blue",
+    "on dark_green",
+    "on dark_goldenrod",
+    "on purple4",
+    "on dark_cyan",
+    "on grey37",
+    "on orange4",
+)
+
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+class Symbol(NamedTuple):
+    """
+    The look of one symbol.
+
+    Attributes:
+        glyph (str): The emoji drawn.
+        tier (int): 0 for plain emojis; each further tier adds a tint.
+        style (str): Rich style of the glyph ("" in tier 0).
+        text (str): Plain-text form, unique per symbol (the glyph, then the
+            tier number in superscript from tier 1 on).
+    """
+
+    glyph: str
+    tier: int
+    style: str
+    text: str
+
+
+class SymbolAlphabet:
+    """
+    Maps symbol numbers to unique looks (see Symbol), glyph varying fastest.
+
+    Attributes:
+        emojis (EmojiMap): The glyphs, in their seeded order.
+    """
+
+    def __init__(self, emojis: Optional[EmojiMap] = None):
+        self.emojis = emojis if emojis is not None else EMOJI_MAP
+
+    @property
+    def num_glyphs(self) -> int:
+        return len(self.emojis)
+
+    def tiers_for(self, num_symbols: int) -> int:
+        """How many tiers a deck of num_symbols symbols uses."""
+        return max(1, -(-num_symbols // self.num_glyphs))
+
+    def __getitem__(self, symbol: int) -> Symbol:
+        if symbol < 0:
+            raise KeyError(symbol)
+        tier, glyph_index = divmod(symbol, self.num_glyphs)
+        glyph = self.emojis[glyph_index]
+        if not tier:
+            return Symbol(glyph, 0, "", glyph)
+        return Symbol(glyph, tier, TINTS[(tier - 1) % len(TINTS)], glyph + str(tier).translate(_SUPERSCRIPTS))
+
+    def text(self, symbol: int) -> str:
+        """The plain-text form of a symbol."""
+        num_glyphs = self.num_glyphs
+        if symbol < num_glyphs:
+            return self.emojis[symbol]
+        return self[symbol].text
+
+    def __repr__(self) -> str:
+        return f"SymbolAlphabet({self.emojis!r})"
+
+
+ALPHABET = SymbolAlphabet()
@@ -1,7 +1,23 @@
-from pathlib import Path
-import random
+"""
+The emoji alphabet used to draw symbols.
+
+Nothing is loaded at import time: EMOJI_MAP is a lazy mapping that reads the
+table on first use. The table expanded from data/emojis.txt is cached as a
+small versioned artifact next to the deck cache, so later runs skip parsing.
+"""
+import os
 import sys
-from typing import Dict, List
+from array import array
+from typing import Iterator, List, Mapping, Optional, Union
+
+# Bump whenever the parsing below changes what ends up in the table.
+EMOJI_TABLE_VERSION = 1
+
+EMOJI_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "emojis.txt")
+
+PathLike = Union[str, os.PathLike]
+
+_table: Optional[str] = None
 
 
 def parse_code_points(line: str) -> List[int]:
@@ -11,24 +27,140 @@ def parse_code_points(line: str) -> List[int]:
     return [int(line, 16)]
 
 
-def generate_emoji_map() -> Dict[int, str]:
-    emojis = []
-    emoji_file = Path(__file__).parent.parent / "data" / "emojis.txt"
+def parse_emoji_file(path: PathLike = EMOJI_FILE) -> str:
+    """Expand the code points and ranges in an emoji file into one string of emojis."""
+    with open(path, "r") as f:
+        return "".join(chr(cp) for line in f if line.strip() for cp in parse_code_points(line.strip()))
+
+
+def _source_stamp(path: PathLike) -> str:
+    stat = os.stat(path)
+    return f"v{EMOJI_TABLE_VERSION} {stat.st_size} {stat.st_mtime_ns}"
+
+
+def emoji_table_path(cache_dir: Optional[PathLike] = None) -> str:
+    """Path of the cached emoji table artifact."""
+    if cache_dir is None:
+        from ..game.cache import default_cache_dir
+
+        cache_dir = default_cache_dir()
+    return os.path.join(cache_dir, f"emojis-v{EMOJI_TABLE_VERSION}.txt")
+
+
+def save_emoji_table(cache_dir: Optional[PathLike] = None) -> str:
+    """
+    Parse the emoji file and write the cached table artifact.
+
+    Returns:
+        str: The path written.
+    """
+    path = emoji_table_path(cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(_source_stamp(EMOJI_FILE) + "\n" + parse_emoji_file())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_emoji_table(cache_dir: Optional[PathLike] = None, write: bool = True) -> str:
+    """
+    Return the full emoji table, from the cached artifact if it is current.
+
+    A missing or stale artifact (older table version, or emojis.txt changed)
+    is rebuilt from emojis.txt and, with write=True, saved for next time.
+
+    Args:
+        cache_dir (Optional[PathLike]): Cache directory (default: the deck cache directory).
+        write (bool): Save the artifact if it had to be rebuilt. Failures to
+            write are ignored.
+    """
+    path = emoji_table_path(cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            stamp, _, table = f.read().partition("\n")
+        if stamp == _source_stamp(EMOJI_FILE):
+            return table
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    if write:
+        try:
+            save_emoji_table(cache_dir)
+        except OSError:
+            pass
+    return parse_emoji_file()
+
+
+def _displayable(table: str) -> str:
+    """Keep the emojis stdout can encode (checked once per table, not per render)."""
+    encoding = getattr(sys.stdout, "encoding", None) or "utf-8"
+    if encoding.upper().replace("_", "-") in ("UTF-8", "UTF8"):
+        return table
+    kept = []
+    for emoji in table:
+        try:
+            emoji.encode(encoding)
+        except (UnicodeEncodeError, LookupError):
+            continue
+        kept.append(emoji)
+    return "".join(kept)
+
+
+def emoji_table() -> str:
+    """The displayable emoji table, loaded on first call and shared by every EmojiMap."""
+    global _table
+    if _table is None:
+        _table = _displayable(load_emoji_table())
+    return _table
+
+
+class EmojiMap(Mapping[int, str]):
+    """
+    A read-only, lazily loaded mapping from index to emoji, in a seeded order.
+
+    The order is a permutation view over the shared table: only the
+    permutation (two bytes per emoji) belongs to the map, and nothing is
+    loaded or shuffled until the map is first used.
+
+    Attributes:
+        seed (Optional[int]): Seed of the permutation; None picks one at random
+            when the map is first used.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed
+        self._order: Optional[array] = None
+
+    def _permutation(self) -> array:
+        if self._order is None:
+            import random
+
+            order = array("H", range(len(emoji_table())))
+            random.Random(self.seed).shuffle(order)
+            self._order = order
+        return self._order
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """Switch to another seeded order (e.g. for a new game); the table is not reloaded."""
+        self.seed = seed
+        self._order = None
+
+    def __getitem__(self, index: int) -> str:
+        order = self._permutation()
+        if not 0 <= index < len(order):
+            raise KeyError(index)
+        return emoji_table()[order[index]]
+
+    def __len__(self) -> int:
+        return len(self._permutation())
 
-    with open(emoji_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            for code_point in parse_code_points(line):
-                try:
-                    emoji = chr(code_point)
-                    if sys.stdout.encoding.upper() in ["UTF-8", "UTF8"]:
-                        emoji.encode("utf-8")
-                        emojis.append(emoji)
-                except (UnicodeEncodeError, UnicodeError):
-                    continue
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
 
-    random.shuffle(emojis)
-    return {i: emoji for i, emoji in enumerate(emojis)}
+    def __repr__(self) -> str:
+        state = f"{len(self)} emojis" if self._order is not None else "not loaded"
+        return f"EmojiMap(seed={self.seed!r}, {state})"
 
 
-EMOJI_MAP = generate_emoji_map()
+EMOJI_MAP = EmojiMap()
@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path_factory):
+    """
+    Give each test an empty deck cache directory of its own.
+
+    Decks (and the emoji table) cached without an explicit directory go to
+    default_cache_dir(); this keeps them out of the user's cache and stops
+    one test's cache files from answering another's lookups.
+    """
+    monkeypatch.setenv("DOBBLE_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
@@ -0,0 +1,71 @@
+import io
+
+from rich.console import Console
+
+from dobble.game.card import DobbleCard
+from dobble.game.deck import Deck
+from dobble.ui import symbols
+from dobble.ui.components import create_card_table
+from dobble.ui.symbols import SymbolCells, SymbolText
+from dobble.utils.alphabet import ALPHABET, TINTS, SymbolAlphabet
+
+LETTERS = {i: chr(65 + i) for i in range(26)}
+
+
+def test_symbols_of_largest_deck_are_unique():
+    """Test that every symbol of the largest deck has its own look and text"""
+    num_symbols = 60 * 59 + 1
+    looks = [ALPHABET[s] for s in range(num_symbols)]
+    assert len({(look.glyph, look.style) for look in looks}) == num_symbols
+    assert len({look.text for look in looks}) == num_symbols
+    assert ALPHABET.tiers_for(num_symbols) == max(look.tier for look in looks) + 1
+
+
+def test_tiers():
+    """Test that small decks are plain glyphs and tiers add a tint and a number"""
+    alphabet = SymbolAlphabet(LETTERS)
+    assert alphabet.tiers_for(26) == 1 and alphabet.tiers_for(27) == 2
+    assert alphabet[3] == ("D", 0, "", "D")
+    assert alphabet[26 + 3] == ("D", 1, TINTS[0], "D¹")
+    assert alphabet[26 * 12].text == "A¹²"
+    assert alphabet.text(5) == "F" and alphabet.text(31) == "F¹"
+
+
+def test_cells_cache_text_and_width(monkeypatch):
+    """Test that each symbol is built and measured once"""
+    cells = SymbolCells(SymbolAlphabet(LETTERS))
+    text = cells.text(30)
+    assert isinstance(text, SymbolText) and text.plain == "E¹"
+    assert cells.width(30) == 2 and cells.width(4) == 1
+    assert cells.text(30) is text and cells.builds == 2
+    assert len(cells) == 31 and cells.nbytes == 31
+
+    calls = []
+    monkeypatch.setattr(symbols, "cell_len", lambda s: calls.append(s) or 1)
+    console = Console(file=io.StringIO(), width=40)
+    assert console.measure(text).maximum == 2
+    cells.prepare(40)
+    assert cells.builds == 40 and len(calls) == 38
+
+
+def test_cells_follow_the_alphabet(monkeypatch):
+    """Test that giving the alphabet other emojis rebuilds the cached symbols"""
+    cells = SymbolCells()
+    monkeypatch.setattr(ALPHABET, "emojis", LETTERS)
+    assert cells.text(0).plain == "A"
+    monkeypatch.setattr(ALPHABET, "emojis", {0: "Z"})
+    assert cells.text(0).plain == "Z" and cells.width(0) == 1
+
+
+def test_large_deck_table_shows_distinct_symbols(monkeypatch):
+    """Test that a card of a deck larger than the emoji table renders every symbol differently"""
+    monkeypatch.setattr(ALPHABET, "emojis", LETTERS)
+    deck = Deck.generate(8)
+    card = deck[len(deck) - 1]
+    console = Console(file=io.StringIO(), width=80, color_system=None)
+    console.print(create_card_table(card, show_coordinates=False))
+    output = console.file.getvalue()
+    for symbol in card.sorted_symbols:
+        assert ALPHABET.text(symbol) in output
+    assert len({ALPHABET.text(s) for s in card.sorted_symbols}) == 8
+    assert str(DobbleCard({1})) != str(DobbleCard({27}))
@@ -0,0 +1,134 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dobble.game.deck import Deck, LazyDeck
+from dobble.main import main
+from dobble.sim.batched import deck_arrays, simulate_batch
+from dobble.sim.engine import simulate_game
+from dobble.sim.policies import make_policy
+from dobble.sim.runner import SimulationConfig, run_simulations
+
+
+def ks_statistic(a, b):
+    """Two-sample Kolmogorov-Smirnov statistic: the largest gap between the empirical CDFs."""
+    a = np.sort(np.asarray(a))
+    b = np.sort(np.asarray(b))
+    values = np.concatenate([a, b])
+    cdf_a = np.searchsorted(a, values, side="right") / a.size
+    cdf_b = np.searchsorted(b, values, side="right") / b.size
+    return float(np.abs(cdf_a - cdf_b).max())
+
+
+def ks_critical_value(n, m, alpha=0.001):
+    """Large-sample critical value of the two-sample KS statistic at significance alpha."""
+    c = math.sqrt(-0.5 * math.log(alpha / 2))
+    return c * math.sqrt((n + m) / (n * m))
+
+
+@pytest.fixture(scope="module")
+def deck():
+    """Fixture providing the 6-symbol deck"""
+    return Deck.generate(6)
+
+
+def test_deck_arrays(deck):
+    """Test the symbol array and incidence matrix"""
+    rows, incidence = deck_arrays(deck)
+    assert rows.shape == (31, 6)
+    assert incidence.shape == (31, 31)
+    assert incidence.sum(axis=1).tolist() == [6] * 31
+    for i in range(len(deck)):
+        assert set(np.flatnonzero(incidence[i]).tolist()) == deck[i].symbols
+
+    lazy_rows, _ = deck_arrays(LazyDeck(6))
+    assert (lazy_rows == rows).all()
+
+
+def test_batch_invariants(deck):
+    """Test per-game bookkeeping of a batch"""
+    result = simulate_batch(deck, 3, 500, "random", seed=1)
+    per_player = 30 // 3
+    assert (result.winners >= 0).all()
+    assert (result.turns >= per_player).all()
+    assert (result.turns <= 3 * (per_player - 1) + per_player).all()
+    assert (result.guesses >= result.turns).all()
+
+    stats = result.to_stats(3)
+    assert stats.games == 500
+    assert sum(stats.wins) == 500
+    assert stats.total_guesses == int(result.guesses.sum())
+
+
+def test_batch_is_deterministic(deck):
+    """Test that a seed fixes the batch outcome"""
+    a = simulate_batch(deck, 2, 50, "reaction", seed=5)
+    b = simulate_batch(deck, 2, 50, "reaction", seed=5)
+    assert (a.turns == b.turns).all() and (a.winners == b.winners).all()
+
+
+def test_batch_guess_limit(deck):
+    """Test that the guess limit leaves games unfinished"""
+    result = simulate_batch(deck, 2, 20, "random", seed=0, max_guesses=2)
+    assert (result.guesses <= 2).all()
+    assert (result.winners == -1).all()
+
+
+def test_batch_too_many_players(deck):
+    """Test a deal that leaves every player without cards"""
+    result = simulate_batch(deck, 40, 3, "random")
+    assert result.winners.tolist() == [0, 0, 0]
+
+
+def test_batch_policy_options(deck):
+    """Test policy options behave like the object-based policies"""
+    result = simulate_batch(deck, 3, 200, "fastest", speeds=[1, 5, 2])
+    assert (result.winners == 1).all()
+    with pytest.raises(ValueError):
+        simulate_batch(deck, 3, 10, "fastest", speeds=[1])
+    with pytest.raises(ValueError):
+        simulate_batch(deck, 3, 10, "psychic")
+
+
+def test_ks_statistic():
+    """Test the two-sample KS statistic"""
+    assert ks_statistic([1, 2, 3], [1, 2, 3]) == 0
+    assert ks_statistic([1, 1], [2, 2]) == 1
+    assert ks_critical_value(100, 100) == pytest.approx(0.276, abs=0.001)
+
+
+@pytest.mark.parametrize("policy,options", [("random", {}), ("reaction", {"skills": [1.0, 1.5, 3.0]})])
+def test_batched_agrees_with_object_engine(deck, policy, options):
+    """Test that both engines give statistically indistinguishable game lengths and win rates"""
+    object_policy = make_policy(policy, 3, **options)
+    reference = [simulate_game(deck, 3, object_policy, seed) for seed in range(400)]
+    batch = simulate_batch(deck, 3, 4000, policy, seed=11, **options)
+
+    turns = [r.turns for r in reference]
+    assert ks_statistic(turns, batch.turns) < ks_critical_value(len(turns), batch.turns.size)
+    guesses = [r.guesses for r in reference]
+    assert ks_statistic(guesses, batch.guesses) < ks_critical_value(len(guesses), batch.guesses.size)
+
+    reference_rates = np.bincount([r.winner for r in reference], minlength=3) / len(reference)
+    batch_rates = np.bincount(batch.winners, minlength=3) / batch.winners.size
+    # Four standard errors of the smaller sample.
+    assert np.abs(reference_rates - batch_rates).max() < 4 * np.sqrt(0.25 / len(reference))
+
+
+def test_runner_batched_engine():
+    """Test batched chunks through the runner"""
+    config = SimulationConfig(4, 2, "random", engine="batched")
+    stats = run_simulations(config, 300, seed=2, workers=1, chunk_size=128)
+    assert stats.games == 300
+    assert stats.unfinished == 0
+
+    with pytest.raises(ValueError):
+        run_simulations(config._replace(engine="quantum"), 10, workers=1)
+
+
+def test_cli_batched(capsys):
+    """Test the simulate subcommand with the batched engine"""
+    main(["simulate", "--games", "50", "--symbols", "4", "--engine", "batched", "--workers", "1"])
+    assert "50 games" in capsys.readouterr().out
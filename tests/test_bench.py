@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from dobble import bench
+from dobble.main import main
+
+
+def quick(**options):
+    return bench.run_suite(sizes=[3], min_time=0.0001, rounds=2, **options)
+
+
+class TestRunSuite:
+    def test_every_case_runs(self):
+        """Test that every case produces a positive timing for a small deck."""
+        results = quick()
+        assert [r.case for r in results] == list(bench.CASES)
+        for result in results:
+            assert result.size == 3
+            assert 0 < result.min <= result.median <= result.max
+            assert result.rounds == 2 and result.iterations >= 1
+
+    def test_selected_cases(self):
+        """Test that only the requested cases run, in order, for each size."""
+        results = bench.run_suite(
+            ["get_matching_symbol", "setup_game"], sizes=[3, 4], min_time=0.0001, rounds=1
+        )
+        assert [r.key for r in results] == [
+            "get_matching_symbol[3]",
+            "get_matching_symbol[4]",
+            "setup_game[3]",
+            "setup_game[4]",
+        ]
+
+    def test_unknown_case(self):
+        """Test that an unknown case name is rejected before anything runs."""
+        with pytest.raises(ValueError, match="nope"):
+            bench.run_suite(["nope"], sizes=[3])
+
+
+class TestResults:
+    @pytest.mark.parametrize("to_json", [bench.to_json, bench.to_pytest_benchmark_json])
+    def test_round_trip(self, tmp_path, to_json):
+        """Test that both JSON layouts load back as medians keyed by case and size."""
+        results = quick(cases=["get_matching_symbol"])
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps(to_json(results)))
+        assert bench.load_results(str(path)) == {"get_matching_symbol[3]": results[0].median}
+
+    def test_not_results(self, tmp_path):
+        """Test that other JSON files are rejected."""
+        path = tmp_path / "other.json"
+        path.write_text("{}")
+        with pytest.raises(ValueError):
+            bench.load_results(str(path))
+
+    def test_compare(self):
+        """Test that only medians slower than the threshold are flagged."""
+        baseline = {"a[3]": 1.0, "b[3]": 1.0, "c[3]": 1.0, "gone[3]": 1.0}
+        current = {"a[3]": 1.05, "b[3]": 1.5, "c[3]": 0.5, "new[3]": 1.0}
+        comparisons = {c.key: c for c in bench.compare(baseline, current, threshold=0.1)}
+        assert set(comparisons) == {"a[3]", "b[3]", "c[3]"}
+        assert [k for k, c in comparisons.items() if c.regressed] == ["b[3]"]
+        assert comparisons["b[3]"].ratio == pytest.approx(1.5)
+
+
+class TestCommand:
+    def run(self, tmp_path, name, *extra):
+        path = tmp_path / name
+        main(["bench", "run", "--sizes", "3", "--cases", "setup_game", "--min-time", "0.0001",
+              "--rounds", "1", "-o", str(path), *extra])
+        return path
+
+    def test_run_and_compare(self, tmp_path, capsys):
+        """Test that a run compares cleanly against itself."""
+        path = self.run(tmp_path, "run.json")
+        assert json.loads(path.read_text())["format"] == "dobble-bench"
+        main(["bench", "compare", str(path), str(path)])
+        assert "0 of 1 benchmarks regressed" in capsys.readouterr().out
+
+    def test_compare_flags_regression(self, tmp_path, capsys):
+        """Test that compare exits with status 1 when a benchmark got slower."""
+        baseline = self.run(tmp_path, "baseline.json", "--format", "pytest-benchmark")
+        document = json.loads(baseline.read_text())
+        document["benchmarks"][0]["stats"]["median"] /= 2
+        baseline.write_text(json.dumps(document))
+        current = self.run(tmp_path, "current.json")
+        with pytest.raises(SystemExit) as exc:
+            main(["bench", "compare", str(baseline), str(current)])
+        assert exc.value.code == 1
+        assert "REGRESSED" in capsys.readouterr().out
+
+    def test_unknown_case(self, tmp_path):
+        """Test that an unknown case is reported as a usage error."""
+        with pytest.raises(SystemExit, match="nope"):
+            main(["bench", "run", "--cases", "nope", "-o", str(tmp_path / "x.json")])
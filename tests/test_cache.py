@@ -0,0 +1,158 @@
+import mmap
+import os
+from array import array
+from pathlib import Path
+
+import pytest
+
+from dobble.game.cache import (
+    HEADER_SIZE,
+    DeckCacheError,
+    build_cache,
+    deck_path,
+    default_cache_dir,
+    load_deck,
+    load_or_build,
+    save_deck,
+)
+from dobble.game.deck import Deck, LazyDeck
+from dobble.game.game import DobbleGame
+from dobble.game.registry import DeckRegistry
+from dobble.main import main
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    """Test cache directory resolution from the environment"""
+    monkeypatch.setenv("DOBBLE_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+
+    monkeypatch.delenv("DOBBLE_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == tmp_path / "pydobble"
+
+
+def test_tests_use_their_own_cache(tmp_path):
+    """Test that decks cached without a directory stay out of the user's cache"""
+    assert load_deck(4) is None
+    load_or_build(4)
+    assert deck_path(4).parent == default_cache_dir() != Path.home() / ".cache" / "pydobble"
+    assert load_deck(4) is not None
+
+
+def test_round_trip(tmp_path):
+    """Test that a saved deck loads back identically"""
+    deck = Deck.generate(8)
+    path = save_deck(deck, tmp_path)
+    assert path == deck_path(8, tmp_path)
+    assert path.stat().st_size == HEADER_SIZE + deck.nbytes
+
+    loaded = load_deck(8, tmp_path)
+    assert len(loaded) == len(deck)
+    assert all(loaded[i] == deck[i] for i in range(len(deck)))
+    assert loaded.match(3, 40) == deck.match(3, 40)
+    assert loaded.data.readonly
+
+
+def test_missing_file(tmp_path):
+    """Test that a missing cache file is a miss"""
+    assert load_deck(8, tmp_path) is None
+
+
+def test_no_temporary_files_left(tmp_path):
+    """Test that the atomic write leaves only the final file"""
+    save_deck(Deck.generate(4), tmp_path)
+    assert os.listdir(tmp_path) == [deck_path(4, tmp_path).name]
+
+
+def test_lazy_decks_are_rejected(tmp_path):
+    """Test that decks without a materialised array cannot be saved"""
+    with pytest.raises(ValueError):
+        save_deck(LazyDeck(4), tmp_path)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:10],  # Truncated header
+        lambda data: b"NOTADECK" + data[8:],  # Bad magic
+        lambda data: data[:-1],  # Truncated payload
+        lambda data: data[:-1] + bytes([data[-1] ^ 1]),  # Flipped bit
+        lambda data: b"",  # Empty file
+        lambda data: data[:13] + b"\xff" + data[14:],  # Unknown typecode
+        lambda data: data[:13] + b"d" + data[14:],  # Typecode never written
+    ],
+)
+def test_corrupt_files_are_detected(monkeypatch, tmp_path, corrupt):
+    """Test integrity checks on damaged files"""
+    path = save_deck(Deck.generate(4), tmp_path)
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    mapped = []
+    real_mmap = mmap.mmap
+
+    def tracked_mmap(*args, **kwargs):
+        mapped.append(real_mmap(*args, **kwargs))
+        return mapped[-1]
+
+    with monkeypatch.context() as patch:
+        patch.setattr(mmap, "mmap", tracked_mmap)
+        with pytest.raises(DeckCacheError):
+            load_deck(4, tmp_path)
+    # The mapping of a rejected file is not left open.
+    assert all(m.closed for m in mapped)
+
+    # load_or_build treats the damage as a miss and repairs the file.
+    assert len(load_or_build(4, tmp_path)) == 13
+    assert load_deck(4, tmp_path) is not None
+
+
+def test_load_or_build_write_flag(tmp_path):
+    """Test that load_or_build only writes when asked to"""
+    load_or_build(5, tmp_path, write=False)
+    assert load_deck(5, tmp_path) is None
+    load_or_build(5, tmp_path)
+    assert load_deck(5, tmp_path) is not None
+
+
+def test_build_cache_skips_valid_files(tmp_path):
+    """Test that prebuilding keeps existing valid files unless forced"""
+    paths = build_cache([3, 4], tmp_path)
+    mtimes = [p.stat().st_mtime_ns for p in paths]
+    assert build_cache([3, 4], tmp_path) == paths
+    assert [p.stat().st_mtime_ns for p in paths] == mtimes
+
+
+def test_build_cache_rejects_invalid_decks(monkeypatch, tmp_path):
+    """Test that a generated deck failing verification is never written"""
+    good = Deck.generate(3)
+    data = good.data.tolist()
+    data[1] = data[0]  # Card 0 now carries one symbol twice.
+    bad = Deck(array(good.data.format, data), 3, plane=good.plane)
+    monkeypatch.setattr(Deck, "generate", classmethod(lambda cls, size: bad))
+    with pytest.raises(ValueError, match="Invalid 3-symbol deck: cards 0 and 0 share"):
+        build_cache([3], tmp_path)
+    assert not deck_path(3, tmp_path).exists()
+    assert build_cache([3], tmp_path, verify=False) == [deck_path(3, tmp_path)]
+
+
+def test_game_uses_cache(monkeypatch, tmp_path):
+    """Test that games map a prebuilt deck instead of generating one"""
+    monkeypatch.setenv("DOBBLE_CACHE_DIR", str(tmp_path))
+    build_cache([6], tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("deck should come from the cache")
+
+    monkeypatch.setattr(Deck, "generate", fail)
+    game = DobbleGame(symbols_per_card=6, registry=DeckRegistry())
+    assert len(game.cards) == 31
+
+
+def test_cli_cache_build(tmp_path):
+    """Test the cache build subcommand"""
+    main(["cache", "build", "--dir", str(tmp_path), "--sizes", "3", "4"])
+    assert load_deck(3, tmp_path) is not None
+    assert load_deck(4, tmp_path) is not None
+
+    with pytest.raises(SystemExit):
+        main(["cache", "build", "--dir", str(tmp_path), "--sizes", "7"])
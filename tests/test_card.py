@@ -1,13 +1,14 @@
 import pytest
 
 from dobble.game.card import DobbleCard
+from dobble.utils.alphabet import ALPHABET
 
 
 @pytest.fixture
 def emoji_map(monkeypatch):
     """Fixture to provide a consistent emoji map for testing"""
     test_emoji_map = {0: "😀", 1: "😂", 2: "😊", 3: "😎", 4: "🤔", 5: "😴"}
-    monkeypatch.setattr("dobble.game.card.EMOJI_MAP", test_emoji_map)
+    monkeypatch.setattr(ALPHABET, "emojis", test_emoji_map)
     return test_emoji_map
 
 
@@ -36,7 +37,7 @@ def test_init():
     [
         ({0, 1, 2}, "Card(😀, 😂, 😊)"),
         (set(), "Card()"),
-        ({6, 7, 8}, "Card(😀, 😂, 😊)"),  # Testing wraparound
+        ({6, 7, 8}, "Card(😀¹, 😂¹, 😊¹)"),  # Past the emojis: the next tier
     ],
 )
 def test_str_representation(emoji_map, symbols, expected_str):
@@ -80,7 +81,7 @@ def test_get_matching_symbol(emoji_map, card_symbols, other_symbols, expected):
 
 
 def test_emoji_wrapping(emoji_map):
-    """Test emoji mapping wraparound for large numbers"""
+    """Test that symbols past the emoji table reuse emojis but still look different"""
     map_size = len(emoji_map)
     test_cases = [
         (map_size + 1, emoji_map[1]),  # Should wrap to index 1
@@ -91,6 +92,7 @@ def test_emoji_wrapping(emoji_map):
     for number, expected_emoji in test_cases:
         card = DobbleCard({number})
         assert expected_emoji in str(card)
+    assert str(DobbleCard({1})) != str(DobbleCard({map_size + 1})) != str(DobbleCard({map_size * 2 + 1}))
 
 
 @pytest.mark.parametrize(
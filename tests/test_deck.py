@@ -0,0 +1,240 @@
+import sys
+
+import pytest
+
+from dobble.game.card import DobbleCard
+from dobble.game.deck import BitsetDeck, Deck, LazyDeck
+
+
+@pytest.fixture
+def deck():
+    """Fixture providing the 4-symbol deck"""
+    return Deck.generate(4)
+
+
+def test_generate(deck):
+    """Test deck dimensions and row ordering"""
+    assert len(deck) == 13
+    assert deck.symbols_per_card == 4
+    assert deck.num_symbols == 13
+    for i in range(len(deck)):
+        row = list(deck.row(i))
+        assert row == sorted(row)
+        assert len(row) == 4
+
+
+def test_cards_are_views(deck):
+    """Test that cards read their symbols from the deck"""
+    card = deck[5]
+    assert isinstance(card, DobbleCard)
+    assert card.deck is deck
+    assert card.index == 5
+    assert card.symbols == set(deck.row(5))
+    assert deck[-1].index == len(deck) - 1
+    assert [c.index for c in deck[2:4]] == [2, 3]
+    with pytest.raises(IndexError):
+        deck[len(deck)]
+
+
+def test_card_has_no_instance_dict(deck):
+    """Test that card views are slotted"""
+    assert not hasattr(deck[0], "__dict__")
+
+
+def test_card_equality(deck):
+    """Test equality between views and standalone cards"""
+    assert deck[3] == deck[3]
+    assert deck[3] != deck[4]
+    assert deck[3] == DobbleCard(deck[3].symbols)
+    assert hash(deck[3]) == hash(DobbleCard(deck[3].symbols))
+
+
+def test_contains(deck):
+    """Test symbol membership"""
+    card = deck[7]
+    for symbol in range(deck.num_symbols):
+        assert card.has_symbol(symbol) == (symbol in card.symbols)
+
+
+def test_from_rows():
+    """Test building a deck from explicit rows"""
+    deck = Deck.from_rows([{3, 1}, [2, 100000]])
+    assert len(deck) == 2
+    assert list(deck.row(0)) == [1, 3]
+    assert list(deck.row(1)) == [2, 100000]
+    assert deck.num_symbols == 100001
+
+    with pytest.raises(ValueError):
+        Deck.from_rows([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        Deck.from_rows([[-1, 2]])
+
+
+def test_incidence(deck):
+    """Test the packed incidence bitmap"""
+    bitmap = deck.incidence()
+    stride = deck.incidence_stride
+    assert len(bitmap) == len(deck) * stride
+    for i in range(len(deck)):
+        for symbol in range(deck.num_symbols):
+            bit = bitmap[i * stride + (symbol >> 3)] >> (symbol & 7) & 1
+            assert bool(bit) == deck.contains(i, symbol)
+    assert deck.nbytes == len(deck) * 4 * 2 + len(bitmap)
+
+
+@pytest.mark.parametrize("symbols_per_card", [2, 3, 4, 5, 6, 9, 10])
+def test_match_closed_form(symbols_per_card):
+    """Test that the arithmetic match agrees with set intersection for every pair"""
+    deck = Deck.generate(symbols_per_card)
+    sets = [set(deck.row(i)) for i in range(len(deck))]
+    pairs = [(i, j) for i in range(len(deck)) for j in range(len(deck)) if i != j]
+
+    for i, j in pairs:
+        assert {deck.match(i, j)} == sets[i] & sets[j]
+    assert deck.match_many(pairs) == [min(sets[i] & sets[j]) for i, j in pairs]
+
+
+def test_match_same_card(deck):
+    """Test that a card matched with itself returns its smallest symbol"""
+    assert deck.match(3, 3) == deck.row(3)[0]
+    assert deck.match_many([(3, 3)]) == [deck.row(3)[0]]
+
+
+def test_match_without_plane():
+    """Test matching on decks that were not built from a plane"""
+    deck = Deck.from_rows([[0, 1, 2], [2, 3, 4], [5, 6, 7]])
+    assert deck.match(0, 1) == 2
+    assert deck.match(0, 2) is None
+    assert deck.match_many([(0, 1), (1, 2)]) == [2, None]
+
+
+def test_card_matching_uses_deck(deck):
+    """Test get_matching_symbol on views of the same deck"""
+    symbol, _ = deck[1].get_matching_symbol(deck[9])
+    assert symbol == deck.match(1, 9)
+
+
+@pytest.mark.parametrize("symbols_per_card", [2, 3, 5, 10])
+def test_bitset_deck_matches_array(symbols_per_card):
+    """Test that the bitset encoding answers every query like the array deck"""
+    deck = Deck.generate(symbols_per_card)
+    bitset = BitsetDeck(deck)
+    assert bitset.data.obj is deck.data.obj  # Rows are shared, not copied.
+    pairs = [(i, j) for i in range(len(deck)) for j in range(len(deck))]
+    assert bitset.match_many(pairs) == deck.match_many(pairs)
+    for i in range(len(deck)):
+        assert bitset.mask(i) == deck.mask(i) == sum(1 << s for s in deck.row(i))
+        for symbol in range(-1, deck.num_symbols + 1):
+            assert bitset.contains(i, symbol) == deck.contains(i, symbol)
+        assert bitset[i] == deck[i]
+
+
+def test_bitset_deck_without_plane():
+    """Test bitset matching on decks that were not built from a plane"""
+    bitset = BitsetDeck(Deck.from_rows([[0, 1, 2], [2, 3, 4], [5, 6, 700]]))
+    assert bitset.match(0, 1) == 2
+    assert bitset.match(0, 2) is None
+    assert bitset.match(2, 2) == 5
+    assert bitset.contains(2, 700) and not bitset.contains(2, 699)
+    assert bitset.nbytes > bitset.data.nbytes
+
+
+def test_bitset_deck_needs_data():
+    """Test that lazy decks cannot be bitset-encoded"""
+    with pytest.raises(ValueError):
+        BitsetDeck(LazyDeck(8))
+
+
+def test_cards_of_different_decks_match():
+    """Test get_matching_symbol between cards of unrelated decks"""
+    a = DobbleCard([1, 5, 9])
+    assert a.get_matching_symbol(DobbleCard([2, 9, 5]))[0] == 5
+    assert a.get_matching_symbol(DobbleCard([2, 3])) is None
+
+
+def test_lazy_deck_matches_eager():
+    """Test that lazily computed rows equal the generated deck"""
+    eager = Deck.generate(10)
+    lazy = LazyDeck(10)
+    assert len(lazy) == len(eager)
+    assert lazy.num_symbols == eager.num_symbols
+    for i in range(len(eager)):
+        assert lazy[i] == eager[i]
+        assert list(lazy.row(i)) == list(eager.row(i))
+    assert lazy.match(4, 17) == eager.match(4, 17)
+
+
+def test_lazy_deck_cache_is_bounded():
+    """Test that the row cache never exceeds its size"""
+    lazy = LazyDeck(8, cache_size=3)
+    for i in range(10):
+        lazy.row(i)
+    assert len(lazy._rows) == 3
+    assert list(lazy._rows) == [7, 8, 9]
+
+    lazy.row(7)
+    lazy.row(20)
+    assert list(lazy._rows) == [9, 7, 20]
+    assert lazy.nbytes == 3 * 8 * 2
+
+    uncached = LazyDeck(8, cache_size=0)
+    uncached.row(1)
+    assert len(uncached._rows) == 0
+
+
+def test_lazy_deck_large_order():
+    """Test that a deck far beyond the eager sizes can be used"""
+    lazy = LazyDeck(258)
+    assert len(lazy) == 257 * 257 + 257 + 1
+    last = lazy[len(lazy) - 1]
+    assert len(last.symbols) == 258
+    assert len(lazy[12345].symbols & last.symbols) == 1
+    with pytest.raises(IndexError):
+        lazy.row(len(lazy))
+
+
+@pytest.mark.parametrize("symbols_per_card", [2, 3, 4, 8, 10])
+def test_point_lines_transpose_line_points(symbols_per_card):
+    """Test that the lines through each point are the cards carrying that symbol"""
+    deck = Deck.generate(symbols_per_card)
+    for symbol in range(deck.num_symbols):
+        expected = [i for i in range(len(deck)) if deck.contains(i, symbol)]
+        assert list(deck.plane.point_lines(symbol)) == expected
+    with pytest.raises(IndexError):
+        deck.plane.point_lines(deck.num_symbols)
+
+
+def test_symbol_index(deck):
+    """Test the symbol-to-cards index against a scan of the deck"""
+    index = deck.symbol_index()
+    assert deck.symbol_index() is index
+    assert len(index.offsets) == deck.num_symbols + 1
+    for symbol in range(deck.num_symbols):
+        expected = [i for i in range(len(deck)) if symbol in deck.row(i)]
+        assert list(deck.cards_with(symbol)) == expected
+        assert deck.symbol_frequency(symbol) == index.frequency(symbol) == 4
+    assert list(deck.cards_with(-1)) == list(deck.cards_with(13)) == []
+    assert deck.symbol_frequency(13) == 0
+    assert deck.nbytes == deck.data.nbytes + index.nbytes
+
+
+def test_symbol_index_without_plane(monkeypatch):
+    """Test the index of an arbitrary deck, with and without NumPy"""
+    rows = [[0, 5], [1, 5], [0, 1], [2, 7]]
+    built = Deck.from_rows(rows).symbol_index()
+    monkeypatch.setitem(sys.modules, "numpy", None)  # Makes `import numpy` raise ImportError.
+    deck = Deck.from_rows(rows)
+    assert deck.symbol_index() == built
+    assert list(deck.symbol_index().offsets) == [0, 2, 4, 5, 5, 5, 7, 7, 8]
+    assert [list(deck.cards_with(s)) for s in range(8)] == [[0, 2], [1, 2], [3], [], [], [0, 1], [], [3]]
+    assert deck.symbol_frequency(5) == 2 and deck.symbol_frequency(3) == 0
+
+
+def test_lazy_deck_cards_with():
+    """Test that a lazy deck answers symbol queries without building an index"""
+    eager = Deck.generate(10)
+    lazy = LazyDeck(10)
+    for symbol in (0, 50, eager.num_symbols - 1):
+        assert list(lazy.cards_with(symbol)) == list(eager.cards_with(symbol))
+        assert lazy.symbol_frequency(symbol) == 10
+    assert lazy._symbol_index is None and lazy.nbytes == 0
@@ -0,0 +1,87 @@
+import subprocess
+import sys
+
+from dobble.utils import emoji_loader
+from dobble.utils.emoji_loader import (
+    EMOJI_TABLE_VERSION,
+    EmojiMap,
+    emoji_table_path,
+    load_emoji_table,
+    parse_code_points,
+    parse_emoji_file,
+    save_emoji_table,
+)
+
+
+def test_parse_code_points():
+    """Test expanding single code points and ranges."""
+    assert parse_code_points("1F600") == [0x1F600]
+    assert parse_code_points("2614..2616") == [0x2614, 0x2615, 0x2616]
+
+
+def test_importing_game_does_not_load_emojis():
+    """Test that importing the game modules leaves the emoji table unloaded."""
+    code = (
+        "import dobble.game.game, dobble.game.card\n"
+        "from dobble.utils import emoji_loader\n"
+        "assert emoji_loader._table is None\n"
+        "assert emoji_loader.EMOJI_MAP._order is None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_table_artifact_round_trip(tmp_path):
+    """Test that the table is saved on first load and read back afterwards."""
+    path = emoji_table_path(tmp_path)
+    assert path.endswith(f"emojis-v{EMOJI_TABLE_VERSION}.txt")
+
+    table = load_emoji_table(tmp_path)
+    assert table == parse_emoji_file()
+    with open(path, encoding="utf-8") as f:
+        assert f.read().endswith(table)
+    assert load_emoji_table(tmp_path) == table
+
+
+def test_stale_artifact_is_rebuilt(tmp_path):
+    """Test that an artifact with another stamp is ignored and replaced."""
+    path = save_emoji_table(tmp_path)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("v0 0 0\nXYZ")
+    assert load_emoji_table(tmp_path) == parse_emoji_file()
+    assert load_emoji_table(tmp_path, write=False) == parse_emoji_file()
+    with open(path, encoding="utf-8") as f:
+        assert "XYZ" not in f.read()
+
+
+def test_load_without_writing(tmp_path):
+    """Test that write=False leaves no artifact behind."""
+    load_emoji_table(tmp_path / "nowhere", write=False)
+    assert not (tmp_path / "nowhere").exists()
+
+
+def test_emoji_map_is_seeded_permutation():
+    """Test that a seeded map is a reproducible reordering of the whole table."""
+    table = emoji_loader.emoji_table()
+    emoji_map = EmojiMap(seed=7)
+    assert len(emoji_map) == len(table)
+    assert sorted(emoji_map.values()) == sorted(table)
+    assert list(emoji_map.values()) == list(EmojiMap(seed=7).values())
+    assert list(emoji_map.values()) != list(EmojiMap(seed=8).values())
+
+
+def test_emoji_map_reseed():
+    """Test that reseeding changes the order in place."""
+    emoji_map = EmojiMap(seed=1)
+    first = [emoji_map[i] for i in range(10)]
+    emoji_map.reseed(2)
+    assert [emoji_map[i] for i in range(10)] != first
+    emoji_map.reseed(1)
+    assert [emoji_map[i] for i in range(10)] == first
+
+
+def test_emoji_map_bounds():
+    """Test that out-of-range indices raise KeyError like a dict."""
+    emoji_map = EmojiMap(seed=0)
+    assert len(emoji_map) - 1 in emoji_map
+    assert -1 not in emoji_map
+    assert len(emoji_map) not in emoji_map
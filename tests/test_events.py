@@ -0,0 +1,185 @@
+import random
+
+import pytest
+
+from dobble.game.deck import Deck
+from dobble.game.events import (
+    MAGIC,
+    Deal,
+    EventReader,
+    EventWriter,
+    Guess,
+    Match,
+    Replay,
+    Win,
+    _get_varint,
+    _put_varint,
+    read_events,
+)
+from dobble.game.game import DobbleGame
+from dobble.main import main
+from dobble.sim.engine import simulate_game
+from dobble.sim.policies import RandomPolicy
+
+
+@pytest.fixture(scope="module")
+def deck():
+    """Fixture providing the 8-symbol deck"""
+    return Deck.generate(8)
+
+
+def state(game):
+    """Everything replay has to reproduce about a game"""
+    return game.live_card.index, [(p.name, list(p.cards.indices)) for p in game.players]
+
+
+def record(path, deck, games=1, players=3, snapshot_every=1000):
+    """Simulate games into a log at path, returning each game's state after every event"""
+    states = []
+    with EventWriter(path, snapshot_every=snapshot_every) as log:
+        for seed in range(games):
+            game = DobbleGame(8, deck=deck, log=log)
+            game.setup_game([f"P{i}" for i in range(players)], rng=random.Random(seed))
+            policy = RandomPolicy(players)
+            rng = random.Random(seed)
+            states.append({log.events: state(game)})
+            while not game.is_over:
+                winner = policy.choose_winner(game, rng)
+                if winner is not None:
+                    game.play_winning_card(winner)
+                    states[-1][log.events] = state(game)
+    return states
+
+
+def test_varints():
+    """Test that varints round-trip and small values take one byte"""
+    buf = bytearray()
+    values = [0, 1, 127, 128, 300, 2**32, 2**63 + 5]
+    for value in values:
+        _put_varint(buf, value)
+    assert buf[:3] == bytes([0, 1, 127])
+    pos = 0
+    for value in values:
+        decoded, pos = _get_varint(buf, pos)
+        assert decoded == value
+    assert pos == len(buf)
+
+
+def test_events_are_read_back(tmp_path, deck):
+    """Test that the reader yields what the game logged, in order"""
+    path = tmp_path / "game.log"
+    with EventWriter(path) as log:
+        game = DobbleGame(8, deck=deck, log=log)
+        game.deal(["Ann", "Bob"], range(len(deck)))
+        symbol = next(iter(set(game.live_card.symbols) & set(game.players[0].get_card().symbols)))
+        assert 0 in game.find_players_with_symbol(symbol)
+        game.record_guess(symbol, 1)
+        game.play_winning_card(0)
+
+    events = list(read_events(path))
+    assert [event.seq for event in events] == list(range(5))
+    assert all(event.game == 0 for event in events)
+    # 56 cards split between two players, and the last card in the centre.
+    assert events[0].data == Deal(8, ("Ann", "Bob"), tuple(range(56)) + (56,))
+    assert events[1].data == Guess(symbol, None)
+    assert events[2].data.symbol == symbol and 0 in events[2].data.players
+    assert events[3].data == Guess(symbol, 1)
+    assert events[4].data == Win(0, 0)
+    times = [event.time for event in events]
+    assert times == sorted(times)
+    assert EventReader(path).started_at > 0
+
+
+def test_replay_matches_every_state(tmp_path, deck):
+    """Test that a game rebuilt at any point matches the game as it was played"""
+    path = tmp_path / "game.log"
+    states = record(path, deck, games=1, snapshot_every=7)[0]
+    replay = Replay(path, deck_for=lambda k: deck)
+    assert len(replay.index[0].starts) > 2  # The deal and some snapshots.
+    for seq, expected in states.items():
+        assert state(replay.game_at(0, seq)) == expected
+    assert replay.game_at(0).is_over
+
+
+def test_snapshots_do_not_change_replay(tmp_path, deck):
+    """Test that logs with and without snapshots replay identically"""
+    for every in (1, 5, 100000):
+        states = record(tmp_path / f"{every}.log", deck, games=2, snapshot_every=every)
+        replay = Replay(tmp_path / f"{every}.log", deck_for=lambda k: deck)
+        assert replay.games == 2
+        for game, game_states in enumerate(states):
+            seq, expected = max(game_states.items())
+            assert state(replay.game_at(game, seq)) == expected
+    assert (tmp_path / "1.log").stat().st_size > (tmp_path / "100000.log").stat().st_size
+
+
+def test_interleaved_games(tmp_path, deck):
+    """Test that games logged side by side are told apart"""
+    path = tmp_path / "server.log"
+    with EventWriter(path, snapshot_every=3) as log:
+        games = [DobbleGame(8, deck=deck, log=log) for _ in range(3)]
+        for i, game in enumerate(games):
+            game.setup_game(["A", "B"], rng=random.Random(i))
+        for _ in range(5):
+            for game in games:
+                game.play_winning_card(1)
+    replay = Replay(path, deck_for=lambda k: deck)
+    for i, game in enumerate(games):
+        assert state(replay.game_at(i)) == state(game)
+
+    final = {}
+    for event, game in replay.states():
+        final[event.game] = state(game)
+    assert final == {i: state(game) for i, game in enumerate(games)}
+
+
+def test_replay_rejects_bad_logs(tmp_path, deck):
+    """Test that foreign files, missing games and inconsistent logs are reported"""
+    bad = tmp_path / "bad.log"
+    bad.write_bytes(b"not a log")
+    with pytest.raises(ValueError):
+        EventReader(bad)
+
+    path = tmp_path / "game.log"
+    record(path, deck)
+    replay = Replay(path, deck_for=lambda k: deck)
+    with pytest.raises(ValueError):
+        replay.game_at(1)
+    with pytest.raises(ValueError):
+        replay.game_at(0, 0)
+
+
+def test_truncated_log(tmp_path, deck):
+    """Test that a record cut short by a crash ends the stream"""
+    path = tmp_path / "game.log"
+    record(path, deck)
+    count = sum(1 for _ in read_events(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    assert sum(1 for _ in read_events(path)) == count - 1
+
+
+def test_small_read_chunks(tmp_path, deck):
+    """Test that records spanning read chunks are decoded"""
+    path = tmp_path / "game.log"
+    record(path, deck, games=3)
+    assert list(EventReader(path, chunk_size=3)) == list(EventReader(path))
+
+
+def test_simulate_log(tmp_path, deck, capsys):
+    """Test that simulated games are logged and replayed from the command line"""
+    path = tmp_path / "sim.log"
+    with EventWriter(path) as log:
+        result = simulate_game(deck, 3, RandomPolicy(3), seed=4, log=log)
+    replay = Replay(path, deck_for=lambda k: deck)
+    game = replay.game_at(0)
+    assert game.is_over
+    assert [i for i, p in enumerate(game.players) if p.is_out_of_cards] == [result.winner]
+
+    main(["simulate", "--games", "3", "--symbols", "8", "--log", str(path)])
+    capsys.readouterr()
+    main(["replay", str(path)])
+    assert "3 games" in capsys.readouterr().out
+    main(["replay", str(path), "--game", "2"])
+    assert "Winner" in capsys.readouterr().out
+    assert path.read_bytes().startswith(MAGIC)
@@ -0,0 +1,126 @@
+import io
+import re
+import xml.etree.ElementTree as ET
+import zlib
+
+import pytest
+
+from dobble.export.glyphs import NUM_MARKS, SHAPES, mark_for
+from dobble.export.pdf import A4, PdfWriter, card_content, card_grid
+from dobble.export.placement import overlaps, place_symbols
+from dobble.export.runner import ExportOptions, check_options, export_deck, iter_cards
+from dobble.game.deck import Deck
+from dobble.game.layout import HexLayout, RandomRotationLayout
+from dobble.main import main
+
+
+def check_pdf(data: bytes) -> int:
+    """Check a PDF's cross-reference table points at its objects; return its page count."""
+    assert data.startswith(b"%PDF-1.4")
+    assert data.rstrip().endswith(b"%%EOF")
+    xref = int(re.search(rb"startxref\n(\d+)", data).group(1))
+    assert data[xref:].startswith(b"xref")
+    count = int(re.match(rb"xref\n0 (\d+)", data[xref:]).group(1))
+    entries = data[xref:].split(b"\n")[2:2 + count]
+    for number, entry in enumerate(entries[1:], 1):
+        assert len(entry) == 19
+        assert data[int(entry[:10]):].startswith(b"%d 0 obj" % number)
+    return int(re.search(rb"/Type /Pages /Count (\d+)", data).group(1))
+
+
+@pytest.mark.parametrize("size", [3, 8, 12, 30])
+def test_placements_do_not_overlap(size):
+    """Test that symbols stay apart and on the card for every layout"""
+    deck = Deck.generate(size)
+    for layout in (None, HexLayout(), RandomRotationLayout(seed=2)):
+        cards = deck if layout is None else deck.with_layout(layout)
+        for index in range(0, len(deck), max(1, len(deck) // 20)):
+            placements = place_symbols(cards.card_layout(index), index, seed=1)
+            assert sorted(p.symbol for p in placements) == list(deck.row(index))
+            assert not overlaps(placements)
+
+
+def test_placement_is_seeded():
+    """Test that a card's placement depends only on the seed and its index"""
+    layout = Deck.generate(8).card_layout(5)
+    assert place_symbols(layout, 5, seed=3) == place_symbols(layout, 5, seed=3)
+    assert place_symbols(layout, 5, seed=3) != place_symbols(layout, 5, seed=4)
+    assert place_symbols(layout, 5, seed=3) != place_symbols(layout, 6, seed=3)
+
+
+def test_marks_are_distinct():
+    """Test that every symbol of the largest deck gets its own mark"""
+    marks = {(m.shape, m.colour, m.label) for m in map(mark_for, range(60 * 59 + 1))}
+    assert len(marks) == 60 * 59 + 1
+    assert mark_for(0).label == "" and mark_for(NUM_MARKS).label == "1"
+    assert mark_for(len(SHAPES)).shape == mark_for(0).shape
+
+
+def test_svg_cards(tmp_path):
+    """Test that SVG export writes one well-formed file per card"""
+    assert export_deck(ExportOptions(4, "emoji"), tmp_path / "cards", "svg", workers=1) == 13
+    files = sorted((tmp_path / "cards").iterdir())
+    assert [f.name for f in files[:2]] == ["card-01.svg", "card-02.svg"]
+    root = ET.parse(files[0]).getroot()
+    assert root.get("width") == "80mm"
+    assert len(root.findall("{http://www.w3.org/2000/svg}text")) == 4
+
+    export_deck(ExportOptions(32, "shapes"), tmp_path / "big", "svg", workers=1, chunk_size=500)
+    root = ET.parse(tmp_path / "big" / "card-001.svg").getroot()
+    assert len(root.findall("{http://www.w3.org/2000/svg}polygon")) == 32
+
+
+def test_pdf_pages(tmp_path):
+    """Test that PDF export fills pages in order and writes a valid file"""
+    slots = len(card_grid(A4, 80 * 72 / 25.4))
+    assert slots == 6
+    path = tmp_path / "deck.pdf"
+    assert export_deck(ExportOptions(8), path, "pdf", workers=1) == 57
+    data = path.read_bytes()
+    assert check_pdf(data) == 10
+    first = re.search(rb"stream\n(.*?)\nendstream", data, re.S).group(1)
+    assert zlib.decompress(first).count(b" cm\n") == 6
+
+
+def test_pdf_writer_streams():
+    """Test that pages are written as they are added"""
+    out = io.BytesIO()
+    with PdfWriter(out) as pdf:
+        pdf.add_page(card_content([]))
+        written = out.tell()
+        assert written > 0 and pdf.num_pages == 1
+    assert check_pdf(out.getvalue()) == 1
+    with pytest.raises(ValueError):
+        card_grid(A4, 1000)
+
+
+def test_workers_do_not_change_output():
+    """Test that drawing in a process pool gives the same cards in the same order"""
+    options = ExportOptions(6, layout="rotated", seed=7)
+    serial = list(iter_cards(options, "pdf", workers=1))
+    assert list(iter_cards(options, "pdf", workers=2, chunk_size=4)) == serial
+
+
+def test_invalid_options():
+    """Test that impossible exports are refused up front"""
+    with pytest.raises(ValueError, match="PDF"):
+        check_options(ExportOptions(8, "emoji"), "pdf")
+    with pytest.raises(ValueError, match="emojis"):
+        check_options(ExportOptions(60, "emoji"), "svg")
+    with pytest.raises(ValueError):
+        check_options(ExportOptions(8, layout="spiral"), "svg")
+    with pytest.raises(ValueError):
+        check_options(ExportOptions(8), "png")
+    with pytest.raises(ValueError, match="prime power"):
+        check_options(ExportOptions(7), "svg")
+
+
+def test_cli_export(tmp_path, capsys):
+    """Test the export command picks the format and glyphs"""
+    main(["export", "--symbols", "4", "-o", str(tmp_path / "deck.pdf"), "--workers", "1"])
+    assert check_pdf((tmp_path / "deck.pdf").read_bytes()) == 3
+    main(["export", "--difficulty", "Easy", "-o", str(tmp_path / "svg"), "--workers", "1"])
+    assert "<text" in next((tmp_path / "svg").iterdir()).read_text()
+    assert "cards to" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        main(["export", "--symbols", "8", "--glyphs", "emoji", "-o", str(tmp_path / "x.pdf")])
@@ -0,0 +1,91 @@
+import itertools
+
+import pytest
+
+from dobble.game.field import GaloisField, prime_power
+from dobble.game.plane import ProjectivePlane, is_valid_card_size
+
+
+@pytest.mark.parametrize(
+    "n,expected",
+    [
+        (0, None),
+        (1, None),
+        (2, (2, 1)),
+        (4, (2, 2)),
+        (6, None),
+        (9, (3, 2)),
+        (12, None),
+        (27, (3, 3)),
+        (49, (7, 2)),
+        (59, (59, 1)),
+        (64, (2, 6)),
+    ],
+)
+def test_prime_power(n, expected):
+    """Test prime power decomposition"""
+    assert prime_power(n) == expected
+
+
+@pytest.mark.parametrize("order", [2, 3, 4, 5, 8, 9, 16, 25, 27])
+def test_field_axioms(order):
+    """Test that the precomputed tables form a field"""
+    field = GaloisField(order)
+    elements = range(order)
+
+    for a, b in itertools.product(elements, repeat=2):
+        assert field.add[a][b] == field.add[b][a]
+        assert field.mul[a][b] == field.mul[b][a]
+        assert field.sub(field.add[a][b], b) == a
+        if b:
+            assert field.div(field.mul[a][b], b) == a
+
+    for a, b, c in itertools.product(elements, repeat=3):
+        assert field.mul[a][field.add[b][c]] == field.add[field.mul[a][b]][field.mul[a][c]]
+
+    for a in elements:
+        assert field.add[a][0] == a
+        assert field.mul[a][1] == a
+
+
+def test_field_rejects_non_prime_power():
+    """Test that composite non prime power orders are rejected"""
+    with pytest.raises(ValueError):
+        GaloisField(6)
+
+
+def test_field_division_by_zero():
+    """Test that dividing by zero raises"""
+    with pytest.raises(ZeroDivisionError):
+        GaloisField(4).div(1, 0)
+
+
+@pytest.mark.parametrize(
+    "symbols_per_card,expected",
+    [(2, True), (3, True), (7, False), (10, True), (11, False), (26, True), (60, True)],
+)
+def test_is_valid_card_size(symbols_per_card, expected):
+    """Test card size validation"""
+    assert is_valid_card_size(symbols_per_card) is expected
+
+
+@pytest.mark.parametrize("order", [1, 2, 3, 4, 5, 8, 9])
+def test_plane_incidence_rows(order):
+    """Test that every pair of lines meets in exactly one point"""
+    plane = ProjectivePlane(order)
+    rows = plane.incidence_rows()
+    k = order + 1
+
+    lines = [rows[i:i + k] for i in range(0, len(rows), k)]
+    assert len(lines) == plane.num_lines
+    assert all(list(line) == sorted(set(line)) for line in lines)
+    assert set(rows) == set(range(plane.num_points))
+
+    for a, b in itertools.combinations(lines, 2):
+        assert len(set(a) & set(b)) == 1
+
+
+def test_plane_typecode():
+    """Test that large planes switch to a wider array type"""
+    assert ProjectivePlane(59).typecode == "H"
+    assert ProjectivePlane(256).typecode == "I"
@@ -1,10 +1,14 @@
+import dataclasses
 import pytest
-import itertools
+import random
 from typing import List
 
 from dobble.game.game import DobbleGame
 from dobble.game.card import DobbleCard
+from dobble.game.deck import BitsetDeck, Deck, LazyDeck
 from dobble.game.player import Player
+from dobble.game.stack import LazyPermutation
+from dobble.game.verify import verify_deck
 from dobble.config import VALID_CARD_SIZES
 
 
@@ -34,9 +38,9 @@ def test_valid_card_generation(symbols_per_card):
         assert len(card.symbols) == symbols_per_card
 
     # Test 3: Exactly one symbol matches for any two cards
-    for card1, card2 in itertools.combinations(game.cards, 2):
-        common_symbols = card1.symbols & card2.symbols
-        assert len(common_symbols) == 1
+    result = verify_deck(game.cards)
+    assert result.ok, result.violations
+    assert result.pairs_checked == expected_cards * (expected_cards + 1) // 2
 
 
 class TestDobbleGameInitialization:
@@ -44,11 +48,32 @@ class TestDobbleGameInitialization:
         """Test initialization with valid number of symbols."""
         game = DobbleGame(symbols_per_card=3)
         assert game.symbols_per_card == 3
-        assert isinstance(game.cards, list)
+        assert isinstance(game.cards, Deck)
         assert all(isinstance(card, DobbleCard) for card in game.cards)
         assert game.live_card is None
         assert game.players == []
 
+    def test_init_bitset_encoding(self):
+        """Test that the bitset encoding plays like the array one."""
+        game = DobbleGame(symbols_per_card=8, encoding="bitset")
+        reference = DobbleGame(symbols_per_card=8)
+        assert isinstance(game.cards, BitsetDeck)
+        assert game.encoding == "bitset"
+        game.setup_game(["Alice", "Bob"], rng=random.Random(3))
+        reference.setup_game(["Alice", "Bob"], rng=random.Random(3))
+        assert game.live_card == reference.live_card
+        for player, other in zip(game.players, reference.players):
+            symbol, _ = player.get_card().get_matching_symbol(game.live_card)
+            assert (symbol, _) == other.get_card().get_matching_symbol(reference.live_card)
+            assert player.has_matching_symbol(symbol)
+
+    def test_init_invalid_encoding(self):
+        """Test that unknown encodings, and bitset with lazy decks, are rejected."""
+        with pytest.raises(ValueError):
+            DobbleGame(symbols_per_card=3, encoding="sparse")
+        with pytest.raises(ValueError):
+            DobbleGame(symbols_per_card=3, lazy=True, encoding="bitset")
+
     def test_init_invalid_symbols(self):
         """Test initialization with invalid number of symbols."""
         with pytest.raises(ValueError) as exc_info:
@@ -84,6 +109,9 @@ class TestGameSetup:
         cards_per_player = len(game.players[0].cards)
         assert all(len(p.cards) == cards_per_player for p in game.players)
 
+        # Piles are windows onto one shared permutation
+        assert game.players[0].cards._indices is game.players[1].cards._indices
+
     def test_setup_game_empty_players(self, game):
         """Test game setup with empty player list."""
         with pytest.raises(ValueError) as exc_info:
@@ -92,7 +120,7 @@ class TestGameSetup:
 
     def test_setup_game_shuffled(self, game):
         """Test that cards are shuffled during setup."""
-        original_cards = game.cards.copy()
+        original_cards = list(game.cards)
         game.setup_game(["Player1"])
 
         # Test that either the live card or player cards are in different order
@@ -115,18 +143,55 @@ class TestGameplay:
 
     def test_find_matching_players(self, setup_game):
         """Test finding players with matching symbols."""
-        # Get a valid symbol from live card
-        live_card_symbol = next(iter(setup_game.live_card.symbols))
-
-        # Create a player card that definitely matches
+        # Any other card of the deck shares exactly one symbol with the live card
+        live_card = setup_game.live_card
         matching_player_idx = 0
-        matching_card = DobbleCard({live_card_symbol, 100, 101})
+        matching_card = setup_game.cards[(live_card.index + 1) % len(setup_game.cards)]
         setup_game.players[matching_player_idx].cards = [matching_card]
 
-        # Test matching
-        matches = setup_game.find_matching_players("A1")  # Coordinate doesn't matter as we mocked the card
+        # Test matching at the coordinate of the shared symbol
+        shared_symbol = next(iter(live_card.symbols & matching_card.symbols))
+        coordinate = live_card.layout.coordinate_of(shared_symbol)
+        matches = setup_game.find_matching_players(coordinate)
         assert matching_player_idx in matches
 
+    def test_symbol_index_tracks_top_cards(self):
+        """Test that the symbol index agrees with a scan of top cards as play goes on."""
+        game = DobbleGame(symbols_per_card=8)
+        game.setup_game([f"Player{i}" for i in range(6)], rng=random.Random(1))
+
+        for turn in range(20):
+            for symbol in range(57):
+                expected = [
+                    i for i, player in enumerate(game.players)
+                    if player.get_card() is not None and player.has_matching_symbol(symbol)
+                ]
+                assert game.find_players_with_symbol(symbol) == expected
+            game.play_winning_card(turn % 6)
+
+    def test_symbol_index_after_cards_replaced(self, setup_game):
+        """Test that replacing a pile moves the player in the symbol index."""
+        card = setup_game.cards[(setup_game.live_card.index + 1) % len(setup_game.cards)]
+        symbol = next(iter(card.symbols))
+        setup_game.players[0].cards = [card]
+        assert 0 in setup_game.find_players_with_symbol(symbol)
+        setup_game.players[0].cards = []
+        assert 0 not in setup_game.find_players_with_symbol(symbol)
+
+    def test_cards_from_another_deck_are_refused(self, setup_game):
+        """Test that piles holding cards of another deck are rejected."""
+        before = setup_game.find_players_with_symbol(0)
+        pile = setup_game.players[0].cards
+        with pytest.raises(ValueError, match="not from this game's deck"):
+            setup_game.players[0].cards = [DobbleCard({0, 1, 2})]
+        assert setup_game.players[0].cards is pile
+        assert setup_game.find_players_with_symbol(0) == before
+        other = DobbleGame(symbols_per_card=4)
+        with pytest.raises(ValueError, match="not from this game's deck"):
+            setup_game.restore([Player("A", [other.cards[1]])], setup_game.live_card.index)
+        with pytest.raises(ValueError, match="not from this game's deck"):
+            setup_game.players = [Player("A", [DobbleCard({0, 1, 2})])]
+
     def test_play_winning_card(self, setup_game):
         """Test playing a winning card."""
         old_live_card = setup_game.live_card
@@ -161,6 +226,118 @@ class TestGameEnd:
         setup_game.players[0].cards = []
         assert setup_game.get_winner() == "Player1"
 
+    def test_is_over_tracks_play(self):
+        """Test that game over is detected as the last card is played."""
+        game = DobbleGame(symbols_per_card=3)
+        game.setup_game(["Player1", "Player2"])
+        for _ in range(3):
+            assert not game.is_over
+            game.play_winning_card(1)
+        assert game.is_over
+        assert game.get_winner() == "Player2"
+
+    def test_watched_player_is_a_plain_dataclass(self, setup_game):
+        """Test that the game's watcher does not show in a player's equality or repr."""
+        player = setup_game.players[0]
+        copy = Player(player.name, player.cards)
+        assert dataclasses.is_dataclass(player) and player == copy
+        assert repr(player) == repr(copy) == f"Player(name='Player1', cards={player.cards!r})"
+
+    def test_players_can_be_replaced(self, setup_game):
+        """Test that assigning players restores the game around them."""
+        live = setup_game.live_card
+        setup_game.players = [Player("Solo", [])]
+        assert setup_game.live_card == live
+        assert setup_game.is_over and setup_game.get_winner() == "Solo"
+        setup_game.players[0].cards = [setup_game.cards[(live.index + 1) % len(setup_game.cards)]]
+        assert not setup_game.is_over
+
+    def test_pile_changed_in_place_is_refused(self, setup_game):
+        """Test that playing from a pile the game did not see change raises."""
+        setup_game.players[0].cards.pop(0)
+        with pytest.raises(ValueError, match="in place"):
+            setup_game.play_winning_card(0)
+
+    def test_is_over_after_cards_replaced(self, setup_game):
+        """Test that replacing a player's pile updates game over state."""
+        setup_game.players[1].cards = []
+        assert setup_game.is_over
+        setup_game.players[1].cards = [setup_game.cards[0]]
+        assert not setup_game.is_over
+
     def test_get_winner_none(self, setup_game):
         """Test getting winner when none exists."""
         assert setup_game.get_winner() is None
+
+
+class TestSymbolsInPlay:
+    def scan(self, game, symbol):
+        """The cards in play carrying symbol, by brute force."""
+        cards = [card.index for p in game.players for card in p.cards] + [game.live_card.index]
+        return sorted(i for i in cards if game.cards.contains(i, symbol))
+
+    def test_frequencies_follow_the_game(self):
+        """Test that in-play symbol counts stay right as cards are dealt and played."""
+        game = DobbleGame(symbols_per_card=4)
+        game.setup_game(["A", "B", "C", "D"], rng=random.Random(3))
+        # 13 cards: 12 dealt, 1 in the centre, none left over.
+        assert game.num_cards_in_play == 13
+        game = DobbleGame(symbols_per_card=8)
+        game.setup_game(["A", "B", "C"], rng=random.Random(3))
+        assert game.num_cards_in_play == 55  # One of the 57 cards is left over.
+        rng = random.Random(0)
+        while not game.is_over:
+            for symbol in range(game.cards.num_symbols):
+                expected = self.scan(game, symbol)
+                assert game.cards_in_play_with(symbol) == expected
+                assert game.symbol_frequency(symbol) == len(expected)
+            game.play_winning_card(rng.randrange(3))
+        assert game.num_cards_in_play == 1 + sum(len(p.cards) for p in game.players)
+
+    def test_restored_game(self):
+        """Test that a restored game works out which cards are in play."""
+        game = DobbleGame(symbols_per_card=4)
+        game.restore([Player("A", [game.cards[1], game.cards[2]])], 0)
+        assert game.num_cards_in_play == 3
+        assert game.cards_in_play_with(0) == self.scan(game, 0)
+        assert sum(game.symbol_frequency(s) for s in range(13)) == 12
+
+    def test_bitset_and_lazy_games(self):
+        """Test in-play counts with the other deck kinds."""
+        for game in (DobbleGame(8, encoding="bitset"), DobbleGame(8, lazy=True)):
+            game.setup_game(["A", "B"], rng=random.Random(1))
+            game.play_winning_card(0)
+            for symbol in range(57):
+                assert game.symbol_frequency(symbol) == len(self.scan(game, symbol))
+
+
+class TestLazyGame:
+    def test_lazy_game_deals_index_stacks(self):
+        """Test that a lazy game deals stacks of indices into its deck."""
+        game = DobbleGame(symbols_per_card=8, lazy=True)
+        assert isinstance(game.cards, LazyDeck)
+
+        game.setup_game(["Alice", "Bob", "Carol"])
+        dealt = [i for p in game.players for i in p.cards.indices] + [game.live_card.index]
+        assert len(set(dealt)) == len(dealt)
+        assert all(len(p.cards) == 56 // 3 for p in game.players)
+        assert all(p.get_card().deck is game.cards for p in game.players)
+
+    def test_lazy_game_deals_without_building_the_order(self):
+        """Test that dealing a lazy game draws from a LazyPermutation."""
+        game = DobbleGame(symbols_per_card=8, lazy=True)
+        game.setup_game(["Alice", "Bob"], rng=random.Random(4))
+        assert all(isinstance(p.cards._indices, LazyPermutation) for p in game.players)
+        dealt = [i for p in game.players for i in p.cards.indices] + [game.live_card.index]
+        assert sorted(dealt) == list(range(57))
+        again = DobbleGame(symbols_per_card=8, lazy=True)
+        again.setup_game(["Alice", "Bob"], rng=random.Random(4))
+        assert again.players == game.players and again.live_card == game.live_card
+
+    def test_lazy_game_plays(self):
+        """Test that a lazy game plays like an eager one."""
+        game = DobbleGame(symbols_per_card=30, lazy=True)
+        game.setup_game(["Alice"])
+        top_card = game.players[0].get_card()
+        game.play_winning_card(0)
+        assert game.live_card == top_card
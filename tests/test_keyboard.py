@@ -0,0 +1,164 @@
+import os
+import pty
+import subprocess
+import sys
+import termios
+import threading
+import time
+
+import pytest
+
+from dobble.ui.keyboard import DEFAULT_RACE_KEYS, KeyBindings, KeyPress, RawInput, parse_keys
+
+
+@pytest.fixture
+def terminal():
+    """Fixture providing a pseudo-terminal as (master fd, slave fd)"""
+    master, slave = pty.openpty()
+    yield master, slave
+    os.close(master)
+    os.close(slave)
+
+
+def test_parse_keys():
+    """Test decoding of characters, named keys and escape sequences"""
+    assert parse_keys("a\r\x7f") == (["a", "enter", "backspace"], "")
+    assert parse_keys("\x1b[A\x1b[B\x1bOC\x1b[D") == (["up", "down", "right", "left"], "")
+    assert parse_keys("\x1b[1;5A") == (["\x1b[1;5A"], "")
+    assert parse_keys("x\x1b[") == (["x"], "\x1b[")
+    assert parse_keys("\x1bx") == (["escape", "x"], "")
+
+
+def test_bindings():
+    """Test that race keys map to players and bad keys are refused"""
+    bindings = KeyBindings.default(3)
+    assert bindings.keys == list(DEFAULT_RACE_KEYS[:3])
+    assert bindings.player_for(DEFAULT_RACE_KEYS[1]) == 1
+    assert bindings.player_for("a") is None
+    for keys in (["/", "/"], ["a", "/"], ["1"], ["  "]):
+        with pytest.raises(ValueError):
+            KeyBindings(keys)
+
+
+def test_session_sets_and_restores_terminal_mode(terminal):
+    """Test that the terminal leaves canonical mode once, for the whole session"""
+    _, slave = terminal
+    before = termios.tcgetattr(slave)
+    with RawInput(slave) as keyboard:
+        assert keyboard.is_open
+        mode = termios.tcgetattr(slave)
+        assert not mode[3] & (termios.ICANON | termios.ECHO)
+        assert mode[3] & termios.ISIG  # Ctrl-C still works.
+    assert termios.tcgetattr(slave) == before
+
+
+def test_keys_are_read_without_enter(terminal):
+    """Test that keys arrive one by one, decoded and timestamped"""
+    master, slave = terminal
+    with RawInput(slave) as keyboard:
+        assert keyboard.read_key(timeout=0.01) is None
+        start = time.monotonic()
+        os.write(master, b"\x1b[Ax")
+        up, x = keyboard.read_key(1), keyboard.read_key(1)
+        assert (up.key, x.key) == ("up", "x")
+        assert start <= up.time == x.time <= time.monotonic()
+        os.write(master, "é\x1b".encode())
+        assert [press.key for press in keyboard.read_keys(1)] == ["é", "escape"]
+
+
+def test_escape_sequence_split_across_reads(terminal):
+    """Test that an escape sequence arriving in pieces is put back together"""
+    master, slave = terminal
+    with RawInput(slave) as keyboard:
+        os.write(master, b"\x1b[")
+        time.sleep(0.01)
+        os.write(master, b"B")
+        assert keyboard.read_key(1).key == "down"
+
+
+def test_read_line(terminal):
+    """Test line editing in the session, with the caller doing the echo"""
+    master, slave = terminal
+    shown = []
+    with RawInput(slave) as keyboard:
+        os.write(master, b"B3\x7f2\x1b[A\r")
+        assert keyboard.read_line(shown.append) == "B2"
+    assert "".join(shown) == "B3\b \b2\n"
+
+
+def type_slowly(fd, chunks):
+    for chunk in chunks:
+        time.sleep(0.02)
+        os.write(fd, chunk)
+
+
+def test_first_press_wins(terminal):
+    """Test that the earliest race key of a racing player wins"""
+    master, slave = terminal
+    bindings = KeyBindings(["/", "[", "]"])
+    ticks = iter(range(100))
+    with RawInput(slave, clock=lambda: next(ticks)) as keyboard:
+        # Player 2 is not racing, and letters are not race keys.
+        typist = threading.Thread(target=type_slowly, args=(master, [b"a]", b"[", b"/"]))
+        typist.start()
+        winner, press = keyboard.first_press(bindings, [0, 1], timeout=1)
+        assert (winner, press) == (1, KeyPress("[", 1))
+        assert keyboard.read_key(1) == KeyPress("/", 2)
+        typist.join()
+
+        # Keys read together keep their order.
+        os.write(master, b"/[")
+        assert keyboard.first_press(bindings, [0, 1], timeout=1)[0] == 0
+        assert keyboard.first_press(bindings, [0, 1], timeout=0.01) == (1, KeyPress("[", 3))
+        assert keyboard.first_press(bindings, [0, 1], timeout=0.01) is None
+
+
+def test_flush_and_closed_session(terminal):
+    """Test discarding typed-ahead keys, and reading from a closed session"""
+    master, slave = terminal
+    keyboard = RawInput(slave)
+    with pytest.raises(ValueError):
+        keyboard.read_key(0)
+    with keyboard:
+        os.write(master, b"//")
+        time.sleep(0.01)
+        keyboard.flush()
+        assert keyboard.read_key(0.01) is None
+
+
+def test_interactive_game_in_a_pty():
+    """Test the game end to end in a pseudo-terminal: select, name players, quit"""
+    master, slave = pty.openpty()
+    before = termios.tcgetattr(slave)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "dobble.main"],
+        stdin=slave,
+        stdout=slave,
+        stderr=slave,
+        env={**os.environ, "TERM": "dumb", "COLUMNS": "100", "LINES": "40"},
+    )
+    output = b""
+
+    def expect(text: bytes) -> None:
+        nonlocal output
+        deadline = time.monotonic() + 20
+        while text not in output:
+            assert time.monotonic() < deadline, output[-500:]
+            try:
+                output += os.read(master, 65536)
+            except OSError:
+                break
+
+    try:
+        expect(b"Select Difficulty")
+        os.write(master, b"\x1b[B\x1b[A\r")  # Down, up, select the first level.
+        expect(b"Enter player names")
+        os.write(master, b"Ann, Bob\r")
+        expect(b"Enter coordinate")
+        os.write(master, b"q\r")
+        assert process.wait(20) == 0
+        assert termios.tcgetattr(slave) == before
+    finally:
+        process.kill()
+        os.close(master)
+        os.close(slave)
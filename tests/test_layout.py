@@ -0,0 +1,115 @@
+import pytest
+
+from dobble.game.card import DobbleCard
+from dobble.game.deck import Deck, LazyDeck
+from dobble.game.game import DobbleGame
+from dobble.game.layout import (
+    HexLayout,
+    RandomRotationLayout,
+    SquareLayout,
+    column_label,
+    make_layout,
+    parse_coordinate,
+)
+
+
+@pytest.mark.parametrize(
+    "col,label",
+    [(0, "A"), (25, "Z"), (26, "AA"), (27, "AB"), (701, "ZZ"), (702, "AAA")],
+)
+def test_column_label_round_trip(col, label):
+    """Test spreadsheet-style column labels and parsing them back."""
+    assert column_label(col) == label
+    assert parse_coordinate(f"{label.lower()}7") == (6, col)
+
+
+@pytest.mark.parametrize("coordinate", ["", "1", "A", "Ax", "?1", "ÄA1"])
+def test_parse_coordinate_rejects_malformed(coordinate):
+    """Test that malformed coordinates parse to None."""
+    assert parse_coordinate(coordinate) is None
+
+
+def test_square_layout_matches_reading_order():
+    """Test that the square layout fills rows in ascending symbol order."""
+    layout = SquareLayout().arrange([3, 5, 8, 13, 21], 0)
+    assert layout.grid == ((3, 5, 8), (13, 21, None), (None, None, None))
+    assert layout.symbol_at_coordinate("B2") == 21
+    assert layout.symbol_at_coordinate("b02") == 21
+    assert layout.symbol_at_coordinate("C2") is None
+    assert layout.symbol_at_coordinate("D1") is None
+    assert layout.coordinate_of(13) == "A2"
+    assert layout.coordinate_of(4) is None
+
+
+@pytest.mark.parametrize(
+    "layout",
+    [SquareLayout(), HexLayout(), RandomRotationLayout(), RandomRotationLayout(HexLayout(), seed=3)],
+)
+@pytest.mark.parametrize("symbols_per_card", [3, 8, 18])
+def test_layout_maps_are_inverse(layout, symbols_per_card):
+    """Test that every symbol is placed once and both maps agree."""
+    deck = Deck.generate(symbols_per_card).with_layout(layout)
+    for index in range(0, len(deck), 7):
+        card_layout = deck.card_layout(index)
+        placed = [s for row in card_layout.grid for s in row if s is not None]
+        assert sorted(placed) == list(deck.row(index))
+        for symbol in placed:
+            assert card_layout.symbol_at_coordinate(card_layout.coordinate_of(symbol)) == symbol
+
+
+def test_hex_layout_staggers_rows():
+    """Test that hex rows alternate between even and odd columns."""
+    layout = HexLayout().arrange(list(range(8)), 0)
+    for r, row in enumerate(layout.grid):
+        assert all(c % 2 == r % 2 for c, s in enumerate(row) if s is not None)
+
+
+def test_random_rotation_is_deterministic():
+    """Test that a rotated card looks the same every time, but cards differ."""
+    layout = RandomRotationLayout(seed=1)
+    symbols = list(range(9))
+    assert layout.arrange(symbols, 5).grid == RandomRotationLayout(seed=1).arrange(symbols, 5).grid
+    grids = {layout.arrange(symbols, i).grid for i in range(20)}
+    assert len(grids) > 1
+
+
+def test_card_layout_is_cached():
+    """Test that a deck computes each card's layout once."""
+    deck = Deck.generate(8)
+    assert deck[3].layout is deck[3].layout
+    lazy = LazyDeck(8)
+    assert lazy[3].layout is lazy[3].layout
+
+
+def test_with_layout_shares_data():
+    """Test that re-laying out a deck does not copy or disturb the original."""
+    deck = Deck.generate(8)
+    hex_deck = deck.with_layout(HexLayout())
+    assert hex_deck.data.obj is deck.data.obj
+    assert isinstance(deck.layout, SquareLayout)
+    assert deck[0].layout.cols == 3
+    assert hex_deck[0].layout.cols == 5
+
+
+def test_game_uses_layout():
+    """Test that a game resolves coordinates through the chosen layout."""
+    game = DobbleGame(8, layout=HexLayout())
+    game.setup_game(["Alice"])
+    symbol = game.live_card.layout.grid[1][1]
+    assert game.get_symbol_at_coordinate("B2") == symbol
+    assert game.get_symbol_at_coordinate("A2") is None
+
+
+def test_standalone_card_layout():
+    """Test that cards built from a set of symbols still get a layout."""
+    card = DobbleCard({7, 2, 9})
+    assert card.has_symbol_at_coordinate("A2") == 9
+    assert DobbleCard(set()).layout.grid == ()
+
+
+def test_make_layout():
+    """Test constructing layouts by name."""
+    assert isinstance(make_layout("hex"), HexLayout)
+    assert make_layout("rotated", seed=4).seed == 4
+    with pytest.raises(ValueError):
+        make_layout("triangle")
@@ -1,10 +1,15 @@
+import ast
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import Mock, patch
 from rich.prompt import Prompt, IntPrompt
 
 from dobble.config import DIFFICULTY_LEVELS
+from dobble.game.game import DobbleGame
 from dobble.ui.game_ui import GameUI
-from dobble.main import GameController
+from dobble.main import GameController, build_parser
 
 
 @pytest.fixture
@@ -50,7 +55,7 @@ def game_ui():
 
 @pytest.fixture
 def game_controller(mock_game):
-    with patch("dobble.game.game.DobbleGame", return_value=mock_game):
+    with patch("dobble.game.game.DobbleGame", return_value=mock_game), patch("dobble.ui.keyboard.RawInput"):
         controller = GameController()
         controller.game = mock_game  # Pre-set the game instance
         yield controller
@@ -77,3 +82,110 @@ class TestGameUI:
         result = game_ui.select_winner([1], players)
         assert result == 1
 
+    def test_select_winner_through_keyboard(self, game_ui, mock_console):
+        keyboard = Mock()
+        keyboard.read_line.side_effect = ["9", "x", "2"]
+        players = [Mock(name=f"Player{i}") for i in range(12)]
+        assert game_ui.select_winner([3, 11], players, keyboard) == 11
+        assert keyboard.read_line.call_count == 3
+
+
+class TestGameController:
+    def test_many_players_pick_the_winner(self, game_controller, mock_console):
+        """Test that 11 or more players play without race keys, choosing tie winners by number"""
+        names = [f"Player{i}" for i in range(12)]
+        game_controller.ui = Mock()
+        game_controller.ui.select_difficulty.return_value = 8
+        game_controller.ui.get_player_names.return_value = names
+        with patch("dobble.game.game.DobbleGame", DobbleGame):
+            game_controller.setup_new_game()
+        assert game_controller.bindings is None
+        assert len(game_controller.game.players) == 12
+
+        game = game_controller.game
+        game_controller.screen = Mock()
+        game_controller.screen.viewport.num_pages = 1
+        game_controller.keyboard = Mock()
+        game_controller.keyboard.read_line.return_value = "A1"
+        game.find_matching_players = Mock(return_value=[2, 5])
+        game_controller.ui.select_winner.return_value = 5
+        game_controller.run_game_turn()
+        game_controller.ui.select_winner.assert_called_once()
+        game_controller.ui.race_winner.assert_not_called()
+        assert len(game.players[5].cards) == len(game.players[2].cards) - 1
+
+    def test_default_race_keys_up_to_ten_players(self, game_controller):
+        assert game_controller._race_bindings(10).keys[-1] == "="
+        assert game_controller._race_bindings(11) is None
+        game_controller.race_keys = "!@"
+        with pytest.raises(SystemExit):
+            game_controller._race_bindings(11)
+
+
+
+UI_MODULES = ("rich", "termios", "dobble.ui")
+
+
+def loaded_modules(code: str, modules=UI_MODULES) -> set:
+    """Run code in a fresh interpreter and return which of modules (the UI by default) it imported."""
+    probe = f"\nimport sys\nprint(sorted(m for m in {tuple(modules)!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code + probe], capture_output=True, text=True, check=True
+    )
+    return set(ast.literal_eval(result.stdout.strip().splitlines()[-1]))
+
+
+class TestStartup:
+    def test_help_does_not_load_ui(self):
+        """Test that building the parser imports none of the terminal UI."""
+        assert loaded_modules("from dobble.main import build_parser\nbuild_parser()") == set()
+
+    def test_simulate_does_not_load_ui(self):
+        """Test that a headless subcommand never imports the terminal UI."""
+        code = (
+            "from dobble.main import main\n"
+            "main(['simulate', '--games', '3', '--workers', '1', '--symbols', '3', '--json'])"
+        )
+        assert loaded_modules(code) == set()
+
+    def test_game_does_not_load_numpy(self):
+        """Test that importing the game leaves NumPy to the code that needs it."""
+        assert loaded_modules("import dobble.game.card, dobble.game.game", ["numpy"]) == set()
+
+    def test_interactive_loads_ui(self):
+        """Test that the interactive game still brings in the UI when it starts."""
+        assert loaded_modules("import dobble.main\ndobble.main.GameController()") == set(UI_MODULES)
+
+
+class TestArguments:
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["simulate", "--games", "0"],
+            ["simulate", "--chunk-size", "-5"],
+            ["simulate", "--players", "two"],
+            ["simulate", "--workers", "0"],
+            ["simulate", "--seed", "-1"],
+            ["export", "--symbols", "4", "-o", "deck.pdf", "--chunk-size", "0"],
+            ["export", "--symbols", "4", "-o", "deck.pdf", "--card-mm", "nan"],
+            ["serve", "--port", "70000"],
+            ["serve", "--max-pending", "0"],
+            ["loadgen", "--think-ms", "-1"],
+            ["replay", "events.log", "--game", "-1"],
+            ["bench", "run", "--rounds", "0"],
+            ["cache", "build", "--sizes", "0"],
+        ],
+    )
+    def test_numbers_are_checked_by_the_parser(self, argv, capsys):
+        """Test that out-of-range numeric options are usage errors, reported before anything runs."""
+        with pytest.raises(SystemExit) as exc:
+            build_parser().parse_args(argv)
+        assert exc.value.code == 2
+        assert "is not a" in capsys.readouterr().err
+
+    def test_numbers_in_range_are_accepted(self):
+        """Test that the numeric types convert valid values."""
+        args = build_parser().parse_args(["serve", "--port", "0", "--workers", "0"])
+        assert (args.port, args.workers) == (0, 0)
+        args = build_parser().parse_args(["export", "-o", "x", "--card-mm", "63.5", "--chunk-size", "1"])
+        assert (args.card_mm, args.chunk_size) == (63.5, 1)
@@ -0,0 +1,122 @@
+import sys
+import threading
+
+import pytest
+
+from dobble.game import deck as deck_module
+from dobble.game.deck import BitsetDeck, Deck, LazyDeck
+from dobble.game.game import DobbleGame
+from dobble.game.registry import DeckRegistry, RegistryStats, build_deck, default_registry
+
+
+def test_get_shares_one_deck():
+    """Test that repeated requests for an order return the same deck"""
+    registry = DeckRegistry()
+    deck = registry.get(4)
+    assert registry.get(4) is deck
+    assert registry.get(4, "lazy") is not deck
+    assert isinstance(registry.get(4, "lazy"), LazyDeck)
+    assert isinstance(registry.get(4, "bitset"), BitsetDeck)
+    stats = registry.stats()
+    assert stats == RegistryStats(hits=2, misses=3, evictions=0, decks=3, nbytes=stats.nbytes)
+    assert stats.nbytes >= deck.nbytes
+    assert (4, "plane") in registry and len(registry) == 3
+
+
+def test_lru_eviction_by_count():
+    """Test that the least recently used deck is dropped first"""
+    registry = DeckRegistry(max_decks=2)
+    three = registry.get(3)
+    registry.get(4)
+    registry.get(3)
+    registry.get(6)
+    assert (4, "plane") not in registry
+    assert registry.get(3) is three
+    assert registry.stats().evictions == 1
+
+
+def test_eviction_by_size():
+    """Test that max_bytes bounds the decks held, keeping the newest"""
+    small = build_deck(3).nbytes
+    registry = DeckRegistry(max_bytes=small)
+    registry.get(3)
+    assert len(registry) == 1
+    big = registry.get(8)
+    assert (3, "plane") not in registry
+    assert registry.stats().nbytes == big.nbytes > small
+
+
+def test_invalid_arguments():
+    """Test that bad bounds and generators are rejected"""
+    with pytest.raises(ValueError):
+        DeckRegistry(max_decks=0)
+    with pytest.raises(ValueError):
+        DeckRegistry(max_bytes=-1)
+    with pytest.raises(ValueError, match="generator"):
+        DeckRegistry().get(4, "sets")
+
+
+def test_threads_get_one_deck(monkeypatch):
+    """Test that concurrent misses on one order all end up with the same deck"""
+    registry = DeckRegistry()
+    barrier = threading.Barrier(8)
+    generate = Deck.generate
+
+    def slow_generate(*args, **kwargs):
+        barrier.wait(timeout=5)
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(Deck, "generate", slow_generate)
+    monkeypatch.setenv("DOBBLE_CACHE_DIR", "/nonexistent")
+    decks = []
+    threads = [threading.Thread(target=lambda: decks.append(registry.get(5))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(decks) == 8
+    assert all(deck is decks[0] for deck in decks)
+    assert registry.get(5) is decks[0]
+    assert len(registry) == 1
+
+
+def test_games_share_registry_deck():
+    """Test that games of one order hold the same deck, each with its own deal"""
+    registry = DeckRegistry()
+    games = [DobbleGame(8, registry=registry) for _ in range(3)]
+    assert all(game.cards is games[0].cards for game in games)
+    assert registry.stats().misses == 1
+    games[0].setup_game(["A", "B"])
+    games[1].setup_game(["A", "B"])
+    assert games[1].cards is games[0].cards
+    assert DobbleGame(8).cards is default_registry().get(8)
+    assert isinstance(DobbleGame(8, encoding="bitset", registry=registry).cards, BitsetDeck)
+
+
+def test_shared_deck_caches_are_thread_safe(monkeypatch):
+    """Test that threads sharing a deck can fill and evict its row and layout caches at once"""
+    monkeypatch.setattr(deck_module, "LAYOUT_CACHE_SIZE", 4)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    deck = DeckRegistry().get(30, "lazy")
+    deck.cache_size = 4
+    errors = []
+
+    def play(seed):
+        try:
+            for i in range(5000):
+                index = (i * 7 + seed * 13) % len(deck)
+                deck.row(index)
+                deck.card_layout(index)
+        except Exception as e:  # pragma: no cover - only on a race
+            errors.append(e)
+
+    threads = [threading.Thread(target=play, args=(seed,)) for seed in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
@@ -0,0 +1,135 @@
+import io
+import random
+import re
+
+import pytest
+from rich.console import Console
+
+from dobble.game.game import DobbleGame
+from dobble.utils.alphabet import ALPHABET
+from dobble.ui.components import RenderCache
+from dobble.ui.display import game_screen
+from dobble.ui.screen import GameScreen
+from dobble.ui.viewport import Viewport
+
+WIDTH, HEIGHT = 100, 60
+CSI = re.compile(r"\x1b\[(\??[0-9;]*)([A-Za-z])")
+
+
+@pytest.fixture(autouse=True)
+def letter_symbols(monkeypatch):
+    """Draw symbols as single-width letters so screen columns are easy to follow."""
+    monkeypatch.setattr(ALPHABET, "emojis", {i: chr(65 + i) for i in range(26)})
+
+
+def make_console() -> Console:
+    return Console(file=io.StringIO(), width=WIDTH, height=HEIGHT, force_terminal=True, color_system=None)
+
+
+def apply_output(screen, data):
+    """Play terminal output onto a character grid, understanding the escapes a GameScreen uses."""
+    y = x = 0
+    i = 0
+    while i < len(data):
+        match = CSI.match(data, i)
+        if match:
+            args, command = match.groups()
+            i = match.end()
+            nums = [int(a) for a in args.split(";") if a and not a.startswith("?")]
+            if command == "H":
+                y, x = (nums[0] - 1, nums[1] - 1) if nums else (0, 0)
+            elif command == "J":
+                if nums and nums[0] == 2:
+                    screen[:] = [[" "] * WIDTH for _ in range(HEIGHT)]
+                else:
+                    screen[y][x:] = [" "] * (WIDTH - x)
+                    screen[y + 1:] = [[" "] * WIDTH for _ in range(HEIGHT - y - 1)]
+            elif command == "K":
+                start = x if not nums or nums[0] == 0 else 0
+                screen[y][start:] = [" "] * (WIDTH - start)
+            continue
+        char = data[i]
+        i += 1
+        if char == "\n":
+            y, x = y + 1, 0
+        elif char == "\r":
+            x = 0
+        else:
+            screen[y][x] = char
+            x += 1
+    return screen
+
+
+def expected_screen(game):
+    console = Console(width=WIDTH, height=HEIGHT, color_system=None, record=True, file=io.StringIO())
+    console.print(game_screen(game, RenderCache(), viewport=Viewport()))
+    return console.export_text().rstrip("\n").split("\n")
+
+
+def visible(screen):
+    lines = ["".join(row).rstrip() for row in screen]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def play(game, screen, turns, rng):
+    """Draw a frame per turn, with some prompt text under it, and yield the terminal grid."""
+    console = screen.console
+    grid = [[" "] * WIDTH for _ in range(HEIGHT)]
+    for _ in range(turns):
+        screen.show(game)
+        console.print("Enter coordinate: B2")
+        apply_output(grid, console.file.getvalue())
+        console.file.seek(0)
+        console.file.truncate()
+        yield grid
+        game.play_winning_card(rng.randrange(len(game.players)))
+
+
+@pytest.mark.parametrize("num_players", [2, 5])
+def test_diff_redraw_matches_full_render(num_players):
+    """Test that the terminal shows exactly the current frame after each diffed redraw."""
+    game = DobbleGame(8)
+    game.setup_game([f"P{i}" for i in range(num_players)], rng=random.Random(0))
+    screen = GameScreen(make_console())
+    for grid in play(game, screen, 6, random.Random(1)):
+        assert visible(grid)[:-1] == [line.rstrip() for line in expected_screen(game)]
+        assert visible(grid)[-1] == "Enter coordinate: B2"
+
+
+def test_unchanged_frame_writes_little():
+    """Test that redrawing an unchanged game rewrites no card lines."""
+    game = DobbleGame(8)
+    game.setup_game(["Alice", "Bob"], rng=random.Random(0))
+    console = make_console()
+    screen = GameScreen(console)
+    screen.show(game)
+    first = len(console.file.getvalue())
+    screen.show(game)
+    second = len(console.file.getvalue()) - first
+    assert second < first / 10
+
+
+def test_render_cache_reuses_unchanged_panels():
+    """Test that only the changed panels miss the cache on the next frame."""
+    game = DobbleGame(8)
+    game.setup_game(["Alice", "Bob", "Carol"], rng=random.Random(0))
+    cache = RenderCache()
+    console = make_console()
+    console.print(game_screen(game, cache))
+    game.play_winning_card(0)
+    misses = cache.misses
+    console.print(game_screen(game, cache))
+    # The new live card and Alice's new top card (table and panel each).
+    assert cache.misses - misses == 4
+
+
+def test_render_cache_is_bounded():
+    """Test that the cache evicts the least recently used panels."""
+    game = DobbleGame(8)
+    cache = RenderCache(maxsize=5)
+    for card in list(game.cards)[:10]:
+        cache.card_table(card)
+    assert len(cache) == 5
+    assert cache.card_table(game.cards[9]) is cache.card_table(game.cards[9])
@@ -0,0 +1,287 @@
+import asyncio
+import json
+
+import pytest
+
+from dobble.game.events import EventWriter, Replay, read_events
+from dobble.net.loadgen import percentile, run_load
+from dobble.net.protocol import ProtocolError, decode, encode
+from dobble.net.server import Connection, DobbleServer
+
+
+class Client:
+    """A minimal protocol client for tests."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, server):
+        return cls(*await asyncio.open_connection("127.0.0.1", server.bound_port))
+
+    def send(self, **message):
+        self.writer.write(encode(message))
+
+    async def receive(self, kind=None):
+        while True:
+            line = await asyncio.wait_for(self.reader.readline(), 5)
+            assert line, "connection closed"
+            message = json.loads(line)
+            if kind is None or message["type"] == kind:
+                return message
+
+    def close(self):
+        self.writer.close()
+
+
+def run(test, **options):
+    """Run test(server) against a server listening on a free port."""
+
+    async def main():
+        server = DobbleServer(port=0, seed=1, **options)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def matching_symbol(turn):
+    return min(set(turn["card"]) & set(turn["live"]))
+
+
+async def seat(server, count, table="t1", symbols=8):
+    clients = [await Client.connect(server) for _ in range(count)]
+    for i, client in enumerate(clients):
+        client.send(type="join", table=table, name=f"P{i}", players=count, symbols=symbols)
+        joined = await client.receive("joined")
+        assert joined["seat"] == i
+    turns = [await client.receive("turn") for client in clients]
+    return clients, turns
+
+
+def test_protocol():
+    """Test encoding and decoding of protocol lines"""
+    assert decode(encode({"type": "stats"})) == {"type": "stats"}
+    assert encode({"type": "x", "n": 1}).endswith(b"\n")
+    for line in (b"not json", b"[1, 2]", b'{"kind": "claim"}', b'{"type": 3}'):
+        with pytest.raises(ProtocolError):
+            decode(line)
+
+
+def test_first_claim_wins():
+    """Test that the earliest valid claim wins, and later ones are told they were late"""
+
+    async def test(server):
+        (alice, bob), (turn_a, turn_b) = await seat(server, 2)
+        assert turn_a["live"] == turn_b["live"]
+        assert turn_a["turn"] == 0 and turn_a["cards"] == turn_b["cards"]
+
+        alice.send(type="claim", turn=0, symbol=matching_symbol(turn_a))
+        bob.send(type="claim", turn=0, symbol=matching_symbol(turn_b))
+        for client in (alice, bob):
+            result = await client.receive("result")
+            assert result["seat"] == 0 and result["name"] == "P0"
+            assert result["symbol"] == matching_symbol(turn_a)
+        rejected = await bob.receive("rejected")
+        assert rejected["reason"] == "late" and rejected["behind"] >= 0
+
+        next_turn = await alice.receive("turn")
+        assert next_turn["turn"] == 1
+        assert next_turn["live"] == turn_a["card"]
+        assert next_turn["cards"] == turn_a["cards"] - 1
+
+        bob.send(type="claim", turn=0, symbol=1)
+        bob.send(type="claim", turn=1, symbol=-1)
+        assert (await bob.receive("rejected"))["reason"] == "late"
+        assert (await bob.receive("rejected"))["reason"] == "wrong"
+        assert server.stats["turns"] == 1
+
+    run(test)
+
+
+def test_claim_by_coordinate():
+    """Test that a claim can name the coordinate of the symbol on the live card"""
+
+    async def test(server):
+        (alice, _), (turn, _) = await seat(server, 2)
+        table = server.tables["t1"]
+        coordinate = table.game.live_card.layout.coordinate_of(matching_symbol(turn))
+        alice.send(type="claim", coordinate=coordinate)
+        assert (await alice.receive("result"))["symbol"] == matching_symbol(turn)
+
+    run(test)
+
+
+def test_game_to_the_end():
+    """Test that a table plays to a winner and is then removed"""
+
+    async def test(server):
+        clients, turns = await seat(server, 2, symbols=3)
+        alice = clients[0]
+        turn = turns[0]
+        while True:
+            alice.send(type="claim", turn=turn["turn"], symbol=matching_symbol(turn))
+            await alice.receive("result")
+            message = await alice.receive()
+            if message["type"] == "over":
+                break
+            turn = message
+        assert message["seat"] == 0 and message["turns"] == turns[0]["cards"]
+        assert "t1" not in server.tables
+        assert server.stats["games_finished"] == 1
+
+    run(test)
+
+
+def test_event_log(tmp_path):
+    """Test that a logged table's game can be replayed"""
+    path = tmp_path / "server.log"
+
+    async def test(server):
+        clients, turns = await seat(server, 2, symbols=3)
+        clients[1].send(type="claim", turn=0, symbol=99)
+        await clients[1].receive("rejected")
+        clients[0].send(type="claim", turn=0, symbol=matching_symbol(turns[0]))
+        await clients[0].receive("result")
+        return server.tables["t1"].game
+
+    with EventWriter(path) as log:
+        game = run(test, log=log)
+    assert [event.kind for event in read_events(path)] == ["deal", "guess", "guess", "win"]
+    replayed = Replay(path).game_at(0)
+    assert replayed.live_card == game.live_card
+    assert [len(player.cards) for player in replayed.players] == [len(player.cards) for player in game.players]
+
+
+def test_auto_match_and_leave():
+    """Test seating without a table id, and a player leaving mid-game"""
+
+    async def test(server):
+        alice, bob = await Client.connect(server), await Client.connect(server)
+        alice.send(type="join", players=2, symbols=4)
+        bob.send(type="join", players=2, symbols=4)
+        table = (await alice.receive("joined"))["table"]
+        assert (await bob.receive("joined"))["table"] == table
+        await alice.receive("turn")
+
+        bob.close()
+        over = await alice.receive("over")
+        assert over["seat"] is None and over["reason"] == "Player 2 left"
+        assert server.tables == {}
+
+    run(test)
+
+
+def test_join_errors():
+    """Test that bad joins are refused with an error message"""
+
+    async def test(server):
+        client = await Client.connect(server)
+        for message in (
+            {"players": 0},
+            {"symbols": 7},
+            {"players": 9, "symbols": 3},
+        ):
+            client.send(type="join", **message)
+            assert (await client.receive())["type"] == "error"
+        client.send(type="join", table="t1", players=3)
+        await client.receive("joined")
+        client.send(type="join", table="t2")
+        assert "Already" in (await client.receive("error"))["message"]
+        client.send(type="claim", symbol=1)
+        assert (await client.receive("error"))["message"] == "Not in a game"
+        client.send(type="dance")
+        assert "Unknown" in (await client.receive("error"))["message"]
+        client.writer.write(b"{oops\n")
+        assert "Invalid JSON" in (await client.receive("error"))["message"]
+
+        other = await Client.connect(server)
+        other.send(type="join", table="t1", players=2)
+        assert "is for 3 players" in (await other.receive("error"))["message"]
+
+    run(test)
+
+
+def test_only_server_sizes_are_played(monkeypatch):
+    """Test that joins are limited to the server's deck sizes, whose decks are ready before it listens"""
+
+    async def test(server):
+        assert sorted(server._decks) == [3, 8]
+        built = []
+        monkeypatch.setattr(server.registry, "get", lambda *args: built.append(args))
+        client = await Client.connect(server)
+        for symbols in (12, 258, 1025):
+            client.send(type="join", players=2, symbols=symbols)
+            assert "must be one of 3, 8" in (await client.receive("error"))["message"]
+        client.send(type="join", players=2, symbols=3)
+        await client.receive("joined")
+        assert built == []
+
+    run(test, sizes=[3, 8])
+
+
+def test_stats():
+    """Test the stats message"""
+
+    async def test(server):
+        client = await Client.connect(server)
+        client.send(type="stats")
+        stats = await client.receive("stats")
+        assert stats["connections"] == 1 and stats["tables_playing"] == 0
+        assert stats["cpu_seconds"] >= 0
+
+    run(test)
+
+
+class FakeTransport:
+    def __init__(self):
+        self.aborted = False
+
+    def abort(self):
+        self.aborted = True
+
+
+class FakeWriter:
+    def __init__(self):
+        self.transport = FakeTransport()
+
+
+def test_slow_client_is_dropped():
+    """Test that a client whose outgoing queue fills up is disconnected"""
+
+    async def test():
+        conn = Connection(FakeWriter(), max_pending=2)
+        conn.send(b"1\n")
+        conn.send(b"2\n")
+        assert not conn.closed
+        conn.send(b"3\n")
+        assert conn.closed and conn.dropped and conn.writer.transport.aborted
+        conn.send(b"4\n")  # Ignored once closed.
+
+    asyncio.run(test())
+
+
+def test_load_generator():
+    """Test that the load generator plays every table to the end and reports latencies"""
+
+    async def test(server):
+        return await run_load("127.0.0.1", server.bound_port, tables=3, players=3, symbols=3, games=2, think=0)
+
+    report = run(test)
+    assert report.games == 6
+    assert report.turns > 0 and report.turns_per_second > 0
+    assert 0 < report.p50_ms <= report.p99_ms
+    assert report.tables_per_core > 0
+
+
+def test_percentile():
+    """Test nearest-rank percentiles"""
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) == 0.0
@@ -0,0 +1,166 @@
+import asyncio
+import os
+import signal
+
+from dobble.net.loadgen import run_load
+from dobble.net.ring import HashRing
+from dobble.net.shards import ShardedServer
+
+from test_server import Client, matching_symbol, seat
+
+KEYS = [f"table-{i}" for i in range(2000)]
+
+
+def test_ring_spreads_keys():
+    """Test that every node gets a fair share of keys"""
+    ring = HashRing(["a", "b", "c", "d"])
+    counts = {node: 0 for node in ring.nodes}
+    for key in KEYS:
+        counts[ring.node_for(key)] += 1
+    assert all(300 < count < 700 for count in counts.values()), counts
+
+
+def test_ring_moves_only_removed_keys():
+    """Test that removing a node only reassigns that node's keys"""
+    ring = HashRing(["a", "b", "c", "d"])
+    before = {key: ring.node_for(key) for key in KEYS}
+    ring.remove("c")
+    assert "c" not in ring and len(ring) == 3
+    for key, node in before.items():
+        if node != "c":
+            assert ring.node_for(key) == node
+    ring.add("c")
+    assert {key: ring.node_for(key) for key in KEYS} == before
+
+
+def test_empty_ring():
+    """Test that an empty ring refuses lookups"""
+    ring = HashRing()
+    try:
+        ring.node_for("x")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def run(test, **options):
+    async def main():
+        server = ShardedServer(port=0, sizes=[3, 8], **options)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_sharded_games():
+    """Test that games spread over workers play to the end"""
+
+    async def test(server):
+        report = await run_load("127.0.0.1", server.bound_port, tables=8, players=2, symbols=3, think=0)
+        client = await Client.connect(server)
+        client.send(type="stats")
+        return report, await client.receive("stats")
+
+    report, stats = run(test, workers=2)
+    assert report.games == 8
+    assert stats["games_finished"] == 8 and stats["workers"] == 2
+    assert stats["tables_playing"] == 0
+
+
+def test_tables_are_routed_by_ring():
+    """Test that a table is hosted by the worker the ring picks for its id"""
+
+    async def test(server):
+        clients, turns = await seat(server, 2, table="t1")
+        owner = server.ring.node_for("t1")
+        await asyncio.sleep(0.1)
+        assert server._routes["t1"].name == owner
+        clients[0].send(type="claim", turn=0, symbol=matching_symbol(turns[0]))
+        assert (await clients[1].receive("result"))["seat"] == 0
+
+    run(test, workers=3)
+
+
+def test_worker_failure():
+    """Test that a dead worker's tables end, and the worker is replaced"""
+
+    async def test(server):
+        clients, _ = await seat(server, 2, table="t1")
+        await asyncio.sleep(0.1)
+        worker = server._routes["t1"]
+        os.kill(worker.process.pid, signal.SIGKILL)
+        for client in clients:
+            over = await client.receive("over")
+            assert over["reason"] == "worker failed"
+        assert "t1" not in server._routes
+
+        # The table can be played again once the replacement is up.
+        for _ in range(50):
+            if len(server.ring) == 2:
+                break
+            await asyncio.sleep(0.1)
+        assert len(server.ring) == 2 and server.worker_failures == 1
+        clients, turns = await seat(server, 2, table="t1")
+        assert turns[0]["turn"] == 0
+
+    run(test, workers=2)
+
+
+def test_auto_tables():
+    """Test that joins without a table id are seated together"""
+
+    async def test(server):
+        alice, bob = await Client.connect(server), await Client.connect(server)
+        alice.send(type="join", players=2, symbols=3)
+        bob.send(type="join", players=2, symbols=3)
+        a, b = await alice.receive("joined"), await bob.receive("joined")
+        assert a["table"] == b["table"] and {a["seat"], b["seat"]} == {0, 1}
+        await alice.receive("turn")
+
+    run(test, workers=2)
+
+
+async def waiting_tables(server, count):
+    for _ in range(50):
+        if (await server.snapshot())["tables_waiting"] == count:
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"expected {count} waiting tables")
+
+
+def test_auto_seat_freed_by_leave():
+    """Test that a seat given up before a table fills goes to the next join"""
+
+    async def test(server):
+        alice = await Client.connect(server)
+        alice.send(type="join", players=2, symbols=3)
+        first = await alice.receive("joined")
+        alice.send(type="leave")
+        await waiting_tables(server, 0)
+        bob, carol = await Client.connect(server), await Client.connect(server)
+        bob.send(type="join", players=2, symbols=3)
+        b = await bob.receive("joined")
+        carol.send(type="join", players=2, symbols=3)
+        c = await carol.receive("joined")
+        assert b["table"] == c["table"] and {b["seat"], c["seat"]} == {0, 1}
+        await bob.receive("turn")
+        await carol.receive("turn")
+
+        # A client dropping while it waits frees its seat too.
+        dave = await Client.connect(server)
+        dave.send(type="join", players=2, symbols=3)
+        d = await dave.receive("joined")
+        dave.close()
+        await waiting_tables(server, 0)
+        erin, frank = await Client.connect(server), await Client.connect(server)
+        erin.send(type="join", players=2, symbols=3)
+        frank.send(type="join", players=2, symbols=3)
+        e, f = await erin.receive("joined"), await frank.receive("joined")
+        assert e["table"] == f["table"] != d["table"] != first["table"]
+        await erin.receive("turn")
+
+    run(test, workers=2)
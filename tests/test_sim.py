@@ -0,0 +1,145 @@
+import json
+import random
+
+import pytest
+
+from dobble.game.deck import Deck
+from dobble.game.game import DobbleGame
+from dobble.main import main
+from dobble.sim.engine import GameResult, SimulationStats, simulate_game
+from dobble.sim.policies import (
+    FastestSpotterPolicy,
+    RandomPolicy,
+    ReactionTimePolicy,
+    make_policy,
+)
+from dobble.sim.runner import SimulationConfig, run_simulations
+
+
+@pytest.fixture(scope="module")
+def deck():
+    """Fixture providing the 8-symbol deck"""
+    return Deck.generate(8)
+
+
+@pytest.fixture
+def game(deck):
+    """Fixture providing a dealt 3-player game"""
+    game = DobbleGame(8, deck=deck)
+    game.setup_game(["A", "B", "C"], rng=random.Random(1))
+    return game
+
+
+def test_seeded_deal_is_reproducible(deck):
+    """Test that dealing with the same seed gives the same piles"""
+    piles = []
+    for _ in range(2):
+        game = DobbleGame(8, deck=deck)
+        game.setup_game(["A", "B"], rng=random.Random(42))
+        piles.append([list(p.cards.indices) for p in game.players])
+    assert piles[0] == piles[1]
+
+
+def test_game_rejects_mismatched_deck(deck):
+    """Test that a shared deck must have the requested order"""
+    with pytest.raises(ValueError):
+        DobbleGame(4, deck=deck)
+
+
+def test_random_policy_picks_a_matching_player(game):
+    """Test that random guesses only ever award the card to a matching player"""
+    policy = RandomPolicy(3)
+    rng = random.Random(0)
+    for _ in range(50):
+        winner = policy.choose_winner(game, rng)
+        if winner is not None:
+            symbol, _ = game.live_card.get_matching_symbol(game.players[winner].get_card())
+            assert winner in game.find_players_with_symbol(symbol)
+
+
+def test_fastest_spotter_policy(game):
+    """Test that the fastest player always wins"""
+    policy = FastestSpotterPolicy(3, speeds=[1.0, 3.0, 2.0])
+    assert {policy.choose_winner(game, random.Random(i)) for i in range(20)} == {1}
+
+    tied = FastestSpotterPolicy(3)
+    assert {tied.choose_winner(game, random.Random(i)) for i in range(50)} == {0, 1, 2}
+
+
+def test_reaction_time_policy_favours_skill(game):
+    """Test that more skilled players win more often"""
+    policy = ReactionTimePolicy(3, skills=[1.0, 1.0, 4.0])
+    rng = random.Random(0)
+    wins = [0, 0, 0]
+    for _ in range(300):
+        wins[policy.choose_winner(game, rng)] += 1
+    assert wins[2] > wins[0] + wins[1]
+
+
+def test_make_policy():
+    """Test building policies by name"""
+    assert isinstance(make_policy("reaction", 2, sigma=0.1), ReactionTimePolicy)
+    with pytest.raises(ValueError):
+        make_policy("psychic", 2)
+    with pytest.raises(ValueError):
+        make_policy("fastest", 2, speeds=[1.0])
+
+
+def test_simulate_game(deck):
+    """Test a single simulated game runs to completion deterministically"""
+    result = simulate_game(deck, 3, RandomPolicy(3), seed=7)
+    assert result == simulate_game(deck, 3, RandomPolicy(3), seed=7)
+    assert result.winner in (0, 1, 2)
+    # Each player holds 56 // 3 = 18 cards; the winner played all of theirs.
+    assert 18 <= result.turns <= 3 * 17 + 18
+    assert result.guesses >= result.turns
+
+
+def test_simulate_game_guess_limit(deck):
+    """Test that the guess limit stops a game without a winner"""
+    result = simulate_game(deck, 2, RandomPolicy(2), seed=7, max_guesses=3)
+    assert result.guesses == 3
+    assert result.winner is None
+
+
+def test_stats_aggregation():
+    """Test streaming aggregation and merging"""
+    a = SimulationStats(2)
+    a.add(GameResult(0, 10, 12, 0))
+    a.add(GameResult(1, 20, 25, 1))
+    b = SimulationStats(2)
+    b.add(GameResult(2, 30, 30, 1))
+    b.add(GameResult(3, 5, 100, None))
+    a.merge(b)
+
+    assert a.games == 4
+    assert a.unfinished == 1
+    assert a.wins == [1, 2]
+    assert a.mean_turns == pytest.approx(16.25)
+    assert a.turn_quantile(0.5) == 10
+    assert a.turn_quantile(1.0) == 30
+    assert a.win_rates() == pytest.approx([1 / 3, 2 / 3])
+    assert a.summary()["mean_guesses"] == pytest.approx(167 / 4)
+
+    with pytest.raises(ValueError):
+        a.merge(SimulationStats(3))
+
+
+def test_results_do_not_depend_on_scheduling():
+    """Test that worker count and chunking do not change the results"""
+    config = SimulationConfig(symbols_per_card=4, num_players=2, policy="random")
+    serial = run_simulations(config, 60, seed=3, workers=1, chunk_size=60)
+    pooled = run_simulations(config, 60, seed=3, workers=2, chunk_size=7)
+    assert serial.summary() == pooled.summary()
+
+
+def test_cli_simulate(capsys):
+    """Test the simulate subcommand"""
+    main(["simulate", "--games", "20", "--players", "2", "--symbols", "4", "--workers", "1", "--json"])
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["games"] == 20
+    assert summary["symbols_per_card"] == 4
+    assert len(summary["win_rates"]) == 2
+
+    main(["simulate", "--games", "5", "--difficulty", "Trivial", "--workers", "1"])
+    assert "5 games of 2 players" in capsys.readouterr().out
@@ -0,0 +1,106 @@
+import random
+from array import array
+
+import pytest
+
+from dobble.game.deck import Deck
+from dobble.game.stack import CardStack, LazyPermutation
+
+
+@pytest.fixture
+def deck():
+    """Fixture providing the 3-symbol deck"""
+    return Deck.generate(3)
+
+
+def test_stack_reads_cards_from_deck(deck):
+    """Test that a stack hands out views of the deck"""
+    stack = CardStack(deck, [4, 0, 2])
+    assert len(stack) == 3
+    assert stack[0] == deck[4]
+    assert stack[-1] == deck[2]
+    assert stack[1:] == [deck[0], deck[2]]
+    assert list(stack) == [deck[4], deck[0], deck[2]]
+    assert list(stack.indices) == [4, 0, 2]
+
+
+def test_stack_pop(deck):
+    """Test removing cards from a stack"""
+    stack = CardStack(deck, [4, 0, 2])
+    assert stack.pop(0) == deck[4]
+    assert stack.pop() == deck[2]
+    assert len(stack) == 1
+    stack.pop()
+    assert not stack
+
+
+def test_stack_equality(deck):
+    """Test comparing stacks with stacks and lists"""
+    stack = CardStack(deck, [1, 2])
+    assert stack == CardStack(deck, [1, 2])
+    assert stack != CardStack(deck, [2, 1])
+    assert stack == [deck[1], deck[2]]
+    assert stack != [deck[1]]
+
+
+def test_stacks_share_one_permutation(deck):
+    """Test windows onto a shared index array"""
+    shared = array("I", [6, 5, 4, 3, 2, 1])
+    first = CardStack(deck, shared, 0, 3)
+    second = CardStack(deck, shared, 3, 6)
+    assert list(first.indices) == [6, 5, 4]
+    assert list(second.indices) == [3, 2, 1]
+    assert first.top_index == 6
+
+    assert first.pop(0) == deck[6]
+    assert first.pop(0) == deck[5]
+    assert second.pop() == deck[1]
+    assert list(first.indices) == [4]
+    assert list(second.indices) == [3, 2]
+    assert list(shared) == [6, 5, 4, 3, 2, 1]
+
+    first.pop(0)
+    assert first.top_index is None
+    with pytest.raises(IndexError):
+        first.pop(0)
+    with pytest.raises(IndexError):
+        first[0]
+
+
+def test_pop_from_middle_detaches(deck):
+    """Test that popping from the middle leaves the shared array alone"""
+    shared = array("I", [0, 1, 2, 3, 4])
+    stack = CardStack(deck, shared, 1, 5)
+    assert stack.pop(1) == deck[2]
+    assert list(stack.indices) == [1, 3, 4]
+    assert list(shared) == [0, 1, 2, 3, 4]
+    assert stack[-1] == deck[4]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 13, 57, 1000])
+def test_lazy_permutation_is_a_permutation(n):
+    """Test that every position maps to a different index below n"""
+    perm = LazyPermutation(n, random.Random(n))
+    assert len(perm) == n
+    assert sorted(perm) == list(range(n))
+    assert list(perm[2:5]) == [perm[i] for i in range(2, min(5, n))]
+    if n:
+        assert perm[-1] == perm[n - 1]
+    with pytest.raises(IndexError):
+        perm[n]
+
+
+def test_lazy_permutation_is_seeded():
+    """Test that the rng decides the order"""
+    assert list(LazyPermutation(57, random.Random(1))) == list(LazyPermutation(57, random.Random(1)))
+    assert list(LazyPermutation(57, random.Random(1))) != list(LazyPermutation(57, random.Random(2)))
+
+
+def test_stacks_over_lazy_permutation(deck):
+    """Test that stacks deal from a lazy permutation without copying it"""
+    perm = LazyPermutation(len(deck), random.Random(0))
+    stack = CardStack(deck, perm, 2, 6)
+    assert stack.indices == perm[2:6]
+    assert stack.pop(0) == deck[perm[2]]
+    assert stack.pop(1) == deck[perm[4]]
+    assert stack.indices == array("I", [perm[3], perm[5]])
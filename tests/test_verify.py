@@ -0,0 +1,88 @@
+from array import array
+
+import pytest
+
+from dobble.config import VALID_CARD_SIZES
+from dobble.game.deck import Deck, LazyDeck
+from dobble.game import verify
+from dobble.game.verify import BACKENDS, DeckViolation, verify_deck
+
+# Cards 0/2 share two symbols and card 4 shares none with the rest.
+BAD_ROWS = [[0, 1, 2], [0, 3, 4], [0, 1, 5], [2, 3, 6], [7, 8, 9]]
+BAD_VIOLATIONS = [
+    DeckViolation(0, 2, 2),
+    DeckViolation(0, 4, 0),
+    DeckViolation(1, 4, 0),
+    DeckViolation(2, 3, 0),
+    DeckViolation(2, 4, 0),
+    DeckViolation(3, 4, 0),
+]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("symbols_per_card", [2, 3, 8, 14])
+def test_generated_decks_pass(backend, symbols_per_card):
+    """Test that generated decks verify with either backend and any chunking"""
+    deck = Deck.generate(symbols_per_card)
+    n = len(deck)
+    for chunk_size in (1, 7, 512):
+        result = verify_deck(deck, chunk_size=chunk_size, workers=2, backend=backend)
+        assert result.ok
+        assert result.num_cards == n
+        assert result.pairs_checked == n * (n + 1) // 2
+
+
+def test_every_order_passes():
+    """Test that every playable deck verifies"""
+    for symbols_per_card in VALID_CARD_SIZES:
+        assert verify_deck(Deck.generate(symbols_per_card)).ok
+
+
+def test_lazy_deck():
+    """Test that lazy decks verify too"""
+    assert verify_deck(LazyDeck(10)).ok
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_reports_violations_in_order(backend, chunk_size):
+    """Test that violations are found and reported in (card1, card2) order"""
+    deck = Deck.from_rows(BAD_ROWS)
+    result = verify_deck(deck, chunk_size=chunk_size, backend=backend)
+    assert not result.ok
+    assert result.violations == BAD_VIOLATIONS
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_stops_at_max_violations(backend):
+    """Test that checking stops early with the first violations"""
+    deck = Deck.from_rows(BAD_ROWS)
+    result = verify_deck(deck, chunk_size=1, max_violations=2, backend=backend)
+    assert result.violations == BAD_VIOLATIONS[:2]
+    assert result.pairs_checked < 15
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_repeated_symbol(backend):
+    """Test that a card with fewer distinct symbols than its width is reported against itself"""
+    good = Deck.generate(3)
+    data = good.data.tolist()
+    data[1] = data[0]
+    deck = Deck(array(good.data.format, data), 3)
+    assert DeckViolation(0, 0, 2) in verify_deck(deck, backend=backend).violations
+
+
+def test_python_backend_without_bit_count(monkeypatch):
+    """Test the pure-Python backend's popcount fallback for Pythons before 3.10"""
+    monkeypatch.setattr(verify, "_popcount", verify._count_ones)
+    assert verify_deck(Deck.generate(8), backend="python").ok
+    assert verify_deck(Deck.from_rows(BAD_ROWS), backend="python").violations == BAD_VIOLATIONS
+
+
+def test_invalid_arguments():
+    """Test that bad options are rejected"""
+    deck = Deck.generate(3)
+    with pytest.raises(ValueError):
+        verify_deck(deck, backend="gpu")
+    with pytest.raises(ValueError):
+        verify_deck(deck, chunk_size=0)
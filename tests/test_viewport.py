@@ -0,0 +1,81 @@
+import io
+import random
+
+import pytest
+from rich.console import Console
+
+from dobble.game.game import DobbleGame
+from dobble.utils.alphabet import ALPHABET
+from dobble.ui.components import RenderCache
+from dobble.ui.display import game_screen
+from dobble.ui.viewport import Viewport
+
+WIDTH, HEIGHT = 120, 50
+
+
+@pytest.fixture(autouse=True)
+def letter_symbols(monkeypatch):
+    """Draw symbols as single-width letters."""
+    monkeypatch.setattr(ALPHABET, "emojis", {i: chr(65 + i % 26) for i in range(1000)})
+
+
+@pytest.fixture
+def party_game():
+    game = DobbleGame(30, lazy=True)
+    game.setup_game([f"Guest{i}" for i in range(60)], rng=random.Random(0))
+    return game
+
+
+def render(game, viewport, cache=None):
+    console = Console(width=WIDTH, height=HEIGHT, color_system=None, record=True, file=io.StringIO())
+    console.print(game_screen(game, cache if cache is not None else RenderCache(), viewport=viewport))
+    return console.export_text().rstrip("\n").split("\n")
+
+
+def test_viewport_fits_terminal(party_game):
+    """Test that a page of a large table fits above the prompt area."""
+    viewport = Viewport(reserve=8)
+    lines = render(party_game, viewport)
+    assert len(lines) <= HEIGHT - 8
+    assert 1 <= viewport.page_size < 60
+    assert viewport.num_pages == -(-60 // viewport.page_size)
+
+
+def test_viewport_builds_only_visible_panels(party_game):
+    """Test that render work depends on the page, not on the number of players."""
+    viewport = Viewport()
+    cache = RenderCache()
+    render(party_game, viewport, cache)
+    # Live card table and panel, plus one table and panel per visible player.
+    assert len(cache) <= 2 + 2 * viewport.page_size
+
+
+def test_viewport_pages_through_players(party_game):
+    """Test that turning pages shows different players and summarises the rest."""
+    viewport = Viewport()
+    first = "\n".join(render(party_game, viewport))
+    assert "Guest0 (" in first
+    assert f"Page 1/{viewport.num_pages}" in first
+
+    viewport.scroll(1)
+    second = "\n".join(render(party_game, viewport))
+    assert f"Guest{viewport.page_size} (" in second
+    assert "╭─ Guest0 " not in second
+    assert "Guest0 (" in first.split("Page 1")[0] and "more" in second
+
+    viewport.scroll(100)
+    render(party_game, viewport)
+    assert viewport.page == viewport.num_pages - 1
+    viewport.scroll(-100)
+    assert viewport.page == 0
+
+
+def test_viewport_single_page_has_no_summary():
+    """Test that small tables are drawn in full without a pager."""
+    game = DobbleGame(8)
+    game.setup_game(["Alice", "Bob"], rng=random.Random(0))
+    viewport = Viewport()
+    lines = render(game, viewport)
+    assert viewport.num_pages == 1
+    assert not any(line.startswith("Page ") for line in lines)
+    assert any("Alice (28 cards)" in line for line in lines)